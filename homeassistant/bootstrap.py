@@ -15,11 +15,23 @@ from typing import TYPE_CHECKING, Any
 import voluptuous as vol
 import yarl
 
-from homeassistant import config as conf_util, config_entries, core, loader
+from homeassistant import (
+    config as conf_util,
+    config_entries,
+    core,
+    loader,
+    requirements,
+)
 from homeassistant.components import http
 from homeassistant.const import REQUIRED_NEXT_PYTHON_DATE, REQUIRED_NEXT_PYTHON_VER
 from homeassistant.exceptions import HomeAssistantError
-from homeassistant.helpers import area_registry, device_registry, entity_registry
+from homeassistant.helpers import (
+    area_registry,
+    config_per_platform,
+    device_registry,
+    entity_registry,
+    template,
+)
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.setup import (
@@ -436,6 +448,42 @@ async def async_setup_multi_components(
         )
 
 
+async def _async_preimport_integrations(
+    hass: core.HomeAssistant,
+    integrations: dict[str, loader.Integration],
+    config: dict[str, Any],
+) -> None:
+    """Import the integrations and platforms that will be set up in the executor.
+
+    Setup waits for an import that is already running instead of importing the
+    module again on the event loop. A module is only imported once the
+    requirements of its integration were processed.
+    """
+
+    async def _async_preimport(domain: str, platform_domain: str | None = None) -> None:
+        """Import an integration or one of its platforms."""
+        integration = await requirements.async_get_integration_with_requirements(
+            hass, domain
+        )
+        if platform_domain is None:
+            await integration.async_get_component()
+        else:
+            await integration.async_get_platform(platform_domain)
+
+    imports = [_async_preimport(domain) for domain in integrations]
+
+    for domain in integrations:
+        for platform_name, _ in config_per_platform(config, domain):
+            if platform_name is not None:
+                imports.append(_async_preimport(platform_name, domain))
+
+    for result in await gather_with_concurrency(
+        MAX_LOAD_CONCURRENTLY, *imports, return_exceptions=True
+    ):
+        if isinstance(result, BaseException):
+            _LOGGER.warning("Unable to pre-import module: %s", result)
+
+
 async def _async_set_up_integrations(
     hass: core.HomeAssistant, config: dict[str, Any]
 ) -> None:
@@ -488,6 +536,11 @@ async def _async_set_up_integrations(
 
     _LOGGER.info("Domains to be set up: %s", domains_to_setup)
 
+    # Warm up the imports while the integrations are set up
+    preimport_task = hass.async_create_task(
+        _async_preimport_integrations(hass, integration_cache, config)
+    )
+
     logging_domains = domains_to_setup & LOGGING_INTEGRATIONS
 
     # Load logging as soon as possible
@@ -527,11 +580,12 @@ async def _async_set_up_integrations(
 
     stage_2_domains = domains_to_setup - logging_domains - debuggers - stage_1_domains
 
-    # Load the registries
+    # Load the registries and the cache of compiled templates
     await asyncio.gather(
         device_registry.async_load(hass),
         entity_registry.async_load(hass),
         area_registry.async_load(hass),
+        template.async_load_bytecode_cache(hass),
     )
 
     # Start setup
@@ -571,6 +625,18 @@ async def _async_set_up_integrations(
         },
     )
 
+    await preimport_task
+
+    _LOGGER.debug(
+        "Integration import times: %s",
+        dict(
+            sorted(
+                hass.data.get(loader.DATA_IMPORT_TIME, {}).items(),
+                key=lambda item: item[1],  # type: ignore
+            )
+        ),
+    )
+
     # Wrap up startup
     _LOGGER.debug("Waiting for startup to wrap up")
     try:
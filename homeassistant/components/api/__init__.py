@@ -225,7 +225,13 @@ class APIStatesView(HomeAssistantView):
             for state in request.app["hass"].states.async_all()
             if entity_perm(state.entity_id, "read")
         ]
-        return self.json(states)
+        try:
+            return self.json_serialized(
+                f'[{",".join(state.as_json() for state in states)}]'
+            )
+        except (ValueError, TypeError):
+            # Logged by json
+            return self.json(states)
 
 
 class APIEntityStateView(HomeAssistantView):
@@ -242,9 +248,13 @@ class APIEntityStateView(HomeAssistantView):
             raise Unauthorized(entity_id=entity_id)
 
         state = request.app["hass"].states.get(entity_id)
-        if state:
+        if not state:
+            return self.json_message("Entity not found.", HTTP_NOT_FOUND)
+        try:
+            return self.json_serialized(state.as_json())
+        except (ValueError, TypeError):
+            # Logged by json
             return self.json(state)
-        return self.json_message("Entity not found.", HTTP_NOT_FOUND)
 
     async def post(self, request, entity_id):
         """Update state of entity."""
@@ -400,6 +400,7 @@ class GroupEntity(Entity):
 
         async def _update_at_start(_):
             await self.async_update()
+            self.async_invalidate_static_attributes()
             self.async_write_ha_state()
 
         self.hass.bus.async_listen_once(EVENT_HOMEASSISTANT_START, _update_at_start)
@@ -410,6 +411,7 @@ class GroupEntity(Entity):
             return
 
         await self.async_update()
+        self.async_invalidate_static_attributes()
         self.async_write_ha_state()
 
     @abstractmethod
@@ -530,6 +532,7 @@ class Group(Entity):
     def name(self, value):
         """Set Group name."""
         self._name = value
+        self.async_invalidate_static_attributes()
 
     @property
     def state(self):
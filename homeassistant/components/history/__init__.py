@@ -3,6 +3,7 @@ from __future__ import annotations
 
 from collections.abc import Iterable
 from datetime import datetime as dt, timedelta
+from fnmatch import fnmatchcase
 import logging
 import time
 from typing import cast
@@ -11,10 +12,13 @@ from aiohttp import web
 from sqlalchemy import not_, or_
 import voluptuous as vol
 
+from homeassistant.auth.permissions.const import POLICY_READ
 from homeassistant.components import websocket_api
 from homeassistant.components.http import HomeAssistantView
 from homeassistant.components.recorder import history, models as history_models
 from homeassistant.components.recorder.statistics import (
+    PERIOD_5MINUTE,
+    PERIOD_HOUR,
     list_statistic_ids,
     statistics_during_period,
 )
@@ -26,15 +30,20 @@ from homeassistant.const import (
     CONF_INCLUDE,
     HTTP_BAD_REQUEST,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.exceptions import Unauthorized
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.deprecation import deprecated_class, deprecated_function
 from homeassistant.helpers.entityfilter import (
     CONF_ENTITY_GLOBS,
     INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA,
 )
+from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.helpers.json import json_bytes
 import homeassistant.util.dt as dt_util
 
+from .downsample import downsample
+
 # mypy: allow-untyped-defs, no-check-untyped-defs
 
 _LOGGER = logging.getLogger(__name__)
@@ -47,6 +56,13 @@ GLOB_TO_SQL_CHARS = {
     46: "_",  # .
 }
 
+# Buckets per entity returned by the downsampled history view
+DEFAULT_POINTS = 500
+MAX_POINTS = 10000
+
+# States per message streamed by history/stream
+STREAM_BATCH_SIZE = 1000
+
 CONFIG_SCHEMA = vol.Schema(
     {
         DOMAIN: INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA.extend(
@@ -102,6 +118,7 @@ async def async_setup(hass, config):
     use_include_order = conf.get(CONF_ORDER)
 
     hass.http.register_view(HistoryPeriodView(filters, use_include_order))
+    hass.http.register_view(HistoryDownsampledView(filters))
     hass.components.frontend.async_register_built_in_panel(
         "history", "history", "hass:poll-box"
     )
@@ -109,6 +126,7 @@ async def async_setup(hass, config):
         ws_get_statistics_during_period
     )
     hass.components.websocket_api.async_register_command(ws_get_list_statistic_ids)
+    hass.components.websocket_api.async_register_command(ws_stream_history)
 
     return True
 
@@ -124,6 +142,9 @@ class LazyState(history_models.LazyState):
         vol.Required("start_time"): str,
         vol.Optional("end_time"): str,
         vol.Optional("statistic_ids"): [str],
+        vol.Optional("period", default=PERIOD_HOUR): vol.Any(
+            PERIOD_5MINUTE, PERIOD_HOUR
+        ),
     }
 )
 @websocket_api.async_response
@@ -157,6 +178,7 @@ async def ws_get_statistics_during_period(
         start_time,
         end_time,
         msg.get("statistic_ids"),
+        msg["period"],
     )
     connection.send_result(msg["id"], statistics)
 
@@ -181,6 +203,227 @@ async def ws_get_list_statistic_ids(
     connection.send_result(msg["id"], statistic_ids)
 
 
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "history/stream",
+        vol.Required("start_time"): str,
+        vol.Optional("end_time"): str,
+        vol.Required("entity_ids"): cv.entity_ids,
+        vol.Optional("minimal_response", default=False): bool,
+    }
+)
+@websocket_api.async_response
+async def ws_stream_history(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict
+) -> None:
+    """Stream the history of entities, followed by their state changes.
+
+    The state changes of each entity are sent in batches as they are read
+    from the database, then a history_complete event is sent. Until
+    end_time, the state changes of the entities are sent as they happen.
+    """
+    msg_id = msg["id"]
+    start_time = dt_util.parse_datetime(msg["start_time"])
+    if start_time is None:
+        connection.send_error(msg_id, "invalid_start_time", "Invalid start_time")
+        return
+    start_time = dt_util.as_utc(start_time)
+
+    end_time = None
+    if "end_time" in msg:
+        end_time = dt_util.parse_datetime(msg["end_time"])
+        if end_time is None:
+            connection.send_error(msg_id, "invalid_end_time", "Invalid end_time")
+            return
+        end_time = dt_util.as_utc(end_time)
+
+    entity_ids = msg["entity_ids"]
+    for entity_id in entity_ids:
+        if not connection.user.permissions.check_entity(entity_id, POLICY_READ):
+            raise Unauthorized(entity_id=entity_id)
+
+    now = dt_util.utcnow()
+    history_end = now if end_time is None else min(end_time, now)
+    # Live state changes are held back until the history was sent
+    pending: list[Event] | None = []
+
+    @callback
+    def _forward_state_changes(event: Event) -> None:
+        """Forward the state changes of the entities."""
+        new_state = event.data["new_state"]
+        if new_state is None:
+            return
+        if end_time is not None and new_state.last_updated >= end_time:
+            return
+        if pending is not None:
+            pending.append(event)
+            return
+        connection.send_message(
+            websocket_api.event_message(
+                msg_id, {"entity_id": new_state.entity_id, "states": [new_state]}
+            )
+        )
+
+    unsub_state_changes = None
+    if end_time is None or end_time > now:
+        unsub_state_changes = async_track_state_change_event(
+            hass, entity_ids, _forward_state_changes
+        )
+
+    @callback
+    def _unsubscribe() -> None:
+        """Stop streaming."""
+        if unsub_state_changes is not None:
+            unsub_state_changes()
+
+    connection.subscriptions[msg_id] = _unsubscribe
+    connection.send_result(msg_id)
+
+    last_updated = {}
+    try:
+        for entity_id in entity_ids:
+            last_updated[entity_id] = await _async_stream_entity_history(
+                hass,
+                connection,
+                msg_id,
+                entity_id,
+                start_time,
+                history_end,
+                msg["minimal_response"],
+            )
+            if msg_id not in connection.subscriptions:
+                return
+    except Exception:
+        # Stop streaming, async_response sends the error to the client
+        if connection.subscriptions.pop(msg_id, None) is not None:
+            _unsubscribe()
+        raise
+
+    if unsub_state_changes is not None:
+        # State changes from the last moments before the history ended
+        # may not have been committed yet, the current state stands in
+        # for them
+        changed_entity_ids = {event.data["entity_id"] for event in pending or ()}
+        for entity_id in entity_ids:
+            state = hass.states.get(entity_id)
+            if (
+                entity_id in changed_entity_ids
+                or state is None
+                or (
+                    last_updated[entity_id] is not None
+                    and state.last_changed <= last_updated[entity_id]
+                )
+            ):
+                continue
+            connection.send_message(
+                websocket_api.event_message(
+                    msg_id, {"entity_id": entity_id, "states": [state]}
+                )
+            )
+
+    connection.send_message(
+        websocket_api.event_message(msg_id, {"history_complete": True})
+    )
+    events, pending = pending or [], None
+    for event in events:
+        _forward_state_changes(event)
+
+
+async def _async_stream_entity_history(
+    hass, connection, msg_id, entity_id, start_time, end_time, minimal_response
+):
+    """Send the history of an entity in batches.
+
+    Each batch is read in the executor and sent from the event loop. The
+    next batch is only read once the previous one was written to the client,
+    no database cursor is held open while waiting for the client.
+
+    Returns when the last state was updated.
+    """
+    timer_start = time.perf_counter()
+    minimal_response = minimal_response and (
+        entity_id.split(".", 1)[0] not in history.NEED_ATTRIBUTE_DOMAINS
+    )
+    count = 0
+    last_updated = None
+    after = None
+    while True:
+        messages, count, last_updated, after = await hass.async_add_executor_job(
+            _read_stream_batch,
+            hass,
+            msg_id,
+            entity_id,
+            start_time,
+            end_time,
+            minimal_response,
+            count,
+            last_updated,
+            after,
+        )
+        for message in messages:
+            if msg_id not in connection.subscriptions:
+                # Unsubscribed while streaming
+                return last_updated
+            connection.send_message(message)
+            await connection.async_wait_for_writer()
+        if after is None:
+            break
+
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        elapsed = time.perf_counter() - timer_start
+        _LOGGER.debug("Streamed %d states of %s in %fs", count, entity_id, elapsed)
+    return last_updated
+
+
+def _read_stream_batch(
+    hass,
+    msg_id,
+    entity_id,
+    start_time,
+    end_time,
+    minimal_response,
+    count,
+    last_updated,
+    after,
+):
+    """Read the next batch of the history of an entity.
+
+    Returns the serialized messages, the updated count and last_updated,
+    and the cursor of the next batch.
+    """
+    states, after = history.get_state_changes_batch(
+        hass, start_time, end_time, entity_id, after, STREAM_BATCH_SIZE
+    )
+    to_isoformat = history_models.process_timestamp_to_utc_isoformat
+    messages = []
+    batch: list = []
+    for state in states:
+        if minimal_response and count:
+            batch.append(
+                {
+                    history.STATE_KEY: state.state,
+                    history.LAST_CHANGED_KEY: to_isoformat(state.last_changed),
+                }
+            )
+        else:
+            batch.append(state.as_dict())
+        count += 1
+        last_updated = state.last_updated
+        if len(batch) == STREAM_BATCH_SIZE:
+            messages.append(_stream_batch_message(msg_id, entity_id, batch))
+            batch = []
+    if batch:
+        messages.append(_stream_batch_message(msg_id, entity_id, batch))
+    return messages, count, last_updated, after
+
+
+def _stream_batch_message(msg_id, entity_id, batch):
+    """Serialize a batch of states of an entity."""
+    return websocket_api.const.JSON_DUMP(
+        websocket_api.event_message(msg_id, {"entity_id": entity_id, "states": batch})
+    )
+
+
 class HistoryPeriodView(HomeAssistantView):
     """Handle history period requests."""
 
@@ -307,6 +550,118 @@ class HistoryPeriodView(HomeAssistantView):
         return self.json(result)
 
 
+class HistoryDownsampledView(HomeAssistantView):
+    """Handle downsampled history requests."""
+
+    url = "/api/history/downsampled"
+    name = "api:history:view-downsampled"
+    extra_urls = ["/api/history/downsampled/{datetime}"]
+
+    def __init__(self, filters):
+        """Initialize the downsampled history view."""
+        self.filters = filters
+
+    async def get(
+        self, request: web.Request, datetime: str | None = None
+    ) -> web.StreamResponse:
+        """Return the history of entities reduced to a bounded number of buckets.
+
+        The buckets are either given by their size in seconds with the bucket
+        query parameter, or by their number with the points query parameter.
+        """
+        now = dt_util.utcnow()
+        if datetime:
+            datetime_ = dt_util.parse_datetime(datetime)
+            if datetime_ is None:
+                return self.json_message("Invalid datetime", HTTP_BAD_REQUEST)
+            start_time = dt_util.as_utc(datetime_)
+        else:
+            start_time = now - timedelta(days=1)
+
+        end_time_str = request.query.get("end_time")
+        if end_time_str:
+            end_time = dt_util.parse_datetime(end_time_str)
+            if end_time is None:
+                return self.json_message("Invalid end_time", HTTP_BAD_REQUEST)
+            end_time = dt_util.as_utc(end_time)
+        else:
+            end_time = start_time + timedelta(days=1)
+        # There is no history in the future
+        end_time = min(end_time, now)
+
+        entity_ids_str = request.query.get("filter_entity_id")
+        if not entity_ids_str:
+            return self.json_message("filter_entity_id is missing", HTTP_BAD_REQUEST)
+        # Entities excluded from the history are left out, as by
+        # HistoryPeriodView
+        entity_ids = [
+            entity_id
+            for entity_id in entity_ids_str.lower().split(",")
+            if not self.filters or self.filters.matches(entity_id)
+        ]
+
+        try:
+            if "bucket" in request.query:
+                bucket_size = timedelta(seconds=float(request.query["bucket"]))
+                if bucket_size <= timedelta(0):
+                    raise ValueError
+            else:
+                points = int(request.query.get("points", DEFAULT_POINTS))
+                if not 0 < points <= MAX_POINTS:
+                    raise ValueError
+                bucket_size = max(
+                    (end_time - start_time) / points, timedelta(seconds=1)
+                )
+        except (ValueError, OverflowError):
+            return self.json_message("Invalid points or bucket", HTTP_BAD_REQUEST)
+
+        if end_time <= start_time:
+            return self.json([])
+        if (end_time - start_time) / bucket_size > MAX_POINTS:
+            return self.json_message("Too many buckets", HTTP_BAD_REQUEST)
+
+        hass = request.app["hass"]
+        response = web.StreamResponse(headers={"Content-Type": "application/json"})
+        await response.prepare(request)
+        # Each entity is written as soon as it is downsampled,
+        # the whole response is never held in memory
+        separator = b"["
+        for entity_id in entity_ids:
+            buckets = await hass.async_add_executor_job(
+                self._downsampled_entity,
+                hass,
+                entity_id,
+                start_time,
+                end_time,
+                bucket_size,
+            )
+            chunk = json_bytes({"entity_id": entity_id, "buckets": buckets})
+            await response.write(separator + chunk)
+            separator = b","
+        await response.write(b"[]" if separator == b"[" else b"]")
+        await response.write_eof()
+        return response
+
+    @staticmethod
+    def _downsampled_entity(hass, entity_id, start_time, end_time, bucket_size):
+        """Downsample the history of an entity."""
+        timer_start = time.perf_counter()
+        buckets = downsample(
+            history.iter_state_values_during_period(
+                hass, start_time, end_time, entity_id
+            ),
+            start_time,
+            end_time,
+            bucket_size,
+        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            elapsed = time.perf_counter() - timer_start
+            _LOGGER.debug(
+                "Downsampled %s to %d buckets in %fs", entity_id, len(buckets), elapsed
+            )
+        return buckets
+
+
 def sqlalchemy_filter_from_include_exclude_conf(conf):
     """Build a sql filter from config."""
     filters = Filters()
@@ -369,6 +724,36 @@ class Filters:
 
         baked_query += lambda q: q.filter(self.entity_filter())
 
+    def matches(self, entity_id):
+        """Return True if the entity passes the filter, like entity_filter."""
+        if not self.has_config:
+            return True
+
+        domain = entity_id.split(".", 1)[0]
+        included = (
+            domain in self.included_domains
+            or entity_id in self.included_entities
+            or any(fnmatchcase(entity_id, glob) for glob in self.included_entity_globs)
+        )
+        excluded = (
+            domain in self.excluded_domains
+            or entity_id in self.excluded_entities
+            or any(fnmatchcase(entity_id, glob) for glob in self.excluded_entity_globs)
+        )
+        if not (
+            self.excluded_domains
+            or self.excluded_entities
+            or self.excluded_entity_globs
+        ):
+            return included
+        if not (
+            self.included_domains
+            or self.included_entities
+            or self.included_entity_globs
+        ):
+            return not excluded
+        return included and not excluded
+
     def entity_filter(self):
         """Generate the entity filter query."""
         includes = []
@@ -0,0 +1,122 @@
+"""Downsample the history of an entity into time buckets."""
+from __future__ import annotations
+
+from collections.abc import Iterable
+from datetime import datetime, timedelta
+import math
+
+from homeassistant.components.recorder.models import process_timestamp_to_utc_isoformat
+
+
+def _to_float(state: str | None) -> float | None:
+    """Return the state as a float, or None if it is not a number."""
+    if state is None:
+        return None
+    try:
+        fstate = float(state)
+    except ValueError:
+        return None
+    return fstate if math.isfinite(fstate) else None
+
+
+class _Bucket:
+    """The states of an entity during a bucket."""
+
+    __slots__ = ("start", "state", "min", "max", "integral", "duration")
+
+    def __init__(self, start: datetime, state: str | None) -> None:
+        """Initialize the bucket with the state carried over into it."""
+        self.start = start
+        self.state = state
+        self.min: float | None = None
+        self.max: float | None = None
+        self.integral = 0.0
+        self.duration = 0.0
+
+    def add_state(self, state: str, fstate: float | None) -> None:
+        """Add a state change."""
+        self.state = state
+        self._add_value(fstate)
+
+    def _add_value(self, fstate: float | None) -> None:
+        """Update the minimum and the maximum."""
+        if fstate is None:
+            return
+        self.min = fstate if self.min is None else min(self.min, fstate)
+        self.max = fstate if self.max is None else max(self.max, fstate)
+
+    def hold(self, fstate: float | None, since: datetime, until: datetime) -> None:
+        """Weight a numeric state by the time it was held."""
+        seconds = (until - since).total_seconds()
+        if fstate is None or not seconds:
+            return
+        self._add_value(fstate)
+        self.integral += fstate * seconds
+        self.duration += seconds
+
+    def as_dict(self) -> dict:
+        """Return the bucket as a JSON friendly dict."""
+        start = process_timestamp_to_utc_isoformat(self.start)
+        if self.min is None:
+            return {"start": start, "state": self.state}
+        return {
+            "start": start,
+            "mean": self.integral / self.duration if self.duration else None,
+            "min": self.min,
+            "max": self.max,
+        }
+
+
+def downsample(
+    values: Iterable[tuple[str, datetime]],
+    start_time: datetime,
+    end_time: datetime,
+    bucket_size: timedelta,
+) -> list[dict]:
+    """Downsample the (state, last_updated) of an entity, sorted by time.
+
+    Numeric states are reduced to the time weighted mean, the minimum and
+    the maximum of each bucket, other states to the last state of each
+    bucket. There is a bucket for each bucket_size from the first state
+    until end_time, so the number of buckets doesn't depend on the number
+    of states.
+    """
+    result: list[dict] = []
+    bucket: _Bucket | None = None
+    state: str | None = None
+    fstate: float | None = None
+    since = start_time
+
+    for new_state, last_updated in values:
+        last_updated = max(last_updated, start_time)
+        if last_updated >= end_time:
+            break
+        if bucket is None:
+            bucket_start = (
+                start_time + (last_updated - start_time) // bucket_size * bucket_size
+            )
+            bucket = _Bucket(bucket_start, None)
+        else:
+            # Close the buckets before the state change
+            while last_updated >= bucket.start + bucket_size:
+                bucket_end = bucket.start + bucket_size
+                bucket.hold(fstate, since, bucket_end)
+                result.append(bucket.as_dict())
+                bucket = _Bucket(bucket_end, state)
+                since = bucket_end
+            bucket.hold(fstate, since, last_updated)
+        state, fstate, since = new_state, _to_float(new_state), last_updated
+        bucket.add_state(state, fstate)
+
+    if bucket is None:
+        return result
+
+    # The last state is held until end_time
+    while True:
+        bucket_end = min(bucket.start + bucket_size, end_time)
+        bucket.hold(fstate, since, bucket_end)
+        result.append(bucket.as_dict())
+        if bucket_end >= end_time:
+            return result
+        bucket = _Bucket(bucket_end, state)
+        since = bucket_end
@@ -6,7 +6,12 @@ from typing import Any
 import voluptuous as vol
 
 from homeassistant.components.automation import AutomationActionType
-from homeassistant.const import CONF_EVENT_DATA, CONF_PLATFORM
+from homeassistant.const import (
+    ATTR_DEVICE_ID,
+    CONF_EVENT_DATA,
+    CONF_PLATFORM,
+    MATCH_ALL,
+)
 from homeassistant.core import CALLBACK_TYPE, Event, HassJob, HomeAssistant, callback
 from homeassistant.helpers import config_validation as cv, template
 from homeassistant.helpers.typing import ConfigType
@@ -24,6 +29,12 @@ TRIGGER_SCHEMA = cv.TRIGGER_BASE_SCHEMA.extend(
 )
 
 
+@callback
+def _device_id_event_key(event: Event) -> Any:
+    """Return the device_id of an event, the key of device event listeners."""
+    return event.data.get(ATTR_DEVICE_ID)
+
+
 def _schema_value(value: Any) -> Any:
     if isinstance(value, list):
         return vol.In(value)
@@ -52,10 +63,10 @@ async def async_attach_trigger(
     removes = []
 
     event_data_schema = None
+    event_data = {}
     if CONF_EVENT_DATA in config:
         # Render the schema input
         template.attach(hass, config[CONF_EVENT_DATA])
-        event_data = {}
         event_data.update(
             template.render_complex(config[CONF_EVENT_DATA], variables, limited=True)
         )
@@ -111,9 +122,23 @@ async def async_attach_trigger(
             event.context,
         )
 
-    removes = [
-        hass.bus.async_listen(event_type, handle_event) for event_type in event_types
-    ]
+    device_id = event_data.get(ATTR_DEVICE_ID)
+    if isinstance(device_id, str):
+        # Device triggers listen for the events of a device, which the
+        # event bus can route by device_id
+        removes = [
+            hass.bus.async_listen_keyed(
+                event_type, _device_id_event_key, [device_id], handle_event
+            )
+            if event_type != MATCH_ALL
+            else hass.bus.async_listen(event_type, handle_event)
+            for event_type in event_types
+        ]
+    else:
+        removes = [
+            hass.bus.async_listen(event_type, handle_event)
+            for event_type in event_types
+        ]
 
     @callback
     def remove_listen_events() -> None:
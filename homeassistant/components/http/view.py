@@ -3,7 +3,6 @@ from __future__ import annotations
 
 import asyncio
 from collections.abc import Awaitable, Callable
-import json
 import logging
 from typing import Any
 
@@ -20,7 +19,7 @@ import voluptuous as vol
 from homeassistant import exceptions
 from homeassistant.const import CONTENT_TYPE_JSON, HTTP_OK, HTTP_SERVICE_UNAVAILABLE
 from homeassistant.core import Context, is_callback
-from homeassistant.helpers.json import JSONEncoder
+from homeassistant.helpers.json import json_bytes
 
 from .const import KEY_AUTHENTICATED, KEY_HASS
 
@@ -53,7 +52,7 @@ class HomeAssistantView:
     ) -> web.Response:
         """Return a JSON response."""
         try:
-            msg = json.dumps(result, cls=JSONEncoder, allow_nan=False).encode("UTF-8")
+            msg = json_bytes(result)
         except (ValueError, TypeError) as err:
             _LOGGER.error("Unable to serialize to JSON: %s\n%s", err, result)
             raise HTTPInternalServerError from err
@@ -66,6 +65,22 @@ class HomeAssistantView:
         response.enable_compression()
         return response
 
+    @staticmethod
+    def json_serialized(
+        body: str,
+        status_code: int = HTTP_OK,
+        headers: LooseHeaders | None = None,
+    ) -> web.Response:
+        """Return a response of JSON that was serialized beforehand."""
+        response = web.Response(
+            body=body.encode("UTF-8"),
+            content_type=CONTENT_TYPE_JSON,
+            status=status_code,
+            headers=headers,
+        )
+        response.enable_compression()
+        return response
+
     def json_message(
         self,
         message: str,
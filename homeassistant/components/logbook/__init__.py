@@ -1,9 +1,13 @@
 """Event parser and human readable log generator."""
+from __future__ import annotations
+
 from contextlib import suppress
-from datetime import timedelta
+from datetime import datetime, timedelta
+import heapq
 from itertools import groupby
 import json
 import re
+from typing import NamedTuple
 
 import sqlalchemy
 from sqlalchemy.orm import aliased
@@ -13,9 +17,12 @@ import voluptuous as vol
 from homeassistant.components.automation import EVENT_AUTOMATION_TRIGGERED
 from homeassistant.components.history import sqlalchemy_filter_from_include_exclude_conf
 from homeassistant.components.http import HomeAssistantView
+from homeassistant.components.recorder.const import DATA_INSTANCE
 from homeassistant.components.recorder.models import (
     Events,
+    StateAttributes,
     States,
+    process_timestamp,
     process_timestamp_to_utc_isoformat,
 )
 from homeassistant.components.recorder.util import session_scope
@@ -81,11 +88,6 @@ ALL_EVENT_TYPES_EXCEPT_STATE_CHANGED = [
     *HOMEASSISTANT_EVENTS,
 ]
 
-ALL_EVENT_TYPES = [
-    EVENT_STATE_CHANGED,
-    *ALL_EVENT_TYPES_EXCEPT_STATE_CHANGED,
-]
-
 EVENT_COLUMNS = [
     Events.event_type,
     Events.event_data,
@@ -95,8 +97,36 @@ EVENT_COLUMNS = [
     Events.context_parent_id,
 ]
 
+# State changes are only stored in the states table, these
+# columns make a states row look like a state_changed event
+STATE_EVENT_COLUMNS = [
+    literal(value=EVENT_STATE_CHANGED, type_=sqlalchemy.String).label("event_type"),
+    literal(value=EMPTY_JSON_OBJECT, type_=sqlalchemy.Text).label("event_data"),
+    States.last_updated.label("time_fired"),
+    States.context_id.label("context_id"),
+    States.context_user_id.label("context_user_id"),
+    States.context_parent_id.label("context_parent_id"),
+]
+
 SCRIPT_AUTOMATION_EVENTS = [EVENT_AUTOMATION_TRIGGERED, EVENT_SCRIPT_STARTED]
 
+
+class ArchivedStateRow(NamedTuple):
+    """An archived state change with the columns of the logbook query."""
+
+    event_type: str
+    event_data: str
+    time_fired: datetime
+    context_id: str | None
+    context_user_id: str | None
+    context_parent_id: str | None
+    state: str | None
+    entity_id: str
+    domain: str
+    attributes: str | None
+    shared_attrs: str | None
+
+
 LOG_MESSAGE_SCHEMA = vol.Schema(
     {
         vol.Required(ATTR_NAME): cv.string,
@@ -429,9 +459,9 @@ def _get_events(
     entity_attr_cache = EntityAttributeCache(hass)
     context_lookup = {None: None}
 
-    def yield_events(query):
+    def yield_events(rows):
         """Yield Events that are not filtered away."""
-        for row in query.yield_per(1000):
+        for row in rows:
             event = LazyEventPartialState(row)
             context_lookup.setdefault(event.context_id, event)
             if event.event_type == EVENT_CALL_SERVICE:
@@ -447,54 +477,97 @@ def _get_events(
     with session_scope(hass=hass) as session:
         old_state = aliased(States, name="old_state")
 
+        query = _generate_events_query_without_states(session)
+        query = _apply_event_time_filter(query, start_day, end_day)
+        query = _apply_event_types_filter(
+            hass, query, ALL_EVENT_TYPES_EXCEPT_STATE_CHANGED
+        )
+        states_query = _generate_states_query(session, start_day, end_day, old_state)
+
         if entity_ids is not None:
-            query = _generate_events_query_without_states(session)
-            query = _apply_event_time_filter(query, start_day, end_day)
-            query = _apply_event_types_filter(
-                hass, query, ALL_EVENT_TYPES_EXCEPT_STATE_CHANGED
-            )
             if entity_matches_only:
                 # When entity_matches_only is provided, contexts and events that do not
                 # contain the entity_ids are not included in the logbook response.
                 query = _apply_event_entity_id_matchers(query, entity_ids)
+            states_query = states_query.filter(States.entity_id.in_(entity_ids))
+        elif filters:
+            states_query = states_query.filter(filters.entity_filter())
 
-            query = query.union_all(
-                _generate_states_query(
-                    session, start_day, end_day, old_state, entity_ids
-                )
-            )
-        else:
-            query = _generate_events_query(session)
-            query = _apply_event_time_filter(query, start_day, end_day)
-            query = _apply_events_types_and_states_filter(
-                hass, query, old_state
-            ).filter(
-                (States.last_updated == States.last_changed)
-                | (Events.event_type != EVENT_STATE_CHANGED)
-            )
-            if filters:
-                query = query.filter(
-                    filters.entity_filter() | (Events.event_type != EVENT_STATE_CHANGED)
-                )
+        if context_id is not None:
+            query = query.filter(Events.context_id == context_id)
+            states_query = states_query.filter(States.context_id == context_id)
 
-            if context_id is not None:
-                query = query.filter(Events.context_id == context_id)
+        query = query.union_all(states_query).order_by(Events.time_fired)
+        rows = query.yield_per(1000)
 
-        query = query.order_by(Events.time_fired)
+        if context_id is None and (
+            archived_rows := _get_archived_state_rows(
+                hass, start_day, end_day, entity_ids, filters
+            )
+        ):
+            rows = heapq.merge(
+                archived_rows, rows, key=lambda row: process_timestamp(row.time_fired)
+            )
 
         return list(
-            humanify(hass, yield_events(query), entity_attr_cache, context_lookup)
+            humanify(hass, yield_events(rows), entity_attr_cache, context_lookup)
         )
 
 
-def _generate_events_query(session):
-    return session.query(
-        *EVENT_COLUMNS,
-        States.state,
-        States.entity_id,
-        States.domain,
-        States.attributes,
-    )
+def _get_archived_state_rows(hass, start_day, end_day, entity_ids, filters):
+    """Return the state changes moved to the archive by the purge.
+
+    The state changes are selected like the states query does and
+    returned as rows of the logbook query, sorted by time_fired.
+    """
+    instance = hass.data.get(DATA_INSTANCE)
+    if instance is None or instance.archive is None:
+        return []
+    archive = instance.archive
+
+    if entity_ids is None:
+        entity_ids = [
+            entity_id
+            for entity_id in archive.entity_ids()
+            if not filters or filters.matches(entity_id)
+        ]
+
+    rows = []
+    for entity_id, group in groupby(
+        archive.states_during_period(start_day, end_day, entity_ids),
+        lambda row: row.entity_id,
+    ):
+        old_state = archive.state_before(start_day, entity_id)
+        for row in group:
+            if (
+                row.last_changed == row.last_updated
+                and old_state is not None
+                and row.state is not None
+                and row.state != old_state.state
+                and (
+                    row.domain not in CONTINUOUS_DOMAINS
+                    or UNIT_OF_MEASUREMENT_JSON
+                    not in (row.shared_attrs or row.attributes or "")
+                )
+            ):
+                rows.append(
+                    ArchivedStateRow(
+                        EVENT_STATE_CHANGED,
+                        EMPTY_JSON_OBJECT,
+                        row.last_updated,
+                        None,
+                        None,
+                        None,
+                        row.state,
+                        row.entity_id,
+                        row.domain,
+                        row.attributes,
+                        row.shared_attrs,
+                    )
+                )
+            old_state = row
+    rows.sort(key=lambda row: row.time_fired)
+    return rows
 
 
 def _generate_events_query_without_states(session):
@@ -504,37 +577,29 @@ def _generate_events_query_without_states(session):
         literal(value=None, type_=sqlalchemy.String).label("entity_id"),
         literal(value=None, type_=sqlalchemy.String).label("domain"),
         literal(value=None, type_=sqlalchemy.Text).label("attributes"),
+        literal(value=None, type_=sqlalchemy.Text).label("shared_attrs"),
     )
 
 
-def _generate_states_query(session, start_day, end_day, old_state, entity_ids):
+def _generate_states_query(session, start_day, end_day, old_state):
     return (
-        _generate_events_query(session)
-        .outerjoin(Events, (States.event_id == Events.event_id))
+        session.query(
+            *STATE_EVENT_COLUMNS,
+            States.state,
+            States.entity_id,
+            States.domain,
+            States.attributes,
+            StateAttributes.shared_attrs,
+        )
         .outerjoin(old_state, (States.old_state_id == old_state.state_id))
+        .outerjoin(
+            StateAttributes, (States.attributes_id == StateAttributes.attributes_id)
+        )
         .filter(_missing_state_matcher(old_state))
         .filter(_continuous_entity_matcher())
         .filter((States.last_updated > start_day) & (States.last_updated < end_day))
-        .filter(
-            (States.last_updated == States.last_changed)
-            & States.entity_id.in_(entity_ids)
-        )
-    )
-
-
-def _apply_events_types_and_states_filter(hass, query, old_state):
-    events_query = (
-        query.outerjoin(States, (Events.event_id == States.event_id))
-        .outerjoin(old_state, (States.old_state_id == old_state.state_id))
-        .filter(
-            (Events.event_type != EVENT_STATE_CHANGED)
-            | _missing_state_matcher(old_state)
-        )
-        .filter(
-            (Events.event_type != EVENT_STATE_CHANGED) | _continuous_entity_matcher()
-        )
+        .filter(States.last_updated == States.last_changed)
     )
-    return _apply_event_types_filter(hass, events_query, ALL_EVENT_TYPES)
 
 
 def _missing_state_matcher(old_state):
@@ -555,7 +620,11 @@ def _continuous_entity_matcher():
     #
     return sqlalchemy.or_(
         sqlalchemy.not_(States.domain.in_(CONTINUOUS_DOMAINS)),
-        sqlalchemy.not_(States.attributes.contains(UNIT_OF_MEASUREMENT_JSON)),
+        sqlalchemy.not_(
+            sqlalchemy.func.coalesce(
+                StateAttributes.shared_attrs, States.attributes
+            ).contains(UNIT_OF_MEASUREMENT_JSON)
+        ),
     )
 
 
@@ -715,7 +784,9 @@ class LazyEventPartialState:
         if self._attributes:
             return self._attributes.get(ATTR_ICON)
 
-        result = ICON_JSON_EXTRACT.search(self._row.attributes)
+        result = ICON_JSON_EXTRACT.search(
+            self._row.shared_attrs or self._row.attributes
+        )
         return result and result.group(1)
 
     @property
@@ -740,13 +811,11 @@ class LazyEventPartialState:
     def attributes(self):
         """State attributes."""
         if not self._attributes:
-            if (
-                self._row.attributes is None
-                or self._row.attributes == EMPTY_JSON_OBJECT
-            ):
+            source = self._row.shared_attrs or self._row.attributes
+            if source is None or source == EMPTY_JSON_OBJECT:
                 self._attributes = {}
             else:
-                self._attributes = json.loads(self._row.attributes)
+                self._attributes = json.loads(source)
         return self._attributes
 
     @property
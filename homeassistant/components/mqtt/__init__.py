@@ -2,11 +2,10 @@
 from __future__ import annotations
 
 import asyncio
-from functools import lru_cache, partial, wraps
+from collections import deque
+from functools import partial, wraps
 import inspect
-from itertools import groupby
 import logging
-from operator import attrgetter
 import ssl
 import time
 from typing import Any, Awaitable, Callable, Union, cast
@@ -75,12 +74,14 @@ from .const import (
 from .discovery import LAST_DISCOVERY
 from .models import (
     AsyncMessageCallbackType,
+    InboundMetrics,
     MessageCallbackType,
     PublishMessage,
     PublishPayloadType,
     ReceiveMessage,
     ReceivePayloadType,
 )
+from .router import TopicRouter
 from .util import _VALID_QOS_SCHEMA, valid_publish_topic, valid_subscribe_topic
 
 _LOGGER = logging.getLogger(__name__)
@@ -118,6 +119,8 @@ CONNECTION_FAILED_RECOVERABLE = "connection_failed_recoverable"
 
 DISCOVERY_COOLDOWN = 2
 TIMEOUT_ACK = 10
+# Topics per SUBSCRIBE or UNSUBSCRIBE packet, to stay within broker limits
+MAX_TOPICS_PER_PACKET = 500
 
 PLATFORMS = [
     "alarm_control_panel",
@@ -417,6 +420,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     websocket_api.async_register_command(hass, websocket_subscribe)
     websocket_api.async_register_command(hass, websocket_remove_device)
     websocket_api.async_register_command(hass, websocket_mqtt_info)
+    websocket_api.async_register_command(hass, websocket_inbound_metrics)
 
     if conf is None:
         # If we have a config entry, setup is done by that config entry.
@@ -551,12 +555,11 @@ async def async_setup_entry(hass, entry):
     return True
 
 
-@attr.s(slots=True, frozen=True)
+@attr.s(slots=True, frozen=True, eq=False)
 class Subscription:
     """Class to hold data about an active subscription."""
 
     topic: str = attr.ib()
-    matcher: Any = attr.ib()
     job: HassJob = attr.ib()
     qos: int = attr.ib(default=0)
     encoding: str | None = attr.ib(default="utf-8")
@@ -579,12 +582,23 @@ class MQTT:
         self.hass = hass
         self.config_entry = config_entry
         self.conf = conf
-        self.subscriptions: list[Subscription] = []
+        self.subscriptions: TopicRouter[Subscription] = TopicRouter()
         self.connected = False
         self._ha_started = asyncio.Event()
         self._last_subscribe = time.time()
         self._mqttc: mqtt.Client = None
         self._paho_lock = asyncio.Lock()
+        # The topics subscribed to at the broker
+        self._subscribed: set[str] = set()
+        # Topics whose subscription at the broker needs to be updated
+        self._pending_topics: set[str] = set()
+        self._subscribe_task: asyncio.Task | None = None
+        # Resolved once the broker acknowledged the next update of subscriptions
+        self._pending_flush: asyncio.Future[None] | None = None
+        # Messages received by the network thread with their receive time
+        self._inbound: deque[tuple[Any, float]] = deque()
+        self._inbound_scheduled = False
+        self.inbound_metrics = InboundMetrics()
 
         self._pending_operations: dict[str, asyncio.Event] = {}
 
@@ -750,64 +764,167 @@ class MQTT:
     ) -> Callable[[], None]:
         """Set up a subscription to a topic with the provided qos.
 
+        Returns once the broker acknowledged the subscription.
+
         This method is a coroutine.
         """
         if not isinstance(topic, str):
             raise HomeAssistantError("Topic needs to be a string!")
 
-        subscription = Subscription(
-            topic, _matcher_for_topic(topic), HassJob(msg_callback), qos, encoding
-        )
-        self.subscriptions.append(subscription)
-        self._matching_subscriptions.cache_clear()
+        subscription = Subscription(topic, HassJob(msg_callback), qos, encoding)
+        self.subscriptions.add(topic, subscription)
 
         # Only subscribe if currently connected.
         if self.connected:
             self._last_subscribe = time.time()
-            await self._async_perform_subscription(topic, qos)
+            await self._async_wait_for_subscription_update(topic)
 
         @callback
         def async_remove() -> None:
             """Remove subscription."""
-            if subscription not in self.subscriptions:
-                raise HomeAssistantError("Can't remove subscription twice")
-            self.subscriptions.remove(subscription)
-            self._matching_subscriptions.cache_clear()
+            try:
+                remaining = self.subscriptions.remove(topic, subscription)
+            except KeyError as err:
+                raise HomeAssistantError("Can't remove subscription twice") from err
 
-            if any(other.topic == topic for other in self.subscriptions):
+            if remaining:
                 # Other subscriptions on topic remaining - don't unsubscribe.
                 return
 
             # Only unsubscribe if currently connected.
             if self.connected:
-                self.hass.async_create_task(self._async_unsubscribe(topic))
+                self._async_queue_subscription_update(topic)
 
         return async_remove
 
-    async def _async_unsubscribe(self, topic: str) -> None:
-        """Unsubscribe from a topic.
+    @callback
+    def _async_queue_subscription_update(self, topic: str) -> None:
+        """Queue updating the subscription of a topic at the broker.
 
-        This method is a coroutine.
+        Topics queued in the same iteration of the event loop, or while the
+        broker has not acknowledged the previous update yet, are sent
+        together, so subscriptions made together, like the ones of discovered
+        entities, share packets without delaying a lone subscription.
         """
-        async with self._paho_lock:
-            result: int | None = None
-            result, mid = await self.hass.async_add_executor_job(
-                self._mqttc.unsubscribe, topic
+        self._pending_topics.add(topic)
+        if self._subscribe_task is None:
+            self._subscribe_task = self.hass.async_create_task(
+                self._async_flush_subscriptions()
             )
-            _LOGGER.debug("Unsubscribing from %s, mid: %s", topic, mid)
-            _raise_on_error(result)
-        await self._wait_for_mid(mid)
 
-    async def _async_perform_subscription(self, topic: str, qos: int) -> None:
-        """Perform a paho-mqtt subscription."""
-        async with self._paho_lock:
-            result: int | None = None
-            result, mid = await self.hass.async_add_executor_job(
-                self._mqttc.subscribe, topic, qos
-            )
-            _LOGGER.debug("Subscribing to %s, mid: %s", topic, mid)
-            _raise_on_error(result)
-        await self._wait_for_mid(mid)
+    async def _async_wait_for_subscription_update(self, topic: str) -> None:
+        """Queue updating the subscription of a topic and wait for the broker.
+
+        Raises the error of the client when the update failed.
+        """
+        self._async_queue_subscription_update(topic)
+        if self._pending_flush is None:
+            self._pending_flush = self.hass.loop.create_future()
+        # Shielded, a cancelled caller must not cancel the other waiters
+        await asyncio.shield(self._pending_flush)
+
+    async def _async_flush_subscriptions(self) -> None:
+        """Update the queued subscriptions until none are left."""
+        try:
+            # Let the subscriptions of this iteration of the loop join
+            await asyncio.sleep(0)
+            while self._pending_topics:
+                await self._async_update_subscriptions()
+        except Exception:  # pylint: disable=broad-except
+            # The topics stay queued for the next update
+            _LOGGER.exception("Unable to update subscriptions")
+        finally:
+            self._subscribe_task = None
+
+    async def _async_resubscribe(self) -> None:
+        """Subscribe to all topics again after connecting."""
+        self._subscribed.clear()
+        self._pending_topics.update(
+            topic for topic, _ in self.subscriptions.topic_filters()
+        )
+        await self._async_update_subscriptions()
+
+    async def _async_update_subscriptions(self) -> None:
+        """Bring the subscriptions at the broker in line with the queued topics.
+
+        Topics are subscribed with the highest qos of their subscriptions and
+        unsubscribed when they have none left, with as few packets as possible.
+        The callers waiting for the update are resolved once the broker
+        acknowledged it, or get the error of the client.
+        """
+        mids: list[int] = []
+        error: HomeAssistantError | None = None
+        flush: asyncio.Future[None] | None = None
+        # The topics not sent to the broker yet, queued again on failure
+        unsent: set[str] = set()
+        try:
+            async with self._paho_lock:
+                topics, self._pending_topics = self._pending_topics, set()
+                flush, self._pending_flush = self._pending_flush, None
+                if not self.connected:
+                    # All topics are subscribed again when connecting
+                    topics = set()
+
+                subscribe: list[tuple[str, int]] = []
+                unsubscribe: list[str] = []
+                for topic in sorted(topics):
+                    if subscriptions := self.subscriptions.get(topic):
+                        # Subscribing again makes the broker resend retained messages
+                        qos = max(subscription.qos for subscription in subscriptions)
+                        subscribe.append((topic, qos))
+                    elif topic in self._subscribed:
+                        unsubscribe.append(topic)
+                unsent.update(topic for topic, _ in subscribe)
+                unsent.update(unsubscribe)
+
+                for idx in range(0, len(subscribe), MAX_TOPICS_PER_PACKET):
+                    chunk = subscribe[idx : idx + MAX_TOPICS_PER_PACKET]
+                    result, mid = await self.hass.async_add_executor_job(
+                        self._mqttc.subscribe, chunk
+                    )
+                    unsent.difference_update(topic for topic, _ in chunk)
+                    _LOGGER.debug("Subscribing to %s, mid: %s", chunk, mid)
+                    try:
+                        _raise_on_error(result)
+                    except HomeAssistantError as err:
+                        error = err
+                        continue
+                    self._subscribed.update(topic for topic, _ in chunk)
+                    mids.append(mid)
+
+                for idx in range(0, len(unsubscribe), MAX_TOPICS_PER_PACKET):
+                    topic_chunk = unsubscribe[idx : idx + MAX_TOPICS_PER_PACKET]
+                    result, mid = await self.hass.async_add_executor_job(
+                        self._mqttc.unsubscribe, topic_chunk
+                    )
+                    unsent.difference_update(topic_chunk)
+                    _LOGGER.debug("Unsubscribing from %s, mid: %s", topic_chunk, mid)
+                    try:
+                        _raise_on_error(result)
+                    except HomeAssistantError as err:
+                        error = err
+                        continue
+                    self._subscribed.difference_update(topic_chunk)
+                    mids.append(mid)
+
+            await asyncio.gather(*(self._wait_for_mid(mid) for mid in mids))
+
+            if flush is None:
+                if error is not None:
+                    _LOGGER.error("Unable to update subscriptions: %s", error)
+            elif error is None:
+                flush.set_result(None)
+            else:
+                flush.set_exception(error)
+        finally:
+            if unsent:
+                # Updated with the next subscription or when connecting again
+                self._pending_topics.update(unsent)
+            if flush is not None and not flush.done():
+                # Raised or cancelled before the broker answered
+                flush.set_exception(
+                    error or HomeAssistantError("Unable to update subscriptions")
+                )
 
     def _mqtt_on_connect(self, _mqttc, _userdata, _flags, result_code: int) -> None:
         """On connect callback.
@@ -834,12 +951,8 @@ class MQTT:
             result_code,
         )
 
-        # Group subscriptions to only re-subscribe once for each topic.
-        keyfunc = attrgetter("topic")
-        for topic, subs in groupby(sorted(self.subscriptions, key=keyfunc), keyfunc):
-            # Re-subscribe with the highest requested qos
-            max_qos = max(subscription.qos for subscription in subs)
-            self.hass.add_job(self._async_perform_subscription, topic, max_qos)
+        # Re-subscribe to all topics in a few packets
+        self.hass.add_job(self._async_resubscribe)
 
         if (
             CONF_BIRTH_MESSAGE in self.conf
@@ -862,16 +975,41 @@ class MQTT:
             )
 
     def _mqtt_on_message(self, _mqttc, _userdata, msg) -> None:
-        """Message received callback."""
-        self.hass.add_job(self._mqtt_handle_message, msg)
+        """Message received callback.
 
-    @lru_cache(2048)
-    def _matching_subscriptions(self, topic):
-        subscriptions = []
-        for subscription in self.subscriptions:
-            if subscription.matcher(topic):
-                subscriptions.append(subscription)
-        return subscriptions
+        Messages are buffered and the event loop is only woken up when it is
+        not already scheduled to dispatch them, so a burst of messages, like
+        the retained ones after subscribing, is dispatched in one go.
+        """
+        self._inbound.append((msg, time.monotonic()))
+        if not self._inbound_scheduled:
+            self._inbound_scheduled = True
+            self.hass.loop.call_soon_threadsafe(self._mqtt_handle_inbound)
+
+    @callback
+    def _mqtt_handle_inbound(self) -> None:
+        """Dispatch the messages buffered by the network thread."""
+        # Cleared first, so messages appended while dispatching schedule a
+        # new wakeup instead of waiting for the next message.
+        self._inbound_scheduled = False
+        inbound = self._inbound
+        metrics = self.inbound_metrics
+        pending = len(inbound)
+        metrics.batches += 1
+        metrics.messages += pending
+        metrics.queue_depth_max = max(metrics.queue_depth_max, pending)
+
+        for _ in range(pending):
+            msg, received = inbound.popleft()
+            latency = time.monotonic() - received
+            metrics.dispatch_latency_total += latency
+            if latency > metrics.dispatch_latency_max:
+                metrics.dispatch_latency_max = latency
+            # A failing subscriber must not hold up the rest of the batch
+            try:
+                self._mqtt_handle_message(msg)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Error while dispatching message on %s", msg.topic)
 
     @callback
     def _mqtt_handle_message(self, msg) -> None:
@@ -883,15 +1021,24 @@ class MQTT:
         )
         timestamp = dt_util.utcnow()
 
-        subscriptions = self._matching_subscriptions(msg.topic)
+        subscriptions = self.subscriptions.match(msg.topic)
+        # The payload decoded once for each encoding, None if decoding failed
+        decoded: dict[str, SubscribePayloadType | None] = {}
 
         for subscription in subscriptions:
 
             payload: SubscribePayloadType = msg.payload
-            if subscription.encoding is not None:
-                try:
-                    payload = msg.payload.decode(subscription.encoding)
-                except (AttributeError, UnicodeDecodeError):
+            if (encoding := subscription.encoding) is not None:
+                decoded_payload: SubscribePayloadType | None
+                if encoding in decoded:
+                    decoded_payload = decoded[encoding]
+                else:
+                    try:
+                        decoded_payload = msg.payload.decode(encoding)
+                    except (AttributeError, UnicodeDecodeError):
+                        decoded_payload = None
+                    decoded[encoding] = decoded_payload
+                if decoded_payload is None:
                     _LOGGER.warning(
                         "Can't decode payload %s on %s with encoding %s (for %s)",
                         msg.payload[0:8192],
@@ -900,6 +1047,7 @@ class MQTT:
                         subscription.job,
                     )
                     continue
+                payload = decoded_payload
 
             self.hass.async_run_hass_job(
                 subscription.job,
@@ -983,16 +1131,6 @@ def _raise_on_error(result_code: int | None) -> None:
         )
 
 
-def _matcher_for_topic(subscription: str) -> Any:
-    # pylint: disable=import-outside-toplevel
-    from paho.mqtt.matcher import MQTTMatcher
-
-    matcher = MQTTMatcher()
-    matcher[subscription] = True
-
-    return lambda topic: next(matcher.iter_match(topic), False)
-
-
 @websocket_api.websocket_command(
     {vol.Required("type"): "mqtt/device/debug_info", vol.Required("device_id"): str}
 )
@@ -1005,6 +1143,18 @@ async def websocket_mqtt_info(hass, connection, msg):
     connection.send_result(msg["id"], mqtt_info)
 
 
+@websocket_api.websocket_command({vol.Required("type"): "mqtt/inbound_metrics"})
+@callback
+def websocket_inbound_metrics(hass, connection, msg):
+    """Get the metrics of the messages received from the broker."""
+    metrics = hass.data[DATA_MQTT].inbound_metrics
+    result = attr.asdict(metrics)
+    result["dispatch_latency_avg"] = (
+        metrics.dispatch_latency_total / metrics.messages if metrics.messages else 0.0
+    )
+    connection.send_result(msg["id"], result)
+
+
 @websocket_api.websocket_command(
     {vol.Required("type"): "mqtt/device/remove", vol.Required("device_id"): str}
 )
@@ -263,6 +263,13 @@ async def async_start(  # noqa: C901
 
     hass.data[INTEGRATION_UNSUBSCRIBE] = {}
 
+    async def async_subscribe_integration_topic(key, topic, msg_callback):
+        """Subscribe to a discovery topic of an integration."""
+        hass.data[INTEGRATION_UNSUBSCRIBE][key] = await mqtt.async_subscribe(
+            hass, topic, msg_callback, 0
+        )
+
+    subscribes = []
     for (integration, topics) in mqtt_integrations.items():
 
         async def async_integration_message_received(integration, msg):
@@ -299,14 +306,17 @@ async def async_start(  # noqa: C901
                     unsub()
 
         for topic in topics:
-            key = f"{integration}_{topic}"
-            hass.data[INTEGRATION_UNSUBSCRIBE][key] = await mqtt.async_subscribe(
-                hass,
-                topic,
-                functools.partial(async_integration_message_received, integration),
-                0,
+            subscribes.append(
+                async_subscribe_integration_topic(
+                    f"{integration}_{topic}",
+                    topic,
+                    functools.partial(async_integration_message_received, integration),
+                )
             )
 
+    # Subscribe together, so the topics share a SUBSCRIBE packet
+    await asyncio.gather(*subscribes)
+
 
 async def async_stop(hass: HomeAssistant) -> None:
     """Stop MQTT Discovery."""
@@ -593,6 +593,7 @@ class MqttEntity(
         await self.availability_discovery_update(config)
         await self.device_info_discovery_update(config)
         await self._subscribe_topics()
+        self.async_invalidate_static_attributes()
         self.async_write_ha_state()
 
     async def async_will_remove_from_hass(self):
@@ -32,5 +32,17 @@ class ReceiveMessage:
     timestamp: dt.datetime = attr.ib(default=None)
 
 
+@attr.s(slots=True)
+class InboundMetrics:
+    """Metrics of the messages received from the broker."""
+
+    messages: int = attr.ib(default=0)
+    batches: int = attr.ib(default=0)
+    queue_depth_max: int = attr.ib(default=0)
+    # Seconds between receiving a message and dispatching it
+    dispatch_latency_max: float = attr.ib(default=0.0)
+    dispatch_latency_total: float = attr.ib(default=0.0)
+
+
 AsyncMessageCallbackType = Callable[[ReceiveMessage], Awaitable[None]]
 MessageCallbackType = Callable[[ReceiveMessage], None]
@@ -0,0 +1,141 @@
+"""Route MQTT topics to the subscriptions with a matching topic filter."""
+from __future__ import annotations
+
+from collections.abc import Iterator
+from itertools import count
+from operator import itemgetter
+from typing import Generic, TypeVar
+
+_T = TypeVar("_T")
+
+WILDCARD_SINGLE_LEVEL = "+"
+WILDCARD_MULTI_LEVEL = "#"
+
+
+class _Node(Generic[_T]):
+    """A level of the topic filters in the trie."""
+
+    __slots__ = ("children", "items")
+
+    def __init__(self) -> None:
+        """Initialize the node."""
+        self.children: dict[str, _Node[_T]] = {}
+        # The items of the topic filter ending at this node with their sequence
+        self.items: dict[_T, int] = {}
+
+
+class TopicRouter(Generic[_T]):
+    """Trie of topic filters, matches topics like paho's MQTTMatcher.
+
+    Adding and removing a topic filter only touches the nodes of its levels,
+    and matching a topic only visits the nodes that can match it, so neither
+    depends on the number of subscriptions.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the router."""
+        self._root: _Node[_T] = _Node()
+        self._sequence = count()
+
+    def add(self, topic_filter: str, item: _T) -> None:
+        """Add an item for a topic filter."""
+        node = self._root
+        for level in topic_filter.split("/"):
+            if (child := node.children.get(level)) is None:
+                child = node.children[level] = _Node()
+            node = child
+        node.items[item] = next(self._sequence)
+
+    def remove(self, topic_filter: str, item: _T) -> bool:
+        """Remove an item of a topic filter.
+
+        Return if other items of the topic filter remain. Raise KeyError
+        when the item was not added for the topic filter.
+        """
+        path = [self._root]
+        for level in topic_filter.split("/"):
+            if (child := path[-1].children.get(level)) is None:
+                raise KeyError(item)
+            path.append(child)
+
+        node = path[-1]
+        del node.items[item]
+        if node.items:
+            return True
+
+        # Prune the levels that no longer lead to a topic filter
+        for level, parent in zip(
+            reversed(topic_filter.split("/")), reversed(path[:-1])
+        ):
+            if node.items or node.children:
+                break
+            del parent.children[level]
+            node = parent
+        return False
+
+    def __contains__(self, topic_filter: str) -> bool:
+        """Return if a topic filter has items."""
+        return bool(self.get(topic_filter))
+
+    def get(self, topic_filter: str) -> list[_T]:
+        """Return the items of a topic filter."""
+        node = self._root
+        for level in topic_filter.split("/"):
+            if (child := node.children.get(level)) is None:
+                return []
+            node = child
+        return list(node.items)
+
+    def topic_filters(self) -> Iterator[tuple[str, list[_T]]]:
+        """Iterate over the topic filters and their items."""
+        stack: list[tuple[list[str], _Node[_T]]] = [([], self._root)]
+        while stack:
+            levels, node = stack.pop()
+            if node.items and levels:
+                yield "/".join(levels), list(node.items)
+            for level, child in node.children.items():
+                stack.append(([*levels, level], child))
+
+    def match(self, topic: str) -> list[_T]:
+        """Return the items of the topic filters matching a topic.
+
+        The items are returned in the order they were added.
+        """
+        levels = topic.split("/")
+        # Wildcards don't match the first level of topics starting with $
+        normal = not topic.startswith("$")
+        matches: list[dict[_T, int]] = []
+        last = len(levels)
+
+        def visit(node: _Node[_T], index: int) -> None:
+            """Collect the items of the topic filters below a node."""
+            children = node.children
+            if index == last:
+                if node.items:
+                    matches.append(node.items)
+            else:
+                if (child := children.get(levels[index])) is not None:
+                    visit(child, index + 1)
+                if (normal or index > 0) and (
+                    child := children.get(WILDCARD_SINGLE_LEVEL)
+                ) is not None:
+                    visit(child, index + 1)
+            if (normal or index > 0) and (
+                child := children.get(WILDCARD_MULTI_LEVEL)
+            ) is not None:
+                if child.items:
+                    matches.append(child.items)
+
+        visit(self._root, 0)
+
+        if not matches:
+            return []
+        if len(matches) == 1:
+            return list(matches[0])
+        return [
+            item
+            for item, _ in sorted(
+                (item for items in matches for item in items.items()),
+                key=itemgetter(1),
+            )
+        ]
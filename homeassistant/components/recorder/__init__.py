@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import asyncio
+from collections import OrderedDict, deque
 import concurrent.futures
 from datetime import datetime, timedelta
 import logging
@@ -11,7 +12,14 @@ import threading
 import time
 from typing import Any, Callable, NamedTuple
 
-from sqlalchemy import create_engine, event as sqlalchemy_event, exc, select
+from sqlalchemy import (
+    bindparam,
+    create_engine,
+    event as sqlalchemy_event,
+    exc,
+    select,
+    text,
+)
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import scoped_session, sessionmaker
 from sqlalchemy.pool import StaticPool
@@ -49,8 +57,23 @@ from homeassistant.loader import bind_hass
 import homeassistant.util.dt as dt_util
 
 from . import history, migration, purge, statistics
-from .const import CONF_DB_INTEGRITY_CHECK, DATA_INSTANCE, DOMAIN, SQLITE_URL_PREFIX
-from .models import Base, Events, RecorderRuns, States
+from .archive import StatesArchive
+from .const import (
+    CONF_DB_INTEGRITY_CHECK,
+    DATA_INSTANCE,
+    DOMAIN,
+    MAX_BIND_VARS_PER_INSERT,
+    SQLITE_URL_PREFIX,
+)
+from .models import (
+    Base,
+    Events,
+    RecorderRuns,
+    StateAttributes,
+    States,
+    Statistics,
+    StatisticsShortTerm,
+)
 from .pool import RecorderPool
 from .util import (
     dburl_to_path,
@@ -75,6 +98,9 @@ ATTR_APPLY_FILTER = "apply_filter"
 
 MAX_QUEUE_BACKLOG = 30000
 
+# The number of attribute ids to cache in memory
+STATE_ATTRIBUTES_ID_CACHE_SIZE = 2048
+
 SERVICE_PURGE_SCHEMA = vol.Schema(
     {
         vol.Optional(ATTR_KEEP_DAYS): cv.positive_int,
@@ -99,11 +125,17 @@ SERVICE_DISABLE_SCHEMA = vol.Schema({})
 
 DEFAULT_URL = "sqlite:///{hass_config_path}"
 DEFAULT_DB_FILE = "home-assistant_v2.db"
+DEFAULT_ARCHIVE_DIR = "home-assistant_v2_archive"
 DEFAULT_DB_INTEGRITY_CHECK = True
 DEFAULT_DB_MAX_RETRIES = 10
 DEFAULT_DB_RETRY_WAIT = 3
 DEFAULT_COMMIT_INTERVAL = 1
+DEFAULT_SHORT_TERM_STATISTICS_KEEP_DAYS = 10
 KEEPALIVE_TIME = 30
+# The hourly statistics are compiled at *:12
+STATISTICS_COMPILE_MINUTE = 12
+# The 5 minute statistics are compiled 10 seconds after the period
+SHORT_TERM_STATISTICS_COMPILE_SECOND = 10
 
 # Controls how often we clean up
 # States and Events objects
@@ -117,6 +149,9 @@ CONF_PURGE_KEEP_DAYS = "purge_keep_days"
 CONF_PURGE_INTERVAL = "purge_interval"
 CONF_EVENT_TYPES = "event_types"
 CONF_COMMIT_INTERVAL = "commit_interval"
+CONF_BULK_INSERT = "bulk_insert"
+CONF_ARCHIVE = "archive"
+CONF_SHORT_TERM_STATISTICS_KEEP_DAYS = "short_term_statistics_keep_days"
 
 INVALIDATED_ERR = "Database connection invalidated"
 CONNECTIVITY_ERR = "Error in database connectivity during commit"
@@ -145,6 +180,12 @@ CONFIG_SCHEMA = vol.Schema(
                     vol.Optional(
                         CONF_COMMIT_INTERVAL, default=DEFAULT_COMMIT_INTERVAL
                     ): cv.positive_int,
+                    vol.Optional(CONF_BULK_INSERT, default=False): cv.boolean,
+                    vol.Optional(CONF_ARCHIVE, default=False): cv.boolean,
+                    vol.Optional(
+                        CONF_SHORT_TERM_STATISTICS_KEEP_DAYS,
+                        default=DEFAULT_SHORT_TERM_STATISTICS_KEEP_DAYS,
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1)),
                     vol.Optional(
                         CONF_DB_MAX_RETRIES, default=DEFAULT_DB_MAX_RETRIES
                     ): cv.positive_int,
@@ -222,11 +263,14 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     auto_purge = conf[CONF_AUTO_PURGE]
     keep_days = conf[CONF_PURGE_KEEP_DAYS]
     commit_interval = conf[CONF_COMMIT_INTERVAL]
+    bulk_insert = conf[CONF_BULK_INSERT]
     db_max_retries = conf[CONF_DB_MAX_RETRIES]
     db_retry_wait = conf[CONF_DB_RETRY_WAIT]
     db_url = conf.get(CONF_DB_URL) or DEFAULT_URL.format(
         hass_config_path=hass.config.path(DEFAULT_DB_FILE)
     )
+    archive_path = hass.config.path(DEFAULT_ARCHIVE_DIR) if conf[CONF_ARCHIVE] else None
+    short_term_statistics_keep_days = conf[CONF_SHORT_TERM_STATISTICS_KEEP_DAYS]
     exclude = conf[CONF_EXCLUDE]
     exclude_t = exclude.get(CONF_EVENT_TYPES, [])
     instance = hass.data[DATA_INSTANCE] = Recorder(
@@ -239,6 +283,9 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         db_retry_wait=db_retry_wait,
         entity_filter=entity_filter,
         exclude_t=exclude_t,
+        bulk_insert=bulk_insert,
+        archive_path=archive_path,
+        short_term_statistics_keep_days=short_term_statistics_keep_days,
     )
     instance.async_initialize()
     instance.start()
@@ -253,6 +300,8 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
 async def _process_recorder_platform(hass, domain, platform):
     """Process a recorder platform."""
     hass.data[DOMAIN][domain] = platform
+    if hasattr(platform, "create_statistics_accumulator"):
+        hass.data[DATA_INSTANCE].async_add_statistics_platform(domain, platform)
 
 
 @callback
@@ -322,9 +371,23 @@ class PerodicCleanupTask:
 
 
 class StatisticsTask(NamedTuple):
-    """An object to insert into the recorder queue to run a statistics task."""
+    """An object to insert into the recorder queue to run a statistics task.
+
+    When job is set it holds the statistics compiled by the statistics
+    worker, which are saved by the task.
+    """
 
     start: datetime
+    job: concurrent.futures.Future | None = None
+    table: type[Statistics | StatisticsShortTerm] = Statistics
+
+
+class StatisticsPlatformTask(NamedTuple):
+    """An object to insert into the recorder queue to add the statistics accumulators of a platform."""
+
+    domain: str
+    accumulators: dict[type[Statistics | StatisticsShortTerm], Any]
+    created: datetime
 
 
 class WaitTask:
@@ -345,6 +408,9 @@ class Recorder(threading.Thread):
         db_retry_wait: int,
         entity_filter: Callable[[str], bool],
         exclude_t: list[str],
+        bulk_insert: bool = False,
+        archive_path: str | None = None,
+        short_term_statistics_keep_days: int = DEFAULT_SHORT_TERM_STATISTICS_KEEP_DAYS,
     ) -> None:
         """Initialize the recorder."""
         threading.Thread.__init__(self, name="Recorder")
@@ -353,6 +419,12 @@ class Recorder(threading.Thread):
         self.auto_purge = auto_purge
         self.keep_days = keep_days
         self.commit_interval = commit_interval
+        self.bulk_insert = bulk_insert
+        self.archive = StatesArchive(archive_path) if archive_path else None
+        self.short_term_statistics_keep_days = short_term_statistics_keep_days
+        self.statistics_accumulators = statistics.StatisticsAccumulators(
+            hass, entity_filter
+        )
         self.queue: Any = queue.SimpleQueue()
         self.recording_start = dt_util.utcnow()
         self.db_url = uri
@@ -371,7 +443,24 @@ class Recorder(threading.Thread):
         self._commits_without_expire = 0
         self._keepalive_count = 0
         self._old_states: dict[str, States] = {}
+        self._state_attributes_ids: OrderedDict[str, int] = OrderedDict()
+        self._pending_state_attributes: dict[str, StateAttributes] = {}
         self._pending_expunge: list[States] = []
+        # Used instead of the session objects above when bulk_insert is enabled
+        self._old_state_ids: dict[str, int] = {}
+        self._pending_event_rows: list[dict[str, Any]] = []
+        self._pending_state_rows: list[tuple[dict[str, Any], str]] = []
+        self._mysql_id_increment: int | None = None
+        # Statistics that can not be compiled from the accumulators are
+        # compiled one period at a time by the statistics worker
+        self._statistics_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="RecorderStatistics"
+        )
+        self._missed_statistics: deque[tuple[datetime, type]] = deque()
+        self._statistics_job: concurrent.futures.Future | None = None
+        self._statistics_job_table: type | None = None
+        self._statistics_worker_enabled = True
+        self._waiting_for_statistics = False
         self.event_session = None
         self.get_session = None
         self._completed_first_database_setup = None
@@ -461,10 +550,28 @@ class Recorder(threading.Thread):
 
     def do_adhoc_statistics(self, **kwargs):
         """Trigger an adhoc statistics run."""
+        table = (
+            StatisticsShortTerm
+            if kwargs.get("period") == statistics.PERIOD_5MINUTE
+            else Statistics
+        )
         start = kwargs.get("start")
         if not start:
-            start = statistics.get_start_time()
-        self.queue.put(StatisticsTask(start))
+            start = statistics.get_start_time(table)
+        self.queue.put(StatisticsTask(start, table=table))
+
+    @callback
+    def async_add_statistics_platform(self, domain, platform):
+        """Add the statistics accumulators of a recorder platform.
+
+        The accumulators start from the current states. The state changes
+        after that are queued behind them, so none are missed or fed twice.
+        """
+        created = dt_util.utcnow()
+        accumulators = self.statistics_accumulators.async_create_platform_accumulators(
+            platform
+        )
+        self.queue.put(StatisticsPlatformTask(domain, accumulators, created))
 
     @callback
     def async_register(self, shutdown_task, hass_started):
@@ -550,6 +657,12 @@ class Recorder(threading.Thread):
         start = statistics.get_start_time()
         self.queue.put(StatisticsTask(start))
 
+    @callback
+    def async_five_minute_statistics(self, now):
+        """Trigger the 5 minute statistics run."""
+        start = statistics.get_start_time(StatisticsShortTerm)
+        self.queue.put(StatisticsTask(start, table=StatisticsShortTerm))
+
     def _async_setup_periodic_tasks(self):
         """Prepare periodic tasks."""
         # Run nightly tasks at 4:12am
@@ -558,7 +671,17 @@ class Recorder(threading.Thread):
         )
         # Compile hourly statistics every hour at *:12
         async_track_time_change(
-            self.hass, self.async_hourly_statistics, minute=12, second=0
+            self.hass,
+            self.async_hourly_statistics,
+            minute=STATISTICS_COMPILE_MINUTE,
+            second=0,
+        )
+        # Compile short term statistics every 5 minutes
+        async_track_time_change(
+            self.hass,
+            self.async_five_minute_statistics,
+            minute="/5",
+            second=SHORT_TERM_STATISTICS_COMPILE_SECOND,
         )
 
     def run(self):
@@ -610,6 +733,7 @@ class Recorder(threading.Thread):
                 return
 
         _LOGGER.debug("Recorder processing the queue")
+        self._schedule_missed_statistics()
         self.hass.add_job(self._async_recorder_ready)
         self._run_event_loop()
 
@@ -700,6 +824,9 @@ class Recorder(threading.Thread):
 
     def _run_purge(self, purge_before, repack, apply_filter):
         """Purge the database."""
+        # Commit pending states first so the purge can see
+        # which state attributes are still in use
+        self._commit_event_session_or_retry()
         if purge.purge_old_data(self, purge_before, repack, apply_filter):
             # We always need to do the db cleanups after a purge
             # is finished to ensure the WAL checkpoint and other
@@ -711,17 +838,105 @@ class Recorder(threading.Thread):
 
     def _run_purge_entities(self, entity_filter):
         """Purge entities from the database."""
+        self._commit_event_session_or_retry()
         if purge.purge_entity_data(self, entity_filter):
             return
         # Schedule a new purge task if this one didn't finish
         self.queue.put(PurgeEntitiesTask(entity_filter))
 
-    def _run_statistics(self, start):
+    def _run_statistics(self, start, job, table):
         """Run statistics task."""
-        if statistics.compile_statistics(self, start):
+        if job is not None:
+            self._save_missed_statistics(start, job, table)
+            return
+        if self._statistics_pending(table) or not self.statistics_accumulators.covers(
+            start, table
+        ):
+            # Compiling from the recorded states can take a long time,
+            # it is done by the statistics worker to keep recording.
+            # Periods are compiled in order since a sum continues from
+            # the statistics of the previous period.
+            self.statistics_accumulators.discard(start + table.duration, table)
+            self._missed_statistics.append((start, table))
+            self._compile_next_missed_statistics()
+            return
+        if statistics.compile_statistics(self, start, table):
             return
         # Schedule a new statistics task if this one didn't finish
-        self.queue.put(StatisticsTask(start))
+        self.queue.put(StatisticsTask(start, table=table))
+
+    def _statistics_pending(self, table):
+        """Return True if the statistics worker has periods of the table to compile."""
+        return self._statistics_job_table is table or any(
+            pending_table is table for _, pending_table in self._missed_statistics
+        )
+
+    def _schedule_missed_statistics(self):
+        """Compile the statistics of the periods missed while not running."""
+        now = dt_util.utcnow()
+        for table, compiled in (
+            (Statistics, now.minute >= STATISTICS_COMPILE_MINUTE),
+            (
+                StatisticsShortTerm,
+                now.minute % 5 or now.second >= SHORT_TERM_STATISTICS_COMPILE_SECOND,
+            ),
+        ):
+            last_period = statistics.get_start_time(table)
+            if not compiled:
+                # The periodic run will compile the last period
+                last_period -= table.duration
+            try:
+                missed_periods = statistics.get_missed_periods(self, last_period, table)
+            except SQLAlchemyError as err:
+                _LOGGER.error("Error looking up missed statistics: %s", err)
+                return
+            if missed_periods:
+                _LOGGER.debug(
+                    "Compiling %s missed %s periods",
+                    len(missed_periods),
+                    table.__tablename__,
+                )
+            self._missed_statistics.extend((start, table) for start in missed_periods)
+        self._compile_next_missed_statistics()
+
+    def _compile_next_missed_statistics(self):
+        """Let the statistics worker compile the next missed period."""
+        if self._statistics_job or not self._missed_statistics:
+            return
+        start, table = self._missed_statistics.popleft()
+        if self._statistics_worker_enabled:
+            job = self._statistics_executor.submit(
+                statistics.compile_missed_statistics, self.hass, start, table
+            )
+        else:
+            job = concurrent.futures.Future()
+            try:
+                job.set_result(
+                    statistics.compile_missed_statistics(self.hass, start, table)
+                )
+            except Exception as err:  # pylint: disable=broad-except
+                job.set_exception(err)
+        self._statistics_job = job
+        self._statistics_job_table = table
+        # The compiled statistics are saved in the recorder thread
+        job.add_done_callback(
+            lambda job: self.queue.put(StatisticsTask(start, job, table))
+        )
+
+    def _save_missed_statistics(self, start, job, table):
+        """Save the statistics compiled by the statistics worker."""
+        try:
+            if not statistics.save_statistics(self, start, job.result(), table):
+                # Compile the period again if saving didn't finish
+                self._missed_statistics.appendleft((start, table))
+        finally:
+            self._statistics_job = None
+            self._statistics_job_table = None
+            self._compile_next_missed_statistics()
+            if self._waiting_for_statistics and not self._statistics_job:
+                # Release the waiter after this task is done
+                self._waiting_for_statistics = False
+                self.queue.put(WaitTask())
 
     def _process_one_event(self, event):
         """Process one event."""
@@ -735,9 +950,18 @@ class Recorder(threading.Thread):
             perodic_db_cleanups(self)
             return
         if isinstance(event, StatisticsTask):
-            self._run_statistics(event.start)
+            self._run_statistics(event.start, event.job, event.table)
+            return
+        if isinstance(event, StatisticsPlatformTask):
+            self.statistics_accumulators.add_platform(
+                event.domain, event.accumulators, event.created
+            )
             return
         if isinstance(event, WaitTask):
+            if self._statistics_job:
+                # Wait for the statistics worker as well
+                self._waiting_for_statistics = True
+                return
             self._queue_watch.set()
             return
         if event.event_type == EVENT_TIME_CHANGED:
@@ -755,46 +979,278 @@ class Recorder(threading.Thread):
         if not self.enabled:
             return
 
-        try:
-            if event.event_type == EVENT_STATE_CHANGED:
-                dbevent = Events.from_event(event, event_data="{}")
-            else:
-                dbevent = Events.from_event(event)
-            dbevent.created = event.time_fired
-            self.event_session.add(dbevent)
-        except (TypeError, ValueError):
-            _LOGGER.warning("Event is not JSON serializable: %s", event)
-            return
-
         if event.event_type == EVENT_STATE_CHANGED:
-            try:
-                dbstate = States.from_event(event)
-                has_new_state = event.data.get("new_state")
-                if dbstate.entity_id in self._old_states:
-                    old_state = self._old_states.pop(dbstate.entity_id)
-                    if old_state.state_id:
-                        dbstate.old_state_id = old_state.state_id
-                    else:
-                        dbstate.old_state = old_state
-                if not has_new_state:
-                    dbstate.state = None
-                dbstate.event = dbevent
-                dbstate.created = event.time_fired
-                self.event_session.add(dbstate)
-                if has_new_state:
-                    self._old_states[dbstate.entity_id] = dbstate
-                    self._pending_expunge.append(dbstate)
-            except (TypeError, ValueError):
-                _LOGGER.warning(
-                    "State is not JSON serializable: %s",
-                    event.data.get("new_state"),
-                )
+            new_state = event.data.get("new_state")
+            # Only significant changes are used for statistics,
+            # like the compilation from the recorded states
+            if new_state and new_state.last_changed == new_state.last_updated:
+                self.statistics_accumulators.add_state(new_state)
+
+        if self.bulk_insert:
+            self._buffer_event_rows(event)
+        else:
+            self._add_event_to_session(event)
 
         # If they do not have a commit interval
         # than we commit right away
         if not self.commit_interval:
             self._commit_event_session_or_retry()
 
+    def _add_event_to_session(self, event):
+        """Add the event or its state to the event session.
+
+        State changes are only stored in the states table, they do
+        not get an events row.
+        """
+        if event.event_type != EVENT_STATE_CHANGED:
+            try:
+                dbevent = Events.from_event(event)
+                dbevent.created = event.time_fired
+                self.event_session.add(dbevent)
+            except (TypeError, ValueError):
+                _LOGGER.warning("Event is not JSON serializable: %s", event)
+            return
+
+        try:
+            dbstate = States.from_event(event)
+            has_new_state = event.data.get("new_state")
+            if dbstate.entity_id in self._old_states:
+                old_state = self._old_states.pop(dbstate.entity_id)
+                if old_state.state_id:
+                    dbstate.old_state_id = old_state.state_id
+                else:
+                    dbstate.old_state = old_state
+            if not has_new_state:
+                dbstate.state = None
+            self._link_state_attributes(event, dbstate)
+            dbstate.created = event.time_fired
+            self.event_session.add(dbstate)
+            if has_new_state:
+                self._old_states[dbstate.entity_id] = dbstate
+                self._pending_expunge.append(dbstate)
+        except (TypeError, ValueError):
+            _LOGGER.warning(
+                "State is not JSON serializable: %s",
+                event.data.get("new_state"),
+            )
+
+    def _buffer_event_rows(self, event):
+        """Buffer the row for the event or its state until the next commit."""
+        if event.event_type != EVENT_STATE_CHANGED:
+            try:
+                event_row = Events.row_from_event(event)
+            except (TypeError, ValueError):
+                _LOGGER.warning("Event is not JSON serializable: %s", event)
+                return
+            event_row["created"] = event.time_fired
+            self._pending_event_rows.append(event_row)
+            return
+
+        try:
+            state_row = States.row_from_event(event)
+            shared_attrs = StateAttributes.shared_attrs_from_event(event)
+        except (TypeError, ValueError):
+            _LOGGER.warning(
+                "State is not JSON serializable: %s",
+                event.data.get("new_state"),
+            )
+            return
+
+        if not event.data.get("new_state"):
+            state_row["state"] = None
+        state_row["created"] = event.time_fired
+        self._pending_state_rows.append((state_row, shared_attrs))
+
+    def _write_pending_rows(self):
+        """Write the buffered rows in the event session transaction.
+
+        The events are written with a single executemany and the states
+        and new attributes with as few statements as _insert_rows allows.
+        A state links to the previous state of the entity, which may be in
+        the same batch, so those links are set with an executemany update
+        once the ids of the new states are known.
+
+        Returns the old state ids and new attributes ids that become valid
+        once the transaction is committed.
+        """
+        connection = self.event_session.connection()
+
+        if self._pending_event_rows:
+            connection.execute(Events.__table__.insert(), self._pending_event_rows)
+        if not self._pending_state_rows:
+            return {}, {}
+
+        new_attributes_ids = self._write_new_state_attributes(connection)
+
+        state_rows = []
+        # The index of the previous state of the entity in the batch
+        last_index: dict[str, int] = {}
+        old_state_links: list[tuple[int, int]] = []
+        for index, (state_row, shared_attrs) in enumerate(self._pending_state_rows):
+            if attributes_id := new_attributes_ids.get(shared_attrs):
+                state_row["attributes_id"] = attributes_id
+            else:
+                self._state_attributes_ids.move_to_end(shared_attrs)
+                state_row["attributes_id"] = self._state_attributes_ids[shared_attrs]
+
+            entity_id = state_row["entity_id"]
+            if (old_index := last_index.get(entity_id)) is None:
+                state_row["old_state_id"] = self._old_state_ids.get(entity_id)
+            else:
+                state_row["old_state_id"] = None
+                # A removed entity has no old state for the next state
+                if state_rows[old_index]["state"] is not None:
+                    old_state_links.append((index, old_index))
+            last_index[entity_id] = index
+            state_rows.append(state_row)
+
+        state_ids = self._insert_rows(
+            connection, States.__table__.c.state_id, state_rows
+        )
+        if old_state_links:
+            states = States.__table__
+            connection.execute(
+                states.update()
+                .where(states.c.state_id == bindparam("b_state_id"))
+                .values(old_state_id=bindparam("b_old_state_id")),
+                [
+                    {
+                        "b_state_id": state_ids[index],
+                        "b_old_state_id": state_ids[old_index],
+                    }
+                    for index, old_index in old_state_links
+                ],
+            )
+
+        old_state_ids: dict[str, int | None] = {
+            entity_id: state_ids[index]
+            if state_rows[index]["state"] is not None
+            else None
+            for entity_id, index in last_index.items()
+        }
+        return old_state_ids, new_attributes_ids
+
+    def _write_new_state_attributes(self, connection):
+        """Write the shared attributes of the buffered states that are not stored yet.
+
+        Returns the attributes ids of the shared attributes that were not
+        cached, including those that were already in the database.
+        """
+        new_attributes_ids: dict[str, int] = {}
+        new_rows = []
+        for _, shared_attrs in self._pending_state_rows:
+            if (
+                shared_attrs in new_attributes_ids
+                or shared_attrs in self._state_attributes_ids
+            ):
+                continue
+            attr_hash = StateAttributes.hash_shared_attrs(shared_attrs)
+            if attributes_id := self._find_shared_attr_in_db(attr_hash, shared_attrs):
+                new_attributes_ids[shared_attrs] = attributes_id
+                continue
+            # Not written yet, the id is filled in below
+            new_attributes_ids[shared_attrs] = 0
+            new_rows.append({"hash": attr_hash, "shared_attrs": shared_attrs})
+
+        if new_rows:
+            attributes_ids = self._insert_rows(
+                connection, StateAttributes.__table__.c.attributes_id, new_rows
+            )
+            for row, attributes_id in zip(new_rows, attributes_ids):
+                new_attributes_ids[row["shared_attrs"]] = attributes_id
+        return new_attributes_ids
+
+    def _insert_rows(self, connection, id_column, rows):
+        """Insert rows and return their ids in order.
+
+        Dialects that return the primary keys of an executemany, like
+        PostgreSQL, insert all rows with a single executemany. SQLite and
+        MySQL insert the rows with multi-row INSERT statements, whose rows
+        get consecutive ids, so the ids follow from the id the statement
+        reports. Other dialects insert the rows one at a time.
+        """
+        table = id_column.table
+        dialect = connection.dialect
+        if dialect.insert_executemany_returning:
+            result = connection.execute(table.insert(), rows)
+            return [row_id for (row_id,) in result.inserted_primary_key_rows]
+        if dialect.name not in ("sqlite", "mysql"):
+            return [
+                connection.execute(table.insert(), row).inserted_primary_key[0]
+                for row in rows
+            ]
+
+        if dialect.name == "mysql":
+            if self._mysql_id_increment is None:
+                self._mysql_id_increment = connection.execute(
+                    text("SELECT @@auto_increment_increment")
+                ).scalar()
+            step = self._mysql_id_increment
+        else:
+            step = 1
+        ids: list[int] = []
+        rows_per_insert = max(1, MAX_BIND_VARS_PER_INSERT // len(rows[0]))
+        for idx in range(0, len(rows), rows_per_insert):
+            chunk = rows[idx : idx + rows_per_insert]
+            row_id = connection.execute(table.insert().values(chunk)).lastrowid
+            if dialect.name == "sqlite":
+                # SQLite reports the id of the last row, MySQL of the first
+                row_id -= len(chunk) - 1
+            ids.extend(range(row_id, row_id + len(chunk) * step, step))
+        return ids
+
+    def _link_state_attributes(self, event, dbstate):
+        """Link a state to its deduplicated attributes.
+
+        Recently used attributes are resolved from an in memory cache,
+        attributes not yet committed are shared with the pending object,
+        and only unseen attributes result in a new state_attributes row.
+        """
+        shared_attrs = StateAttributes.shared_attrs_from_event(event)
+        if pending_attributes := self._pending_state_attributes.get(shared_attrs):
+            dbstate.state_attributes = pending_attributes
+            return
+        if attributes_id := self._state_attributes_ids.get(shared_attrs):
+            self._state_attributes_ids.move_to_end(shared_attrs)
+            dbstate.attributes_id = attributes_id
+            return
+        attr_hash = StateAttributes.hash_shared_attrs(shared_attrs)
+        if attributes_id := self._find_shared_attr_in_db(attr_hash, shared_attrs):
+            self._cache_state_attributes_id(shared_attrs, attributes_id)
+            dbstate.attributes_id = attributes_id
+            return
+        dbstate_attributes = StateAttributes(hash=attr_hash, shared_attrs=shared_attrs)
+        dbstate.state_attributes = dbstate_attributes
+        self._pending_state_attributes[shared_attrs] = dbstate_attributes
+        self.event_session.add(dbstate_attributes)
+
+    def _find_shared_attr_in_db(self, attr_hash, shared_attrs):
+        """Find shared attributes in the db from the hash and shared_attrs."""
+        # Avoid flushing pending states and events just to do a lookup,
+        # the attributes we are looking for are never in the pending set
+        with self.event_session.no_autoflush:
+            attributes = (
+                self.event_session.query(StateAttributes.attributes_id)
+                .filter(StateAttributes.hash == attr_hash)
+                .filter(StateAttributes.shared_attrs == shared_attrs)
+                .first()
+            )
+        if attributes:
+            return attributes[0]
+        return None
+
+    def _cache_state_attributes_id(self, shared_attrs, attributes_id):
+        """Remember the attributes id for shared_attrs, evicting the oldest."""
+        self._state_attributes_ids[shared_attrs] = attributes_id
+        if len(self._state_attributes_ids) > STATE_ATTRIBUTES_ID_CACHE_SIZE:
+            self._state_attributes_ids.popitem(last=False)
+
+    def _evict_purged_attributes_ids(self, attributes_ids: set[int]) -> None:
+        """Remove purged attributes ids from the cache."""
+        for shared_attrs, attributes_id in list(self._state_attributes_ids.items()):
+            if attributes_id in attributes_ids:
+                del self._state_attributes_ids[shared_attrs]
+
     def _handle_database_error(self, err):
         """Handle a database error that may result in moving away the corrupt db."""
         if isinstance(err.__cause__, sqlite3.DatabaseError):
@@ -807,7 +1263,12 @@ class Recorder(threading.Thread):
 
     def _commit_event_session_or_retry(self):
         """Commit the event session if there is work to do."""
-        if not self.event_session.new and not self.event_session.dirty:
+        if (
+            not self.event_session.new
+            and not self.event_session.dirty
+            and not self._pending_event_rows
+            and not self._pending_state_rows
+        ):
             return
         tries = 1
         while tries <= self.db_max_retries:
@@ -838,8 +1299,32 @@ class Recorder(threading.Thread):
                 if dbstate in self.event_session:
                     self.event_session.expunge(dbstate)
             self._pending_expunge = []
+
+        old_state_ids: dict[str, int | None] = {}
+        new_attributes_ids: dict[str, int] = {}
+        if self._pending_event_rows or self._pending_state_rows:
+            old_state_ids, new_attributes_ids = self._write_pending_rows()
+
         self.event_session.commit()
 
+        self._pending_event_rows = []
+        self._pending_state_rows = []
+        for entity_id, state_id in old_state_ids.items():
+            if state_id is None:
+                self._old_state_ids.pop(entity_id, None)
+            else:
+                self._old_state_ids[entity_id] = state_id
+        for shared_attrs, attributes_id in new_attributes_ids.items():
+            self._cache_state_attributes_id(shared_attrs, attributes_id)
+
+        # Once the attributes are committed we know their ids
+        # and can resolve them without touching the database
+        for shared_attrs, dbstate_attributes in self._pending_state_attributes.items():
+            self._cache_state_attributes_id(
+                shared_attrs, dbstate_attributes.attributes_id
+            )
+        self._pending_state_attributes = {}
+
         # Expire is an expensive operation (frequently more expensive
         # than the flush and commit itself) so we only
         # do it after EXPIRE_AFTER_COMMITS commits
@@ -858,6 +1343,11 @@ class Recorder(threading.Thread):
     def _close_event_session(self):
         """Close the event session."""
         self._old_states = {}
+        self._old_state_ids = {}
+        self._pending_event_rows = []
+        self._pending_state_rows = []
+        self._state_attributes_ids = OrderedDict()
+        self._pending_state_attributes = {}
 
         if not self.event_session:
             return
@@ -924,6 +1414,9 @@ class Recorder(threading.Thread):
             kwargs["connect_args"] = {"check_same_thread": False}
             kwargs["poolclass"] = StaticPool
             kwargs["pool_reset_on_return"] = None
+            # The single connection can't be used by the statistics worker
+            # while the recorder thread is using it
+            self._statistics_worker_enabled = False
         elif self.db_url.startswith(SQLITE_URL_PREFIX):
             kwargs["poolclass"] = RecorderPool
         else:
@@ -982,5 +1475,9 @@ class Recorder(threading.Thread):
     def _shutdown(self):
         """Save end time for current run."""
         self.hass.add_job(self._async_stop_queue_watcher_and_event_listener)
+        if self._statistics_job is not None:
+            # A job that did not start yet is compiled again after a restart
+            self._statistics_job.cancel()
+        self._statistics_executor.shutdown(wait=True)
         self._end_session()
         self._close_connection()
@@ -0,0 +1,375 @@
+"""Archive purged states in compressed columnar segment files."""
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+import json
+import logging
+import os
+import struct
+from typing import Iterable, NamedTuple
+import zlib
+
+from sqlalchemy.orm.session import Session
+
+from homeassistant.core import valid_entity_id
+import homeassistant.util.dt as dt_util
+
+from .models import StateAttributes, States, process_timestamp
+
+_LOGGER = logging.getLogger(__name__)
+
+SEGMENT_VERSION = 1
+SEGMENT_SUFFIX = ".seg"
+INDEX_VERSION = 1
+INDEX_FILE = "index.json"
+# Each frame of a segment file is prefixed with its length
+FRAME_HEADER = struct.Struct(">I")
+
+EPOCH = datetime(1970, 1, 1, tzinfo=dt_util.UTC)
+
+
+class ArchivedState(NamedTuple):
+    """An archived state row.
+
+    Has the same columns as the rows of the history queries
+    so it can be wrapped in a LazyState.
+    """
+
+    domain: str
+    entity_id: str
+    state: str | None
+    attributes: str | None
+    shared_attrs: str | None
+    last_changed: datetime
+    last_updated: datetime
+
+
+def _to_micros(timestamp: datetime) -> int:
+    """Convert a timestamp to microseconds since the epoch."""
+    return (process_timestamp(timestamp) - EPOCH) // timedelta(microseconds=1)
+
+
+def _day(timestamp: datetime) -> str:
+    """Return the UTC day of a timestamp, the bucket of its segment."""
+    return process_timestamp(timestamp).date().isoformat()
+
+
+def _from_micros(micros: int) -> datetime:
+    """Convert microseconds since the epoch to a timestamp."""
+    return EPOCH + timedelta(microseconds=micros)
+
+
+def _dictionary_encode(values: Iterable[str | None]) -> tuple[list, list[int]]:
+    """Encode values as a list of distinct values and an index per value."""
+    dictionary: dict[str | None, int] = {}
+    indexes = [dictionary.setdefault(value, len(dictionary)) for value in values]
+    return list(dictionary), indexes
+
+
+def encode_segment(entity_id: str, rows: list[ArchivedState]) -> bytes:
+    """Encode the rows of one entity, sorted by last_updated, into a segment.
+
+    Timestamps are delta encoded and the states and attributes are
+    dictionary encoded before the columns are compressed.
+    """
+    last_updated = [_to_micros(row.last_updated) for row in rows]
+    states, state_indexes = _dictionary_encode(row.state for row in rows)
+    attributes, attribute_indexes = _dictionary_encode(
+        row.shared_attrs or row.attributes for row in rows
+    )
+    columns = {
+        "version": SEGMENT_VERSION,
+        "entity_id": entity_id,
+        "last_updated": [
+            micros - previous
+            for micros, previous in zip(last_updated, [0, *last_updated])
+        ],
+        # last_changed is stored as the offset before last_updated
+        # which is 0 for most rows
+        "last_changed": [
+            micros - _to_micros(row.last_changed)
+            for micros, row in zip(last_updated, rows)
+        ],
+        "states": states,
+        "state_indexes": state_indexes,
+        "attributes": attributes,
+        "attribute_indexes": attribute_indexes,
+    }
+    return zlib.compress(json.dumps(columns, separators=(",", ":")).encode())
+
+
+def decode_segment(data: bytes) -> list[ArchivedState]:
+    """Decode a segment into the archived rows."""
+    columns = json.loads(zlib.decompress(data))
+    if columns["version"] != SEGMENT_VERSION:
+        raise ValueError(f"Unsupported segment version {columns['version']}")
+    entity_id = columns["entity_id"]
+    domain = entity_id.split(".", 1)[0]
+    states = columns["states"]
+    attributes = columns["attributes"]
+    rows = []
+    micros = 0
+    for delta, changed_offset, state_index, attribute_index in zip(
+        columns["last_updated"],
+        columns["last_changed"],
+        columns["state_indexes"],
+        columns["attribute_indexes"],
+    ):
+        micros += delta
+        rows.append(
+            ArchivedState(
+                domain,
+                entity_id,
+                states[state_index],
+                None,
+                attributes[attribute_index],
+                _from_micros(micros - changed_offset),
+                _from_micros(micros),
+            )
+        )
+    return rows
+
+
+def _frame(data: bytes) -> bytes:
+    """Prefix an encoded segment with its length."""
+    return FRAME_HEADER.pack(len(data)) + data
+
+
+def _merge_rows(frames: list[list[ArchivedState]]) -> list[ArchivedState]:
+    """Merge the rows of frames sorted by last_updated."""
+    # Rows of a retried purge are archived again, keep them once
+    return sorted(
+        dict.fromkeys(row for rows in frames for row in rows),
+        key=lambda row: row.last_updated,
+    )
+
+
+def read_segment(path: str) -> list[ArchivedState]:
+    """Read the rows of a segment file sorted by last_updated.
+
+    A frame at the end which is incomplete, because it is being appended
+    or its write was cut off, is skipped.
+    """
+    with open(path, "rb") as segment_file:
+        data = segment_file.read()
+    frames = []
+    offset = 0
+    while offset + FRAME_HEADER.size <= len(data):
+        (length,) = FRAME_HEADER.unpack_from(data, offset)
+        offset += FRAME_HEADER.size
+        if offset + length > len(data):
+            break
+        try:
+            frames.append(decode_segment(data[offset : offset + length]))
+        except (zlib.error, ValueError) as err:
+            _LOGGER.warning("Skipping unreadable frame of segment %s: %s", path, err)
+            break
+        offset += length
+    if len(frames) == 1:
+        return frames[0]
+    return _merge_rows(frames)
+
+
+class StatesArchive:
+    """Segment files of the states removed by the purge.
+
+    The rows of an entity are bucketed by the UTC day they were updated,
+    each bucket is a segment stored as <path>/<entity_id>/<day>.seg. Every
+    purge batch appends a frame to the segments of its days, the frames of
+    a segment are compacted into one when the purge has moved on to a
+    later day. An index of the days with segments per entity is kept in
+    <path>/index.json, so the segments of a time range are found without
+    listing the directories.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Initialize the archive."""
+        self.path = path
+        self._index: dict[str, list[str]] | None = None
+        # The segments frames were appended to since they were compacted
+        self._appended: dict[str, set[str]] = {}
+
+    def _load_index(self) -> dict[str, list[str]]:
+        """Return the days with segments of the entities."""
+        if self._index is None:
+            try:
+                with open(os.path.join(self.path, INDEX_FILE)) as index_file:
+                    self._index = json.load(index_file)["entities"]
+            except FileNotFoundError:
+                self._index = {}
+        return self._index
+
+    def archive_states(self, session: Session, state_ids: list[int]) -> None:
+        """Write the states that are about to be purged to segments."""
+        rows = (
+            session.query(
+                States.domain,
+                States.entity_id,
+                States.state,
+                States.attributes,
+                StateAttributes.shared_attrs,
+                States.last_changed,
+                States.last_updated,
+            )
+            .outerjoin(
+                StateAttributes, States.attributes_id == StateAttributes.attributes_id
+            )
+            .filter(States.state_id.in_(state_ids))
+            .order_by(States.entity_id, States.last_updated)
+            .all()
+        )
+        bucket_rows: dict[tuple[str, str], list[ArchivedState]] = {}
+        for row in rows:
+            # Timezone aware like the rows read back from the segments
+            archived = ArchivedState(*row)._replace(
+                last_changed=process_timestamp(row.last_changed),
+                last_updated=process_timestamp(row.last_updated),
+            )
+            bucket_rows.setdefault(
+                (archived.entity_id, _day(archived.last_updated)), []
+            ).append(archived)
+
+        # Readers use the index in other threads, it is replaced, not modified
+        index = dict(self._load_index())
+        for (entity_id, day), archived_rows in bucket_rows.items():
+            if not valid_entity_id(entity_id):
+                _LOGGER.warning("Not archiving states of invalid entity %s", entity_id)
+                continue
+            self._append_segment(entity_id, day, archived_rows)
+            days = index.get(entity_id, [])
+            if day not in days:
+                index[entity_id] = sorted([*days, day])
+
+        # The purge removes the oldest states first, the days before the
+        # last day of an entity in this batch are complete
+        for entity_id, appended_days in self._appended.items():
+            last_day = max(appended_days)
+            for day in [day for day in appended_days if day < last_day]:
+                self._compact_segment(entity_id, day)
+
+        if index != self._index:
+            self._write_file(
+                os.path.join(self.path, INDEX_FILE),
+                json.dumps({"version": INDEX_VERSION, "entities": index}).encode(),
+            )
+            self._index = index
+        _LOGGER.debug("Archived %s states of %s entities", len(rows), len(bucket_rows))
+
+    def _segment_path(self, entity_id: str, day: str) -> str:
+        """Return the path of the segment of an entity for a day."""
+        return os.path.join(self.path, entity_id, f"{day}{SEGMENT_SUFFIX}")
+
+    def _append_segment(
+        self, entity_id: str, day: str, rows: list[ArchivedState]
+    ) -> None:
+        """Append rows to the segment of their day as a frame."""
+        appended_days = self._appended.setdefault(entity_id, set())
+        segment_path = self._segment_path(entity_id, day)
+        frame = _frame(encode_segment(entity_id, rows))
+        if day in appended_days:
+            with open(segment_path, "ab") as segment_file:
+                segment_file.write(frame)
+            return
+
+        # The segment was not written since it was compacted, which
+        # also drops a frame that was cut off by a crash
+        try:
+            existing = read_segment(segment_path)
+        except FileNotFoundError:
+            os.makedirs(os.path.dirname(segment_path), exist_ok=True)
+            self._write_file(segment_path, frame)
+        else:
+            self._write_file(
+                segment_path,
+                _frame(encode_segment(entity_id, _merge_rows([existing, rows]))),
+            )
+        appended_days.add(day)
+
+    def _compact_segment(self, entity_id: str, day: str) -> None:
+        """Merge the frames of a segment into one."""
+        segment_path = self._segment_path(entity_id, day)
+        rows = read_segment(segment_path)
+        self._write_file(segment_path, _frame(encode_segment(entity_id, rows)))
+        self._appended[entity_id].discard(day)
+
+    @staticmethod
+    def _write_file(path: str, data: bytes) -> None:
+        """Write a file, replacing it at once."""
+        # Readers run in other threads so the file
+        # must never be seen partially written
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "wb") as temp_file:
+            temp_file.write(data)
+        os.replace(temp_path, path)
+
+    def _segment_paths(
+        self, entity_id: str, start_time: datetime, end_time: datetime | None
+    ) -> list[str]:
+        """Return the segments of an entity that overlap the time range."""
+        start_day = _day(start_time)
+        end_day = _day(end_time) if end_time is not None else None
+        return [
+            self._segment_path(entity_id, day)
+            for day in self._load_index().get(entity_id, ())
+            if day >= start_day and (end_day is None or day <= end_day)
+        ]
+
+    def state_before(
+        self,
+        point_in_time: datetime,
+        entity_id: str,
+        not_before: datetime | None = None,
+    ) -> ArchivedState | None:
+        """Return the last archived state of an entity before point_in_time.
+
+        States updated before not_before are not returned.
+        """
+        point_in_time = process_timestamp(point_in_time)
+        not_before = process_timestamp(not_before)
+        point_day = _day(point_in_time)
+        not_before_day = _day(not_before) if not_before is not None else None
+        for day in reversed(self._load_index().get(entity_id, ())):
+            if day > point_day:
+                continue
+            if not_before_day is not None and day < not_before_day:
+                break
+            for row in reversed(read_segment(self._segment_path(entity_id, day))):
+                if row.last_updated < point_in_time:
+                    if not_before is not None and row.last_updated < not_before:
+                        return None
+                    return row
+        return None
+
+    def entity_ids(self) -> list[str]:
+        """Return the entity ids with archived states."""
+        return sorted(self._load_index())
+
+    def states_during_period(
+        self,
+        start_time: datetime,
+        end_time: datetime | None = None,
+        entity_ids: Iterable[str] | None = None,
+    ) -> list[ArchivedState]:
+        """Return the archived states sorted by entity_id and last_updated.
+
+        Like the history queries only states updated after start_time
+        and before end_time are returned.
+        """
+        start_time = process_timestamp(start_time)
+        end_time = process_timestamp(end_time)
+        if entity_ids is None:
+            entity_ids = self.entity_ids()
+        else:
+            entity_ids = sorted(entity_ids)
+        rows: list[ArchivedState] = []
+        for archived_entity_id in entity_ids:
+            for segment_path in self._segment_paths(
+                archived_entity_id, start_time, end_time
+            ):
+                rows.extend(
+                    row
+                    for row in read_segment(segment_path)
+                    if row.last_updated > start_time
+                    and (end_time is None or row.last_updated < end_time)
+                )
+        return rows
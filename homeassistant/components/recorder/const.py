@@ -13,3 +13,7 @@ CONF_DB_INTEGRITY_CHECK = "db_integrity_check"
 # We can increase this back to 1000 once most
 # have upgraded their sqlite version
 MAX_ROWS_TO_PURGE = 998
+
+# The maximum number of bind parameters of one multi-row insert, which
+# has the same limit as the purge on sqlite3 before version 3.32.0
+MAX_BIND_VARS_PER_INSERT = 998
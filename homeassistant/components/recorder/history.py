@@ -11,7 +11,9 @@ from sqlalchemy.ext import baked
 
 from homeassistant.components import recorder
 from homeassistant.components.recorder.models import (
+    StateAttributes,
     States,
+    process_timestamp,
     process_timestamp_to_utc_isoformat,
 )
 from homeassistant.components.recorder.util import execute, session_scope
@@ -48,12 +50,26 @@ QUERY_STATES = [
     States.entity_id,
     States.state,
     States.attributes,
+    StateAttributes.shared_attrs,
     States.last_changed,
     States.last_updated,
 ]
 
 HISTORY_BAKERY = "recorder_history_bakery"
 
+# Rows fetched at a time when iterating over the states of a period
+STATE_VALUES_BATCH_SIZE = 1000
+
+
+def _query_states_with_attributes(session):
+    """Query states with the shared attributes outer joined.
+
+    The attributes are only decoded when LazyState.attributes is accessed.
+    """
+    return session.query(*QUERY_STATES).outerjoin(
+        StateAttributes, States.attributes_id == StateAttributes.attributes_id
+    )
+
 
 def async_setup(hass):
     """Set up the history hooks."""
@@ -86,9 +102,7 @@ def _get_significant_states(
     """
     timer_start = time.perf_counter()
 
-    baked_query = hass.data[HISTORY_BAKERY](
-        lambda session: session.query(*QUERY_STATES)
-    )
+    baked_query = hass.data[HISTORY_BAKERY](_query_states_with_attributes)
 
     if significant_changes_only:
         baked_query += lambda q: q.filter(
@@ -120,6 +134,16 @@ def _get_significant_states(
             start_time=start_time, end_time=end_time, entity_ids=entity_ids
         )
     )
+    states = _with_archived_states(
+        hass,
+        states,
+        start_time,
+        end_time,
+        _archived_entity_ids(hass, entity_ids, filters),
+        (lambda row: row.domain in SIGNIFICANT_DOMAINS or _is_state_change(row))
+        if significant_changes_only
+        else (lambda row: True),
+    )
 
     if _LOGGER.isEnabledFor(logging.DEBUG):
         elapsed = time.perf_counter() - timer_start
@@ -140,9 +164,7 @@ def _get_significant_states(
 def state_changes_during_period(hass, start_time, end_time=None, entity_id=None):
     """Return states changes during UTC period start_time - end_time."""
     with session_scope(hass=hass) as session:
-        baked_query = hass.data[HISTORY_BAKERY](
-            lambda session: session.query(*QUERY_STATES)
-        )
+        baked_query = hass.data[HISTORY_BAKERY](_query_states_with_attributes)
 
         baked_query += lambda q: q.filter(
             (States.last_changed == States.last_updated)
@@ -155,7 +177,9 @@ def state_changes_during_period(hass, start_time, end_time=None, entity_id=None)
             )
 
         if entity_id is not None:
-            baked_query += lambda q: q.filter_by(entity_id=bindparam("entity_id"))
+            baked_query += lambda q: q.filter(
+                States.entity_id == bindparam("entity_id")
+            )
             entity_id = entity_id.lower()
 
         baked_query += lambda q: q.order_by(States.entity_id, States.last_updated)
@@ -165,24 +189,196 @@ def state_changes_during_period(hass, start_time, end_time=None, entity_id=None)
                 start_time=start_time, end_time=end_time, entity_id=entity_id
             )
         )
+        states = _with_archived_states(
+            hass,
+            states,
+            start_time,
+            end_time,
+            [entity_id] if entity_id is not None else None,
+            _is_state_change,
+        )
 
         entity_ids = [entity_id] if entity_id is not None else None
 
         return _sorted_states_to_dict(hass, session, states, start_time, entity_ids)
 
 
+def _get_archive(hass):
+    """Return the archive of the purged states, None when it is disabled."""
+    instance = hass.data.get(recorder.DATA_INSTANCE)
+    return instance.archive if instance is not None else None
+
+
+def _is_state_change(row):
+    """Return True if the state changed, not only its attributes."""
+    return row.last_changed == row.last_updated
+
+
+def _archived_entity_ids(hass, entity_ids, filters):
+    """Return the archived entities like the queries of all entities select them."""
+    if entity_ids is not None:
+        return entity_ids
+    if (archive := _get_archive(hass)) is None:
+        return []
+    return [
+        entity_id
+        for entity_id in archive.entity_ids()
+        if split_entity_id(entity_id)[0] not in IGNORE_DOMAINS
+        and (filters is None or filters.matches(entity_id))
+    ]
+
+
+def _with_archived_states(hass, states, start_time, end_time, entity_ids, include):
+    """Add the states that were moved to the archive by the purge.
+
+    The states must be sorted by entity_id and last_updated. The archived
+    states of an entity are older than its states in the database so they
+    go first. Only the archived states for which include returns True are
+    added, all archived entities are read when entity_ids is None.
+    """
+    archive = _get_archive(hass)
+    if archive is None or (entity_ids is not None and not entity_ids):
+        return states
+
+    archived_states = {
+        ent_id: list(group)
+        for ent_id, group in groupby(
+            filter(
+                include,
+                archive.states_during_period(start_time, end_time, entity_ids),
+            ),
+            lambda row: row.entity_id,
+        )
+    }
+    if not archived_states:
+        return states
+
+    merged = []
+    for ent_id, group in groupby(states, lambda state: state.entity_id):
+        merged.extend(archived_states.pop(ent_id, ()))
+        merged.extend(group)
+    for group in archived_states.values():
+        merged.extend(group)
+    return merged
+
+
+def _archived_states_at(hass, utc_point_in_time, entity_ids, not_before=None):
+    """Return the archived states of the entities at a point in time."""
+    archive = _get_archive(hass)
+    if archive is None:
+        return []
+    states = []
+    for entity_id in entity_ids:
+        row = archive.state_before(utc_point_in_time, entity_id, not_before)
+        if row is not None:
+            states.append(LazyState(row))
+    return states
+
+
+def iter_state_values_during_period(hass, start_time, end_time, entity_id):
+    """Yield the (state, last_updated) of an entity during the period.
+
+    The state at start_time comes first, with start_time as last_updated.
+    The rows are fetched in batches, the states of long periods are never
+    all in memory.
+    """
+    initial_state = get_state(hass, start_time, entity_id)
+    if initial_state is not None:
+        yield initial_state.state, start_time
+
+    instance = hass.data.get(recorder.DATA_INSTANCE)
+    if instance is not None and instance.archive is not None:
+        for row in instance.archive.states_during_period(
+            start_time, end_time, [entity_id]
+        ):
+            yield row.state, row.last_updated
+
+    with session_scope(hass=hass) as session:
+        query = (
+            session.query(States.state, States.last_updated)
+            .filter(
+                (States.entity_id == entity_id.lower())
+                & (States.last_updated > start_time)
+                & (States.last_updated < end_time)
+            )
+            .order_by(States.last_updated)
+            .yield_per(STATE_VALUES_BATCH_SIZE)
+        )
+        for state, last_updated in query:
+            yield state, process_timestamp(last_updated)
+
+
+def get_state_changes_batch(
+    hass, start_time, end_time, entity_id, after=None, limit=STATE_VALUES_BATCH_SIZE
+):
+    """Return the next batch of state changes of an entity during the period.
+
+    Without after, the state at start_time and the archived state changes
+    come first, followed by the first limit state changes in the database.
+    Pass the returned cursor as after to read the next batch. Every batch is
+    read in its own session, no cursor is kept open between batches.
+
+    Returns a list of LazyState and the cursor, which is None when there
+    are no more state changes.
+    """
+    states = []
+    if after is None:
+        initial_state = get_state(hass, start_time, entity_id)
+        if initial_state is not None:
+            initial_state.last_changed = start_time
+            initial_state.last_updated = start_time
+            states.append(initial_state)
+
+        instance = hass.data.get(recorder.DATA_INSTANCE)
+        if instance is not None and instance.archive is not None:
+            for row in instance.archive.states_during_period(
+                start_time, end_time, [entity_id]
+            ):
+                if row.last_changed == row.last_updated:
+                    states.append(LazyState(row))
+
+    with session_scope(hass=hass) as session:
+        query = (
+            session.query(*QUERY_STATES, States.state_id)
+            .outerjoin(
+                StateAttributes, States.attributes_id == StateAttributes.attributes_id
+            )
+            .filter(
+                (States.entity_id == entity_id.lower())
+                & (States.last_changed == States.last_updated)
+                & (States.last_updated < end_time)
+            )
+        )
+        if after is None:
+            query = query.filter(States.last_updated > start_time)
+        else:
+            last_updated, state_id = after
+            query = query.filter(
+                (States.last_updated > last_updated)
+                | ((States.last_updated == last_updated) & (States.state_id > state_id))
+            )
+        rows = execute(
+            query.order_by(States.last_updated, States.state_id).limit(limit)
+        )
+
+    states.extend(LazyState(row) for row in rows)
+    if len(rows) < limit:
+        return states, None
+    return states, (rows[-1].last_updated, rows[-1].state_id)
+
+
 def get_last_state_changes(hass, number_of_states, entity_id):
     """Return the last number_of_states."""
     start_time = dt_util.utcnow()
 
     with session_scope(hass=hass) as session:
-        baked_query = hass.data[HISTORY_BAKERY](
-            lambda session: session.query(*QUERY_STATES)
-        )
+        baked_query = hass.data[HISTORY_BAKERY](_query_states_with_attributes)
         baked_query += lambda q: q.filter(States.last_changed == States.last_updated)
 
         if entity_id is not None:
-            baked_query += lambda q: q.filter_by(entity_id=bindparam("entity_id"))
+            baked_query += lambda q: q.filter(
+                States.entity_id == bindparam("entity_id")
+            )
             entity_id = entity_id.lower()
 
         baked_query += lambda q: q.order_by(
@@ -216,7 +412,11 @@ def get_states(hass, utc_point_in_time, entity_ids=None, run=None, filters=None)
 
         # History did not run before utc_point_in_time
         if run is None:
-            return []
+            return _archived_states_at(
+                hass,
+                utc_point_in_time,
+                _archived_entity_ids(hass, entity_ids, filters),
+            )
 
     with session_scope(hass=hass) as session:
         return _get_states_with_session(
@@ -238,12 +438,16 @@ def _get_states_with_session(
 
         # History did not run before utc_point_in_time
         if run is None:
-            return []
+            return _archived_states_at(
+                hass,
+                utc_point_in_time,
+                _archived_entity_ids(hass, entity_ids, filters),
+            )
 
     # We have more than one entity to look at (most commonly we want
     # all entities,) so we need to do a search on all states since the
     # last recorder run started.
-    query = session.query(*QUERY_STATES)
+    query = _query_states_with_attributes(session)
 
     most_recent_states_by_date = session.query(
         States.entity_id.label("max_entity_id"),
@@ -285,15 +489,28 @@ def _get_states_with_session(
         if filters:
             query = filters.apply(query)
 
-    return [LazyState(row) for row in execute(query)]
+    states = [LazyState(row) for row in execute(query)]
+    # The states of entities which were not updated since they were archived
+    recorded_entity_ids = {state.entity_id for state in states}
+    states.extend(
+        _archived_states_at(
+            hass,
+            utc_point_in_time,
+            [
+                entity_id
+                for entity_id in _archived_entity_ids(hass, entity_ids, filters)
+                if entity_id not in recorded_entity_ids
+            ],
+            run.start,
+        )
+    )
+    return states
 
 
 def _get_single_entity_states_with_session(hass, session, utc_point_in_time, entity_id):
     # Use an entirely different (and extremely fast) query if we only
     # have a single entity id
-    baked_query = hass.data[HISTORY_BAKERY](
-        lambda session: session.query(*QUERY_STATES)
-    )
+    baked_query = hass.data[HISTORY_BAKERY](_query_states_with_attributes)
     baked_query += lambda q: q.filter(
         States.last_updated < bindparam("utc_point_in_time"),
         States.entity_id == bindparam("entity_id"),
@@ -305,7 +522,9 @@ def _get_single_entity_states_with_session(hass, session, utc_point_in_time, ent
         utc_point_in_time=utc_point_in_time, entity_id=entity_id
     )
 
-    return [LazyState(row) for row in execute(query)]
+    return [LazyState(row) for row in execute(query)] or _archived_states_at(
+        hass, utc_point_in_time, [entity_id]
+    )
 
 
 def _sorted_states_to_dict(
@@ -16,8 +16,10 @@ from .models import (
     TABLE_STATES,
     Base,
     SchemaChanges,
+    StateAttributes,
     Statistics,
     StatisticsMeta,
+    StatisticsShortTerm,
 )
 from .util import session_scope
 
@@ -221,6 +223,30 @@ def _add_columns(connection, table_name, columns_def):
             )
 
 
+def _backfill_states_context(connection):
+    """Copy the context of existing states from their state_changed events.
+
+    The state_changed events rows are left in place, they are
+    removed by the purge along with the states that link to them.
+    """
+    _LOGGER.warning(
+        "Copying the context of existing states from the events table. "
+        "Note: this can take several minutes on large databases and slow "
+        "computers. Please be patient!"
+    )
+    connection.execute(
+        text(
+            "UPDATE states SET "
+            + ", ".join(
+                f"{column} = (SELECT events.{column} FROM events "
+                "WHERE events.event_id = states.event_id)"
+                for column in ("context_id", "context_user_id", "context_parent_id")
+            )
+            + " WHERE states.event_id IS NOT NULL AND states.context_id IS NULL"
+        )
+    )
+
+
 def _modify_columns(connection, engine, table_name, columns_def):
     """Modify columns in a table."""
     if engine.dialect.name == "sqlite":
@@ -347,7 +373,7 @@ def _drop_foreign_key_constraints(connection, engine, table, columns):
             )
 
 
-def _apply_update(engine, session, new_version, old_version):
+def _apply_update(engine, session, new_version, old_version):  # noqa: C901
     """Perform operations to bring schema up to date."""
     connection = session.connection()
     if new_version == 1:
@@ -475,6 +501,34 @@ def _apply_update(engine, session, new_version, old_version):
 
         StatisticsMeta.__table__.create(engine)
         Statistics.__table__.create(engine)
+    elif new_version == 19:
+        # Move the attributes out of the states table into the
+        # deduplicated state_attributes table. Existing rows keep
+        # their attributes in the states table.
+        if not sqlalchemy.inspect(engine).has_table(StateAttributes.__tablename__):
+            StateAttributes.__table__.create(engine)
+        _add_columns(connection, "states", ["attributes_id INTEGER"])
+        _create_index(connection, "states", "ix_states_attributes_id")
+    elif new_version == 20:
+        # State changes are no longer stored in the events table,
+        # the context moves back to the states table. The context_id
+        # and context_user_id columns still exist on databases that
+        # were created before schema version 9.
+        _add_columns(
+            connection,
+            "states",
+            [
+                "context_id CHARACTER(36)",
+                "context_user_id CHARACTER(36)",
+                "context_parent_id CHARACTER(36)",
+            ],
+        )
+        _create_index(connection, "states", "ix_states_context_id")
+        _backfill_states_context(connection)
+    elif new_version == 21:
+        # Add the short term statistics table
+        if not sqlalchemy.inspect(engine).has_table(StatisticsShortTerm.__tablename__):
+            StatisticsShortTerm.__table__.create(engine)
     else:
         raise ValueError(f"No schema migration defined for version {new_version}")
 
@@ -9,7 +9,7 @@ from sqlalchemy.orm.session import Session
 from sqlalchemy.sql.expression import distinct
 
 from .const import MAX_ROWS_TO_PURGE
-from .models import Events, RecorderRuns, States
+from .models import Events, RecorderRuns, StateAttributes, States
 from .repack import repack_database
 from .util import retryable_database_job, session_scope
 
@@ -34,12 +34,22 @@ def purge_old_data(
 
     with session_scope(session=instance.get_session()) as session:  # type: ignore
         # Purge a max of MAX_ROWS_TO_PURGE, based on the oldest states or events record
+        # State changes do not have an events row so the states
+        # are selected on their own
         event_ids = _select_event_ids_to_purge(session, purge_before)
-        state_ids = _select_state_ids_to_purge(session, purge_before, event_ids)
+        state_ids, attributes_ids = _select_state_and_attributes_ids_to_purge(
+            session, purge_before
+        )
         if state_ids:
+            if instance.archive and not _archive_states(instance, session, state_ids):
+                # Keep the states in the database rather than losing them
+                return True
             _purge_state_ids(session, state_ids)
+        if attributes_ids:
+            _purge_unused_attributes_ids(instance, session, attributes_ids)
         if event_ids:
             _purge_event_ids(session, event_ids)
+        if state_ids or event_ids:
             # If states or events purging isn't processing the purge_before yet,
             # return false, as we are not done yet.
             _LOGGER.debug("Purging hasn't fully completed yet")
@@ -65,20 +75,32 @@ def _select_event_ids_to_purge(session: Session, purge_before: datetime) -> list
     return [event.event_id for event in events]
 
 
-def _select_state_ids_to_purge(
-    session: Session, purge_before: datetime, event_ids: list[int]
-) -> list[int]:
-    """Return a list of state ids to purge."""
-    if not event_ids:
-        return []
+def _select_state_and_attributes_ids_to_purge(
+    session: Session, purge_before: datetime
+) -> tuple[list[int], set[int]]:
+    """Return a list of state ids and a set of attributes ids to purge."""
     states = (
-        session.query(States.state_id)
+        session.query(States.state_id, States.attributes_id)
         .filter(States.last_updated < purge_before)
-        .filter(States.event_id.in_(event_ids))
+        .limit(MAX_ROWS_TO_PURGE)
         .all()
     )
     _LOGGER.debug("Selected %s state ids to remove", len(states))
-    return [state.state_id for state in states]
+    state_ids = [state.state_id for state in states]
+    attributes_ids = {
+        state.attributes_id for state in states if state.attributes_id is not None
+    }
+    return state_ids, attributes_ids
+
+
+def _archive_states(instance: Recorder, session: Session, state_ids: list[int]) -> bool:
+    """Archive the states before they are purged."""
+    try:
+        instance.archive.archive_states(session, state_ids)  # type: ignore
+    except OSError as err:
+        _LOGGER.error("Error archiving states, the states are not purged: %s", err)
+        return False
+    return True
 
 
 def _purge_state_ids(session: Session, state_ids: list[int]) -> None:
@@ -103,8 +125,45 @@ def _purge_state_ids(session: Session, state_ids: list[int]) -> None:
     _LOGGER.debug("Deleted %s states", deleted_rows)
 
 
+def _purge_unused_attributes_ids(
+    instance: Recorder, session: Session, attributes_ids: set[int]
+) -> None:
+    """Delete the attributes ids that are no longer used by any state."""
+    # Attributes are shared between states so only the ones
+    # that are not referenced by a remaining state can go
+    still_used = {
+        attributes_id
+        for (attributes_id,) in session.query(distinct(States.attributes_id))
+        .filter(States.attributes_id.in_(attributes_ids))
+        .all()
+    }
+    unused_attributes_ids = attributes_ids - still_used
+    if not unused_attributes_ids:
+        return
+    deleted_rows = (
+        session.query(StateAttributes)
+        .filter(StateAttributes.attributes_id.in_(unused_attributes_ids))
+        .delete(synchronize_session=False)
+    )
+    _LOGGER.debug("Deleted %s attribute states", deleted_rows)
+    # The purge runs in the recorder thread so its safe
+    # to evict the ids from the cache here
+    instance._evict_purged_attributes_ids(  # pylint: disable=protected-access
+        unused_attributes_ids
+    )
+
+
 def _purge_event_ids(session: Session, event_ids: list[int]) -> None:
-    """Delete by event id."""
+    """Unlink states from the events and delete by event id."""
+    # States recorded before the state changes stopped having an
+    # events row can outlive their event since states and events
+    # are now selected independently
+    unlinked_rows = (
+        session.query(States)
+        .filter(States.event_id.in_(event_ids))
+        .update({"event_id": None}, synchronize_session=False)
+    )
+    _LOGGER.debug("Updated %s states to remove event_id", unlinked_rows)
     deleted_rows = (
         session.query(Events)
         .filter(Events.event_id.in_(event_ids))
@@ -138,7 +197,7 @@ def _purge_filtered_data(instance: Recorder, session: Session) -> bool:
         if not instance.entity_filter(entity_id)
     ]
     if len(excluded_entity_ids) > 0:
-        _purge_filtered_states(session, excluded_entity_ids)
+        _purge_filtered_states(instance, session, excluded_entity_ids)
         return False
 
     # Check if excluded event_types are in database
@@ -148,19 +207,22 @@ def _purge_filtered_data(instance: Recorder, session: Session) -> bool:
         if event_type in instance.exclude_t
     ]
     if len(excluded_event_types) > 0:
-        _purge_filtered_events(session, excluded_event_types)
+        _purge_filtered_events(instance, session, excluded_event_types)
         return False
 
     return True
 
 
-def _purge_filtered_states(session: Session, excluded_entity_ids: list[str]) -> None:
+def _purge_filtered_states(
+    instance: Recorder, session: Session, excluded_entity_ids: list[str]
+) -> None:
     """Remove filtered states and linked events."""
     state_ids: list[int]
     event_ids: list[int | None]
-    state_ids, event_ids = zip(
+    attributes_ids: list[int | None]
+    state_ids, event_ids, attributes_ids = zip(
         *(
-            session.query(States.state_id, States.event_id)
+            session.query(States.state_id, States.event_id, States.attributes_id)
             .filter(States.entity_id.in_(excluded_entity_ids))
             .limit(MAX_ROWS_TO_PURGE)
             .all()
@@ -172,9 +234,14 @@ def _purge_filtered_states(session: Session, excluded_entity_ids: list[str]) ->
     )
     _purge_state_ids(session, state_ids)
     _purge_event_ids(session, event_ids)  # type: ignore  # type of event_ids already narrowed to 'list[int]'
+    _purge_unused_attributes_ids(
+        instance, session, {id_ for id_ in attributes_ids if id_ is not None}
+    )
 
 
-def _purge_filtered_events(session: Session, excluded_event_types: list[str]) -> None:
+def _purge_filtered_events(
+    instance: Recorder, session: Session, excluded_event_types: list[str]
+) -> None:
     """Remove filtered events and linked states."""
     events: list[Events] = (
         session.query(Events.event_id)
@@ -187,11 +254,17 @@ def _purge_filtered_events(session: Session, excluded_event_types: list[str]) ->
         "Selected %s event_ids to remove that should be filtered", len(event_ids)
     )
     states: list[States] = (
-        session.query(States.state_id).filter(States.event_id.in_(event_ids)).all()
+        session.query(States.state_id, States.attributes_id)
+        .filter(States.event_id.in_(event_ids))
+        .all()
     )
     state_ids: list[int] = [state.state_id for state in states]
+    attributes_ids: set[int] = {
+        state.attributes_id for state in states if state.attributes_id is not None
+    }
     _purge_state_ids(session, state_ids)
     _purge_event_ids(session, event_ids)
+    _purge_unused_attributes_ids(instance, session, attributes_ids)
 
 
 @retryable_database_job("purge")
@@ -206,7 +279,7 @@ def purge_entity_data(instance: Recorder, entity_filter: Callable[[str], bool])
         _LOGGER.debug("Purging entity data for %s", selected_entity_ids)
         if len(selected_entity_ids) > 0:
             # Purge a max of MAX_ROWS_TO_PURGE, based on the oldest states or events record
-            _purge_filtered_states(session, selected_entity_ids)
+            _purge_filtered_states(instance, session, selected_entity_ids)
             _LOGGER.debug("Purging entity data hasn't fully completed yet")
             return False
 
@@ -7,23 +7,26 @@ from itertools import groupby
 import logging
 from typing import TYPE_CHECKING, Any, Callable
 
-from sqlalchemy import bindparam
+from sqlalchemy import bindparam, func
 from sqlalchemy.ext import baked
 from sqlalchemy.orm.scoping import scoped_session
 
 from homeassistant.const import PRESSURE_PA, TEMP_CELSIUS
-from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.core import Event, HomeAssistant, State, callback
 from homeassistant.helpers import entity_registry
 import homeassistant.util.dt as dt_util
 import homeassistant.util.pressure as pressure_util
 import homeassistant.util.temperature as temperature_util
 from homeassistant.util.unit_system import UnitSystem
 
-from .const import DOMAIN
+from .const import DATA_INSTANCE, DOMAIN
 from .models import (
     StatisticMetaData,
     Statistics,
+    StatisticsBase,
     StatisticsMeta,
+    StatisticsShortTerm,
+    process_timestamp,
     process_timestamp_to_utc_isoformat,
 )
 from .util import execute, retryable_database_job, session_scope
@@ -42,6 +45,17 @@ QUERY_STATISTICS = [
     Statistics.sum,
 ]
 
+QUERY_STATISTICS_SHORT_TERM = [
+    StatisticsShortTerm.metadata_id,
+    StatisticsShortTerm.start,
+    StatisticsShortTerm.mean,
+    StatisticsShortTerm.min,
+    StatisticsShortTerm.max,
+    StatisticsShortTerm.last_reset,
+    StatisticsShortTerm.state,
+    StatisticsShortTerm.sum,
+]
+
 QUERY_STATISTIC_META = [
     StatisticsMeta.id,
     StatisticsMeta.statistic_id,
@@ -50,6 +64,13 @@ QUERY_STATISTIC_META = [
 
 STATISTICS_BAKERY = "recorder_statistics_bakery"
 STATISTICS_META_BAKERY = "recorder_statistics_bakery"
+STATISTICS_SHORT_TERM_BAKERY = "recorder_statistics_short_term_bakery"
+
+PERIOD_5MINUTE = "5minute"
+PERIOD_HOUR = "hour"
+
+# The statistics tables, from the finest to the coarsest period
+STATISTICS_TABLES: list[type[StatisticsBase]] = [StatisticsShortTerm, Statistics]
 
 # Convert pressure and temperature statistics from the native unit used for statistics
 # to the units configured by the user
@@ -73,6 +94,7 @@ def async_setup(hass: HomeAssistant) -> None:
     """Set up the history hooks."""
     hass.data[STATISTICS_BAKERY] = baked.bakery()
     hass.data[STATISTICS_META_BAKERY] = baked.bakery()
+    hass.data[STATISTICS_SHORT_TERM_BAKERY] = baked.bakery()
 
     def entity_id_changed(event: Event) -> None:
         """Handle entity_id changed."""
@@ -100,11 +122,35 @@ def async_setup(hass: HomeAssistant) -> None:
         )
 
 
-def get_start_time() -> datetime:
-    """Return start time."""
-    last_hour = dt_util.utcnow() - timedelta(hours=1)
-    start = last_hour.replace(minute=0, second=0, microsecond=0)
-    return start
+def get_period_start(time: datetime, duration: timedelta) -> datetime:
+    """Return the start of the period of duration which contains time.
+
+    The duration must divide an hour.
+    """
+    minutes = duration // timedelta(minutes=1)
+    return time.replace(
+        minute=time.minute - time.minute % minutes, second=0, microsecond=0
+    )
+
+
+def get_start_time(table: type[StatisticsBase] = Statistics) -> datetime:
+    """Return the start of the last complete period of the table."""
+    return get_period_start(dt_util.utcnow() - table.duration, table.duration)
+
+
+def _baked_statistics_query(
+    hass: HomeAssistant, table: type[StatisticsBase]
+) -> baked.BakedQuery:
+    """Return a baked query of the statistics of the table."""
+    # The query cache of a bakery is keyed by the code of the lambdas,
+    # so each table needs its own bakery
+    if table is StatisticsShortTerm:
+        return hass.data[STATISTICS_SHORT_TERM_BAKERY](
+            lambda session: session.query(*QUERY_STATISTICS_SHORT_TERM)
+        )
+    return hass.data[STATISTICS_BAKERY](
+        lambda session: session.query(*QUERY_STATISTICS)
+    )
 
 
 def _get_metadata_ids(
@@ -141,32 +187,229 @@ def _get_or_add_metadata_id(
     return metadata_id[0]
 
 
-@retryable_database_job("statistics")
-def compile_statistics(instance: Recorder, start: datetime) -> bool:
-    """Compile statistics."""
-    start = dt_util.as_utc(start)
-    end = start + timedelta(hours=1)
+class StatisticsAccumulators:
+    """Statistics accumulators of the recorder platforms.
+
+    A recorder platform can provide an accumulator for the periods of
+    each statistics table with create_statistics_accumulator(hass,
+    duration). The accumulators are fed with the significant state
+    changes in the recorder thread, which lets the statistics be
+    compiled without querying the states.
+
+    An accumulator only covers the periods which started after it was
+    created, since it has not seen the state changes before that.
+    """
+
+    def __init__(self, hass: HomeAssistant, entity_filter: Callable[[str], bool]):
+        """Initialize the accumulators."""
+        self.hass = hass
+        self._entity_filter = entity_filter
+        self._accumulators: dict[type[StatisticsBase], dict[str, Any]] = {
+            table: {} for table in STATISTICS_TABLES
+        }
+        self._complete_from: dict[type[StatisticsBase], dict[str, datetime]] = {
+            table: {} for table in STATISTICS_TABLES
+        }
+        self._compiled_until: dict[type[StatisticsBase], datetime] = {}
+
+    @callback
+    def async_create_platform_accumulators(
+        self, platform: Any
+    ) -> dict[type[StatisticsBase], Any]:
+        """Create the accumulators of a recorder platform.
+
+        The accumulators start from the current states, like the compilation
+        from the recorded states does. Pass them to add_platform in the
+        recorder thread.
+        """
+        states = [
+            state
+            for state in self.hass.states.async_all()
+            if self._entity_filter(state.entity_id)
+        ]
+        accumulators = {}
+        for table in STATISTICS_TABLES:
+            accumulator = platform.create_statistics_accumulator(
+                self.hass, table.duration
+            )
+            for state in states:
+                accumulator.add_state(state)
+            accumulators[table] = accumulator
+        return accumulators
+
+    def add_platform(
+        self,
+        domain: str,
+        accumulators: dict[type[StatisticsBase], Any],
+        created: datetime,
+    ) -> None:
+        """Add the accumulators of a recorder platform."""
+        for table, accumulator in accumulators.items():
+            self._accumulators[table][domain] = accumulator
+            self._complete_from[table][domain] = (
+                get_period_start(created, table.duration) + table.duration
+            )
+
+    def add_state(self, state: State) -> None:
+        """Add a significant state change to the accumulators."""
+        for accumulators in self._accumulators.values():
+            for accumulator in accumulators.values():
+                accumulator.add_state(state)
+
+    def covers(self, start: datetime, table: type[StatisticsBase]) -> bool:
+        """Return True if all platforms can compile the period from an accumulator."""
+        if start != get_period_start(start, table.duration):
+            return False
+        compiled_until = self._compiled_until.get(table)
+        if compiled_until is not None and start < compiled_until:
+            return False
+        for domain, platform in list(self.hass.data[DOMAIN].items()):
+            if not hasattr(platform, "compile_statistics"):
+                continue
+            if (
+                domain not in self._accumulators[table]
+                or start < self._complete_from[table][domain]
+            ):
+                return False
+        return True
+
+    def compile_statistics(
+        self, domain: str, start: datetime, table: type[StatisticsBase]
+    ) -> dict:
+        """Compile the statistics of a platform from its accumulator."""
+        stats: dict = self._accumulators[table][domain].compile_statistics(
+            start, start + table.duration
+        )
+        return stats
+
+    def discard(self, end: datetime, table: type[StatisticsBase]) -> None:
+        """Discard the accumulated state changes before end."""
+        for accumulator in self._accumulators[table].values():
+            accumulator.discard(end)
+        compiled_until = self._compiled_until.get(table)
+        if compiled_until is None or end > compiled_until:
+            self._compiled_until[table] = end
+
+
+def _compile_platform_statistics(
+    hass: HomeAssistant,
+    start: datetime,
+    table: type[StatisticsBase],
+    accumulators: StatisticsAccumulators | None = None,
+) -> list[dict]:
+    """Compile the statistics of the recorder platforms."""
+    end = start + table.duration
     _LOGGER.debug("Compiling statistics for %s-%s", start, end)
     platform_stats = []
-    for domain, platform in instance.hass.data[DOMAIN].items():
+    for domain, platform in list(hass.data[DOMAIN].items()):
         if not hasattr(platform, "compile_statistics"):
             continue
-        platform_stats.append(platform.compile_statistics(instance.hass, start, end))
+        if accumulators is not None:
+            platform_stats.append(accumulators.compile_statistics(domain, start, table))
+        else:
+            platform_stats.append(platform.compile_statistics(hass, start, end))
         _LOGGER.debug(
             "Statistics for %s during %s-%s: %s", domain, start, end, platform_stats[-1]
         )
-
+    if accumulators is not None:
+        accumulators.discard(end, table)
+    return platform_stats
+
+
+def _save_statistics(
+    instance: Recorder,
+    start: datetime,
+    platform_stats: list[dict],
+    table: type[StatisticsBase],
+) -> None:
+    """Save the compiled statistics of the recorder platforms."""
     with session_scope(session=instance.get_session()) as session:  # type: ignore
         for stats in platform_stats:
             for entity_id, stat in stats.items():
                 metadata_id = _get_or_add_metadata_id(
                     instance.hass, session, entity_id, stat["meta"]
                 )
-                session.add(Statistics.from_stats(metadata_id, start, stat["stat"]))
+                session.add(table.from_stats(metadata_id, start, stat["stat"]))
+        if table is StatisticsShortTerm:
+            # The short term statistics are only kept for a while
+            session.query(StatisticsShortTerm).filter(
+                StatisticsShortTerm.start < _short_term_retained_from(instance)
+            ).delete(synchronize_session=False)
+
+
+@retryable_database_job("statistics")
+def compile_statistics(
+    instance: Recorder, start: datetime, table: type[StatisticsBase] = Statistics
+) -> bool:
+    """Compile statistics from the accumulators.
 
+    The accumulators must cover the period, see StatisticsAccumulators.covers.
+    """
+    start = dt_util.as_utc(start)
+    platform_stats = _compile_platform_statistics(
+        instance.hass, start, table, instance.statistics_accumulators
+    )
+    _save_statistics(instance, start, platform_stats, table)
     return True
 
 
+def compile_missed_statistics(
+    hass: HomeAssistant, start: datetime, table: type[StatisticsBase] = Statistics
+) -> list[dict]:
+    """Compile statistics from the recorded states.
+
+    This is slow with many entities and runs in the statistics worker
+    instead of the recorder thread.
+    """
+    return _compile_platform_statistics(hass, dt_util.as_utc(start), table)
+
+
+@retryable_database_job("statistics")
+def save_statistics(
+    instance: Recorder,
+    start: datetime,
+    platform_stats: list[dict],
+    table: type[StatisticsBase] = Statistics,
+) -> bool:
+    """Save statistics compiled by compile_missed_statistics."""
+    _save_statistics(instance, dt_util.as_utc(start), platform_stats, table)
+    return True
+
+
+def _short_term_retained_from(instance: Recorder) -> datetime:
+    """Return the start of the short term statistics which are kept."""
+    return get_period_start(
+        dt_util.utcnow() - timedelta(days=instance.short_term_statistics_keep_days),
+        StatisticsShortTerm.duration,
+    )
+
+
+def get_missed_periods(
+    instance: Recorder, last_period: datetime, table: type[StatisticsBase] = Statistics
+) -> list[datetime]:
+    """Return the start of the periods up to last_period which were not compiled.
+
+    Periods which are older than the rows kept in the table are not returned.
+    """
+    with session_scope(session=instance.get_session()) as session:  # type: ignore
+        last_start = session.query(func.max(table.start)).scalar()
+    if last_start is None:
+        # No statistics were compiled before
+        return []
+    if table is StatisticsShortTerm:
+        retained_from = _short_term_retained_from(instance)
+    else:
+        retained_from = get_period_start(
+            dt_util.utcnow() - timedelta(days=instance.keep_days), table.duration
+        )
+    start = max(process_timestamp(last_start) + table.duration, retained_from)
+    periods = []
+    while start <= last_period:
+        periods.append(start)
+        start += table.duration
+    return periods
+
+
 def _get_metadata(
     hass: HomeAssistant,
     session: scoped_session,
@@ -252,67 +495,137 @@ def list_statistic_ids(
     ]
 
 
+def _statistics_during_period(
+    hass: HomeAssistant,
+    session: scoped_session,
+    start_time: datetime,
+    end_time: datetime | None,
+    statistic_ids: list[str] | None,
+    metadata: dict[str, dict[str, str]],
+    table: type[StatisticsBase],
+) -> dict[str, list[dict]]:
+    """Return the statistics of the table during UTC period start_time - end_time."""
+    baked_query = _baked_statistics_query(hass, table)
+
+    baked_query += lambda q: q.filter(table.start >= bindparam("start_time"))
+
+    if end_time is not None:
+        baked_query += lambda q: q.filter(table.start < bindparam("end_time"))
+
+    metadata_ids = None
+    if statistic_ids is not None:
+        baked_query += lambda q: q.filter(
+            table.metadata_id.in_(bindparam("metadata_ids"))
+        )
+        metadata_ids = list(metadata.keys())
+
+    baked_query += lambda q: q.order_by(table.metadata_id, table.start)
+
+    stats = execute(
+        baked_query(session).params(
+            start_time=start_time, end_time=end_time, metadata_ids=metadata_ids
+        )
+    )
+    if not stats:
+        return {}
+    return _sorted_statistics_to_dict(hass, stats, statistic_ids, metadata)
+
+
 def statistics_during_period(
     hass: HomeAssistant,
     start_time: datetime,
     end_time: datetime | None = None,
     statistic_ids: list[str] | None = None,
+    period: str | None = None,
 ) -> dict[str, list[dict[str, str]]]:
-    """Return states changes during UTC period start_time - end_time."""
-    metadata = None
+    """Return statistics during UTC period start_time - end_time.
+
+    Without a period, the hourly statistics are returned unless the period
+    is shorter than an hour and the short term statistics are kept for all
+    of it, the 5 minute statistics are returned then.
+
+    The short term statistics are only kept for a while. When 5 minute
+    statistics are requested the hourly statistics are returned for the
+    part of the period before the oldest kept short term statistics.
+    """
+    if period is None:
+        period = PERIOD_HOUR
+        if (
+            end_time is not None
+            and end_time - start_time < Statistics.duration
+            and start_time >= _short_term_retained_from(hass.data[DATA_INSTANCE])
+        ):
+            # An hourly row can't describe a period shorter than an hour
+            period = PERIOD_5MINUTE
+
+    short_term_start: datetime | None
+    if period == PERIOD_5MINUTE:
+        # The hourly statistics before the short term statistics end at
+        # the start of the first hour with complete short term statistics
+        short_term_start = (
+            get_period_start(
+                _short_term_retained_from(hass.data[DATA_INSTANCE])
+                - timedelta.resolution,
+                Statistics.duration,
+            )
+            + Statistics.duration
+        )
+        short_term_start = max(short_term_start, start_time)
+    else:
+        short_term_start = end_time
+
     with session_scope(hass=hass) as session:
         metadata = _get_metadata(hass, session, statistic_ids, None)
         if not metadata:
             return {}
 
-        baked_query = hass.data[STATISTICS_BAKERY](
-            lambda session: session.query(*QUERY_STATISTICS)
-        )
-
-        baked_query += lambda q: q.filter(Statistics.start >= bindparam("start_time"))
-
-        if end_time is not None:
-            baked_query += lambda q: q.filter(Statistics.start < bindparam("end_time"))
-
-        metadata_ids = None
-        if statistic_ids is not None:
-            baked_query += lambda q: q.filter(
-                Statistics.metadata_id.in_(bindparam("metadata_ids"))
+        result: dict[str, list[dict]] = {}
+        if short_term_start is None or short_term_start > start_time:
+            result = _statistics_during_period(
+                hass,
+                session,
+                start_time,
+                short_term_start,
+                statistic_ids,
+                metadata,
+                Statistics,
             )
-            metadata_ids = list(metadata.keys())
-
-        baked_query += lambda q: q.order_by(Statistics.metadata_id, Statistics.start)
-
-        stats = execute(
-            baked_query(session).params(
-                start_time=start_time, end_time=end_time, metadata_ids=metadata_ids
+        if short_term_start is not None and (
+            end_time is None or short_term_start < end_time
+        ):
+            short_term = _statistics_during_period(
+                hass,
+                session,
+                short_term_start,
+                end_time,
+                statistic_ids,
+                metadata,
+                StatisticsShortTerm,
             )
-        )
-        if not stats:
-            return {}
-        return _sorted_statistics_to_dict(hass, stats, statistic_ids, metadata)
+            for statistic_id, stats in short_term.items():
+                result.setdefault(statistic_id, []).extend(stats)
+        return result
 
 
-def get_last_statistics(
-    hass: HomeAssistant, number_of_stats: int, statistic_id: str
+def _get_last_statistics(
+    hass: HomeAssistant,
+    number_of_stats: int,
+    statistic_id: str,
+    table: type[StatisticsBase],
 ) -> dict[str, list[dict]]:
-    """Return the last number_of_stats statistics for a statistic_id."""
+    """Return the last number_of_stats statistics of the table for a statistic_id."""
     statistic_ids = [statistic_id]
     with session_scope(hass=hass) as session:
         metadata = _get_metadata(hass, session, statistic_ids, None)
         if not metadata:
             return {}
 
-        baked_query = hass.data[STATISTICS_BAKERY](
-            lambda session: session.query(*QUERY_STATISTICS)
-        )
+        baked_query = _baked_statistics_query(hass, table)
 
         baked_query += lambda q: q.filter_by(metadata_id=bindparam("metadata_id"))
         metadata_id = next(iter(metadata.keys()))
 
-        baked_query += lambda q: q.order_by(
-            Statistics.metadata_id, Statistics.start.desc()
-        )
+        baked_query += lambda q: q.order_by(table.metadata_id, table.start.desc())
 
         baked_query += lambda q: q.limit(bindparam("number_of_stats"))
 
@@ -327,6 +640,22 @@ def get_last_statistics(
         return _sorted_statistics_to_dict(hass, stats, statistic_ids, metadata)
 
 
+def get_last_statistics(
+    hass: HomeAssistant, number_of_stats: int, statistic_id: str
+) -> dict[str, list[dict]]:
+    """Return the last number_of_stats statistics for a statistic_id."""
+    return _get_last_statistics(hass, number_of_stats, statistic_id, Statistics)
+
+
+def get_last_short_term_statistics(
+    hass: HomeAssistant, number_of_stats: int, statistic_id: str
+) -> dict[str, list[dict]]:
+    """Return the last number_of_stats short term statistics for a statistic_id."""
+    return _get_last_statistics(
+        hass, number_of_stats, statistic_id, StatisticsShortTerm
+    )
+
+
 def _sorted_statistics_to_dict(
     hass: HomeAssistant,
     stats: list,
@@ -7,6 +7,11 @@ import logging
 from typing import Callable
 
 from homeassistant.components.recorder import history, statistics
+from homeassistant.components.recorder.models import (
+    Statistics,
+    StatisticsBase,
+    StatisticsShortTerm,
+)
 from homeassistant.components.sensor import (
     ATTR_STATE_CLASS,
     DEVICE_CLASS_BATTERY,
@@ -193,6 +198,85 @@ def _normalize_states(
     return DEVICE_CLASS_UNITS[device_class], fstates
 
 
+def _add_to_last_reset_segments(
+    segments: list[list], fstate: float, last_reset: str
+) -> None:
+    """Add a state to the [last_reset, first state, last state] segments."""
+    if segments and segments[-1][0] == last_reset:
+        segments[-1][2] = fstate
+    else:
+        segments.append([last_reset, fstate, fstate])
+
+
+def _period_end(stat: dict, table: type[StatisticsBase]) -> datetime.datetime:
+    """Return the end of the period of a statistics row."""
+    start = dt_util.parse_datetime(stat["start"])
+    assert start is not None
+    return start + table.duration
+
+
+def _get_last_statistics(
+    hass: HomeAssistant, entity_id: str, short_term: bool
+) -> dict | None:
+    """Return the last statistics which the sum of a period continues from.
+
+    The short term statistics continue from the hourly statistics when
+    those end later, which keeps the sums of both the same.
+    """
+    last_stats = statistics.get_last_statistics(hass, 1, entity_id).get(entity_id)
+    if short_term:
+        last_short_term_stats = statistics.get_last_short_term_statistics(
+            hass, 1, entity_id
+        ).get(entity_id)
+        if last_short_term_stats and (
+            not last_stats
+            or _period_end(last_short_term_stats[0], StatisticsShortTerm)
+            >= _period_end(last_stats[0], Statistics)
+        ):
+            return last_short_term_stats[0]
+    return last_stats[0] if last_stats else None
+
+
+def _compile_sum(
+    hass: HomeAssistant, entity_id: str, segments: list[list], short_term: bool
+) -> dict | None:
+    """Compile the sum from the last_reset segments of the period.
+
+    Each segment holds the first and last state since the last_reset
+    changed. Returns None if there are no valid updates.
+    """
+    last_reset = old_last_reset = None
+    new_state = old_state = None
+    _sum = 0
+    last_stats = _get_last_statistics(hass, entity_id, short_term)
+    if last_stats is not None:
+        # We have compiled history for this sensor before, use that as a starting point
+        last_reset = old_last_reset = last_stats["last_reset"]
+        new_state = old_state = last_stats["state"]
+        _sum = last_stats["sum"]
+
+    for last_reset, first_fstate, last_fstate in segments:
+        if last_reset != old_last_reset:
+            # The sensor has been reset, update the sum
+            if old_state is not None:
+                _sum += new_state - old_state
+            # ..and update the starting point
+            old_state = first_fstate
+            old_last_reset = last_reset
+        new_state = last_fstate
+
+    if last_reset is None or new_state is None or old_state is None:
+        return None
+
+    # Update the sum with the last state
+    _sum += new_state - old_state
+    return {
+        "last_reset": dt_util.parse_datetime(last_reset),
+        "sum": _sum,
+        "state": new_state,
+    }
+
+
 def compile_statistics(
     hass: HomeAssistant, start: datetime.datetime, end: datetime.datetime
 ) -> dict:
@@ -241,41 +325,20 @@ def compile_statistics(
             stat["mean"] = _time_weighted_average(fstates, start, end)
 
         if "sum" in wanted_statistics:
-            last_reset = old_last_reset = None
-            new_state = old_state = None
-            _sum = 0
-            last_stats = statistics.get_last_statistics(hass, 1, entity_id)
-            if entity_id in last_stats:
-                # We have compiled history for this sensor before, use that as a starting point
-                last_reset = old_last_reset = last_stats[entity_id][0]["last_reset"]
-                new_state = old_state = last_stats[entity_id][0]["state"]
-                _sum = last_stats[entity_id][0]["sum"]
-
+            segments: list[list] = []
             for fstate, state in fstates:
-
-                if "last_reset" not in state.attributes:
-                    continue
-                if (last_reset := state.attributes["last_reset"]) != old_last_reset:
-                    # The sensor has been reset, update the sum
-                    if old_state is not None:
-                        _sum += new_state - old_state
-                    # ..and update the starting point
-                    new_state = fstate
-                    old_last_reset = last_reset
-                    old_state = new_state
-                else:
-                    new_state = fstate
-
-            if last_reset is None or new_state is None or old_state is None:
+                if "last_reset" in state.attributes:
+                    _add_to_last_reset_segments(
+                        segments, fstate, state.attributes["last_reset"]
+                    )
+            sum_stat = _compile_sum(
+                hass, entity_id, segments, end - start < Statistics.duration
+            )
+            if sum_stat is None:
                 # No valid updates
                 result.pop(entity_id)
                 continue
-
-            # Update the sum with the last state
-            _sum += new_state - old_state
-            stat["last_reset"] = dt_util.parse_datetime(last_reset)
-            stat["sum"] = _sum
-            stat["state"] = new_state
+            stat.update(sum_stat)
 
         result[entity_id]["stat"] = stat
 
@@ -313,3 +376,223 @@ def list_statistic_ids(hass: HomeAssistant, statistic_type: str | None = None) -
         statistic_ids[entity_id] = statistics_unit
 
     return statistic_ids
+
+
+class _StatisticsWindow:
+    """Running statistics of an entity during a period."""
+
+    __slots__ = (
+        "start",
+        "seed",
+        "unit",
+        "first_time",
+        "last_time",
+        "last_fstate",
+        "min",
+        "max",
+        "integral",
+        "segments",
+    )
+
+    def __init__(self, start: datetime.datetime) -> None:
+        """Initialize the window."""
+        self.start = start
+        # The last state before the window
+        self.seed: tuple | None = None
+        self.unit: str | None = None
+        self.first_time: datetime.datetime | None = None
+        self.last_time: datetime.datetime | None = None
+        self.last_fstate: float | None = None
+        self.min: float | None = None
+        self.max: float | None = None
+        self.integral = 0.0
+        self.segments: list[list] = []
+
+    def add(
+        self,
+        fstate: float,
+        time: datetime.datetime,
+        last_reset: str | None,
+        unit: str | None,
+    ) -> None:
+        """Add a state, states from before the window count from its start."""
+        time = max(time, self.start)
+        if self.last_fstate is None:
+            self.unit = unit
+            self.first_time = time
+        else:
+            # Accumulate the value, weighted by duration until this state change
+            assert self.last_time is not None
+            self.integral += self.last_fstate * (time - self.last_time).total_seconds()
+        self.last_fstate = fstate
+        self.last_time = time
+        self.min = fstate if self.min is None else min(self.min, fstate)
+        self.max = fstate if self.max is None else max(self.max, fstate)
+        if last_reset is not None:
+            _add_to_last_reset_segments(self.segments, fstate, last_reset)
+
+    def mean(self, end: datetime.datetime) -> float:
+        """Return the time weighted average until end."""
+        assert self.last_fstate is not None
+        assert self.first_time is not None and self.last_time is not None
+        integral = (
+            self.integral + self.last_fstate * (end - self.last_time).total_seconds()
+        )
+        return integral / (end - self.first_time).total_seconds()
+
+
+class _EntityStatistics:
+    """Statistics windows of an entity."""
+
+    __slots__ = ("duration", "last", "windows")
+
+    def __init__(self, duration: datetime.timedelta) -> None:
+        """Initialize the entity statistics."""
+        self.duration = duration
+        # The last (fstate, time, last_reset, unit) which carries
+        # over into the periods without state changes, fstate is None
+        # when the last state had no value
+        self.last: tuple | None = None
+        self.windows: dict[datetime.datetime, _StatisticsWindow] = {}
+
+    def add(
+        self,
+        fstate: float,
+        time: datetime.datetime,
+        last_reset: str | None,
+        unit: str | None,
+    ) -> None:
+        """Add a state to the window of its period."""
+        if self.last is not None and time < self.last[1]:
+            return
+        start = statistics.get_period_start(time, self.duration)
+        if (window := self.windows.get(start)) is None:
+            window = self.windows[start] = self._new_window(start, self.last)
+        window.add(fstate, time, last_reset, unit)
+        self.last = (fstate, time, last_reset, unit)
+
+    def add_no_value(self, time: datetime.datetime) -> None:
+        """Add a state without a value, which doesn't carry over."""
+        if self.last is not None and time < self.last[1]:
+            return
+        self.last = (None, time, None, None)
+
+    @staticmethod
+    def _new_window(start: datetime.datetime, seed: tuple | None) -> _StatisticsWindow:
+        """Create a window starting with the last state before it."""
+        window = _StatisticsWindow(start)
+        window.seed = seed
+        if seed is not None and seed[0] is not None:
+            window.add(*seed)
+        return window
+
+    def pop_window(self, start: datetime.datetime) -> _StatisticsWindow | None:
+        """Remove and return the window of the period starting at start."""
+        if (window := self.windows.pop(start, None)) is not None:
+            return window
+        # There were no state changes during the period, the state
+        # before it is the seed of the next window or the last state
+        later = [window for window in self.windows.values() if window.start > start]
+        seed = min(later, key=lambda window: window.start).seed if later else self.last
+        if seed is None or seed[0] is None:
+            return None
+        return self._new_window(start, seed)
+
+    def discard(self, end: datetime.datetime) -> None:
+        """Remove the windows before end."""
+        for start in [start for start in self.windows if start < end]:
+            del self.windows[start]
+
+
+class SensorStatisticsAccumulator:
+    """Accumulate the statistics of the sensors from their state changes.
+
+    The result of compile_statistics is the same as compiling
+    from the recorded states, but without querying them.
+    """
+
+    def __init__(self, hass: HomeAssistant, duration: datetime.timedelta) -> None:
+        """Initialize the accumulator of periods of duration."""
+        self.hass = hass
+        self.duration = duration
+        self._entities: dict[str, _EntityStatistics] = {}
+
+    def add_state(self, state: State) -> None:
+        """Add a significant state change."""
+        if state.domain != DOMAIN:
+            return
+        if state.attributes.get(ATTR_STATE_CLASS) != STATE_CLASS_MEASUREMENT:
+            return
+        device_class = state.attributes.get(ATTR_DEVICE_CLASS)
+        if device_class not in DEVICE_CLASS_STATISTICS:
+            return
+        unit, fstates = _normalize_states([state], device_class, state.entity_id)
+        if not fstates:
+            if (entity := self._entities.get(state.entity_id)) is not None:
+                entity.add_no_value(state.last_updated)
+            return
+        if (entity := self._entities.get(state.entity_id)) is None:
+            entity = self._entities[state.entity_id] = _EntityStatistics(self.duration)
+        entity.add(
+            fstates[0][0],
+            state.last_updated,
+            state.attributes.get("last_reset"),
+            unit,
+        )
+
+    def compile_statistics(
+        self, start: datetime.datetime, end: datetime.datetime
+    ) -> dict:
+        """Compile the statistics of the period start-end."""
+        result: dict = {}
+
+        for entity_id, device_class in _get_entities(self.hass):
+            if (entity := self._entities.get(entity_id)) is None:
+                continue
+            if (window := entity.pop_window(start)) is None:
+                continue
+
+            wanted_statistics = DEVICE_CLASS_STATISTICS[device_class]
+            result[entity_id] = {
+                "meta": {
+                    "unit_of_measurement": window.unit,
+                    "has_mean": "mean" in wanted_statistics,
+                    "has_sum": "sum" in wanted_statistics,
+                }
+            }
+
+            stat: dict = {}
+            if "max" in wanted_statistics:
+                stat["max"] = window.max
+            if "min" in wanted_statistics:
+                stat["min"] = window.min
+            if "mean" in wanted_statistics:
+                stat["mean"] = window.mean(end)
+            if "sum" in wanted_statistics:
+                sum_stat = _compile_sum(
+                    self.hass,
+                    entity_id,
+                    window.segments,
+                    self.duration < Statistics.duration,
+                )
+                if sum_stat is None:
+                    # No valid updates
+                    result.pop(entity_id)
+                    continue
+                stat.update(sum_stat)
+
+            result[entity_id]["stat"] = stat
+
+        return result
+
+    def discard(self, end: datetime.datetime) -> None:
+        """Discard the state changes before end."""
+        for entity in self._entities.values():
+            entity.discard(end)
+
+
+def create_statistics_accumulator(
+    hass: HomeAssistant, duration: datetime.timedelta
+) -> SensorStatisticsAccumulator:
+    """Return an accumulator to compile statistics of periods incrementally."""
+    return SensorStatisticsAccumulator(hass, duration)
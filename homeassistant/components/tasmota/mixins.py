@@ -52,6 +52,7 @@ class TasmotaEntity(Entity):
         """Handle updated discovery message."""
         self._tasmota_entity.config_update(update)
         await self._subscribe_topics()
+        self.async_invalidate_static_attributes()
         if write_state:
             self.async_write_ha_state()
 
@@ -226,6 +226,7 @@ class TemplateEntity(Entity):
                     event, update.template, update.last_result, update.result
                 )
 
+        self.async_invalidate_static_attributes()
         self.async_write_ha_state()
 
     async def _async_template_startup(self, *_) -> None:
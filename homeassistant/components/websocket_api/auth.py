@@ -1,7 +1,7 @@
 """Handle the auth of a connection."""
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 from typing import TYPE_CHECKING, Any, Final
 
 from aiohttp.web import Request
@@ -58,10 +58,12 @@ class AuthPhase:
         hass: HomeAssistant,
         send_message: Callable[[str | dict[str, Any]], None],
         request: Request,
+        wait_for_writer: Callable[[], Awaitable[None]] | None = None,
     ) -> None:
         """Initialize the authentiated connection."""
         self._hass = hass
         self._send_message = send_message
+        self._wait_for_writer = wait_for_writer
         self._logger = logger
         self._request = request
 
@@ -97,5 +99,10 @@ class AuthPhase:
         await process_success_login(self._request)
         self._send_message(auth_ok_message())
         return ActiveConnection(
-            self._logger, self._hass, self._send_message, user, refresh_token
+            self._logger,
+            self._hass,
+            self._send_message,
+            user,
+            refresh_token,
+            self._wait_for_writer,
         )
@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Hashable
+from collections.abc import Awaitable, Hashable
 from typing import TYPE_CHECKING, Any, Callable
 
 import voluptuous as vol
@@ -24,17 +24,20 @@ class ActiveConnection:
         self,
         logger: WebSocketAdapter,
         hass: HomeAssistant,
-        send_message: Callable[[str | dict[str, Any]], None],
+        send_message: Callable[..., None],
         user: User,
         refresh_token: RefreshToken,
+        wait_for_writer: Callable[[], Awaitable[None]] | None = None,
     ) -> None:
         """Initialize an active connection."""
         self.logger = logger
         self.hass = hass
         self.send_message = send_message
+        self._wait_for_writer = wait_for_writer
         self.user = user
         self.refresh_token_id = refresh_token.id
         self.subscriptions: dict[Hashable, Callable[[], Any]] = {}
+        self.supported_features: dict[str, float] = {}
         self.last_id = 0
 
     def context(self, msg: dict[str, Any]) -> Context:
@@ -53,6 +56,14 @@ class ActiveConnection:
         )
         self.send_message(content)
 
+    async def async_wait_for_writer(self) -> None:
+        """Wait until the messages sent so far were written to the client.
+
+        Lets commands streaming large responses pace themselves to the client.
+        """
+        if self._wait_for_writer is not None:
+            await self._wait_for_writer()
+
     @callback
     def send_error(self, msg_id: int, code: str, message: str) -> None:
         """Send a error message."""
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import asyncio
+from collections import deque
 from collections.abc import Callable
 from contextlib import suppress
 import datetime as dt
@@ -17,9 +18,12 @@ from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.helpers.event import async_call_later
 
 from .auth import AuthPhase, auth_required_message
+from .connection import ActiveConnection
 from .const import (
     CANCELLATION_ERRORS,
     DATA_CONNECTIONS,
+    DATA_HANDLERS,
+    FEATURE_COALESCE_MESSAGES,
     MAX_PENDING_MSG,
     PENDING_MSG_PEAK,
     PENDING_MSG_PEAK_TIME,
@@ -61,24 +65,79 @@ class WebSocketHandler:
         self.hass = hass
         self.request = request
         self.wsock: web.WebSocketResponse | None = None
-        self._to_write: asyncio.Queue = asyncio.Queue(maxsize=MAX_PENDING_MSG)
+        self._connection: ActiveConnection | None = None
+        # Messages, coalesce keys of the messages in _coalesced_messages
+        # and None to stop the writer
+        self._message_queue: deque[str | tuple | None] = deque()
+        self._coalesced_messages: dict[tuple, str] = {}
+        self._message_available = asyncio.Event()
+        # Set while no messages are pending or the writer stopped
+        self._messages_written = asyncio.Event()
         self._handle_task: asyncio.Task | None = None
         self._writer_task: asyncio.Task | None = None
         self._logger = WebSocketAdapter(_WS_LOGGER, {"connid": id(self)})
         self._peak_checker_unsub: Callable[[], None] | None = None
+        self._written_at_peak = 0
+        # Metrics of the connection
+        self.written_messages = 0
+        self.coalesced_messages = 0
+        self.peak_pending_messages = 0
+
+    def _pop_message(self) -> str | None:
+        """Return the next message to write, None to stop."""
+        message = self._message_queue.popleft()
+        if message is None or isinstance(message, str):
+            return message
+        return self._coalesced_messages.pop(message)
 
     async def _writer(self) -> None:
         """Write outgoing messages."""
         # Exceptions if Socket disconnected or cancelled by connection handler
         assert self.wsock is not None
+        wsock = self.wsock
+        queue = self._message_queue
         with suppress(RuntimeError, ConnectionResetError, *CANCELLATION_ERRORS):
-            while not self.wsock.closed:
-                message = await self._to_write.get()
+            while not wsock.closed:
+                if not queue:
+                    self._messages_written.set()
+                    self._message_available.clear()
+                    await self._message_available.wait()
+                    continue
+
+                message = self._pop_message()
                 if message is None:
                     break
 
-                self._logger.debug("Sending %s", message)
-                await self.wsock.send_str(message)
+                if (
+                    not queue
+                    or self._connection is None
+                    or not self._connection.supported_features.get(
+                        FEATURE_COALESCE_MESSAGES
+                    )
+                ):
+                    self._logger.debug("Sending %s", message)
+                    self.written_messages += 1
+                    await wsock.send_str(message)
+                    continue
+
+                # Send all pending messages in a single frame
+                batch = [message]
+                stop = False
+                while queue:
+                    message = self._pop_message()
+                    if message is None:
+                        stop = True
+                        break
+                    batch.append(message)
+
+                self._logger.debug("Sending %s", batch)
+                self.written_messages += len(batch)
+                await wsock.send_str(f'[{",".join(batch)}]')
+                if stop:
+                    break
+
+        # Nothing will be written anymore, release the waiters
+        self._messages_written.set()
 
         # Clean up the peaker checker when we shut down the writer
         if self._peak_checker_unsub is not None:
@@ -86,9 +145,14 @@ class WebSocketHandler:
             self._peak_checker_unsub = None
 
     @callback
-    def _send_message(self, message: str | dict[str, Any]) -> None:
+    def _send_message(
+        self, message: str | dict[str, Any], coalesce_key: tuple | None = None
+    ) -> None:
         """Send a message to the client.
 
+        While the client is behind, a pending message with the same
+        coalesce_key is replaced by the message, so it only gets the latest one.
+
         Closes connection if the client is not reading the messages.
 
         Async friendly.
@@ -96,32 +160,86 @@ class WebSocketHandler:
         if not isinstance(message, str):
             message = message_to_json(message)
 
-        try:
-            self._to_write.put_nowait(message)
-        except asyncio.QueueFull:
+        if coalesce_key is not None and len(self._message_queue) >= PENDING_MSG_PEAK:
+            if coalesce_key in self._coalesced_messages:
+                self._coalesced_messages[coalesce_key] = message
+                self.coalesced_messages += 1
+                return
+            self._coalesced_messages[coalesce_key] = message
+            self._message_queue.append(coalesce_key)
+        else:
+            self._message_queue.append(message)
+        self._message_available.set()
+        if self._writer_task is not None and not self._writer_task.done():
+            self._messages_written.clear()
+
+        pending = len(self._message_queue)
+        if pending > self.peak_pending_messages:
+            self.peak_pending_messages = pending
+
+        if pending > MAX_PENDING_MSG:
             self._logger.error(
                 "Client exceeded max pending messages [2]: %s", MAX_PENDING_MSG
             )
 
             self._cancel()
 
-        if self._to_write.qsize() < PENDING_MSG_PEAK:
+        if pending < PENDING_MSG_PEAK:
             if self._peak_checker_unsub:
                 self._peak_checker_unsub()
                 self._peak_checker_unsub = None
             return
 
         if self._peak_checker_unsub is None:
+            self._written_at_peak = self.written_messages
             self._peak_checker_unsub = async_call_later(
                 self.hass, PENDING_MSG_PEAK_TIME, self._check_write_peak
             )
 
+    @callback
+    def async_get_metrics(self) -> dict[str, Any]:
+        """Return the metrics of the connection.
+
+        Pending messages are only sent in a single frame to clients that
+        enabled FEATURE_COALESCE_MESSAGES with the supported_features command.
+        """
+        connection = self._connection
+        return {
+            "user_id": connection.user.id if connection is not None else None,
+            "written_messages": self.written_messages,
+            "coalesced_messages": self.coalesced_messages,
+            "pending_messages": len(self._message_queue),
+            "peak_pending_messages": self.peak_pending_messages,
+            "batched_frames": connection is not None
+            and bool(connection.supported_features.get(FEATURE_COALESCE_MESSAGES)),
+        }
+
+    async def _async_wait_for_writer(self) -> None:
+        """Wait until the pending messages were written."""
+        await self._messages_written.wait()
+
     @callback
     def _check_write_peak(self, _utc_time: dt.datetime) -> None:
         """Check that we are no longer above the write peak."""
         self._peak_checker_unsub = None
 
-        if self._to_write.qsize() < PENDING_MSG_PEAK:
+        pending = len(self._message_queue)
+        if pending < PENDING_MSG_PEAK:
+            return
+
+        if self.written_messages > self._written_at_peak:
+            # The client is slow but still reading, keep coalescing
+            # until it catches up or exceeds the max pending messages
+            self._logger.debug(
+                "Client behind with %s pending messages, wrote %s in %s seconds",
+                pending,
+                self.written_messages - self._written_at_peak,
+                PENDING_MSG_PEAK_TIME,
+            )
+            self._written_at_peak = self.written_messages
+            self._peak_checker_unsub = async_call_later(
+                self.hass, PENDING_MSG_PEAK_TIME, self._check_write_peak
+            )
             return
 
         self._logger.error(
@@ -160,7 +278,13 @@ class WebSocketHandler:
         # event we do not want to block for websocket responses
         self._writer_task = asyncio.create_task(self._writer())
 
-        auth = AuthPhase(self._logger, self.hass, self._send_message, request)
+        auth = AuthPhase(
+            self._logger,
+            self.hass,
+            self._send_message,
+            request,
+            self._async_wait_for_writer,
+        )
         connection = None
         disconnect_warn = None
 
@@ -189,10 +313,11 @@ class WebSocketHandler:
                 raise Disconnect from err
 
             self._logger.debug("Received %s", msg_data)
-            connection = await auth.async_handle(msg_data)
+            connection = self._connection = await auth.async_handle(msg_data)
             self.hass.data[DATA_CONNECTIONS] = (
                 self.hass.data.get(DATA_CONNECTIONS, 0) + 1
             )
+            self.hass.data.setdefault(DATA_HANDLERS, set()).add(self)
             self.hass.helpers.dispatcher.async_dispatcher_send(
                 SIGNAL_WEBSOCKET_CONNECTED
             )
@@ -233,21 +358,30 @@ class WebSocketHandler:
                 connection.async_close()
 
             try:
-                self._to_write.put_nowait(None)
-                # Make sure all error messages are written before closing
-                await self._writer_task
-                await wsock.close()
-            except asyncio.QueueFull:  # can be raised by put_nowait
-                self._writer_task.cancel()
+                if len(self._message_queue) > MAX_PENDING_MSG:
+                    self._writer_task.cancel()
+                else:
+                    self._message_queue.append(None)
+                    self._message_available.set()
+                    # Make sure all error messages are written before closing
+                    await self._writer_task
+                    await wsock.close()
 
             finally:
                 if disconnect_warn is None:
                     self._logger.debug("Disconnected")
                 else:
                     self._logger.warning("Disconnected: %s", disconnect_warn)
+                self._logger.debug(
+                    "Wrote %s messages, coalesced %s, peak of %s pending",
+                    self.written_messages,
+                    self.coalesced_messages,
+                    self.peak_pending_messages,
+                )
 
                 if connection is not None:
                     self.hass.data[DATA_CONNECTIONS] -= 1
+                    self.hass.data[DATA_HANDLERS].discard(self)
                 self.hass.helpers.dispatcher.async_dispatcher_send(
                     SIGNAL_WEBSOCKET_DISCONNECTED
                 )
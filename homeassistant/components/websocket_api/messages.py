@@ -7,7 +7,8 @@ from typing import Any, Final
 
 import voluptuous as vol
 
-from homeassistant.core import Event
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Event, State
 from homeassistant.helpers import config_validation as cv
 from homeassistant.util.json import (
     find_paths_unserializable_data,
@@ -30,6 +31,23 @@ BASE_COMMAND_MESSAGE_SCHEMA: Final = vol.Schema({vol.Required("id"): cv.positive
 
 IDEN_TEMPLATE: Final = "__IDEN__"
 IDEN_JSON_TEMPLATE: Final = '"__IDEN__"'
+# Replaced with JSON serialized beforehand
+DATA_TEMPLATE: Final = "__DATA__"
+DATA_JSON_TEMPLATE: Final = '"__DATA__"'
+
+# Short keys of the entity messages of subscribe_entities
+ENTITY_EVENT_ADD: Final = "a"
+ENTITY_EVENT_REMOVE: Final = "r"
+ENTITY_EVENT_CHANGE: Final = "c"
+
+COMPRESSED_STATE_STATE: Final = "s"
+COMPRESSED_STATE_ATTRIBUTES: Final = "a"
+COMPRESSED_STATE_CONTEXT: Final = "c"
+COMPRESSED_STATE_LAST_CHANGED: Final = "lc"
+COMPRESSED_STATE_LAST_UPDATED: Final = "lu"
+
+STATE_DIFF_ADDITIONS: Final = "+"
+STATE_DIFF_REMOVALS: Final = "-"
 
 
 def result_message(iden: int, result: Any = None) -> dict[str, Any]:
@@ -71,9 +89,113 @@ def _cached_event_message(event: Event) -> str:
     The IDEN_TEMPLATE is used which will be replaced
     with the actual iden in cached_event_message
     """
+    if event.event_type == EVENT_STATE_CHANGED:
+        try:
+            return _state_changed_event_message_json(event)
+        except (ValueError, TypeError):
+            # Logged by message_to_json
+            pass
     return message_to_json(event_message(IDEN_TEMPLATE, event))
 
 
+def _state_changed_event_message_json(event: Event) -> str:
+    """Serialize a state changed event with the JSON of its states."""
+    data = event.data
+    old_state: State | None = data["old_state"]
+    new_state: State | None = data["new_state"]
+    data_json = (
+        f'{{"entity_id": {const.JSON_DUMP(data["entity_id"])}, '
+        f'"old_state": {"null" if old_state is None else old_state.as_json()}, '
+        f'"new_state": {"null" if new_state is None else new_state.as_json()}}}'
+    )
+    return const.JSON_DUMP(
+        event_message(IDEN_TEMPLATE, {**event.as_dict(), "data": DATA_TEMPLATE})
+    ).replace(DATA_JSON_TEMPLATE, data_json, 1)
+
+
+def result_message_json(iden: int, result_json: str) -> str:
+    """Return a success result message with a result serialized to json."""
+    return const.JSON_DUMP(result_message(iden, DATA_TEMPLATE)).replace(
+        DATA_JSON_TEMPLATE, result_json, 1
+    )
+
+
+def cached_state_diff_message(iden: int, event: Event) -> str:
+    """Return an entity message of a state changed event.
+
+    Serialize to json once per message, like cached_event_message.
+    """
+    return _cached_state_diff_message(event).replace(IDEN_JSON_TEMPLATE, str(iden), 1)
+
+
+@lru_cache(maxsize=128)
+def _cached_state_diff_message(event: Event) -> str:
+    """Cache and serialize the entity message of the event to json."""
+    return message_to_json(event_message(IDEN_TEMPLATE, _state_diff_event(event)))
+
+
+def _state_diff_event(event: Event) -> dict[str, Any]:
+    """Convert a state changed event to an entity message.
+
+    A new entity is sent as compressed state, a changed entity
+    only as the difference with its old state.
+    """
+    entity_id = event.data["entity_id"]
+    new_state: State | None = event.data["new_state"]
+    if new_state is None:
+        return {ENTITY_EVENT_REMOVE: [entity_id]}
+    old_state: State | None = event.data["old_state"]
+    if old_state is None:
+        return {ENTITY_EVENT_ADD: {entity_id: compressed_state_dict(new_state)}}
+    return {ENTITY_EVENT_CHANGE: {entity_id: _state_diff(old_state, new_state)}}
+
+
+def _state_diff(old_state: State, new_state: State) -> dict[str, dict[str, Any]]:
+    """Return the difference between two states of an entity."""
+    additions: dict[str, Any] = {}
+    diff: dict[str, dict[str, Any]] = {STATE_DIFF_ADDITIONS: additions}
+    if old_state.state != new_state.state:
+        additions[COMPRESSED_STATE_STATE] = new_state.state
+    if old_state.last_changed != new_state.last_changed:
+        additions[COMPRESSED_STATE_LAST_CHANGED] = new_state.last_changed.timestamp()
+    elif old_state.last_updated != new_state.last_updated:
+        additions[COMPRESSED_STATE_LAST_UPDATED] = new_state.last_updated.timestamp()
+    if old_state.context.id != new_state.context.id:
+        additions[COMPRESSED_STATE_CONTEXT] = new_state.context.id
+
+    old_attributes = old_state.attributes
+    new_attributes = new_state.attributes
+    if old_attributes is new_attributes:
+        return diff
+    changed = {
+        key: value
+        for key, value in new_attributes.items()
+        if key not in old_attributes or old_attributes[key] != value
+    }
+    if changed:
+        additions[COMPRESSED_STATE_ATTRIBUTES] = changed
+    removed = [key for key in old_attributes if key not in new_attributes]
+    if removed:
+        diff[STATE_DIFF_REMOVALS] = {COMPRESSED_STATE_ATTRIBUTES: removed}
+    return diff
+
+
+def compressed_state_dict(state: State) -> dict[str, Any]:
+    """Return a state as a dict with short keys.
+
+    last_updated is left out when it is the same as last_changed.
+    """
+    compressed = {
+        COMPRESSED_STATE_STATE: state.state,
+        COMPRESSED_STATE_ATTRIBUTES: dict(state.attributes),
+        COMPRESSED_STATE_CONTEXT: state.context.id,
+        COMPRESSED_STATE_LAST_CHANGED: state.last_changed.timestamp(),
+    }
+    if state.last_updated != state.last_changed:
+        compressed[COMPRESSED_STATE_LAST_UPDATED] = state.last_updated.timestamp()
+    return compressed
+
+
 def message_to_json(message: dict[str, Any]) -> str:
     """Serialize a websocket message to json."""
     try:
@@ -230,6 +230,7 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
 
     async def core_config_updated(_: Event) -> None:
         """Handle core config updated."""
+        home_zone.async_invalidate_static_attributes()
         await home_zone.async_update_config(_home_conf(hass))
 
     hass.bus.async_listen(EVENT_CORE_CONFIG_UPDATE, core_config_updated)
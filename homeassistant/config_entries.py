@@ -22,7 +22,11 @@ from homeassistant.exceptions import (
 from homeassistant.helpers import device_registry, entity_registry
 from homeassistant.helpers.event import Event
 from homeassistant.helpers.typing import UNDEFINED, DiscoveryInfoType, UndefinedType
-from homeassistant.setup import async_process_deps_reqs, async_setup_component
+from homeassistant.setup import (
+    async_process_deps_reqs,
+    async_record_setup_phase,
+    async_setup_component,
+)
 from homeassistant.util.decorator import Registry
 import homeassistant.util.uuid as uuid_util
 
@@ -290,7 +294,10 @@ class ConfigEntry:
         error_reason = None
 
         try:
-            result = await component.async_setup_entry(hass, self)  # type: ignore
+            with async_record_setup_phase(
+                hass, integration.domain, "config entry setup"
+            ):
+                result = await component.async_setup_entry(hass, self)  # type: ignore
 
             if not isinstance(result, bool):
                 _LOGGER.error(
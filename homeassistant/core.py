@@ -7,7 +7,14 @@ of entities and react to changes.
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Awaitable, Collection, Coroutine, Iterable, Mapping
+from collections.abc import (
+    Awaitable,
+    Collection,
+    Coroutine,
+    Hashable,
+    Iterable,
+    Mapping,
+)
 import datetime
 import enum
 import functools
@@ -59,6 +66,7 @@ from homeassistant.exceptions import (
     ServiceNotFound,
     Unauthorized,
 )
+from homeassistant.helpers.json import json_dumps
 from homeassistant.util import location
 from homeassistant.util.async_ import (
     fire_coroutine_threadsafe,
@@ -661,6 +669,10 @@ class EventBus:
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
         self._listeners: dict[str, list[tuple[HassJob, Callable | None]]] = {}
+        # event_type -> event_key -> key -> jobs
+        self._keyed_listeners: dict[
+            str, dict[Callable[[Event], Hashable | None], dict[Hashable, list[HassJob]]]
+        ] = {}
         self._hass = hass
 
     @callback
@@ -669,7 +681,24 @@ class EventBus:
 
         This method must be run in the event loop.
         """
-        return {key: len(listeners) for key, listeners in self._listeners.items()}
+        listeners = {key: len(listeners) for key, listeners in self._listeners.items()}
+        for event_type, indexes in self._keyed_listeners.items():
+            listeners[event_type] = listeners.get(event_type, 0) + sum(
+                len({job for jobs in index.values() for job in jobs})
+                for index in indexes.values()
+            )
+        return listeners
+
+    @callback
+    def async_keyed_listeners(
+        self, event_type: str, event_key: Callable[[Event], Hashable | None]
+    ) -> dict[Hashable, int]:
+        """Return dictionary with keys and the number of keyed listeners.
+
+        This method must be run in the event loop.
+        """
+        index = self._keyed_listeners.get(event_type, {}).get(event_key, {})
+        return {key: len(jobs) for key, jobs in index.items()}
 
     @property
     def listeners(self) -> dict[str, int]:
@@ -706,21 +735,41 @@ class EventBus:
                 event_type, "event_type", MAX_LENGTH_EVENT_EVENT_TYPE
             )
 
-        listeners = self._listeners.get(event_type, [])
-
-        # EVENT_HOMEASSISTANT_CLOSE should go only to his listeners
-        match_all_listeners = self._listeners.get(MATCH_ALL)
-        if match_all_listeners is not None and event_type != EVENT_HOMEASSISTANT_CLOSE:
-            listeners = match_all_listeners + listeners
-
         event = Event(event_type, event_data, origin, time_fired, context)
 
         if event_type != EVENT_TIME_CHANGED:
             _LOGGER.debug("Bus:Handling %s", event)
 
-        if not listeners:
+        # EVENT_HOMEASSISTANT_CLOSE should go only to his listeners
+        if event_type != EVENT_HOMEASSISTANT_CLOSE:
+            match_all_listeners = self._listeners.get(MATCH_ALL)
+            if match_all_listeners is not None:
+                self._async_fire_listeners(match_all_listeners, event)
+
+        listeners = self._listeners.get(event_type)
+        if listeners is not None:
+            self._async_fire_listeners(listeners, event)
+
+        indexes = self._keyed_listeners.get(event_type)
+        if indexes is None:
             return
 
+        for event_key, index in indexes.items():
+            try:
+                key = event_key(event)
+                # The lookup raises TypeError for unhashable keys
+                if key is None or (key not in index and MATCH_ALL not in index):
+                    continue
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Error in event key")
+                continue
+            self._hass.loop.call_soon(self._async_dispatch_keyed, event_key, key, event)
+
+    @callback
+    def _async_fire_listeners(
+        self, listeners: list[tuple[HassJob, Callable | None]], event: Event
+    ) -> None:
+        """Schedule the listeners whose filter accepts the event."""
         for job, event_filter in listeners:
             if event_filter is not None:
                 try:
@@ -731,6 +780,36 @@ class EventBus:
                     continue
             self._hass.async_add_hass_job(job, event)
 
+    @callback
+    def _async_dispatch_keyed(
+        self, event_key: Callable[[Event], Hashable | None], key: Hashable, event: Event
+    ) -> None:
+        """Run the listeners of a key.
+
+        The listeners are looked up again as they may have been removed
+        since the event was fired.
+        """
+        index = self._keyed_listeners.get(event.event_type, {}).get(event_key)
+        if index is None:
+            return
+
+        for jobs_key in (key, MATCH_ALL):
+            if (jobs := index.get(jobs_key)) is None:
+                continue
+            for job in jobs:
+                # The job lists are replaced when listeners are added or
+                # removed, skip the listeners removed by earlier ones
+                if (current := index.get(jobs_key)) is not jobs and (
+                    current is None or job not in current
+                ):
+                    continue
+                try:
+                    self._hass.async_run_hass_job(job, event)
+                except Exception:  # pylint: disable=broad-except
+                    _LOGGER.exception(
+                        "Error while processing event %s for %s", event, key
+                    )
+
     def listen(self, event_type: str, listener: Callable) -> CALLBACK_TYPE:
         """Listen for all events or events of a specific type.
 
@@ -783,6 +862,80 @@ class EventBus:
 
         return remove_listener
 
+    @callback
+    def async_listen_keyed(
+        self,
+        event_type: str,
+        event_key: Callable[[Event], Hashable | None],
+        keys: Iterable[Hashable],
+        listener: Callable,
+    ) -> CALLBACK_TYPE:
+        """Listen for events of a specific type with one of the keys.
+
+        The key of an event is returned by event_key, which must be a
+        callable decorated with @callback, for example the entity_id in
+        the event data. Listeners sharing the same event_key are indexed
+        by their keys so firing an event only looks up the listeners of
+        its key, instead of running the event_filter of every listener.
+        To listen to every event event_key returns a key for, specify
+        the constant ``MATCH_ALL`` as key. Events for which event_key
+        returns None are not passed to any listener.
+
+        Unlike with async_listen, a listener removed after an event was
+        fired, but before the listeners of the event ran, is not run.
+
+        This method must be run in the event loop.
+        """
+        if not is_callback(event_key):
+            raise HomeAssistantError(f"Event key {event_key} is not a callback")
+        job = HassJob(listener)
+        key_list = list(keys)
+        index = self._keyed_listeners.setdefault(event_type, {}).setdefault(
+            event_key, {}
+        )
+        for key in key_list:
+            # The job lists are replaced, not changed, so they can be
+            # iterated while listeners are added or removed
+            index[key] = [*index.get(key, ()), job]
+
+        @callback
+        def remove_listener() -> None:
+            """Remove the listener."""
+            self._async_remove_keyed_listener(event_type, event_key, key_list, job)
+
+        return remove_listener
+
+    @callback
+    def _async_remove_keyed_listener(
+        self,
+        event_type: str,
+        event_key: Callable[[Event], Hashable | None],
+        keys: list[Hashable],
+        job: HassJob,
+    ) -> None:
+        """Remove a keyed listener.
+
+        This method must be run in the event loop.
+        """
+        try:
+            indexes = self._keyed_listeners[event_type]
+            index = indexes[event_key]
+            for key in keys:
+                jobs = list(index[key])
+                jobs.remove(job)
+                if jobs:
+                    index[key] = jobs
+                else:
+                    del index[key]
+        except (KeyError, ValueError):
+            _LOGGER.exception("Unable to remove unknown keyed listener %s", job)
+            return
+
+        if not index:
+            del indexes[event_key]
+            if not indexes:
+                del self._keyed_listeners[event_type]
+
     def listen_once(
         self, event_type: str, listener: Callable[[Event], None]
     ) -> CALLBACK_TYPE:
@@ -881,6 +1034,7 @@ class State:
         "domain",
         "object_id",
         "_as_dict",
+        "_as_json",
     ]
 
     def __init__(
@@ -910,12 +1064,17 @@ class State:
 
         self.entity_id = entity_id.lower()
         self.state = state
-        self.attributes = MappingProxyType(attributes or {})
+        if isinstance(attributes, MappingProxyType):
+            # Shared with the previous state of the entity
+            self.attributes = attributes
+        else:
+            self.attributes = MappingProxyType(attributes or {})
         self.last_updated = last_updated or dt_util.utcnow()
         self.last_changed = last_changed or self.last_updated
         self.context = context or Context()
         self.domain, self.object_id = split_entity_id(self.entity_id)
         self._as_dict: dict[str, Collection[Any]] | None = None
+        self._as_json: str | None = None
 
     @property
     def name(self) -> str:
@@ -948,6 +1107,18 @@ class State:
             }
         return self._as_dict
 
+    def as_json(self) -> str:
+        """Return a JSON representation of the State.
+
+        Async friendly.
+
+        Like as_dict it is only built once, so a state sent to many
+        clients is only serialized once.
+        """
+        if self._as_json is None:
+            self._as_json = json_dumps(self.as_dict())
+        return self._as_json
+
     @classmethod
     def from_dict(cls, json_dict: dict) -> Any:
         """Initialize a state from a dict.
@@ -1204,12 +1375,19 @@ class StateMachine:
             last_changed = None
         else:
             same_state = old_state.state == new_state and not force_update
-            same_attr = old_state.attributes == MappingProxyType(attributes)
+            same_attr = old_state.attributes is attributes or (
+                old_state.attributes == MappingProxyType(attributes)
+            )
             last_changed = old_state.last_changed if same_state else None
 
         if same_state and same_attr:
             return
 
+        if same_attr:
+            # Share the attributes with the old state, so listeners can
+            # check they didn't change by identity
+            attributes = old_state.attributes  # type: ignore[union-attr]
+
         if context is None:
             context = Context()
 
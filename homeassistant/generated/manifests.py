@@ -0,0 +1,12582 @@
+"""Automatically generated by hassfest.
+
+To update, run python3 -m script.hassfest
+"""
+
+# fmt: off
+
+MANIFESTS = {
+    "abode": {
+        "domain": "abode",
+        "name": "Abode",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/abode",
+        "requirements": [
+            "abodepy==1.2.0",
+        ],
+        "codeowners": [
+            "@shred86",
+        ],
+        "homekit": {
+            "models": [
+                "Abode",
+                "Iota",
+            ],
+        },
+        "iot_class": "cloud_push",
+    },
+    "accuweather": {
+        "domain": "accuweather",
+        "name": "AccuWeather",
+        "documentation": "https://www.home-assistant.io/integrations/accuweather/",
+        "requirements": [
+            "accuweather==0.2.0",
+        ],
+        "codeowners": [
+            "@bieniu",
+        ],
+        "config_flow": True,
+        "quality_scale": "platinum",
+        "iot_class": "cloud_polling",
+    },
+    "acer_projector": {
+        "domain": "acer_projector",
+        "name": "Acer Projector",
+        "documentation": "https://www.home-assistant.io/integrations/acer_projector",
+        "requirements": [
+            "pyserial==3.5",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "acmeda": {
+        "domain": "acmeda",
+        "name": "Rollease Acmeda Automate",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/acmeda",
+        "requirements": [
+            "aiopulse==0.4.2",
+        ],
+        "codeowners": [
+            "@atmurray",
+        ],
+        "iot_class": "local_push",
+    },
+    "actiontec": {
+        "domain": "actiontec",
+        "name": "Actiontec",
+        "documentation": "https://www.home-assistant.io/integrations/actiontec",
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "adguard": {
+        "domain": "adguard",
+        "name": "AdGuard Home",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/adguard",
+        "requirements": [
+            "adguardhome==0.5.0",
+        ],
+        "codeowners": [
+            "@frenck",
+        ],
+        "iot_class": "local_polling",
+    },
+    "ads": {
+        "domain": "ads",
+        "name": "ADS",
+        "documentation": "https://www.home-assistant.io/integrations/ads",
+        "requirements": [
+            "pyads==3.2.2",
+        ],
+        "codeowners": [],
+        "iot_class": "local_push",
+    },
+    "advantage_air": {
+        "domain": "advantage_air",
+        "name": "Advantage Air",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/advantage_air",
+        "codeowners": [
+            "@Bre77",
+        ],
+        "requirements": [
+            "advantage_air==0.2.1",
+        ],
+        "quality_scale": "platinum",
+        "iot_class": "local_polling",
+    },
+    "aemet": {
+        "domain": "aemet",
+        "name": "AEMET OpenData",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/aemet",
+        "requirements": [
+            "AEMET-OpenData==0.2.1",
+        ],
+        "codeowners": [
+            "@noltari",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "aftership": {
+        "domain": "aftership",
+        "name": "AfterShip",
+        "documentation": "https://www.home-assistant.io/integrations/aftership",
+        "requirements": [
+            "pyaftership==0.1.2",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_polling",
+    },
+    "agent_dvr": {
+        "domain": "agent_dvr",
+        "name": "Agent DVR",
+        "documentation": "https://www.home-assistant.io/integrations/agent_dvr/",
+        "requirements": [
+            "agent-py==0.0.23",
+        ],
+        "config_flow": True,
+        "codeowners": [
+            "@ispysoftware",
+        ],
+        "iot_class": "local_polling",
+    },
+    "air_quality": {
+        "domain": "air_quality",
+        "name": "Air Quality",
+        "documentation": "https://www.home-assistant.io/integrations/air_quality",
+        "codeowners": [],
+        "quality_scale": "internal",
+    },
+    "airly": {
+        "domain": "airly",
+        "name": "Airly",
+        "documentation": "https://www.home-assistant.io/integrations/airly",
+        "codeowners": [
+            "@bieniu",
+        ],
+        "requirements": [
+            "airly==1.1.0",
+        ],
+        "config_flow": True,
+        "quality_scale": "platinum",
+        "iot_class": "cloud_polling",
+    },
+    "airnow": {
+        "domain": "airnow",
+        "name": "AirNow",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/airnow",
+        "requirements": [
+            "pyairnow==1.1.0",
+        ],
+        "codeowners": [
+            "@asymworks",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "airvisual": {
+        "domain": "airvisual",
+        "name": "AirVisual",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/airvisual",
+        "requirements": [
+            "pyairvisual==5.0.8",
+        ],
+        "codeowners": [
+            "@bachya",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "aladdin_connect": {
+        "domain": "aladdin_connect",
+        "name": "Aladdin Connect",
+        "documentation": "https://www.home-assistant.io/integrations/aladdin_connect",
+        "requirements": [
+            "aladdin_connect==0.3",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_polling",
+    },
+    "alarm_control_panel": {
+        "domain": "alarm_control_panel",
+        "name": "Alarm Control Panel",
+        "documentation": "https://www.home-assistant.io/integrations/alarm_control_panel",
+        "codeowners": [],
+        "quality_scale": "internal",
+    },
+    "alarmdecoder": {
+        "domain": "alarmdecoder",
+        "name": "AlarmDecoder",
+        "documentation": "https://www.home-assistant.io/integrations/alarmdecoder",
+        "requirements": [
+            "adext==0.4.2",
+        ],
+        "codeowners": [
+            "@ajschmidt8",
+        ],
+        "config_flow": True,
+        "iot_class": "local_push",
+    },
+    "alert": {
+        "domain": "alert",
+        "name": "Alert",
+        "documentation": "https://www.home-assistant.io/integrations/alert",
+        "after_dependencies": [
+            "notify",
+        ],
+        "codeowners": [],
+        "quality_scale": "internal",
+        "iot_class": "local_push",
+    },
+    "alexa": {
+        "domain": "alexa",
+        "name": "Amazon Alexa",
+        "documentation": "https://www.home-assistant.io/integrations/alexa",
+        "dependencies": [
+            "http",
+        ],
+        "after_dependencies": [
+            "camera",
+        ],
+        "codeowners": [
+            "@home-assistant/cloud",
+            "@ochlocracy",
+        ],
+        "iot_class": "cloud_push",
+    },
+    "almond": {
+        "domain": "almond",
+        "name": "Almond",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/almond",
+        "dependencies": [
+            "http",
+            "conversation",
+        ],
+        "codeowners": [
+            "@gcampax",
+            "@balloob",
+        ],
+        "requirements": [
+            "pyalmond==0.0.2",
+        ],
+        "iot_class": "local_polling",
+    },
+    "alpha_vantage": {
+        "domain": "alpha_vantage",
+        "name": "Alpha Vantage",
+        "documentation": "https://www.home-assistant.io/integrations/alpha_vantage",
+        "requirements": [
+            "alpha_vantage==2.3.1",
+        ],
+        "codeowners": [
+            "@fabaff",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "amazon_polly": {
+        "domain": "amazon_polly",
+        "name": "Amazon Polly",
+        "documentation": "https://www.home-assistant.io/integrations/amazon_polly",
+        "requirements": [
+            "boto3==1.16.52",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_push",
+    },
+    "ambee": {
+        "domain": "ambee",
+        "name": "Ambee",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/ambee",
+        "requirements": [
+            "ambee==0.3.0",
+        ],
+        "codeowners": [
+            "@frenck",
+        ],
+        "quality_scale": "platinum",
+        "iot_class": "cloud_polling",
+    },
+    "ambiclimate": {
+        "domain": "ambiclimate",
+        "name": "Ambiclimate",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/ambiclimate",
+        "requirements": [
+            "ambiclimate==0.2.1",
+        ],
+        "dependencies": [
+            "http",
+        ],
+        "codeowners": [
+            "@danielhiversen",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "ambient_station": {
+        "domain": "ambient_station",
+        "name": "Ambient Weather Station",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/ambient_station",
+        "requirements": [
+            "aioambient==1.2.4",
+        ],
+        "codeowners": [
+            "@bachya",
+        ],
+        "iot_class": "cloud_push",
+    },
+    "amcrest": {
+        "domain": "amcrest",
+        "name": "Amcrest",
+        "documentation": "https://www.home-assistant.io/integrations/amcrest",
+        "requirements": [
+            "amcrest==1.7.2",
+        ],
+        "dependencies": [
+            "ffmpeg",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "ampio": {
+        "domain": "ampio",
+        "name": "Ampio Smart Smog System",
+        "documentation": "https://www.home-assistant.io/integrations/ampio",
+        "requirements": [
+            "asmog==0.0.6",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_polling",
+    },
+    "analytics": {
+        "domain": "analytics",
+        "name": "Analytics",
+        "documentation": "https://www.home-assistant.io/integrations/analytics",
+        "codeowners": [
+            "@home-assistant/core",
+            "@ludeeus",
+        ],
+        "dependencies": [
+            "api",
+            "websocket_api",
+        ],
+        "quality_scale": "internal",
+        "iot_class": "cloud_push",
+    },
+    "android_ip_webcam": {
+        "domain": "android_ip_webcam",
+        "name": "Android IP Webcam",
+        "documentation": "https://www.home-assistant.io/integrations/android_ip_webcam",
+        "requirements": [
+            "pydroid-ipcam==0.8",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "androidtv": {
+        "domain": "androidtv",
+        "name": "Android TV",
+        "documentation": "https://www.home-assistant.io/integrations/androidtv",
+        "requirements": [
+            "adb-shell[async]==0.3.4",
+            "androidtv[async]==0.0.60",
+            "pure-python-adb[async]==0.3.0.dev0",
+        ],
+        "codeowners": [
+            "@JeffLIrion",
+        ],
+        "iot_class": "local_polling",
+    },
+    "anel_pwrctrl": {
+        "domain": "anel_pwrctrl",
+        "name": "Anel NET-PwrCtrl",
+        "documentation": "https://www.home-assistant.io/integrations/anel_pwrctrl",
+        "requirements": [
+            "anel_pwrctrl-homeassistant==0.0.1.dev2",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "anthemav": {
+        "domain": "anthemav",
+        "name": "Anthem A/V Receivers",
+        "documentation": "https://www.home-assistant.io/integrations/anthemav",
+        "requirements": [
+            "anthemav==1.1.10",
+        ],
+        "codeowners": [],
+        "iot_class": "local_push",
+    },
+    "apache_kafka": {
+        "domain": "apache_kafka",
+        "name": "Apache Kafka",
+        "documentation": "https://www.home-assistant.io/integrations/apache_kafka",
+        "requirements": [
+            "aiokafka==0.6.0",
+        ],
+        "codeowners": [
+            "@bachya",
+        ],
+        "iot_class": "local_push",
+    },
+    "apcupsd": {
+        "domain": "apcupsd",
+        "name": "apcupsd",
+        "documentation": "https://www.home-assistant.io/integrations/apcupsd",
+        "requirements": [
+            "apcaccess==0.0.13",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "api": {
+        "domain": "api",
+        "name": "Home Assistant API",
+        "documentation": "https://www.home-assistant.io/integrations/api",
+        "dependencies": [
+            "http",
+        ],
+        "codeowners": [
+            "@home-assistant/core",
+        ],
+        "quality_scale": "internal",
+    },
+    "apns": {
+        "domain": "apns",
+        "name": "Apple Push Notification Service (APNS)",
+        "documentation": "https://www.home-assistant.io/integrations/apns",
+        "requirements": [
+            "apns2==0.3.0",
+        ],
+        "after_dependencies": [
+            "device_tracker",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_push",
+    },
+    "apple_tv": {
+        "domain": "apple_tv",
+        "name": "Apple TV",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/apple_tv",
+        "requirements": [
+            "pyatv==0.8.1",
+        ],
+        "zeroconf": [
+            "_mediaremotetv._tcp.local.",
+            "_touch-able._tcp.local.",
+        ],
+        "after_dependencies": [
+            "discovery",
+        ],
+        "codeowners": [
+            "@postlund",
+        ],
+        "iot_class": "local_push",
+    },
+    "apprise": {
+        "domain": "apprise",
+        "name": "Apprise",
+        "documentation": "https://www.home-assistant.io/integrations/apprise",
+        "requirements": [
+            "apprise==0.9.3",
+        ],
+        "codeowners": [
+            "@caronc",
+        ],
+        "iot_class": "cloud_push",
+    },
+    "aprs": {
+        "domain": "aprs",
+        "name": "APRS",
+        "documentation": "https://www.home-assistant.io/integrations/aprs",
+        "codeowners": [
+            "@PhilRW",
+        ],
+        "requirements": [
+            "aprslib==0.6.46",
+            "geopy==2.1.0",
+        ],
+        "iot_class": "cloud_push",
+    },
+    "aqualogic": {
+        "domain": "aqualogic",
+        "name": "AquaLogic",
+        "documentation": "https://www.home-assistant.io/integrations/aqualogic",
+        "requirements": [
+            "aqualogic==2.6",
+        ],
+        "codeowners": [],
+        "iot_class": "local_push",
+    },
+    "aquostv": {
+        "domain": "aquostv",
+        "name": "Sharp Aquos TV",
+        "documentation": "https://www.home-assistant.io/integrations/aquostv",
+        "requirements": [
+            "sharp_aquos_rc==0.3.2",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "arcam_fmj": {
+        "domain": "arcam_fmj",
+        "name": "Arcam FMJ Receivers",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/arcam_fmj",
+        "requirements": [
+            "arcam-fmj==0.7.0",
+        ],
+        "ssdp": [
+            {
+                "deviceType": "urn:schemas-upnp-org:device:MediaRenderer:1",
+                "manufacturer": "ARCAM",
+            },
+        ],
+        "codeowners": [
+            "@elupus",
+        ],
+        "iot_class": "local_polling",
+    },
+    "arduino": {
+        "domain": "arduino",
+        "name": "Arduino",
+        "documentation": "https://www.home-assistant.io/integrations/arduino",
+        "requirements": [
+            "PyMata==2.20",
+        ],
+        "codeowners": [
+            "@fabaff",
+        ],
+        "iot_class": "local_polling",
+    },
+    "arest": {
+        "domain": "arest",
+        "name": "aREST",
+        "documentation": "https://www.home-assistant.io/integrations/arest",
+        "codeowners": [
+            "@fabaff",
+        ],
+        "iot_class": "local_polling",
+    },
+    "arlo": {
+        "domain": "arlo",
+        "name": "Arlo",
+        "documentation": "https://www.home-assistant.io/integrations/arlo",
+        "requirements": [
+            "pyarlo==0.2.4",
+        ],
+        "dependencies": [
+            "ffmpeg",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_polling",
+    },
+    "arris_tg2492lg": {
+        "domain": "arris_tg2492lg",
+        "name": "Arris TG2492LG",
+        "documentation": "https://www.home-assistant.io/integrations/arris_tg2492lg",
+        "requirements": [
+            "arris-tg2492lg==1.1.0",
+        ],
+        "codeowners": [
+            "@vanbalken",
+        ],
+        "iot_class": "local_polling",
+    },
+    "aruba": {
+        "domain": "aruba",
+        "name": "Aruba",
+        "documentation": "https://www.home-assistant.io/integrations/aruba",
+        "requirements": [
+            "pexpect==4.6.0",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "arwn": {
+        "domain": "arwn",
+        "name": "Ambient Radio Weather Network",
+        "documentation": "https://www.home-assistant.io/integrations/arwn",
+        "dependencies": [
+            "mqtt",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "asterisk_cdr": {
+        "domain": "asterisk_cdr",
+        "name": "Asterisk Call Detail Records",
+        "documentation": "https://www.home-assistant.io/integrations/asterisk_cdr",
+        "dependencies": [
+            "asterisk_mbox",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "asterisk_mbox": {
+        "domain": "asterisk_mbox",
+        "name": "Asterisk Voicemail",
+        "documentation": "https://www.home-assistant.io/integrations/asterisk_mbox",
+        "requirements": [
+            "asterisk_mbox==0.5.0",
+        ],
+        "codeowners": [],
+        "iot_class": "local_push",
+    },
+    "asuswrt": {
+        "domain": "asuswrt",
+        "name": "ASUSWRT",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/asuswrt",
+        "requirements": [
+            "aioasuswrt==1.3.4",
+        ],
+        "codeowners": [
+            "@kennedyshead",
+            "@ollo69",
+        ],
+        "iot_class": "local_polling",
+    },
+    "atag": {
+        "domain": "atag",
+        "name": "Atag",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/atag/",
+        "requirements": [
+            "pyatag==0.3.5.3",
+        ],
+        "codeowners": [
+            "@MatsNL",
+        ],
+        "iot_class": "local_polling",
+    },
+    "aten_pe": {
+        "domain": "aten_pe",
+        "name": "ATEN Rack PDU",
+        "documentation": "https://www.home-assistant.io/integrations/aten_pe",
+        "requirements": [
+            "atenpdu==0.3.0",
+        ],
+        "codeowners": [
+            "@mtdcr",
+        ],
+        "iot_class": "local_polling",
+    },
+    "atome": {
+        "domain": "atome",
+        "name": "Atome Linky",
+        "documentation": "https://www.home-assistant.io/integrations/atome",
+        "codeowners": [
+            "@baqs",
+        ],
+        "requirements": [
+            "pyatome==0.1.1",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "august": {
+        "domain": "august",
+        "name": "August",
+        "documentation": "https://www.home-assistant.io/integrations/august",
+        "requirements": [
+            "yalexs==1.1.11",
+        ],
+        "codeowners": [
+            "@bdraco",
+        ],
+        "dhcp": [
+            {
+                "hostname": "connect",
+                "macaddress": "D86162*",
+            },
+            {
+                "hostname": "connect",
+                "macaddress": "B8B7F1*",
+            },
+            {
+                "hostname": "august*",
+                "macaddress": "E076D0*",
+            },
+        ],
+        "config_flow": True,
+        "iot_class": "cloud_push",
+    },
+    "aurora": {
+        "domain": "aurora",
+        "name": "Aurora",
+        "documentation": "https://www.home-assistant.io/integrations/aurora",
+        "config_flow": True,
+        "codeowners": [
+            "@djtimca",
+        ],
+        "requirements": [
+            "auroranoaa==0.0.2",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "aurora_abb_powerone": {
+        "domain": "aurora_abb_powerone",
+        "name": "Aurora ABB Solar PV",
+        "documentation": "https://www.home-assistant.io/integrations/aurora_abb_powerone/",
+        "codeowners": [
+            "@davet2001",
+        ],
+        "requirements": [
+            "aurorapy==0.2.6",
+        ],
+        "iot_class": "local_polling",
+    },
+    "auth": {
+        "domain": "auth",
+        "name": "Auth",
+        "documentation": "https://www.home-assistant.io/integrations/auth",
+        "dependencies": [
+            "http",
+        ],
+        "codeowners": [
+            "@home-assistant/core",
+        ],
+        "quality_scale": "internal",
+    },
+    "automation": {
+        "domain": "automation",
+        "name": "Automation",
+        "documentation": "https://www.home-assistant.io/integrations/automation",
+        "dependencies": [
+            "blueprint",
+            "trace",
+        ],
+        "after_dependencies": [
+            "device_automation",
+            "webhook",
+        ],
+        "codeowners": [
+            "@home-assistant/core",
+        ],
+        "quality_scale": "internal",
+    },
+    "avea": {
+        "domain": "avea",
+        "name": "Elgato Avea",
+        "documentation": "https://www.home-assistant.io/integrations/avea",
+        "codeowners": [
+            "@pattyland",
+        ],
+        "requirements": [
+            "avea==1.5.1",
+        ],
+        "iot_class": "local_polling",
+    },
+    "avion": {
+        "domain": "avion",
+        "name": "Avi-on",
+        "documentation": "https://www.home-assistant.io/integrations/avion",
+        "requirements": [
+            "avion==0.10",
+        ],
+        "codeowners": [],
+        "iot_class": "assumed_state",
+    },
+    "awair": {
+        "domain": "awair",
+        "name": "Awair",
+        "documentation": "https://www.home-assistant.io/integrations/awair",
+        "requirements": [
+            "python_awair==0.2.1",
+        ],
+        "codeowners": [
+            "@ahayworth",
+            "@danielsjf",
+        ],
+        "config_flow": True,
+        "iot_class": "cloud_polling",
+    },
+    "aws": {
+        "domain": "aws",
+        "name": "Amazon Web Services (AWS)",
+        "documentation": "https://www.home-assistant.io/integrations/aws",
+        "requirements": [
+            "aiobotocore==1.2.2",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_push",
+    },
+    "axis": {
+        "domain": "axis",
+        "name": "Axis",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/axis",
+        "requirements": [
+            "axis==44",
+        ],
+        "dhcp": [
+            {
+                "hostname": "axis-00408c*",
+                "macaddress": "00408C*",
+            },
+            {
+                "hostname": "axis-accc8e*",
+                "macaddress": "ACCC8E*",
+            },
+            {
+                "hostname": "axis-b8a44f*",
+                "macaddress": "B8A44F*",
+            },
+        ],
+        "ssdp": [
+            {
+                "manufacturer": "AXIS",
+            },
+        ],
+        "zeroconf": [
+            {
+                "type": "_axis-video._tcp.local.",
+                "macaddress": "00408C*",
+            },
+            {
+                "type": "_axis-video._tcp.local.",
+                "macaddress": "ACCC8E*",
+            },
+            {
+                "type": "_axis-video._tcp.local.",
+                "macaddress": "B8A44F*",
+            },
+        ],
+        "after_dependencies": [
+            "mqtt",
+        ],
+        "codeowners": [
+            "@Kane610",
+        ],
+        "quality_scale": "platinum",
+        "iot_class": "local_push",
+    },
+    "azure_devops": {
+        "domain": "azure_devops",
+        "name": "Azure DevOps",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/azure_devops",
+        "requirements": [
+            "aioazuredevops==1.3.5",
+        ],
+        "codeowners": [
+            "@timmo001",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "azure_event_hub": {
+        "domain": "azure_event_hub",
+        "name": "Azure Event Hub",
+        "documentation": "https://www.home-assistant.io/integrations/azure_event_hub",
+        "requirements": [
+            "azure-eventhub==5.5.0",
+        ],
+        "codeowners": [
+            "@eavanvalkenburg",
+        ],
+        "iot_class": "cloud_push",
+    },
+    "azure_service_bus": {
+        "domain": "azure_service_bus",
+        "name": "Azure Service Bus",
+        "documentation": "https://www.home-assistant.io/integrations/azure_service_bus",
+        "requirements": [
+            "azure-servicebus==0.50.3",
+        ],
+        "codeowners": [
+            "@hfurubotten",
+        ],
+        "iot_class": "cloud_push",
+    },
+    "baidu": {
+        "domain": "baidu",
+        "name": "Baidu",
+        "documentation": "https://www.home-assistant.io/integrations/baidu",
+        "requirements": [
+            "baidu-aip==1.6.6",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_push",
+    },
+    "bayesian": {
+        "domain": "bayesian",
+        "name": "Bayesian",
+        "documentation": "https://www.home-assistant.io/integrations/bayesian",
+        "codeowners": [],
+        "quality_scale": "internal",
+        "iot_class": "local_polling",
+    },
+    "bbb_gpio": {
+        "domain": "bbb_gpio",
+        "name": "BeagleBone Black GPIO",
+        "documentation": "https://www.home-assistant.io/integrations/bbb_gpio",
+        "requirements": [
+            "Adafruit_BBIO==1.1.1",
+        ],
+        "codeowners": [],
+        "iot_class": "local_push",
+    },
+    "bbox": {
+        "domain": "bbox",
+        "name": "Bbox",
+        "documentation": "https://www.home-assistant.io/integrations/bbox",
+        "requirements": [
+            "pybbox==0.0.5-alpha",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "beewi_smartclim": {
+        "domain": "beewi_smartclim",
+        "name": "BeeWi SmartClim BLE sensor",
+        "documentation": "https://www.home-assistant.io/integrations/beewi_smartclim",
+        "requirements": [
+            "beewi_smartclim==0.0.10",
+        ],
+        "codeowners": [
+            "@alemuro",
+        ],
+        "iot_class": "local_polling",
+    },
+    "bh1750": {
+        "domain": "bh1750",
+        "name": "BH1750",
+        "documentation": "https://www.home-assistant.io/integrations/bh1750",
+        "requirements": [
+            "i2csense==0.0.4",
+            "smbus-cffi==0.5.1",
+        ],
+        "codeowners": [],
+        "iot_class": "local_push",
+    },
+    "binary_sensor": {
+        "domain": "binary_sensor",
+        "name": "Binary Sensor",
+        "documentation": "https://www.home-assistant.io/integrations/binary_sensor",
+        "codeowners": [],
+        "quality_scale": "internal",
+    },
+    "bitcoin": {
+        "domain": "bitcoin",
+        "name": "Bitcoin",
+        "documentation": "https://www.home-assistant.io/integrations/bitcoin",
+        "requirements": [
+            "blockchain==1.4.4",
+        ],
+        "codeowners": [
+            "@fabaff",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "bizkaibus": {
+        "domain": "bizkaibus",
+        "name": "Bizkaibus",
+        "documentation": "https://www.home-assistant.io/integrations/bizkaibus",
+        "codeowners": [
+            "@UgaitzEtxebarria",
+        ],
+        "requirements": [
+            "bizkaibus==0.1.1",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "blackbird": {
+        "domain": "blackbird",
+        "name": "Monoprice Blackbird Matrix Switch",
+        "documentation": "https://www.home-assistant.io/integrations/blackbird",
+        "requirements": [
+            "pyblackbird==0.5",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "blebox": {
+        "domain": "blebox",
+        "name": "BleBox devices",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/blebox",
+        "requirements": [
+            "blebox_uniapi==1.3.3",
+        ],
+        "codeowners": [
+            "@bbx-a",
+            "@bbx-jp",
+        ],
+        "iot_class": "local_polling",
+    },
+    "blink": {
+        "domain": "blink",
+        "name": "Blink",
+        "documentation": "https://www.home-assistant.io/integrations/blink",
+        "requirements": [
+            "blinkpy==0.17.0",
+        ],
+        "codeowners": [
+            "@fronzbot",
+        ],
+        "dhcp": [
+            {
+                "hostname": "blink*",
+                "macaddress": "B85F98*",
+            },
+        ],
+        "config_flow": True,
+        "iot_class": "cloud_polling",
+    },
+    "blinksticklight": {
+        "domain": "blinksticklight",
+        "name": "BlinkStick",
+        "documentation": "https://www.home-assistant.io/integrations/blinksticklight",
+        "requirements": [
+            "blinkstick==1.1.8",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "blinkt": {
+        "domain": "blinkt",
+        "name": "Blinkt!",
+        "documentation": "https://www.home-assistant.io/integrations/blinkt",
+        "requirements": [
+            "blinkt==0.1.0",
+        ],
+        "codeowners": [],
+        "iot_class": "local_push",
+    },
+    "blockchain": {
+        "domain": "blockchain",
+        "name": "Blockchain.com",
+        "documentation": "https://www.home-assistant.io/integrations/blockchain",
+        "requirements": [
+            "python-blockchain-api==0.0.2",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_polling",
+    },
+    "bloomsky": {
+        "domain": "bloomsky",
+        "name": "BloomSky",
+        "documentation": "https://www.home-assistant.io/integrations/bloomsky",
+        "codeowners": [],
+        "iot_class": "cloud_polling",
+    },
+    "blueprint": {
+        "domain": "blueprint",
+        "name": "Blueprint",
+        "documentation": "https://www.home-assistant.io/integrations/blueprint",
+        "codeowners": [
+            "@home-assistant/core",
+        ],
+        "quality_scale": "internal",
+    },
+    "bluesound": {
+        "domain": "bluesound",
+        "name": "Bluesound",
+        "documentation": "https://www.home-assistant.io/integrations/bluesound",
+        "requirements": [
+            "xmltodict==0.12.0",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "bluetooth_le_tracker": {
+        "domain": "bluetooth_le_tracker",
+        "name": "Bluetooth LE Tracker",
+        "documentation": "https://www.home-assistant.io/integrations/bluetooth_le_tracker",
+        "requirements": [
+            "pygatt[GATTTOOL]==4.0.5",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "bluetooth_tracker": {
+        "domain": "bluetooth_tracker",
+        "name": "Bluetooth Tracker",
+        "documentation": "https://www.home-assistant.io/integrations/bluetooth_tracker",
+        "requirements": [
+            "bt_proximity==0.2.1",
+            "pybluez==0.22",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "bme280": {
+        "domain": "bme280",
+        "name": "Bosch BME280 Environmental Sensor",
+        "documentation": "https://www.home-assistant.io/integrations/bme280",
+        "requirements": [
+            "i2csense==0.0.4",
+            "smbus-cffi==0.5.1",
+        ],
+        "codeowners": [],
+        "iot_class": "local_push",
+    },
+    "bme680": {
+        "domain": "bme680",
+        "name": "Bosch BME680 Environmental Sensor",
+        "documentation": "https://www.home-assistant.io/integrations/bme680",
+        "requirements": [
+            "bme680==1.0.5",
+            "smbus-cffi==0.5.1",
+        ],
+        "codeowners": [],
+        "iot_class": "local_push",
+    },
+    "bmp280": {
+        "domain": "bmp280",
+        "name": "Bosch BMP280 Environmental Sensor",
+        "documentation": "https://www.home-assistant.io/integrations/bmp280",
+        "codeowners": [
+            "@belidzs",
+        ],
+        "requirements": [
+            "adafruit-circuitpython-bmp280==3.1.1",
+            "RPi.GPIO==0.7.1a4",
+        ],
+        "quality_scale": "silver",
+        "iot_class": "local_polling",
+    },
+    "bmw_connected_drive": {
+        "domain": "bmw_connected_drive",
+        "name": "BMW Connected Drive",
+        "documentation": "https://www.home-assistant.io/integrations/bmw_connected_drive",
+        "requirements": [
+            "bimmer_connected==0.7.15",
+        ],
+        "codeowners": [
+            "@gerard33",
+            "@rikroe",
+        ],
+        "config_flow": True,
+        "iot_class": "cloud_polling",
+    },
+    "bond": {
+        "domain": "bond",
+        "name": "Bond",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/bond",
+        "requirements": [
+            "bond-api==0.1.12",
+        ],
+        "zeroconf": [
+            "_bond._tcp.local.",
+        ],
+        "codeowners": [
+            "@prystupa",
+        ],
+        "quality_scale": "platinum",
+        "iot_class": "local_push",
+    },
+    "bosch_shc": {
+        "domain": "bosch_shc",
+        "name": "Bosch SHC",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/bosch_shc",
+        "requirements": [
+            "boschshcpy==0.2.19",
+        ],
+        "zeroconf": [
+            {
+                "type": "_http._tcp.local.",
+                "name": "bosch shc*",
+            },
+        ],
+        "iot_class": "local_push",
+        "codeowners": [
+            "@tschamm",
+        ],
+        "after_dependencies": [
+            "zeroconf",
+        ],
+    },
+    "braviatv": {
+        "domain": "braviatv",
+        "name": "Sony Bravia TV",
+        "documentation": "https://www.home-assistant.io/integrations/braviatv",
+        "requirements": [
+            "bravia-tv==1.0.11",
+        ],
+        "codeowners": [
+            "@bieniu",
+            "@Drafteed",
+        ],
+        "config_flow": True,
+        "iot_class": "local_polling",
+    },
+    "broadlink": {
+        "domain": "broadlink",
+        "name": "Broadlink",
+        "documentation": "https://www.home-assistant.io/integrations/broadlink",
+        "requirements": [
+            "broadlink==0.17.0",
+        ],
+        "codeowners": [
+            "@danielhiversen",
+            "@felipediel",
+        ],
+        "config_flow": True,
+        "dhcp": [
+            {
+                "macaddress": "34EA34*",
+            },
+            {
+                "macaddress": "24DFA7*",
+            },
+            {
+                "macaddress": "A043B0*",
+            },
+            {
+                "macaddress": "B4430D*",
+            },
+        ],
+        "iot_class": "local_polling",
+    },
+    "brother": {
+        "domain": "brother",
+        "name": "Brother Printer",
+        "documentation": "https://www.home-assistant.io/integrations/brother",
+        "codeowners": [
+            "@bieniu",
+        ],
+        "requirements": [
+            "brother==1.0.2",
+        ],
+        "zeroconf": [
+            {
+                "type": "_printer._tcp.local.",
+                "name": "brother*",
+            },
+        ],
+        "config_flow": True,
+        "quality_scale": "platinum",
+        "iot_class": "local_polling",
+    },
+    "brottsplatskartan": {
+        "domain": "brottsplatskartan",
+        "name": "Brottsplatskartan",
+        "documentation": "https://www.home-assistant.io/integrations/brottsplatskartan",
+        "requirements": [
+            "brottsplatskartan==0.0.1",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_polling",
+    },
+    "browser": {
+        "domain": "browser",
+        "name": "Browser",
+        "documentation": "https://www.home-assistant.io/integrations/browser",
+        "codeowners": [],
+        "quality_scale": "internal",
+        "iot_class": "local_push",
+    },
+    "brunt": {
+        "domain": "brunt",
+        "name": "Brunt Blind Engine",
+        "documentation": "https://www.home-assistant.io/integrations/brunt",
+        "requirements": [
+            "brunt==0.1.3",
+        ],
+        "codeowners": [
+            "@eavanvalkenburg",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "bsblan": {
+        "domain": "bsblan",
+        "name": "BSB-Lan",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/bsblan",
+        "requirements": [
+            "bsblan==0.4.0",
+        ],
+        "codeowners": [
+            "@liudger",
+        ],
+        "iot_class": "local_polling",
+    },
+    "bt_home_hub_5": {
+        "domain": "bt_home_hub_5",
+        "name": "BT Home Hub 5",
+        "documentation": "https://www.home-assistant.io/integrations/bt_home_hub_5",
+        "requirements": [
+            "bthomehub5-devicelist==0.1.1",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "bt_smarthub": {
+        "domain": "bt_smarthub",
+        "name": "BT Smart Hub",
+        "documentation": "https://www.home-assistant.io/integrations/bt_smarthub",
+        "requirements": [
+            "btsmarthub_devicelist==0.2.0",
+        ],
+        "codeowners": [
+            "@jxwolstenholme",
+        ],
+        "iot_class": "local_polling",
+    },
+    "buienradar": {
+        "domain": "buienradar",
+        "name": "Buienradar",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/buienradar",
+        "requirements": [
+            "buienradar==1.0.4",
+        ],
+        "codeowners": [
+            "@mjj4791",
+            "@ties",
+            "@Robbie1221",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "caldav": {
+        "domain": "caldav",
+        "name": "CalDAV",
+        "documentation": "https://www.home-assistant.io/integrations/caldav",
+        "requirements": [
+            "caldav==0.7.1",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_polling",
+    },
+    "calendar": {
+        "domain": "calendar",
+        "name": "Calendar",
+        "documentation": "https://www.home-assistant.io/integrations/calendar",
+        "dependencies": [
+            "http",
+        ],
+        "codeowners": [],
+        "quality_scale": "internal",
+    },
+    "camera": {
+        "domain": "camera",
+        "name": "Camera",
+        "documentation": "https://www.home-assistant.io/integrations/camera",
+        "dependencies": [
+            "http",
+        ],
+        "after_dependencies": [
+            "media_player",
+        ],
+        "codeowners": [],
+        "quality_scale": "internal",
+    },
+    "canary": {
+        "domain": "canary",
+        "name": "Canary",
+        "documentation": "https://www.home-assistant.io/integrations/canary",
+        "requirements": [
+            "py-canary==0.5.1",
+        ],
+        "dependencies": [
+            "ffmpeg",
+        ],
+        "codeowners": [],
+        "config_flow": True,
+        "iot_class": "cloud_polling",
+    },
+    "cast": {
+        "domain": "cast",
+        "name": "Google Cast",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/cast",
+        "requirements": [
+            "pychromecast==9.2.0",
+        ],
+        "after_dependencies": [
+            "cloud",
+            "http",
+            "media_source",
+            "plex",
+            "tts",
+            "zeroconf",
+        ],
+        "zeroconf": [
+            "_googlecast._tcp.local.",
+        ],
+        "codeowners": [
+            "@emontnemery",
+        ],
+        "iot_class": "local_polling",
+    },
+    "cert_expiry": {
+        "domain": "cert_expiry",
+        "name": "Certificate Expiry",
+        "documentation": "https://www.home-assistant.io/integrations/cert_expiry",
+        "config_flow": True,
+        "codeowners": [
+            "@Cereal2nd",
+            "@jjlawren",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "channels": {
+        "domain": "channels",
+        "name": "Channels",
+        "documentation": "https://www.home-assistant.io/integrations/channels",
+        "requirements": [
+            "pychannels==1.0.0",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "circuit": {
+        "domain": "circuit",
+        "name": "Unify Circuit",
+        "documentation": "https://www.home-assistant.io/integrations/circuit",
+        "codeowners": [
+            "@braam",
+        ],
+        "requirements": [
+            "circuit-webhook==1.0.1",
+        ],
+        "iot_class": "cloud_push",
+    },
+    "cisco_ios": {
+        "domain": "cisco_ios",
+        "name": "Cisco IOS",
+        "documentation": "https://www.home-assistant.io/integrations/cisco_ios",
+        "requirements": [
+            "pexpect==4.6.0",
+        ],
+        "codeowners": [
+            "@fbradyirl",
+        ],
+        "iot_class": "local_polling",
+    },
+    "cisco_mobility_express": {
+        "domain": "cisco_mobility_express",
+        "name": "Cisco Mobility Express",
+        "documentation": "https://www.home-assistant.io/integrations/cisco_mobility_express",
+        "requirements": [
+            "ciscomobilityexpress==0.3.9",
+        ],
+        "codeowners": [
+            "@fbradyirl",
+        ],
+        "iot_class": "local_polling",
+    },
+    "cisco_webex_teams": {
+        "domain": "cisco_webex_teams",
+        "name": "Cisco Webex Teams",
+        "documentation": "https://www.home-assistant.io/integrations/cisco_webex_teams",
+        "requirements": [
+            "webexteamssdk==1.1.1",
+        ],
+        "codeowners": [
+            "@fbradyirl",
+        ],
+        "iot_class": "cloud_push",
+    },
+    "citybikes": {
+        "domain": "citybikes",
+        "name": "CityBikes",
+        "documentation": "https://www.home-assistant.io/integrations/citybikes",
+        "codeowners": [],
+        "iot_class": "cloud_polling",
+    },
+    "clementine": {
+        "domain": "clementine",
+        "name": "Clementine Music Player",
+        "documentation": "https://www.home-assistant.io/integrations/clementine",
+        "requirements": [
+            "python-clementine-remote==1.0.1",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "clickatell": {
+        "domain": "clickatell",
+        "name": "Clickatell",
+        "documentation": "https://www.home-assistant.io/integrations/clickatell",
+        "codeowners": [],
+        "iot_class": "cloud_push",
+    },
+    "clicksend": {
+        "domain": "clicksend",
+        "name": "ClickSend SMS",
+        "documentation": "https://www.home-assistant.io/integrations/clicksend",
+        "codeowners": [],
+        "iot_class": "cloud_push",
+    },
+    "clicksend_tts": {
+        "domain": "clicksend_tts",
+        "name": "ClickSend TTS",
+        "documentation": "https://www.home-assistant.io/integrations/clicksend_tts",
+        "codeowners": [],
+        "iot_class": "cloud_push",
+    },
+    "climacell": {
+        "domain": "climacell",
+        "name": "ClimaCell",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/climacell",
+        "requirements": [
+            "pyclimacell==0.18.2",
+        ],
+        "codeowners": [
+            "@raman325",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "climate": {
+        "domain": "climate",
+        "name": "Climate",
+        "documentation": "https://www.home-assistant.io/integrations/climate",
+        "codeowners": [],
+        "quality_scale": "internal",
+    },
+    "cloud": {
+        "domain": "cloud",
+        "name": "Home Assistant Cloud",
+        "documentation": "https://www.home-assistant.io/integrations/cloud",
+        "requirements": [
+            "hass-nabucasa==0.44.0",
+        ],
+        "dependencies": [
+            "http",
+            "webhook",
+        ],
+        "after_dependencies": [
+            "google_assistant",
+            "alexa",
+        ],
+        "codeowners": [
+            "@home-assistant/cloud",
+        ],
+        "iot_class": "cloud_push",
+    },
+    "cloudflare": {
+        "domain": "cloudflare",
+        "name": "Cloudflare",
+        "documentation": "https://www.home-assistant.io/integrations/cloudflare",
+        "requirements": [
+            "pycfdns==1.2.1",
+        ],
+        "codeowners": [
+            "@ludeeus",
+            "@ctalkington",
+        ],
+        "config_flow": True,
+        "iot_class": "cloud_push",
+    },
+    "cmus": {
+        "domain": "cmus",
+        "name": "cmus",
+        "documentation": "https://www.home-assistant.io/integrations/cmus",
+        "requirements": [
+            "pycmus==0.1.1",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "co2signal": {
+        "domain": "co2signal",
+        "name": "CO2 Signal",
+        "documentation": "https://www.home-assistant.io/integrations/co2signal",
+        "requirements": [
+            "co2signal==0.4.2",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_polling",
+    },
+    "coinbase": {
+        "domain": "coinbase",
+        "name": "Coinbase",
+        "documentation": "https://www.home-assistant.io/integrations/coinbase",
+        "requirements": [
+            "coinbase==2.1.0",
+        ],
+        "codeowners": [
+            "@tombrien",
+        ],
+        "config_flow": True,
+        "iot_class": "cloud_polling",
+    },
+    "color_extractor": {
+        "domain": "color_extractor",
+        "name": "ColorExtractor",
+        "config_flow": False,
+        "documentation": "https://www.home-assistant.io/integrations/color_extractor",
+        "requirements": [
+            "colorthief==0.2.1",
+        ],
+        "codeowners": [
+            "@GenericStudent",
+        ],
+    },
+    "comed_hourly_pricing": {
+        "domain": "comed_hourly_pricing",
+        "name": "ComEd Hourly Pricing",
+        "documentation": "https://www.home-assistant.io/integrations/comed_hourly_pricing",
+        "codeowners": [],
+        "iot_class": "cloud_polling",
+    },
+    "comfoconnect": {
+        "domain": "comfoconnect",
+        "name": "Zehnder ComfoAir Q",
+        "documentation": "https://www.home-assistant.io/integrations/comfoconnect",
+        "requirements": [
+            "pycomfoconnect==0.4",
+        ],
+        "codeowners": [
+            "@michaelarnauts",
+        ],
+        "iot_class": "local_push",
+    },
+    "command_line": {
+        "domain": "command_line",
+        "name": "Command Line",
+        "documentation": "https://www.home-assistant.io/integrations/command_line",
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "compensation": {
+        "domain": "compensation",
+        "name": "Compensation",
+        "documentation": "https://www.home-assistant.io/integrations/compensation",
+        "requirements": [
+            "numpy==1.21.0",
+        ],
+        "codeowners": [
+            "@Petro31",
+        ],
+        "iot_class": "calculated",
+    },
+    "concord232": {
+        "domain": "concord232",
+        "name": "Concord232",
+        "documentation": "https://www.home-assistant.io/integrations/concord232",
+        "requirements": [
+            "concord232==0.15",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "config": {
+        "domain": "config",
+        "name": "Configuration",
+        "documentation": "https://www.home-assistant.io/integrations/config",
+        "dependencies": [
+            "http",
+        ],
+        "codeowners": [
+            "@home-assistant/core",
+        ],
+        "quality_scale": "internal",
+    },
+    "configurator": {
+        "domain": "configurator",
+        "name": "Configurator",
+        "documentation": "https://www.home-assistant.io/integrations/configurator",
+        "codeowners": [
+            "@home-assistant/core",
+        ],
+        "quality_scale": "internal",
+    },
+    "control4": {
+        "domain": "control4",
+        "name": "Control4",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/control4",
+        "requirements": [
+            "pyControl4==0.0.6",
+        ],
+        "ssdp": [
+            {
+                "st": "c4:director",
+            },
+        ],
+        "codeowners": [
+            "@lawtancool",
+        ],
+        "iot_class": "local_polling",
+    },
+    "conversation": {
+        "domain": "conversation",
+        "name": "Conversation",
+        "documentation": "https://www.home-assistant.io/integrations/conversation",
+        "dependencies": [
+            "http",
+        ],
+        "codeowners": [
+            "@home-assistant/core",
+        ],
+        "quality_scale": "internal",
+        "iot_class": "local_push",
+    },
+    "coolmaster": {
+        "domain": "coolmaster",
+        "name": "CoolMasterNet",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/coolmaster",
+        "requirements": [
+            "pycoolmasternet-async==0.1.2",
+        ],
+        "codeowners": [
+            "@OnFreund",
+        ],
+        "iot_class": "local_polling",
+    },
+    "coronavirus": {
+        "domain": "coronavirus",
+        "name": "Coronavirus (COVID-19)",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/coronavirus",
+        "requirements": [
+            "coronavirus==1.1.1",
+        ],
+        "codeowners": [
+            "@home_assistant/core",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "counter": {
+        "domain": "counter",
+        "name": "Counter",
+        "documentation": "https://www.home-assistant.io/integrations/counter",
+        "codeowners": [
+            "@fabaff",
+        ],
+        "quality_scale": "internal",
+    },
+    "cover": {
+        "domain": "cover",
+        "name": "Cover",
+        "documentation": "https://www.home-assistant.io/integrations/cover",
+        "codeowners": [
+            "@home-assistant/core",
+        ],
+        "quality_scale": "internal",
+    },
+    "cppm_tracker": {
+        "domain": "cppm_tracker",
+        "name": "Aruba ClearPass",
+        "documentation": "https://www.home-assistant.io/integrations/cppm_tracker",
+        "requirements": [
+            "clearpasspy==1.0.2",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "cpuspeed": {
+        "domain": "cpuspeed",
+        "name": "CPU Speed",
+        "documentation": "https://www.home-assistant.io/integrations/cpuspeed",
+        "requirements": [
+            "py-cpuinfo==8.0.0",
+        ],
+        "codeowners": [
+            "@fabaff",
+        ],
+        "iot_class": "local_push",
+    },
+    "cups": {
+        "domain": "cups",
+        "name": "CUPS",
+        "documentation": "https://www.home-assistant.io/integrations/cups",
+        "requirements": [
+            "pycups==1.9.73",
+        ],
+        "codeowners": [
+            "@fabaff",
+        ],
+        "iot_class": "local_polling",
+    },
+    "currencylayer": {
+        "domain": "currencylayer",
+        "name": "currencylayer",
+        "documentation": "https://www.home-assistant.io/integrations/currencylayer",
+        "codeowners": [],
+        "iot_class": "cloud_polling",
+    },
+    "daikin": {
+        "domain": "daikin",
+        "name": "Daikin AC",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/daikin",
+        "requirements": [
+            "pydaikin==2.4.4",
+        ],
+        "codeowners": [
+            "@fredrike",
+        ],
+        "zeroconf": [
+            "_dkapi._tcp.local.",
+        ],
+        "quality_scale": "platinum",
+        "iot_class": "local_polling",
+    },
+    "danfoss_air": {
+        "domain": "danfoss_air",
+        "name": "Danfoss Air",
+        "documentation": "https://www.home-assistant.io/integrations/danfoss_air",
+        "requirements": [
+            "pydanfossair==0.1.0",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "darksky": {
+        "domain": "darksky",
+        "name": "Dark Sky",
+        "documentation": "https://www.home-assistant.io/integrations/darksky",
+        "requirements": [
+            "python-forecastio==1.4.0",
+        ],
+        "codeowners": [
+            "@fabaff",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "datadog": {
+        "domain": "datadog",
+        "name": "Datadog",
+        "documentation": "https://www.home-assistant.io/integrations/datadog",
+        "requirements": [
+            "datadog==0.15.0",
+        ],
+        "codeowners": [],
+        "iot_class": "local_push",
+    },
+    "ddwrt": {
+        "domain": "ddwrt",
+        "name": "DD-WRT",
+        "documentation": "https://www.home-assistant.io/integrations/ddwrt",
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "debugpy": {
+        "domain": "debugpy",
+        "name": "Remote Python Debugger",
+        "documentation": "https://www.home-assistant.io/integrations/debugpy",
+        "requirements": [
+            "debugpy==1.3.0",
+        ],
+        "codeowners": [
+            "@frenck",
+        ],
+        "quality_scale": "internal",
+        "iot_class": "local_push",
+    },
+    "deconz": {
+        "domain": "deconz",
+        "name": "deCONZ",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/deconz",
+        "requirements": [
+            "pydeconz==81",
+        ],
+        "ssdp": [
+            {
+                "manufacturer": "Royal Philips Electronics",
+            },
+        ],
+        "codeowners": [
+            "@Kane610",
+        ],
+        "quality_scale": "platinum",
+        "iot_class": "local_push",
+    },
+    "decora": {
+        "domain": "decora",
+        "name": "Leviton Decora",
+        "documentation": "https://www.home-assistant.io/integrations/decora",
+        "requirements": [
+            "bluepy==1.3.0",
+            "decora==0.6",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "decora_wifi": {
+        "domain": "decora_wifi",
+        "name": "Leviton Decora Wi-Fi",
+        "documentation": "https://www.home-assistant.io/integrations/decora_wifi",
+        "requirements": [
+            "decora_wifi==1.4",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_polling",
+    },
+    "default_config": {
+        "domain": "default_config",
+        "name": "Default Config",
+        "documentation": "https://www.home-assistant.io/integrations/default_config",
+        "dependencies": [
+            "automation",
+            "cloud",
+            "counter",
+            "dhcp",
+            "frontend",
+            "history",
+            "input_boolean",
+            "input_datetime",
+            "input_number",
+            "input_select",
+            "input_text",
+            "logbook",
+            "map",
+            "media_source",
+            "mobile_app",
+            "my",
+            "network",
+            "person",
+            "scene",
+            "script",
+            "ssdp",
+            "sun",
+            "system_health",
+            "tag",
+            "timer",
+            "updater",
+            "webhook",
+            "zeroconf",
+            "zone",
+        ],
+        "codeowners": [],
+        "quality_scale": "internal",
+    },
+    "delijn": {
+        "domain": "delijn",
+        "name": "De Lijn",
+        "documentation": "https://www.home-assistant.io/integrations/delijn",
+        "codeowners": [
+            "@bollewolle",
+            "@Emilv2",
+        ],
+        "requirements": [
+            "pydelijn==0.6.1",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "deluge": {
+        "domain": "deluge",
+        "name": "Deluge",
+        "documentation": "https://www.home-assistant.io/integrations/deluge",
+        "requirements": [
+            "deluge-client==1.7.1",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "demo": {
+        "domain": "demo",
+        "name": "Demo",
+        "documentation": "https://www.home-assistant.io/integrations/demo",
+        "dependencies": [
+            "conversation",
+            "zone",
+            "group",
+        ],
+        "codeowners": [
+            "@home-assistant/core",
+        ],
+        "quality_scale": "internal",
+        "iot_class": "calculated",
+    },
+    "denon": {
+        "domain": "denon",
+        "name": "Denon Network Receivers",
+        "documentation": "https://www.home-assistant.io/integrations/denon",
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "denonavr": {
+        "domain": "denonavr",
+        "name": "Denon AVR Network Receivers",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/denonavr",
+        "requirements": [
+            "denonavr==0.10.8",
+        ],
+        "codeowners": [
+            "@scarface-4711",
+            "@starkillerOG",
+        ],
+        "ssdp": [
+            {
+                "manufacturer": "Denon",
+                "deviceType": "urn:schemas-upnp-org:device:MediaRenderer:1",
+            },
+            {
+                "manufacturer": "DENON",
+                "deviceType": "urn:schemas-upnp-org:device:MediaRenderer:1",
+            },
+            {
+                "manufacturer": "DENON PROFESSIONAL",
+                "deviceType": "urn:schemas-upnp-org:device:MediaRenderer:1",
+            },
+            {
+                "manufacturer": "Marantz",
+                "deviceType": "urn:schemas-upnp-org:device:MediaRenderer:1",
+            },
+            {
+                "manufacturer": "Denon",
+                "deviceType": "urn:schemas-upnp-org:device:MediaServer:1",
+            },
+            {
+                "manufacturer": "DENON",
+                "deviceType": "urn:schemas-upnp-org:device:MediaServer:1",
+            },
+            {
+                "manufacturer": "DENON PROFESSIONAL",
+                "deviceType": "urn:schemas-upnp-org:device:MediaServer:1",
+            },
+            {
+                "manufacturer": "Marantz",
+                "deviceType": "urn:schemas-upnp-org:device:MediaServer:1",
+            },
+            {
+                "manufacturer": "Denon",
+                "deviceType": "urn:schemas-denon-com:device:AiosDevice:1",
+            },
+            {
+                "manufacturer": "DENON",
+                "deviceType": "urn:schemas-denon-com:device:AiosDevice:1",
+            },
+            {
+                "manufacturer": "DENON PROFESSIONAL",
+                "deviceType": "urn:schemas-denon-com:device:AiosDevice:1",
+            },
+            {
+                "manufacturer": "Marantz",
+                "deviceType": "urn:schemas-denon-com:device:AiosDevice:1",
+            },
+        ],
+        "iot_class": "local_polling",
+    },
+    "derivative": {
+        "domain": "derivative",
+        "name": "Derivative",
+        "documentation": "https://www.home-assistant.io/integrations/derivative",
+        "codeowners": [
+            "@afaucogney",
+        ],
+        "iot_class": "calculated",
+    },
+    "deutsche_bahn": {
+        "domain": "deutsche_bahn",
+        "name": "Deutsche Bahn",
+        "documentation": "https://www.home-assistant.io/integrations/deutsche_bahn",
+        "requirements": [
+            "schiene==0.23",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_polling",
+    },
+    "device_automation": {
+        "domain": "device_automation",
+        "name": "Device Automation",
+        "documentation": "https://www.home-assistant.io/integrations/device_automation",
+        "codeowners": [
+            "@home-assistant/core",
+        ],
+        "quality_scale": "internal",
+    },
+    "device_sun_light_trigger": {
+        "domain": "device_sun_light_trigger",
+        "name": "Presence-based Lights",
+        "documentation": "https://www.home-assistant.io/integrations/device_sun_light_trigger",
+        "after_dependencies": [
+            "device_tracker",
+            "group",
+            "light",
+            "person",
+        ],
+        "codeowners": [],
+        "quality_scale": "internal",
+        "iot_class": "calculated",
+    },
+    "device_tracker": {
+        "domain": "device_tracker",
+        "name": "Device Tracker",
+        "documentation": "https://www.home-assistant.io/integrations/device_tracker",
+        "dependencies": [
+            "zone",
+        ],
+        "after_dependencies": [],
+        "codeowners": [],
+        "quality_scale": "internal",
+    },
+    "devolo_home_control": {
+        "domain": "devolo_home_control",
+        "name": "devolo Home Control",
+        "documentation": "https://www.home-assistant.io/integrations/devolo_home_control",
+        "requirements": [
+            "devolo-home-control-api==0.17.4",
+        ],
+        "after_dependencies": [
+            "zeroconf",
+        ],
+        "config_flow": True,
+        "codeowners": [
+            "@2Fake",
+            "@Shutgun",
+        ],
+        "quality_scale": "silver",
+        "iot_class": "local_push",
+        "zeroconf": [
+            "_dvl-deviceapi._tcp.local.",
+        ],
+    },
+    "dexcom": {
+        "domain": "dexcom",
+        "name": "Dexcom",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/dexcom",
+        "requirements": [
+            "pydexcom==0.2.0",
+        ],
+        "codeowners": [
+            "@gagebenne",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "dhcp": {
+        "domain": "dhcp",
+        "name": "DHCP Discovery",
+        "documentation": "https://www.home-assistant.io/integrations/dhcp",
+        "requirements": [
+            "scapy==2.4.5",
+            "aiodiscover==1.4.2",
+        ],
+        "codeowners": [
+            "@bdraco",
+        ],
+        "quality_scale": "internal",
+        "iot_class": "local_push",
+    },
+    "dht": {
+        "domain": "dht",
+        "name": "DHT Sensor",
+        "documentation": "https://www.home-assistant.io/integrations/dht",
+        "requirements": [
+            "adafruit-circuitpython-dht==3.6.0",
+        ],
+        "codeowners": [
+            "@thegardenmonkey",
+        ],
+        "iot_class": "local_polling",
+    },
+    "dialogflow": {
+        "domain": "dialogflow",
+        "name": "Dialogflow",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/dialogflow",
+        "dependencies": [
+            "webhook",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_push",
+    },
+    "digital_ocean": {
+        "domain": "digital_ocean",
+        "name": "Digital Ocean",
+        "documentation": "https://www.home-assistant.io/integrations/digital_ocean",
+        "requirements": [
+            "python-digitalocean==1.13.2",
+        ],
+        "codeowners": [
+            "@fabaff",
+        ],
+        "iot_class": "local_polling",
+    },
+    "digitalloggers": {
+        "domain": "digitalloggers",
+        "name": "Digital Loggers",
+        "documentation": "https://www.home-assistant.io/integrations/digitalloggers",
+        "requirements": [
+            "dlipower==0.7.165",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "directv": {
+        "domain": "directv",
+        "name": "DirecTV",
+        "documentation": "https://www.home-assistant.io/integrations/directv",
+        "requirements": [
+            "directv==0.4.0",
+        ],
+        "codeowners": [
+            "@ctalkington",
+        ],
+        "quality_scale": "gold",
+        "config_flow": True,
+        "ssdp": [
+            {
+                "manufacturer": "DIRECTV",
+                "deviceType": "urn:schemas-upnp-org:device:MediaServer:1",
+            },
+        ],
+        "iot_class": "local_polling",
+    },
+    "discogs": {
+        "domain": "discogs",
+        "name": "Discogs",
+        "documentation": "https://www.home-assistant.io/integrations/discogs",
+        "requirements": [
+            "discogs_client==2.3.0",
+        ],
+        "codeowners": [
+            "@thibmaek",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "discord": {
+        "domain": "discord",
+        "name": "Discord",
+        "documentation": "https://www.home-assistant.io/integrations/discord",
+        "requirements": [
+            "discord.py==1.7.2",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_push",
+    },
+    "discovery": {
+        "domain": "discovery",
+        "name": "Discovery",
+        "documentation": "https://www.home-assistant.io/integrations/discovery",
+        "requirements": [
+            "netdisco==2.9.0",
+        ],
+        "after_dependencies": [
+            "zeroconf",
+        ],
+        "codeowners": [],
+        "quality_scale": "internal",
+    },
+    "dlib_face_detect": {
+        "domain": "dlib_face_detect",
+        "name": "Dlib Face Detect",
+        "documentation": "https://www.home-assistant.io/integrations/dlib_face_detect",
+        "requirements": [
+            "face_recognition==1.2.3",
+        ],
+        "codeowners": [],
+        "iot_class": "local_push",
+    },
+    "dlib_face_identify": {
+        "domain": "dlib_face_identify",
+        "name": "Dlib Face Identify",
+        "documentation": "https://www.home-assistant.io/integrations/dlib_face_identify",
+        "requirements": [
+            "face_recognition==1.2.3",
+        ],
+        "codeowners": [],
+        "iot_class": "local_push",
+    },
+    "dlink": {
+        "domain": "dlink",
+        "name": "D-Link Wi-Fi Smart Plugs",
+        "documentation": "https://www.home-assistant.io/integrations/dlink",
+        "requirements": [
+            "pyW215==0.7.0",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "dlna_dmr": {
+        "domain": "dlna_dmr",
+        "name": "DLNA Digital Media Renderer",
+        "documentation": "https://www.home-assistant.io/integrations/dlna_dmr",
+        "requirements": [
+            "async-upnp-client==0.19.0",
+        ],
+        "codeowners": [],
+        "iot_class": "local_push",
+    },
+    "dnsip": {
+        "domain": "dnsip",
+        "name": "DNS IP",
+        "documentation": "https://www.home-assistant.io/integrations/dnsip",
+        "requirements": [
+            "aiodns==3.0.0",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_polling",
+    },
+    "dominos": {
+        "domain": "dominos",
+        "name": "Dominos Pizza",
+        "documentation": "https://www.home-assistant.io/integrations/dominos",
+        "requirements": [
+            "pizzapi==0.0.3",
+        ],
+        "dependencies": [
+            "http",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_polling",
+    },
+    "doods": {
+        "domain": "doods",
+        "name": "DOODS - Dedicated Open Object Detection Service",
+        "documentation": "https://www.home-assistant.io/integrations/doods",
+        "requirements": [
+            "pydoods==1.0.2",
+            "pillow==8.2.0",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "doorbird": {
+        "domain": "doorbird",
+        "name": "DoorBird",
+        "documentation": "https://www.home-assistant.io/integrations/doorbird",
+        "requirements": [
+            "doorbirdpy==2.1.0",
+        ],
+        "dependencies": [
+            "http",
+        ],
+        "zeroconf": [
+            {
+                "type": "_axis-video._tcp.local.",
+                "macaddress": "1CCAE3*",
+            },
+        ],
+        "codeowners": [
+            "@oblogic7",
+            "@bdraco",
+        ],
+        "config_flow": True,
+        "iot_class": "local_push",
+    },
+    "dovado": {
+        "domain": "dovado",
+        "name": "Dovado",
+        "documentation": "https://www.home-assistant.io/integrations/dovado",
+        "requirements": [
+            "dovado==0.4.1",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "downloader": {
+        "domain": "downloader",
+        "name": "Downloader",
+        "documentation": "https://www.home-assistant.io/integrations/downloader",
+        "codeowners": [],
+        "quality_scale": "internal",
+    },
+    "dsmr": {
+        "domain": "dsmr",
+        "name": "DSMR Slimme Meter",
+        "documentation": "https://www.home-assistant.io/integrations/dsmr",
+        "requirements": [
+            "dsmr_parser==0.29",
+        ],
+        "codeowners": [
+            "@Robbie1221",
+            "@frenck",
+        ],
+        "config_flow": True,
+        "iot_class": "local_push",
+    },
+    "dsmr_reader": {
+        "domain": "dsmr_reader",
+        "name": "DSMR Reader",
+        "documentation": "https://www.home-assistant.io/integrations/dsmr_reader",
+        "dependencies": [
+            "mqtt",
+        ],
+        "codeowners": [
+            "@depl0y",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "dte_energy_bridge": {
+        "domain": "dte_energy_bridge",
+        "name": "DTE Energy Bridge",
+        "documentation": "https://www.home-assistant.io/integrations/dte_energy_bridge",
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "dublin_bus_transport": {
+        "domain": "dublin_bus_transport",
+        "name": "Dublin Bus",
+        "documentation": "https://www.home-assistant.io/integrations/dublin_bus_transport",
+        "codeowners": [],
+        "iot_class": "cloud_polling",
+    },
+    "duckdns": {
+        "domain": "duckdns",
+        "name": "Duck DNS",
+        "documentation": "https://www.home-assistant.io/integrations/duckdns",
+        "codeowners": [],
+        "iot_class": "cloud_polling",
+    },
+    "dunehd": {
+        "domain": "dunehd",
+        "name": "Dune HD",
+        "documentation": "https://www.home-assistant.io/integrations/dunehd",
+        "requirements": [
+            "pdunehd==1.3.2",
+        ],
+        "codeowners": [
+            "@bieniu",
+        ],
+        "config_flow": True,
+        "iot_class": "local_polling",
+    },
+    "dwd_weather_warnings": {
+        "domain": "dwd_weather_warnings",
+        "name": "Deutscher Wetterdienst (DWD) Weather Warnings",
+        "documentation": "https://www.home-assistant.io/integrations/dwd_weather_warnings",
+        "codeowners": [
+            "@runningman84",
+            "@stephan192",
+            "@Hummel95",
+        ],
+        "requirements": [
+            "dwdwfsapi==1.0.4",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "dweet": {
+        "domain": "dweet",
+        "name": "dweet.io",
+        "documentation": "https://www.home-assistant.io/integrations/dweet",
+        "requirements": [
+            "dweepy==0.3.0",
+        ],
+        "codeowners": [
+            "@fabaff",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "dynalite": {
+        "domain": "dynalite",
+        "name": "Philips Dynalite",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/dynalite",
+        "codeowners": [
+            "@ziv1234",
+        ],
+        "requirements": [
+            "dynalite_devices==0.1.46",
+        ],
+        "iot_class": "local_push",
+    },
+    "dyson": {
+        "domain": "dyson",
+        "name": "Dyson",
+        "documentation": "https://www.home-assistant.io/integrations/dyson",
+        "requirements": [
+            "libpurecool==0.6.4",
+        ],
+        "after_dependencies": [
+            "zeroconf",
+        ],
+        "codeowners": [],
+        "iot_class": "local_push",
+    },
+    "eafm": {
+        "domain": "eafm",
+        "name": "Environment Agency Flood Gauges",
+        "documentation": "https://www.home-assistant.io/integrations/eafm",
+        "config_flow": True,
+        "codeowners": [
+            "@Jc2k",
+        ],
+        "requirements": [
+            "aioeafm==0.1.2",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "ebox": {
+        "domain": "ebox",
+        "name": "EBox",
+        "documentation": "https://www.home-assistant.io/integrations/ebox",
+        "requirements": [
+            "pyebox==1.1.4",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_polling",
+    },
+    "ebusd": {
+        "domain": "ebusd",
+        "name": "ebusd",
+        "documentation": "https://www.home-assistant.io/integrations/ebusd",
+        "requirements": [
+            "ebusdpy==0.0.16",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "ecoal_boiler": {
+        "domain": "ecoal_boiler",
+        "name": "eSterownik eCoal.pl Boiler",
+        "documentation": "https://www.home-assistant.io/integrations/ecoal_boiler",
+        "requirements": [
+            "ecoaliface==0.4.0",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "ecobee": {
+        "domain": "ecobee",
+        "name": "ecobee",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/ecobee",
+        "requirements": [
+            "python-ecobee-api==0.2.11",
+        ],
+        "codeowners": [
+            "@marthoc",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "econet": {
+        "domain": "econet",
+        "name": "Rheem EcoNet Products",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/econet",
+        "requirements": [
+            "pyeconet==0.1.14",
+        ],
+        "codeowners": [
+            "@vangorra",
+            "@w1ll1am23",
+        ],
+        "iot_class": "cloud_push",
+    },
+    "ecovacs": {
+        "domain": "ecovacs",
+        "name": "Ecovacs",
+        "documentation": "https://www.home-assistant.io/integrations/ecovacs",
+        "requirements": [
+            "sucks==0.9.4",
+        ],
+        "codeowners": [
+            "@OverloadUT",
+        ],
+        "iot_class": "cloud_push",
+    },
+    "eddystone_temperature": {
+        "domain": "eddystone_temperature",
+        "name": "Eddystone",
+        "documentation": "https://www.home-assistant.io/integrations/eddystone_temperature",
+        "requirements": [
+            "beacontools[scan]==1.2.3",
+            "construct==2.10.56",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "edimax": {
+        "domain": "edimax",
+        "name": "Edimax",
+        "documentation": "https://www.home-assistant.io/integrations/edimax",
+        "requirements": [
+            "pyedimax==0.2.1",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "edl21": {
+        "domain": "edl21",
+        "name": "EDL21",
+        "documentation": "https://www.home-assistant.io/integrations/edl21",
+        "requirements": [
+            "pysml==0.0.5",
+        ],
+        "codeowners": [
+            "@mtdcr",
+        ],
+        "iot_class": "local_push",
+    },
+    "ee_brightbox": {
+        "domain": "ee_brightbox",
+        "name": "EE Bright Box",
+        "disabled": "Library has incompatible requirements.",
+        "documentation": "https://www.home-assistant.io/integrations/ee_brightbox",
+        "requirements": [
+            "eebrightbox==0.0.4",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "efergy": {
+        "domain": "efergy",
+        "name": "Efergy",
+        "documentation": "https://www.home-assistant.io/integrations/efergy",
+        "codeowners": [],
+        "iot_class": "cloud_polling",
+    },
+    "egardia": {
+        "domain": "egardia",
+        "name": "Egardia",
+        "documentation": "https://www.home-assistant.io/integrations/egardia",
+        "requirements": [
+            "pythonegardia==1.0.40",
+        ],
+        "codeowners": [
+            "@jeroenterheerdt",
+        ],
+        "iot_class": "local_polling",
+    },
+    "eight_sleep": {
+        "domain": "eight_sleep",
+        "name": "Eight Sleep",
+        "documentation": "https://www.home-assistant.io/integrations/eight_sleep",
+        "requirements": [
+            "pyeight==0.1.9",
+        ],
+        "codeowners": [
+            "@mezz64",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "elgato": {
+        "domain": "elgato",
+        "name": "Elgato Light",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/elgato",
+        "requirements": [
+            "elgato==2.1.1",
+        ],
+        "zeroconf": [
+            "_elg._tcp.local.",
+        ],
+        "codeowners": [
+            "@frenck",
+        ],
+        "quality_scale": "platinum",
+        "iot_class": "local_polling",
+    },
+    "eliqonline": {
+        "domain": "eliqonline",
+        "name": "Eliqonline",
+        "documentation": "https://www.home-assistant.io/integrations/eliqonline",
+        "requirements": [
+            "eliqonline==1.2.2",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_polling",
+    },
+    "elkm1": {
+        "domain": "elkm1",
+        "name": "Elk-M1 Control",
+        "documentation": "https://www.home-assistant.io/integrations/elkm1",
+        "requirements": [
+            "elkm1-lib==0.8.10",
+        ],
+        "codeowners": [
+            "@gwww",
+            "@bdraco",
+        ],
+        "config_flow": True,
+        "iot_class": "local_push",
+    },
+    "elv": {
+        "domain": "elv",
+        "name": "ELV PCA",
+        "documentation": "https://www.home-assistant.io/integrations/pca",
+        "codeowners": [
+            "@majuss",
+        ],
+        "requirements": [
+            "pypca==0.0.7",
+        ],
+        "iot_class": "local_polling",
+    },
+    "emby": {
+        "domain": "emby",
+        "name": "Emby",
+        "documentation": "https://www.home-assistant.io/integrations/emby",
+        "requirements": [
+            "pyemby==1.7",
+        ],
+        "codeowners": [
+            "@mezz64",
+        ],
+        "iot_class": "local_push",
+    },
+    "emoncms": {
+        "domain": "emoncms",
+        "name": "Emoncms",
+        "documentation": "https://www.home-assistant.io/integrations/emoncms",
+        "codeowners": [
+            "@borpin",
+        ],
+        "iot_class": "local_polling",
+    },
+    "emoncms_history": {
+        "domain": "emoncms_history",
+        "name": "Emoncms History",
+        "documentation": "https://www.home-assistant.io/integrations/emoncms_history",
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "emonitor": {
+        "domain": "emonitor",
+        "name": "SiteSage Emonitor",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/emonitor",
+        "requirements": [
+            "aioemonitor==1.0.5",
+        ],
+        "dhcp": [
+            {
+                "hostname": "emonitor*",
+                "macaddress": "0090C2*",
+            },
+        ],
+        "codeowners": [
+            "@bdraco",
+        ],
+        "iot_class": "local_polling",
+    },
+    "emulated_hue": {
+        "domain": "emulated_hue",
+        "name": "Emulated Hue",
+        "documentation": "https://www.home-assistant.io/integrations/emulated_hue",
+        "requirements": [
+            "aiohttp_cors==0.7.0",
+        ],
+        "after_dependencies": [
+            "http",
+        ],
+        "codeowners": [],
+        "quality_scale": "internal",
+        "iot_class": "local_push",
+    },
+    "emulated_kasa": {
+        "domain": "emulated_kasa",
+        "name": "Emulated Kasa",
+        "documentation": "https://www.home-assistant.io/integrations/emulated_kasa",
+        "requirements": [
+            "sense_energy==0.9.0",
+        ],
+        "codeowners": [
+            "@kbickar",
+        ],
+        "quality_scale": "internal",
+        "iot_class": "local_push",
+    },
+    "emulated_roku": {
+        "domain": "emulated_roku",
+        "name": "Emulated Roku",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/emulated_roku",
+        "requirements": [
+            "emulated_roku==0.2.1",
+        ],
+        "codeowners": [],
+        "iot_class": "local_push",
+    },
+    "enigma2": {
+        "domain": "enigma2",
+        "name": "Enigma2 (OpenWebif)",
+        "documentation": "https://www.home-assistant.io/integrations/enigma2",
+        "requirements": [
+            "openwebifpy==3.2.7",
+        ],
+        "codeowners": [
+            "@fbradyirl",
+        ],
+        "iot_class": "local_polling",
+    },
+    "enocean": {
+        "domain": "enocean",
+        "name": "EnOcean",
+        "documentation": "https://www.home-assistant.io/integrations/enocean",
+        "requirements": [
+            "enocean==0.50",
+        ],
+        "codeowners": [
+            "@bdurrer",
+        ],
+        "config_flow": True,
+        "iot_class": "local_push",
+    },
+    "enphase_envoy": {
+        "domain": "enphase_envoy",
+        "name": "Enphase Envoy",
+        "documentation": "https://www.home-assistant.io/integrations/enphase_envoy",
+        "requirements": [
+            "envoy_reader==0.19.0",
+        ],
+        "codeowners": [
+            "@gtdiehl",
+        ],
+        "config_flow": True,
+        "zeroconf": [
+            {
+                "type": "_enphase-envoy._tcp.local.",
+            },
+        ],
+        "iot_class": "local_polling",
+    },
+    "entur_public_transport": {
+        "domain": "entur_public_transport",
+        "name": "Entur",
+        "documentation": "https://www.home-assistant.io/integrations/entur_public_transport",
+        "requirements": [
+            "enturclient==0.2.2",
+        ],
+        "codeowners": [
+            "@hfurubotten",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "environment_canada": {
+        "domain": "environment_canada",
+        "name": "Environment Canada",
+        "documentation": "https://www.home-assistant.io/integrations/environment_canada",
+        "requirements": [
+            "env_canada==0.2.5",
+        ],
+        "codeowners": [
+            "@michaeldavie",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "envirophat": {
+        "domain": "envirophat",
+        "name": "Enviro pHAT",
+        "documentation": "https://www.home-assistant.io/integrations/envirophat",
+        "requirements": [
+            "envirophat==0.0.6",
+            "smbus-cffi==0.5.1",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "envisalink": {
+        "domain": "envisalink",
+        "name": "Envisalink",
+        "documentation": "https://www.home-assistant.io/integrations/envisalink",
+        "requirements": [
+            "pyenvisalink==4.0",
+        ],
+        "codeowners": [],
+        "iot_class": "local_push",
+    },
+    "ephember": {
+        "domain": "ephember",
+        "name": "EPH Controls",
+        "documentation": "https://www.home-assistant.io/integrations/ephember",
+        "requirements": [
+            "pyephember==0.3.1",
+        ],
+        "codeowners": [
+            "@ttroy50",
+        ],
+        "iot_class": "local_polling",
+    },
+    "epson": {
+        "domain": "epson",
+        "name": "Epson",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/epson",
+        "requirements": [
+            "epson-projector==0.4.2",
+        ],
+        "codeowners": [
+            "@pszafer",
+        ],
+        "iot_class": "local_polling",
+    },
+    "epsonworkforce": {
+        "domain": "epsonworkforce",
+        "name": "Epson Workforce",
+        "documentation": "https://www.home-assistant.io/integrations/epsonworkforce",
+        "codeowners": [
+            "@ThaStealth",
+        ],
+        "requirements": [
+            "epsonprinter==0.0.9",
+        ],
+        "iot_class": "local_polling",
+    },
+    "eq3btsmart": {
+        "domain": "eq3btsmart",
+        "name": "EQ3 Bluetooth Smart Thermostats",
+        "documentation": "https://www.home-assistant.io/integrations/eq3btsmart",
+        "requirements": [
+            "construct==2.10.56",
+            "python-eq3bt==0.1.11",
+        ],
+        "codeowners": [
+            "@rytilahti",
+        ],
+        "iot_class": "local_polling",
+    },
+    "esphome": {
+        "domain": "esphome",
+        "name": "ESPHome",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/esphome",
+        "requirements": [
+            "aioesphomeapi==5.0.1",
+        ],
+        "zeroconf": [
+            "_esphomelib._tcp.local.",
+        ],
+        "codeowners": [
+            "@OttoWinter",
+            "@jesserockz",
+        ],
+        "after_dependencies": [
+            "zeroconf",
+            "tag",
+        ],
+        "iot_class": "local_push",
+    },
+    "essent": {
+        "domain": "essent",
+        "name": "Essent",
+        "documentation": "https://www.home-assistant.io/integrations/essent",
+        "requirements": [
+            "PyEssent==0.14",
+        ],
+        "codeowners": [
+            "@TheLastProject",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "etherscan": {
+        "domain": "etherscan",
+        "name": "Etherscan",
+        "documentation": "https://www.home-assistant.io/integrations/etherscan",
+        "requirements": [
+            "python-etherscan-api==0.0.3",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_polling",
+    },
+    "eufy": {
+        "domain": "eufy",
+        "name": "eufy",
+        "documentation": "https://www.home-assistant.io/integrations/eufy",
+        "requirements": [
+            "lakeside==0.12",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "everlights": {
+        "domain": "everlights",
+        "name": "EverLights",
+        "documentation": "https://www.home-assistant.io/integrations/everlights",
+        "requirements": [
+            "pyeverlights==0.1.0",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "evohome": {
+        "domain": "evohome",
+        "name": "Honeywell Total Connect Comfort (Europe)",
+        "documentation": "https://www.home-assistant.io/integrations/evohome",
+        "requirements": [
+            "evohome-async==0.3.15",
+        ],
+        "codeowners": [
+            "@zxdavb",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "ezviz": {
+        "domain": "ezviz",
+        "name": "Ezviz",
+        "documentation": "https://www.home-assistant.io/integrations/ezviz",
+        "dependencies": [
+            "ffmpeg",
+        ],
+        "codeowners": [
+            "@RenierM26",
+            "@baqs",
+        ],
+        "requirements": [
+            "pyezviz==0.1.8.9",
+        ],
+        "config_flow": True,
+        "iot_class": "cloud_polling",
+    },
+    "faa_delays": {
+        "domain": "faa_delays",
+        "name": "FAA Delays",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/faa_delays",
+        "requirements": [
+            "faadelays==0.0.7",
+        ],
+        "codeowners": [
+            "@ntilley905",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "facebook": {
+        "domain": "facebook",
+        "name": "Facebook Messenger",
+        "documentation": "https://www.home-assistant.io/integrations/facebook",
+        "codeowners": [],
+        "iot_class": "cloud_push",
+    },
+    "facebox": {
+        "domain": "facebox",
+        "name": "Facebox",
+        "documentation": "https://www.home-assistant.io/integrations/facebox",
+        "codeowners": [],
+        "iot_class": "local_push",
+    },
+    "fail2ban": {
+        "domain": "fail2ban",
+        "name": "Fail2Ban",
+        "documentation": "https://www.home-assistant.io/integrations/fail2ban",
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "familyhub": {
+        "domain": "familyhub",
+        "name": "Samsung Family Hub",
+        "documentation": "https://www.home-assistant.io/integrations/familyhub",
+        "requirements": [
+            "python-family-hub-local==0.0.2",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "fan": {
+        "domain": "fan",
+        "name": "Fan",
+        "documentation": "https://www.home-assistant.io/integrations/fan",
+        "codeowners": [],
+        "quality_scale": "internal",
+    },
+    "fastdotcom": {
+        "domain": "fastdotcom",
+        "name": "Fast.com",
+        "documentation": "https://www.home-assistant.io/integrations/fastdotcom",
+        "requirements": [
+            "fastdotcom==0.0.3",
+        ],
+        "codeowners": [
+            "@rohankapoorcom",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "feedreader": {
+        "domain": "feedreader",
+        "name": "Feedreader",
+        "documentation": "https://www.home-assistant.io/integrations/feedreader",
+        "requirements": [
+            "feedparser==6.0.2",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_polling",
+    },
+    "ffmpeg": {
+        "domain": "ffmpeg",
+        "name": "FFmpeg",
+        "documentation": "https://www.home-assistant.io/integrations/ffmpeg",
+        "requirements": [
+            "ha-ffmpeg==3.0.2",
+        ],
+        "codeowners": [],
+    },
+    "ffmpeg_motion": {
+        "domain": "ffmpeg_motion",
+        "name": "FFmpeg Motion",
+        "documentation": "https://www.home-assistant.io/integrations/ffmpeg_motion",
+        "dependencies": [
+            "ffmpeg",
+        ],
+        "codeowners": [],
+        "iot_class": "calculated",
+    },
+    "ffmpeg_noise": {
+        "domain": "ffmpeg_noise",
+        "name": "FFmpeg Noise",
+        "documentation": "https://www.home-assistant.io/integrations/ffmpeg_noise",
+        "dependencies": [
+            "ffmpeg",
+        ],
+        "codeowners": [],
+        "iot_class": "calculated",
+    },
+    "fibaro": {
+        "domain": "fibaro",
+        "name": "Fibaro",
+        "documentation": "https://www.home-assistant.io/integrations/fibaro",
+        "requirements": [
+            "fiblary3==0.1.7",
+        ],
+        "codeowners": [],
+        "iot_class": "local_push",
+    },
+    "fido": {
+        "domain": "fido",
+        "name": "Fido",
+        "documentation": "https://www.home-assistant.io/integrations/fido",
+        "requirements": [
+            "pyfido==2.1.1",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_polling",
+    },
+    "file": {
+        "domain": "file",
+        "name": "File",
+        "documentation": "https://www.home-assistant.io/integrations/file",
+        "codeowners": [
+            "@fabaff",
+        ],
+        "iot_class": "local_polling",
+    },
+    "filesize": {
+        "domain": "filesize",
+        "name": "File Size",
+        "documentation": "https://www.home-assistant.io/integrations/filesize",
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "filter": {
+        "domain": "filter",
+        "name": "Filter",
+        "documentation": "https://www.home-assistant.io/integrations/filter",
+        "dependencies": [
+            "recorder",
+        ],
+        "codeowners": [
+            "@dgomes",
+        ],
+        "quality_scale": "internal",
+        "iot_class": "local_push",
+    },
+    "fints": {
+        "domain": "fints",
+        "name": "FinTS",
+        "documentation": "https://www.home-assistant.io/integrations/fints",
+        "requirements": [
+            "fints==1.0.1",
+        ],
+        "codeowners": [],
+        "iot_class": "local_push",
+    },
+    "fireservicerota": {
+        "domain": "fireservicerota",
+        "name": "FireServiceRota",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/fireservicerota",
+        "requirements": [
+            "pyfireservicerota==0.0.43",
+        ],
+        "codeowners": [
+            "@cyberjunky",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "firmata": {
+        "domain": "firmata",
+        "name": "Firmata",
+        "config_flow": False,
+        "documentation": "https://www.home-assistant.io/integrations/firmata",
+        "requirements": [
+            "pymata-express==1.19",
+        ],
+        "codeowners": [
+            "@DaAwesomeP",
+        ],
+        "iot_class": "local_push",
+    },
+    "fitbit": {
+        "domain": "fitbit",
+        "name": "Fitbit",
+        "documentation": "https://www.home-assistant.io/integrations/fitbit",
+        "requirements": [
+            "fitbit==0.3.1",
+        ],
+        "dependencies": [
+            "configurator",
+            "http",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_polling",
+    },
+    "fixer": {
+        "domain": "fixer",
+        "name": "Fixer",
+        "documentation": "https://www.home-assistant.io/integrations/fixer",
+        "requirements": [
+            "fixerio==1.0.0a0",
+        ],
+        "codeowners": [
+            "@fabaff",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "fleetgo": {
+        "domain": "fleetgo",
+        "name": "FleetGO",
+        "documentation": "https://www.home-assistant.io/integrations/fleetgo",
+        "requirements": [
+            "ritassist==0.9.2",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_polling",
+    },
+    "flexit": {
+        "domain": "flexit",
+        "name": "Flexit",
+        "documentation": "https://www.home-assistant.io/integrations/flexit",
+        "requirements": [
+            "pyflexit==0.3",
+        ],
+        "dependencies": [
+            "modbus",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "flic": {
+        "domain": "flic",
+        "name": "Flic",
+        "documentation": "https://www.home-assistant.io/integrations/flic",
+        "requirements": [
+            "pyflic==2.0.3",
+        ],
+        "codeowners": [],
+        "iot_class": "local_push",
+    },
+    "flick_electric": {
+        "domain": "flick_electric",
+        "name": "Flick Electric",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/flick_electric/",
+        "requirements": [
+            "PyFlick==0.0.2",
+        ],
+        "codeowners": [
+            "@ZephireNZ",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "flo": {
+        "domain": "flo",
+        "name": "Flo",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/flo",
+        "requirements": [
+            "aioflo==0.4.1",
+        ],
+        "codeowners": [
+            "@dmulcahey",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "flock": {
+        "domain": "flock",
+        "name": "Flock",
+        "documentation": "https://www.home-assistant.io/integrations/flock",
+        "codeowners": [
+            "@fabaff",
+        ],
+        "iot_class": "cloud_push",
+    },
+    "flume": {
+        "domain": "flume",
+        "name": "Flume",
+        "documentation": "https://www.home-assistant.io/integrations/flume/",
+        "requirements": [
+            "pyflume==0.5.5",
+        ],
+        "codeowners": [
+            "@ChrisMandich",
+            "@bdraco",
+        ],
+        "config_flow": True,
+        "dhcp": [
+            {
+                "hostname": "flume-gw-*",
+            },
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "flunearyou": {
+        "domain": "flunearyou",
+        "name": "Flu Near You",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/flunearyou",
+        "requirements": [
+            "pyflunearyou==1.0.7",
+        ],
+        "codeowners": [
+            "@bachya",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "flux": {
+        "domain": "flux",
+        "name": "Flux",
+        "documentation": "https://www.home-assistant.io/integrations/flux",
+        "after_dependencies": [
+            "light",
+        ],
+        "codeowners": [],
+        "quality_scale": "internal",
+        "iot_class": "calculated",
+    },
+    "flux_led": {
+        "domain": "flux_led",
+        "name": "Flux LED/MagicLight",
+        "documentation": "https://www.home-assistant.io/integrations/flux_led",
+        "requirements": [
+            "flux_led==0.22",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "folder": {
+        "domain": "folder",
+        "name": "Folder",
+        "documentation": "https://www.home-assistant.io/integrations/folder",
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "folder_watcher": {
+        "domain": "folder_watcher",
+        "name": "Folder Watcher",
+        "documentation": "https://www.home-assistant.io/integrations/folder_watcher",
+        "requirements": [
+            "watchdog==2.1.3",
+        ],
+        "codeowners": [],
+        "quality_scale": "internal",
+        "iot_class": "local_polling",
+    },
+    "foobot": {
+        "domain": "foobot",
+        "name": "Foobot",
+        "documentation": "https://www.home-assistant.io/integrations/foobot",
+        "requirements": [
+            "foobot_async==1.0.0",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_polling",
+    },
+    "forecast_solar": {
+        "domain": "forecast_solar",
+        "name": "Forecast.Solar",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/forecast_solar",
+        "requirements": [
+            "forecast_solar==1.3.1",
+        ],
+        "codeowners": [
+            "@klaasnicolaas",
+            "@frenck",
+        ],
+        "quality_scale": "platinum",
+        "iot_class": "cloud_polling",
+    },
+    "forked_daapd": {
+        "domain": "forked_daapd",
+        "name": "forked-daapd",
+        "documentation": "https://www.home-assistant.io/integrations/forked_daapd",
+        "codeowners": [
+            "@uvjustin",
+        ],
+        "requirements": [
+            "pyforked-daapd==0.1.11",
+            "pylibrespot-java==0.1.0",
+        ],
+        "config_flow": True,
+        "zeroconf": [
+            "_daap._tcp.local.",
+        ],
+        "iot_class": "local_push",
+    },
+    "fortios": {
+        "domain": "fortios",
+        "name": "FortiOS",
+        "documentation": "https://www.home-assistant.io/integrations/fortios/",
+        "requirements": [
+            "fortiosapi==1.0.5",
+        ],
+        "codeowners": [
+            "@kimfrellsen",
+        ],
+        "iot_class": "local_polling",
+    },
+    "foscam": {
+        "domain": "foscam",
+        "name": "Foscam",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/foscam",
+        "requirements": [
+            "libpyfoscam==1.0",
+        ],
+        "codeowners": [
+            "@skgsergio",
+        ],
+        "iot_class": "local_polling",
+    },
+    "foursquare": {
+        "domain": "foursquare",
+        "name": "Foursquare",
+        "documentation": "https://www.home-assistant.io/integrations/foursquare",
+        "dependencies": [
+            "http",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_push",
+    },
+    "free_mobile": {
+        "domain": "free_mobile",
+        "name": "Free Mobile",
+        "documentation": "https://www.home-assistant.io/integrations/free_mobile",
+        "requirements": [
+            "freesms==0.2.0",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_push",
+    },
+    "freebox": {
+        "domain": "freebox",
+        "name": "Freebox",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/freebox",
+        "requirements": [
+            "freebox-api==0.0.10",
+        ],
+        "zeroconf": [
+            "_fbx-api._tcp.local.",
+        ],
+        "codeowners": [
+            "@hacf-fr",
+            "@Quentame",
+        ],
+        "iot_class": "local_polling",
+    },
+    "freedns": {
+        "domain": "freedns",
+        "name": "FreeDNS",
+        "documentation": "https://www.home-assistant.io/integrations/freedns",
+        "codeowners": [],
+        "iot_class": "cloud_push",
+    },
+    "freedompro": {
+        "domain": "freedompro",
+        "name": "Freedompro",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/freedompro",
+        "codeowners": [
+            "@stefano055415",
+        ],
+        "requirements": [
+            "pyfreedompro==1.1.0",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "fritz": {
+        "domain": "fritz",
+        "name": "AVM FRITZ!Box Tools",
+        "documentation": "https://www.home-assistant.io/integrations/fritz",
+        "requirements": [
+            "fritzconnection==1.4.2",
+            "fritzprofiles==0.6.1",
+            "xmltodict==0.12.0",
+        ],
+        "dependencies": [
+            "network",
+        ],
+        "codeowners": [
+            "@mammuth",
+            "@AaronDavidSchneider",
+            "@chemelli74",
+        ],
+        "config_flow": True,
+        "ssdp": [
+            {
+                "st": "urn:schemas-upnp-org:device:fritzbox:1",
+            },
+        ],
+        "iot_class": "local_polling",
+    },
+    "fritzbox": {
+        "domain": "fritzbox",
+        "name": "AVM FRITZ!SmartHome",
+        "documentation": "https://www.home-assistant.io/integrations/fritzbox",
+        "requirements": [
+            "pyfritzhome==0.6.2",
+        ],
+        "ssdp": [
+            {
+                "st": "urn:schemas-upnp-org:device:fritzbox:1",
+            },
+        ],
+        "codeowners": [
+            "@mib1185",
+        ],
+        "config_flow": True,
+        "iot_class": "local_polling",
+    },
+    "fritzbox_callmonitor": {
+        "domain": "fritzbox_callmonitor",
+        "name": "AVM FRITZ!Box Call Monitor",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/fritzbox_callmonitor",
+        "requirements": [
+            "fritzconnection==1.4.2",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "fronius": {
+        "domain": "fronius",
+        "name": "Fronius",
+        "documentation": "https://www.home-assistant.io/integrations/fronius",
+        "requirements": [
+            "pyfronius==0.5.3",
+        ],
+        "codeowners": [
+            "@nielstron",
+        ],
+        "iot_class": "local_polling",
+    },
+    "frontend": {
+        "domain": "frontend",
+        "name": "Home Assistant Frontend",
+        "documentation": "https://www.home-assistant.io/integrations/frontend",
+        "requirements": [
+            "home-assistant-frontend==20210707.0",
+        ],
+        "dependencies": [
+            "api",
+            "auth",
+            "config",
+            "device_automation",
+            "http",
+            "lovelace",
+            "onboarding",
+            "search",
+            "system_log",
+            "websocket_api",
+        ],
+        "codeowners": [
+            "@home-assistant/frontend",
+        ],
+        "quality_scale": "internal",
+    },
+    "frontier_silicon": {
+        "domain": "frontier_silicon",
+        "name": "Frontier Silicon",
+        "documentation": "https://www.home-assistant.io/integrations/frontier_silicon",
+        "requirements": [
+            "afsapi==0.0.4",
+        ],
+        "codeowners": [],
+        "iot_class": "local_push",
+    },
+    "futurenow": {
+        "domain": "futurenow",
+        "name": "P5 FutureNow",
+        "documentation": "https://www.home-assistant.io/integrations/futurenow",
+        "requirements": [
+            "pyfnip==0.2",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "garadget": {
+        "domain": "garadget",
+        "name": "Garadget",
+        "documentation": "https://www.home-assistant.io/integrations/garadget",
+        "codeowners": [],
+        "iot_class": "cloud_polling",
+    },
+    "garages_amsterdam": {
+        "domain": "garages_amsterdam",
+        "name": "Garages Amsterdam",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/garages_amsterdam",
+        "requirements": [
+            "garages-amsterdam==2.1.1",
+        ],
+        "codeowners": [
+            "@klaasnicolaas",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "garmin_connect": {
+        "domain": "garmin_connect",
+        "name": "Garmin Connect",
+        "documentation": "https://www.home-assistant.io/integrations/garmin_connect",
+        "requirements": [
+            "garminconnect_ha==0.1.6",
+        ],
+        "codeowners": [
+            "@cyberjunky",
+        ],
+        "config_flow": True,
+        "iot_class": "cloud_polling",
+    },
+    "gc100": {
+        "domain": "gc100",
+        "name": "Global Cach\u00e9 GC-100",
+        "documentation": "https://www.home-assistant.io/integrations/gc100",
+        "requirements": [
+            "python-gc100==1.0.3a",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "gdacs": {
+        "domain": "gdacs",
+        "name": "Global Disaster Alert and Coordination System (GDACS)",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/gdacs",
+        "requirements": [
+            "aio_georss_gdacs==0.5",
+        ],
+        "codeowners": [
+            "@exxamalte",
+        ],
+        "quality_scale": "platinum",
+        "iot_class": "cloud_polling",
+    },
+    "generic": {
+        "domain": "generic",
+        "name": "Generic",
+        "documentation": "https://www.home-assistant.io/integrations/generic",
+        "codeowners": [],
+        "iot_class": "local_push",
+    },
+    "generic_hygrostat": {
+        "domain": "generic_hygrostat",
+        "name": "Generic hygrostat",
+        "documentation": "https://www.home-assistant.io/integrations/generic_hygrostat",
+        "codeowners": [
+            "@Shulyaka",
+        ],
+        "quality_scale": "internal",
+        "iot_class": "local_polling",
+    },
+    "generic_thermostat": {
+        "domain": "generic_thermostat",
+        "name": "Generic Thermostat",
+        "documentation": "https://www.home-assistant.io/integrations/generic_thermostat",
+        "dependencies": [
+            "sensor",
+            "switch",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "geniushub": {
+        "domain": "geniushub",
+        "name": "Genius Hub",
+        "documentation": "https://www.home-assistant.io/integrations/geniushub",
+        "requirements": [
+            "geniushub-client==0.6.30",
+        ],
+        "codeowners": [
+            "@zxdavb",
+        ],
+        "iot_class": "local_polling",
+    },
+    "geo_json_events": {
+        "domain": "geo_json_events",
+        "name": "GeoJSON",
+        "documentation": "https://www.home-assistant.io/integrations/geo_json_events",
+        "requirements": [
+            "geojson_client==0.6",
+        ],
+        "codeowners": [
+            "@exxamalte",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "geo_location": {
+        "domain": "geo_location",
+        "name": "Geolocation",
+        "documentation": "https://www.home-assistant.io/integrations/geo_location",
+        "codeowners": [],
+        "quality_scale": "internal",
+    },
+    "geo_rss_events": {
+        "domain": "geo_rss_events",
+        "name": "GeoRSS",
+        "documentation": "https://www.home-assistant.io/integrations/geo_rss_events",
+        "requirements": [
+            "georss_generic_client==0.6",
+        ],
+        "codeowners": [
+            "@exxamalte",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "geofency": {
+        "domain": "geofency",
+        "name": "Geofency",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/geofency",
+        "dependencies": [
+            "webhook",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_push",
+    },
+    "geonetnz_quakes": {
+        "domain": "geonetnz_quakes",
+        "name": "GeoNet NZ Quakes",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/geonetnz_quakes",
+        "requirements": [
+            "aio_geojson_geonetnz_quakes==0.13",
+        ],
+        "codeowners": [
+            "@exxamalte",
+        ],
+        "quality_scale": "platinum",
+        "iot_class": "cloud_polling",
+    },
+    "geonetnz_volcano": {
+        "domain": "geonetnz_volcano",
+        "name": "GeoNet NZ Volcano",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/geonetnz_volcano",
+        "requirements": [
+            "aio_geojson_geonetnz_volcano==0.6",
+        ],
+        "codeowners": [
+            "@exxamalte",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "gios": {
+        "domain": "gios",
+        "name": "GIO\u015a",
+        "documentation": "https://www.home-assistant.io/integrations/gios",
+        "codeowners": [
+            "@bieniu",
+        ],
+        "requirements": [
+            "gios==1.0.2",
+        ],
+        "config_flow": True,
+        "quality_scale": "platinum",
+        "iot_class": "cloud_polling",
+    },
+    "github": {
+        "domain": "github",
+        "name": "GitHub",
+        "documentation": "https://www.home-assistant.io/integrations/github",
+        "requirements": [
+            "PyGithub==1.43.8",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_polling",
+    },
+    "gitlab_ci": {
+        "domain": "gitlab_ci",
+        "name": "GitLab-CI",
+        "documentation": "https://www.home-assistant.io/integrations/gitlab_ci",
+        "requirements": [
+            "python-gitlab==1.6.0",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_polling",
+    },
+    "gitter": {
+        "domain": "gitter",
+        "name": "Gitter",
+        "documentation": "https://www.home-assistant.io/integrations/gitter",
+        "requirements": [
+            "gitterpy==0.1.7",
+        ],
+        "codeowners": [
+            "@fabaff",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "glances": {
+        "domain": "glances",
+        "name": "Glances",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/glances",
+        "requirements": [
+            "glances_api==0.2.0",
+        ],
+        "codeowners": [
+            "@fabaff",
+            "@engrbm87",
+        ],
+        "iot_class": "local_polling",
+    },
+    "gntp": {
+        "domain": "gntp",
+        "name": "Growl (GnGNTP)",
+        "documentation": "https://www.home-assistant.io/integrations/gntp",
+        "requirements": [
+            "gntp==1.0.3",
+        ],
+        "codeowners": [],
+        "iot_class": "local_push",
+    },
+    "goalfeed": {
+        "domain": "goalfeed",
+        "name": "Goalfeed",
+        "documentation": "https://www.home-assistant.io/integrations/goalfeed",
+        "requirements": [
+            "pysher==1.0.1",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_push",
+    },
+    "goalzero": {
+        "domain": "goalzero",
+        "name": "Goal Zero Yeti",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/goalzero",
+        "requirements": [
+            "goalzero==0.1.7",
+        ],
+        "dhcp": [
+            {
+                "hostname": "yeti*",
+            },
+        ],
+        "codeowners": [
+            "@tkdrob",
+        ],
+        "iot_class": "local_polling",
+    },
+    "gogogate2": {
+        "domain": "gogogate2",
+        "name": "Gogogate2 and ismartgate",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/gogogate2",
+        "requirements": [
+            "ismartgate==4.0.0",
+        ],
+        "codeowners": [
+            "@vangorra",
+            "@bdraco",
+        ],
+        "homekit": {
+            "models": [
+                "iSmartGate",
+            ],
+        },
+        "dhcp": [
+            {
+                "hostname": "ismartgate*",
+            },
+        ],
+        "iot_class": "local_polling",
+    },
+    "google": {
+        "domain": "google",
+        "name": "Google Calendars",
+        "documentation": "https://www.home-assistant.io/integrations/google",
+        "requirements": [
+            "google-api-python-client==1.6.4",
+            "httplib2==0.19.0",
+            "oauth2client==4.0.0",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_polling",
+    },
+    "google_assistant": {
+        "domain": "google_assistant",
+        "name": "Google Assistant",
+        "documentation": "https://www.home-assistant.io/integrations/google_assistant",
+        "dependencies": [
+            "http",
+        ],
+        "after_dependencies": [
+            "camera",
+        ],
+        "codeowners": [
+            "@home-assistant/cloud",
+        ],
+        "iot_class": "cloud_push",
+    },
+    "google_cloud": {
+        "domain": "google_cloud",
+        "name": "Google Cloud Platform",
+        "documentation": "https://www.home-assistant.io/integrations/google_cloud",
+        "requirements": [
+            "google-cloud-texttospeech==0.4.0",
+        ],
+        "codeowners": [
+            "@lufton",
+        ],
+        "iot_class": "cloud_push",
+    },
+    "google_domains": {
+        "domain": "google_domains",
+        "name": "Google Domains",
+        "documentation": "https://www.home-assistant.io/integrations/google_domains",
+        "codeowners": [],
+        "iot_class": "cloud_polling",
+    },
+    "google_maps": {
+        "domain": "google_maps",
+        "name": "Google Maps",
+        "documentation": "https://www.home-assistant.io/integrations/google_maps",
+        "requirements": [
+            "locationsharinglib==4.1.5",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_polling",
+    },
+    "google_pubsub": {
+        "domain": "google_pubsub",
+        "name": "Google Pub/Sub",
+        "documentation": "https://www.home-assistant.io/integrations/google_pubsub",
+        "requirements": [
+            "google-cloud-pubsub==2.1.0",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_push",
+    },
+    "google_translate": {
+        "domain": "google_translate",
+        "name": "Google Translate Text-to-Speech",
+        "documentation": "https://www.home-assistant.io/integrations/google_translate",
+        "requirements": [
+            "gTTS==2.2.3",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_push",
+    },
+    "google_travel_time": {
+        "domain": "google_travel_time",
+        "name": "Google Maps Travel Time",
+        "documentation": "https://www.home-assistant.io/integrations/google_travel_time",
+        "requirements": [
+            "googlemaps==2.5.1",
+        ],
+        "codeowners": [],
+        "config_flow": True,
+        "iot_class": "cloud_polling",
+    },
+    "google_wifi": {
+        "domain": "google_wifi",
+        "name": "Google Wifi",
+        "documentation": "https://www.home-assistant.io/integrations/google_wifi",
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "gpmdp": {
+        "domain": "gpmdp",
+        "name": "Google Play Music Desktop Player (GPMDP)",
+        "disabled": "Integration has incompatible requirements.",
+        "documentation": "https://www.home-assistant.io/integrations/gpmdp",
+        "requirements": [
+            "websocket-client==0.54.0",
+        ],
+        "dependencies": [
+            "configurator",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "gpsd": {
+        "domain": "gpsd",
+        "name": "GPSD",
+        "documentation": "https://www.home-assistant.io/integrations/gpsd",
+        "requirements": [
+            "gps3==0.33.3",
+        ],
+        "codeowners": [
+            "@fabaff",
+        ],
+        "iot_class": "local_polling",
+    },
+    "gpslogger": {
+        "domain": "gpslogger",
+        "name": "GPSLogger",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/gpslogger",
+        "dependencies": [
+            "webhook",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_push",
+    },
+    "graphite": {
+        "domain": "graphite",
+        "name": "Graphite",
+        "documentation": "https://www.home-assistant.io/integrations/graphite",
+        "codeowners": [],
+        "iot_class": "local_push",
+    },
+    "gree": {
+        "domain": "gree",
+        "name": "Gree Climate",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/gree",
+        "requirements": [
+            "greeclimate==0.11.7",
+        ],
+        "codeowners": [
+            "@cmroche",
+        ],
+        "iot_class": "local_polling",
+    },
+    "greeneye_monitor": {
+        "domain": "greeneye_monitor",
+        "name": "GreenEye Monitor (GEM)",
+        "documentation": "https://www.home-assistant.io/integrations/greeneye_monitor",
+        "requirements": [
+            "greeneye_monitor==2.1",
+        ],
+        "codeowners": [
+            "@jkeljo",
+        ],
+        "iot_class": "local_push",
+    },
+    "greenwave": {
+        "domain": "greenwave",
+        "name": "Greenwave Reality",
+        "documentation": "https://www.home-assistant.io/integrations/greenwave",
+        "requirements": [
+            "greenwavereality==0.5.1",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "group": {
+        "domain": "group",
+        "name": "Group",
+        "documentation": "https://www.home-assistant.io/integrations/group",
+        "codeowners": [
+            "@home-assistant/core",
+        ],
+        "quality_scale": "internal",
+        "iot_class": "calculated",
+    },
+    "growatt_server": {
+        "domain": "growatt_server",
+        "name": "Growatt",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/growatt_server/",
+        "requirements": [
+            "growattServer==1.0.1",
+        ],
+        "codeowners": [
+            "@indykoning",
+            "@muppet3000",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "gstreamer": {
+        "domain": "gstreamer",
+        "name": "GStreamer",
+        "documentation": "https://www.home-assistant.io/integrations/gstreamer",
+        "requirements": [
+            "gstreamer-player==1.1.2",
+        ],
+        "codeowners": [],
+        "iot_class": "local_push",
+    },
+    "gtfs": {
+        "domain": "gtfs",
+        "name": "General Transit Feed Specification (GTFS)",
+        "documentation": "https://www.home-assistant.io/integrations/gtfs",
+        "requirements": [
+            "pygtfs==0.1.6",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "guardian": {
+        "domain": "guardian",
+        "name": "Elexa Guardian",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/guardian",
+        "requirements": [
+            "aioguardian==1.0.4",
+        ],
+        "zeroconf": [
+            "_api._udp.local.",
+        ],
+        "codeowners": [
+            "@bachya",
+        ],
+        "iot_class": "local_polling",
+        "dhcp": [
+            {
+                "hostname": "gvc*",
+                "macaddress": "30AEA4*",
+            },
+            {
+                "hostname": "guardian*",
+                "macaddress": "30AEA4*",
+            },
+        ],
+    },
+    "habitica": {
+        "domain": "habitica",
+        "name": "Habitica",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/habitica",
+        "requirements": [
+            "habitipy==0.2.0",
+        ],
+        "codeowners": [
+            "@ASMfreaK",
+            "@leikoilja",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "hangouts": {
+        "domain": "hangouts",
+        "name": "Google Hangouts",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/hangouts",
+        "requirements": [
+            "hangups==0.4.14",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_push",
+    },
+    "harman_kardon_avr": {
+        "domain": "harman_kardon_avr",
+        "name": "Harman Kardon AVR",
+        "documentation": "https://www.home-assistant.io/integrations/harman_kardon_avr",
+        "requirements": [
+            "hkavr==0.0.5",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "harmony": {
+        "domain": "harmony",
+        "name": "Logitech Harmony Hub",
+        "documentation": "https://www.home-assistant.io/integrations/harmony",
+        "requirements": [
+            "aioharmony==0.2.7",
+        ],
+        "codeowners": [
+            "@ehendrix23",
+            "@bramkragten",
+            "@bdraco",
+            "@mkeesey",
+        ],
+        "ssdp": [
+            {
+                "manufacturer": "Logitech",
+                "deviceType": "urn:myharmony-com:device:harmony:1",
+            },
+        ],
+        "dependencies": [
+            "remote",
+            "switch",
+        ],
+        "config_flow": True,
+        "iot_class": "local_push",
+    },
+    "hassio": {
+        "domain": "hassio",
+        "name": "Home Assistant Supervisor",
+        "documentation": "https://www.home-assistant.io/hassio",
+        "dependencies": [
+            "http",
+        ],
+        "after_dependencies": [
+            "panel_custom",
+        ],
+        "codeowners": [
+            "@home-assistant/supervisor",
+        ],
+        "iot_class": "local_polling",
+    },
+    "haveibeenpwned": {
+        "domain": "haveibeenpwned",
+        "name": "HaveIBeenPwned",
+        "documentation": "https://www.home-assistant.io/integrations/haveibeenpwned",
+        "codeowners": [],
+        "iot_class": "cloud_polling",
+    },
+    "hddtemp": {
+        "domain": "hddtemp",
+        "name": "hddtemp",
+        "documentation": "https://www.home-assistant.io/integrations/hddtemp",
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "hdmi_cec": {
+        "domain": "hdmi_cec",
+        "name": "HDMI-CEC",
+        "documentation": "https://www.home-assistant.io/integrations/hdmi_cec",
+        "requirements": [
+            "pyCEC==0.5.1",
+        ],
+        "codeowners": [],
+        "iot_class": "local_push",
+    },
+    "heatmiser": {
+        "domain": "heatmiser",
+        "name": "Heatmiser",
+        "documentation": "https://www.home-assistant.io/integrations/heatmiser",
+        "requirements": [
+            "heatmiserV3==1.1.18",
+        ],
+        "codeowners": [
+            "@andylockran",
+        ],
+        "iot_class": "local_polling",
+    },
+    "heos": {
+        "domain": "heos",
+        "name": "Denon HEOS",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/heos",
+        "requirements": [
+            "pyheos==0.7.2",
+        ],
+        "ssdp": [
+            {
+                "st": "urn:schemas-denon-com:device:ACT-Denon:1",
+            },
+        ],
+        "codeowners": [
+            "@andrewsayre",
+        ],
+        "iot_class": "local_push",
+    },
+    "here_travel_time": {
+        "domain": "here_travel_time",
+        "name": "HERE Travel Time",
+        "documentation": "https://www.home-assistant.io/integrations/here_travel_time",
+        "requirements": [
+            "herepy==2.0.0",
+        ],
+        "codeowners": [
+            "@eifinger",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "hikvision": {
+        "domain": "hikvision",
+        "name": "Hikvision",
+        "documentation": "https://www.home-assistant.io/integrations/hikvision",
+        "requirements": [
+            "pyhik==0.2.8",
+        ],
+        "codeowners": [
+            "@mezz64",
+        ],
+        "iot_class": "local_push",
+    },
+    "hikvisioncam": {
+        "domain": "hikvisioncam",
+        "name": "Hikvision",
+        "documentation": "https://www.home-assistant.io/integrations/hikvisioncam",
+        "requirements": [
+            "hikvision==0.4",
+        ],
+        "codeowners": [
+            "@fbradyirl",
+        ],
+        "iot_class": "local_polling",
+    },
+    "hisense_aehw4a1": {
+        "domain": "hisense_aehw4a1",
+        "name": "Hisense AEH-W4A1",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/hisense_aehw4a1",
+        "requirements": [
+            "pyaehw4a1==0.3.9",
+        ],
+        "codeowners": [
+            "@bannhead",
+        ],
+        "iot_class": "local_polling",
+    },
+    "history": {
+        "domain": "history",
+        "name": "History",
+        "documentation": "https://www.home-assistant.io/integrations/history",
+        "dependencies": [
+            "http",
+            "recorder",
+        ],
+        "codeowners": [
+            "@home-assistant/core",
+        ],
+        "quality_scale": "internal",
+    },
+    "history_stats": {
+        "domain": "history_stats",
+        "name": "History Stats",
+        "documentation": "https://www.home-assistant.io/integrations/history_stats",
+        "dependencies": [
+            "recorder",
+        ],
+        "codeowners": [],
+        "quality_scale": "internal",
+        "iot_class": "local_polling",
+    },
+    "hitron_coda": {
+        "domain": "hitron_coda",
+        "name": "Rogers Hitron CODA",
+        "documentation": "https://www.home-assistant.io/integrations/hitron_coda",
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "hive": {
+        "domain": "hive",
+        "name": "Hive",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/hive",
+        "requirements": [
+            "pyhiveapi==0.4.2",
+        ],
+        "codeowners": [
+            "@Rendili",
+            "@KJonline",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "hlk_sw16": {
+        "domain": "hlk_sw16",
+        "name": "Hi-Link HLK-SW16",
+        "documentation": "https://www.home-assistant.io/integrations/hlk_sw16",
+        "requirements": [
+            "hlk-sw16==0.0.9",
+        ],
+        "codeowners": [
+            "@jameshilliard",
+        ],
+        "config_flow": True,
+        "iot_class": "local_push",
+    },
+    "home_connect": {
+        "domain": "home_connect",
+        "name": "Home Connect",
+        "documentation": "https://www.home-assistant.io/integrations/home_connect",
+        "dependencies": [
+            "http",
+        ],
+        "codeowners": [
+            "@DavidMStraub",
+        ],
+        "requirements": [
+            "homeconnect==0.6.3",
+        ],
+        "config_flow": True,
+        "iot_class": "cloud_push",
+    },
+    "home_plus_control": {
+        "domain": "home_plus_control",
+        "name": "Legrand Home+ Control",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/home_plus_control",
+        "requirements": [
+            "homepluscontrol==0.0.5",
+        ],
+        "dependencies": [
+            "http",
+        ],
+        "codeowners": [
+            "@chemaaa",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "homeassistant": {
+        "domain": "homeassistant",
+        "name": "Home Assistant Core Integration",
+        "documentation": "https://www.home-assistant.io/integrations/homeassistant",
+        "codeowners": [
+            "@home-assistant/core",
+        ],
+        "quality_scale": "internal",
+    },
+    "homekit": {
+        "domain": "homekit",
+        "name": "HomeKit",
+        "documentation": "https://www.home-assistant.io/integrations/homekit",
+        "requirements": [
+            "HAP-python==3.5.1",
+            "fnvhash==0.1.0",
+            "PyQRCode==1.2.1",
+            "base36==0.1.1",
+            "PyTurboJPEG==1.5.0",
+        ],
+        "dependencies": [
+            "http",
+            "camera",
+            "ffmpeg",
+            "network",
+        ],
+        "after_dependencies": [
+            "zeroconf",
+        ],
+        "codeowners": [
+            "@bdraco",
+        ],
+        "zeroconf": [
+            "_homekit._tcp.local.",
+        ],
+        "config_flow": True,
+        "iot_class": "local_push",
+    },
+    "homekit_controller": {
+        "domain": "homekit_controller",
+        "name": "HomeKit Controller",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/homekit_controller",
+        "requirements": [
+            "aiohomekit==0.5.1",
+        ],
+        "zeroconf": [
+            "_hap._tcp.local.",
+        ],
+        "after_dependencies": [
+            "zeroconf",
+        ],
+        "codeowners": [
+            "@Jc2k",
+            "@bdraco",
+        ],
+        "iot_class": "local_push",
+    },
+    "homematic": {
+        "domain": "homematic",
+        "name": "Homematic",
+        "documentation": "https://www.home-assistant.io/integrations/homematic",
+        "requirements": [
+            "pyhomematic==0.1.73",
+        ],
+        "codeowners": [
+            "@pvizeli",
+            "@danielperna84",
+        ],
+        "iot_class": "local_push",
+    },
+    "homematicip_cloud": {
+        "domain": "homematicip_cloud",
+        "name": "HomematicIP Cloud",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/homematicip_cloud",
+        "requirements": [
+            "homematicip==0.13.1",
+        ],
+        "codeowners": [],
+        "quality_scale": "platinum",
+        "iot_class": "cloud_push",
+    },
+    "homeworks": {
+        "domain": "homeworks",
+        "name": "Lutron Homeworks",
+        "documentation": "https://www.home-assistant.io/integrations/homeworks",
+        "requirements": [
+            "pyhomeworks==0.0.6",
+        ],
+        "codeowners": [],
+        "iot_class": "local_push",
+    },
+    "honeywell": {
+        "domain": "honeywell",
+        "name": "Honeywell Total Connect Comfort (US)",
+        "documentation": "https://www.home-assistant.io/integrations/honeywell",
+        "requirements": [
+            "somecomfort==0.5.2",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_polling",
+    },
+    "horizon": {
+        "domain": "horizon",
+        "name": "Unitymedia Horizon HD Recorder",
+        "documentation": "https://www.home-assistant.io/integrations/horizon",
+        "requirements": [
+            "horimote==0.4.1",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "hp_ilo": {
+        "domain": "hp_ilo",
+        "name": "HP Integrated Lights-Out (ILO)",
+        "documentation": "https://www.home-assistant.io/integrations/hp_ilo",
+        "requirements": [
+            "python-hpilo==4.3",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "html5": {
+        "domain": "html5",
+        "name": "HTML5 Push Notifications",
+        "documentation": "https://www.home-assistant.io/integrations/html5",
+        "requirements": [
+            "pywebpush==1.9.2",
+        ],
+        "dependencies": [
+            "http",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_push",
+    },
+    "http": {
+        "domain": "http",
+        "name": "HTTP",
+        "documentation": "https://www.home-assistant.io/integrations/http",
+        "requirements": [
+            "aiohttp_cors==0.7.0",
+        ],
+        "codeowners": [
+            "@home-assistant/core",
+        ],
+        "quality_scale": "internal",
+        "iot_class": "local_push",
+    },
+    "htu21d": {
+        "domain": "htu21d",
+        "name": "HTU21D(F) Sensor",
+        "documentation": "https://www.home-assistant.io/integrations/htu21d",
+        "requirements": [
+            "i2csense==0.0.4",
+            "smbus-cffi==0.5.1",
+        ],
+        "codeowners": [],
+        "iot_class": "local_push",
+    },
+    "huawei_lte": {
+        "domain": "huawei_lte",
+        "name": "Huawei LTE",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/huawei_lte",
+        "requirements": [
+            "huawei-lte-api==1.4.18",
+            "stringcase==1.2.0",
+            "url-normalize==1.4.1",
+        ],
+        "ssdp": [
+            {
+                "deviceType": "urn:schemas-upnp-org:device:InternetGatewayDevice:1",
+                "manufacturer": "Huawei",
+            },
+        ],
+        "codeowners": [
+            "@scop",
+            "@fphammerle",
+        ],
+        "iot_class": "local_polling",
+    },
+    "huawei_router": {
+        "domain": "huawei_router",
+        "name": "Huawei Router",
+        "documentation": "https://www.home-assistant.io/integrations/huawei_router",
+        "codeowners": [
+            "@abmantis",
+        ],
+        "iot_class": "local_polling",
+    },
+    "hue": {
+        "domain": "hue",
+        "name": "Philips Hue",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/hue",
+        "requirements": [
+            "aiohue==2.5.1",
+        ],
+        "ssdp": [
+            {
+                "manufacturer": "Royal Philips Electronics",
+                "modelName": "Philips hue bridge 2012",
+            },
+            {
+                "manufacturer": "Royal Philips Electronics",
+                "modelName": "Philips hue bridge 2015",
+            },
+            {
+                "manufacturer": "Signify",
+                "modelName": "Philips hue bridge 2015",
+            },
+        ],
+        "homekit": {
+            "models": [
+                "BSB002",
+            ],
+        },
+        "codeowners": [
+            "@balloob",
+            "@frenck",
+        ],
+        "quality_scale": "platinum",
+        "iot_class": "local_push",
+    },
+    "huisbaasje": {
+        "domain": "huisbaasje",
+        "name": "Huisbaasje",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/huisbaasje",
+        "requirements": [
+            "huisbaasje-client==0.1.0",
+        ],
+        "codeowners": [
+            "@denniss17",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "humidifier": {
+        "domain": "humidifier",
+        "name": "Humidifier",
+        "documentation": "https://www.home-assistant.io/integrations/humidifier",
+        "codeowners": [
+            "@home-assistant/core",
+            "@Shulyaka",
+        ],
+        "quality_scale": "internal",
+    },
+    "hunterdouglas_powerview": {
+        "domain": "hunterdouglas_powerview",
+        "name": "Hunter Douglas PowerView",
+        "documentation": "https://www.home-assistant.io/integrations/hunterdouglas_powerview",
+        "requirements": [
+            "aiopvapi==1.6.14",
+        ],
+        "codeowners": [
+            "@bdraco",
+        ],
+        "config_flow": True,
+        "homekit": {
+            "models": [
+                "PowerView",
+            ],
+        },
+        "dhcp": [
+            {
+                "hostname": "hunter*",
+                "macaddress": "002674*",
+            },
+        ],
+        "zeroconf": [
+            "_powerview._tcp.local.",
+        ],
+        "iot_class": "local_polling",
+    },
+    "hvv_departures": {
+        "domain": "hvv_departures",
+        "name": "HVV Departures",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/hvv_departures",
+        "requirements": [
+            "pygti==0.9.2",
+        ],
+        "codeowners": [
+            "@vigonotion",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "hydrawise": {
+        "domain": "hydrawise",
+        "name": "Hunter Hydrawise",
+        "documentation": "https://www.home-assistant.io/integrations/hydrawise",
+        "requirements": [
+            "hydrawiser==0.2",
+        ],
+        "codeowners": [
+            "@ptcryan",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "hyperion": {
+        "codeowners": [
+            "@dermotduffy",
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/hyperion",
+        "domain": "hyperion",
+        "name": "Hyperion",
+        "quality_scale": "platinum",
+        "requirements": [
+            "hyperion-py==0.7.4",
+        ],
+        "ssdp": [
+            {
+                "manufacturer": "Hyperion Open Source Ambient Lighting",
+                "st": "urn:hyperion-project.org:device:basic:1",
+            },
+        ],
+        "iot_class": "local_push",
+    },
+    "ialarm": {
+        "domain": "ialarm",
+        "name": "Antifurto365 iAlarm",
+        "documentation": "https://www.home-assistant.io/integrations/ialarm",
+        "requirements": [
+            "pyialarm==1.9.0",
+        ],
+        "codeowners": [
+            "@RyuzakiKK",
+        ],
+        "config_flow": True,
+        "iot_class": "local_polling",
+    },
+    "iammeter": {
+        "domain": "iammeter",
+        "name": "IamMeter",
+        "documentation": "https://www.home-assistant.io/integrations/iammeter",
+        "codeowners": [
+            "@lewei50",
+        ],
+        "requirements": [
+            "iammeter==0.1.7",
+        ],
+        "iot_class": "local_polling",
+    },
+    "iaqualink": {
+        "domain": "iaqualink",
+        "name": "Jandy iAqualink",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/iaqualink/",
+        "codeowners": [
+            "@flz",
+        ],
+        "requirements": [
+            "iaqualink==0.3.90",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "icloud": {
+        "domain": "icloud",
+        "name": "Apple iCloud",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/icloud",
+        "requirements": [
+            "pyicloud==0.10.2",
+        ],
+        "codeowners": [
+            "@Quentame",
+            "@nzapponi",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "idteck_prox": {
+        "domain": "idteck_prox",
+        "name": "IDTECK Proximity Reader",
+        "documentation": "https://www.home-assistant.io/integrations/idteck_prox",
+        "requirements": [
+            "rfk101py==0.0.1",
+        ],
+        "codeowners": [],
+        "iot_class": "local_push",
+    },
+    "ifttt": {
+        "domain": "ifttt",
+        "name": "IFTTT",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/ifttt",
+        "requirements": [
+            "pyfttt==0.3",
+        ],
+        "dependencies": [
+            "webhook",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_push",
+    },
+    "iglo": {
+        "domain": "iglo",
+        "name": "iGlo",
+        "documentation": "https://www.home-assistant.io/integrations/iglo",
+        "requirements": [
+            "iglo==1.2.7",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "ign_sismologia": {
+        "domain": "ign_sismologia",
+        "name": "IGN Sismolog\u00eda",
+        "documentation": "https://www.home-assistant.io/integrations/ign_sismologia",
+        "requirements": [
+            "georss_ign_sismologia_client==0.3",
+        ],
+        "codeowners": [
+            "@exxamalte",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "ihc": {
+        "domain": "ihc",
+        "name": "IHC Controller",
+        "documentation": "https://www.home-assistant.io/integrations/ihc",
+        "requirements": [
+            "defusedxml==0.7.1",
+            "ihcsdk==2.7.0",
+        ],
+        "codeowners": [],
+        "iot_class": "local_push",
+    },
+    "image": {
+        "domain": "image",
+        "name": "Image",
+        "config_flow": False,
+        "documentation": "https://www.home-assistant.io/integrations/image",
+        "requirements": [
+            "pillow==8.2.0",
+        ],
+        "dependencies": [
+            "http",
+        ],
+        "codeowners": [
+            "@home-assistant/core",
+        ],
+        "quality_scale": "internal",
+    },
+    "image_processing": {
+        "domain": "image_processing",
+        "name": "Image Processing",
+        "documentation": "https://www.home-assistant.io/integrations/image_processing",
+        "dependencies": [
+            "camera",
+        ],
+        "codeowners": [],
+        "quality_scale": "internal",
+    },
+    "imap": {
+        "domain": "imap",
+        "name": "IMAP",
+        "documentation": "https://www.home-assistant.io/integrations/imap",
+        "requirements": [
+            "aioimaplib==0.9.0",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_push",
+    },
+    "imap_email_content": {
+        "domain": "imap_email_content",
+        "name": "IMAP Email Content",
+        "documentation": "https://www.home-assistant.io/integrations/imap_email_content",
+        "codeowners": [],
+        "iot_class": "cloud_push",
+    },
+    "incomfort": {
+        "domain": "incomfort",
+        "name": "Intergas InComfort/Intouch Lan2RF gateway",
+        "documentation": "https://www.home-assistant.io/integrations/incomfort",
+        "requirements": [
+            "incomfort-client==0.4.4",
+        ],
+        "codeowners": [
+            "@zxdavb",
+        ],
+        "iot_class": "local_polling",
+    },
+    "influxdb": {
+        "domain": "influxdb",
+        "name": "InfluxDB",
+        "documentation": "https://www.home-assistant.io/integrations/influxdb",
+        "requirements": [
+            "influxdb==5.2.3",
+            "influxdb-client==1.14.0",
+        ],
+        "codeowners": [
+            "@fabaff",
+            "@mdegat01",
+        ],
+        "iot_class": "local_push",
+    },
+    "input_boolean": {
+        "domain": "input_boolean",
+        "name": "Input Boolean",
+        "documentation": "https://www.home-assistant.io/integrations/input_boolean",
+        "codeowners": [
+            "@home-assistant/core",
+        ],
+        "quality_scale": "internal",
+    },
+    "input_datetime": {
+        "domain": "input_datetime",
+        "name": "Input Datetime",
+        "documentation": "https://www.home-assistant.io/integrations/input_datetime",
+        "codeowners": [
+            "@home-assistant/core",
+        ],
+        "quality_scale": "internal",
+    },
+    "input_number": {
+        "domain": "input_number",
+        "name": "Input Number",
+        "documentation": "https://www.home-assistant.io/integrations/input_number",
+        "codeowners": [
+            "@home-assistant/core",
+        ],
+        "quality_scale": "internal",
+    },
+    "input_select": {
+        "domain": "input_select",
+        "name": "Input Select",
+        "documentation": "https://www.home-assistant.io/integrations/input_select",
+        "codeowners": [
+            "@home-assistant/core",
+        ],
+        "quality_scale": "internal",
+    },
+    "input_text": {
+        "domain": "input_text",
+        "name": "Input Text",
+        "documentation": "https://www.home-assistant.io/integrations/input_text",
+        "codeowners": [
+            "@home-assistant/core",
+        ],
+        "quality_scale": "internal",
+    },
+    "insteon": {
+        "domain": "insteon",
+        "name": "Insteon",
+        "documentation": "https://www.home-assistant.io/integrations/insteon",
+        "requirements": [
+            "pyinsteon==1.0.12",
+        ],
+        "codeowners": [
+            "@teharris1",
+        ],
+        "config_flow": True,
+        "iot_class": "local_push",
+    },
+    "integration": {
+        "domain": "integration",
+        "name": "Integration - Riemann sum integral",
+        "documentation": "https://www.home-assistant.io/integrations/integration",
+        "codeowners": [
+            "@dgomes",
+        ],
+        "quality_scale": "internal",
+        "iot_class": "local_push",
+    },
+    "intent": {
+        "domain": "intent",
+        "name": "Intent",
+        "config_flow": False,
+        "documentation": "https://www.home-assistant.io/integrations/intent",
+        "dependencies": [
+            "http",
+        ],
+        "codeowners": [
+            "@home-assistant/core",
+        ],
+    },
+    "intent_script": {
+        "domain": "intent_script",
+        "name": "Intent Script",
+        "documentation": "https://www.home-assistant.io/integrations/intent_script",
+        "codeowners": [],
+        "quality_scale": "internal",
+    },
+    "intesishome": {
+        "domain": "intesishome",
+        "name": "IntesisHome",
+        "documentation": "https://www.home-assistant.io/integrations/intesishome",
+        "codeowners": [
+            "@jnimmo",
+        ],
+        "requirements": [
+            "pyintesishome==1.7.6",
+        ],
+        "iot_class": "cloud_push",
+    },
+    "ios": {
+        "domain": "ios",
+        "name": "Home Assistant iOS",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/ios",
+        "dependencies": [
+            "device_tracker",
+            "http",
+            "zeroconf",
+        ],
+        "codeowners": [
+            "@robbiet480",
+        ],
+        "iot_class": "cloud_push",
+    },
+    "iota": {
+        "domain": "iota",
+        "name": "IOTA",
+        "documentation": "https://www.home-assistant.io/integrations/iota",
+        "requirements": [
+            "pyota==2.0.5",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_polling",
+    },
+    "iperf3": {
+        "domain": "iperf3",
+        "name": "Iperf3",
+        "documentation": "https://www.home-assistant.io/integrations/iperf3",
+        "requirements": [
+            "iperf3==0.1.11",
+        ],
+        "codeowners": [
+            "@rohankapoorcom",
+        ],
+        "iot_class": "local_polling",
+    },
+    "ipma": {
+        "domain": "ipma",
+        "name": "Instituto Portugu\u00eas do Mar e Atmosfera (IPMA)",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/ipma",
+        "requirements": [
+            "pyipma==2.0.5",
+        ],
+        "codeowners": [
+            "@dgomes",
+            "@abmantis",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "ipp": {
+        "domain": "ipp",
+        "name": "Internet Printing Protocol (IPP)",
+        "documentation": "https://www.home-assistant.io/integrations/ipp",
+        "requirements": [
+            "pyipp==0.11.0",
+        ],
+        "codeowners": [
+            "@ctalkington",
+        ],
+        "config_flow": True,
+        "quality_scale": "platinum",
+        "zeroconf": [
+            "_ipps._tcp.local.",
+            "_ipp._tcp.local.",
+        ],
+        "iot_class": "local_polling",
+    },
+    "iqvia": {
+        "domain": "iqvia",
+        "name": "IQVIA",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/iqvia",
+        "requirements": [
+            "numpy==1.21.0",
+            "pyiqvia==1.0.0",
+        ],
+        "codeowners": [
+            "@bachya",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "irish_rail_transport": {
+        "domain": "irish_rail_transport",
+        "name": "Irish Rail Transport",
+        "documentation": "https://www.home-assistant.io/integrations/irish_rail_transport",
+        "requirements": [
+            "pyirishrail==0.0.2",
+        ],
+        "codeowners": [
+            "@ttroy50",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "islamic_prayer_times": {
+        "domain": "islamic_prayer_times",
+        "name": "Islamic Prayer Times",
+        "documentation": "https://www.home-assistant.io/integrations/islamic_prayer_times",
+        "requirements": [
+            "prayer_times_calculator==0.0.5",
+        ],
+        "codeowners": [
+            "@engrbm87",
+        ],
+        "config_flow": True,
+        "iot_class": "cloud_polling",
+    },
+    "iss": {
+        "domain": "iss",
+        "name": "International Space Station (ISS)",
+        "documentation": "https://www.home-assistant.io/integrations/iss",
+        "requirements": [
+            "pyiss==1.0.1",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_polling",
+    },
+    "isy994": {
+        "domain": "isy994",
+        "name": "Universal Devices ISY994",
+        "documentation": "https://www.home-assistant.io/integrations/isy994",
+        "requirements": [
+            "pyisy==3.0.0",
+        ],
+        "codeowners": [
+            "@bdraco",
+            "@shbatm",
+        ],
+        "config_flow": True,
+        "ssdp": [
+            {
+                "manufacturer": "Universal Devices Inc.",
+                "deviceType": "urn:udi-com:device:X_Insteon_Lighting_Device:1",
+            },
+        ],
+        "dhcp": [
+            {
+                "hostname": "isy*",
+                "macaddress": "0021B9*",
+            },
+        ],
+        "iot_class": "local_push",
+    },
+    "itach": {
+        "domain": "itach",
+        "name": "Global Cach\u00e9 iTach TCP/IP to IR",
+        "documentation": "https://www.home-assistant.io/integrations/itach",
+        "requirements": [
+            "pyitachip2ir==0.0.7",
+        ],
+        "codeowners": [],
+        "iot_class": "assumed_state",
+    },
+    "itunes": {
+        "domain": "itunes",
+        "name": "Apple iTunes",
+        "documentation": "https://www.home-assistant.io/integrations/itunes",
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "izone": {
+        "domain": "izone",
+        "name": "iZone",
+        "documentation": "https://www.home-assistant.io/integrations/izone",
+        "requirements": [
+            "python-izone==1.1.6",
+        ],
+        "codeowners": [
+            "@Swamp-Ig",
+        ],
+        "config_flow": True,
+        "homekit": {
+            "models": [
+                "iZone",
+            ],
+        },
+        "iot_class": "local_push",
+    },
+    "jewish_calendar": {
+        "domain": "jewish_calendar",
+        "name": "Jewish Calendar",
+        "documentation": "https://www.home-assistant.io/integrations/jewish_calendar",
+        "requirements": [
+            "hdate==0.10.2",
+        ],
+        "codeowners": [
+            "@tsvi",
+        ],
+        "iot_class": "calculated",
+    },
+    "joaoapps_join": {
+        "domain": "joaoapps_join",
+        "name": "Joaoapps Join",
+        "documentation": "https://www.home-assistant.io/integrations/joaoapps_join",
+        "requirements": [
+            "python-join-api==0.0.6",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_push",
+    },
+    "juicenet": {
+        "domain": "juicenet",
+        "name": "JuiceNet",
+        "documentation": "https://www.home-assistant.io/integrations/juicenet",
+        "requirements": [
+            "python-juicenet==1.0.2",
+        ],
+        "codeowners": [
+            "@jesserockz",
+        ],
+        "config_flow": True,
+        "iot_class": "cloud_polling",
+    },
+    "kaiterra": {
+        "domain": "kaiterra",
+        "name": "Kaiterra",
+        "documentation": "https://www.home-assistant.io/integrations/kaiterra",
+        "requirements": [
+            "kaiterra-async-client==0.0.2",
+        ],
+        "codeowners": [
+            "@Michsior14",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "kankun": {
+        "domain": "kankun",
+        "name": "Kankun",
+        "documentation": "https://www.home-assistant.io/integrations/kankun",
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "keba": {
+        "domain": "keba",
+        "name": "Keba Charging Station",
+        "documentation": "https://www.home-assistant.io/integrations/keba",
+        "requirements": [
+            "keba-kecontact==1.1.0",
+        ],
+        "codeowners": [
+            "@dannerph",
+        ],
+        "iot_class": "local_polling",
+    },
+    "keenetic_ndms2": {
+        "domain": "keenetic_ndms2",
+        "name": "Keenetic NDMS2 Router",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/keenetic_ndms2",
+        "requirements": [
+            "ndms2_client==0.1.1",
+        ],
+        "ssdp": [
+            {
+                "deviceType": "urn:schemas-upnp-org:device:InternetGatewayDevice:1",
+                "manufacturer": "Keenetic Ltd.",
+            },
+            {
+                "deviceType": "urn:schemas-upnp-org:device:InternetGatewayDevice:1",
+                "manufacturer": "ZyXEL Communications Corp.",
+            },
+        ],
+        "codeowners": [
+            "@foxel",
+        ],
+        "iot_class": "local_polling",
+    },
+    "kef": {
+        "domain": "kef",
+        "name": "KEF",
+        "documentation": "https://www.home-assistant.io/integrations/kef",
+        "codeowners": [
+            "@basnijholt",
+        ],
+        "requirements": [
+            "aiokef==0.2.16",
+            "getmac==0.8.2",
+        ],
+        "iot_class": "local_polling",
+    },
+    "keyboard": {
+        "domain": "keyboard",
+        "name": "Keyboard",
+        "documentation": "https://www.home-assistant.io/integrations/keyboard",
+        "requirements": [
+            "pyuserinput==0.1.11",
+        ],
+        "codeowners": [],
+        "iot_class": "local_push",
+    },
+    "keyboard_remote": {
+        "domain": "keyboard_remote",
+        "name": "Keyboard Remote",
+        "documentation": "https://www.home-assistant.io/integrations/keyboard_remote",
+        "requirements": [
+            "evdev==1.4.0",
+            "aionotify==0.2.0",
+        ],
+        "codeowners": [
+            "@bendavid",
+        ],
+        "iot_class": "local_push",
+    },
+    "kira": {
+        "domain": "kira",
+        "name": "Kira",
+        "documentation": "https://www.home-assistant.io/integrations/kira",
+        "requirements": [
+            "pykira==0.1.1",
+        ],
+        "codeowners": [],
+        "iot_class": "local_push",
+    },
+    "kiwi": {
+        "domain": "kiwi",
+        "name": "KIWI",
+        "documentation": "https://www.home-assistant.io/integrations/kiwi",
+        "requirements": [
+            "kiwiki-client==0.1.1",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_polling",
+    },
+    "kmtronic": {
+        "domain": "kmtronic",
+        "name": "KMtronic",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/kmtronic",
+        "requirements": [
+            "pykmtronic==0.3.0",
+        ],
+        "codeowners": [
+            "@dgomes",
+        ],
+        "iot_class": "local_push",
+    },
+    "knx": {
+        "domain": "knx",
+        "name": "KNX",
+        "documentation": "https://www.home-assistant.io/integrations/knx",
+        "requirements": [
+            "xknx==0.18.8",
+        ],
+        "codeowners": [
+            "@Julius2342",
+            "@farmio",
+            "@marvin-w",
+        ],
+        "quality_scale": "silver",
+        "iot_class": "local_push",
+    },
+    "kodi": {
+        "domain": "kodi",
+        "name": "Kodi",
+        "documentation": "https://www.home-assistant.io/integrations/kodi",
+        "requirements": [
+            "pykodi==0.2.5",
+        ],
+        "codeowners": [
+            "@OnFreund",
+            "@cgtobi",
+        ],
+        "zeroconf": [
+            "_xbmc-jsonrpc-h._tcp.local.",
+        ],
+        "config_flow": True,
+        "iot_class": "local_push",
+    },
+    "konnected": {
+        "domain": "konnected",
+        "name": "Konnected.io",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/konnected",
+        "requirements": [
+            "konnected==1.2.0",
+        ],
+        "ssdp": [
+            {
+                "manufacturer": "konnected.io",
+            },
+        ],
+        "dependencies": [
+            "http",
+        ],
+        "codeowners": [
+            "@heythisisnate",
+            "@kit-klein",
+        ],
+        "iot_class": "local_polling",
+    },
+    "kostal_plenticore": {
+        "domain": "kostal_plenticore",
+        "name": "Kostal Plenticore Solar Inverter",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/kostal_plenticore",
+        "requirements": [
+            "kostal_plenticore==0.2.0",
+        ],
+        "codeowners": [
+            "@stegm",
+        ],
+        "iot_class": "local_polling",
+    },
+    "kraken": {
+        "domain": "kraken",
+        "name": "Kraken",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/kraken",
+        "requirements": [
+            "krakenex==2.1.0",
+            "pykrakenapi==0.1.8",
+        ],
+        "codeowners": [
+            "@eifinger",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "kulersky": {
+        "domain": "kulersky",
+        "name": "Kuler Sky",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/kulersky",
+        "requirements": [
+            "pykulersky==0.5.2",
+        ],
+        "codeowners": [
+            "@emlove",
+        ],
+        "iot_class": "local_polling",
+    },
+    "kwb": {
+        "domain": "kwb",
+        "name": "KWB Easyfire",
+        "documentation": "https://www.home-assistant.io/integrations/kwb",
+        "requirements": [
+            "pykwb==0.0.8",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "lacrosse": {
+        "domain": "lacrosse",
+        "name": "LaCrosse",
+        "documentation": "https://www.home-assistant.io/integrations/lacrosse",
+        "requirements": [
+            "pylacrosse==0.4",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "lametric": {
+        "domain": "lametric",
+        "name": "LaMetric",
+        "documentation": "https://www.home-assistant.io/integrations/lametric",
+        "requirements": [
+            "lmnotify==0.0.4",
+        ],
+        "codeowners": [
+            "@robbiet480",
+        ],
+        "iot_class": "cloud_push",
+    },
+    "lannouncer": {
+        "domain": "lannouncer",
+        "name": "LANnouncer",
+        "documentation": "https://www.home-assistant.io/integrations/lannouncer",
+        "codeowners": [],
+        "iot_class": "local_push",
+    },
+    "lastfm": {
+        "domain": "lastfm",
+        "name": "Last.fm",
+        "documentation": "https://www.home-assistant.io/integrations/lastfm",
+        "requirements": [
+            "pylast==4.2.0",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_polling",
+    },
+    "launch_library": {
+        "domain": "launch_library",
+        "name": "Launch Library",
+        "documentation": "https://www.home-assistant.io/integrations/launch_library",
+        "requirements": [
+            "pylaunches==1.0.0",
+        ],
+        "codeowners": [
+            "@ludeeus",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "lcn": {
+        "domain": "lcn",
+        "name": "LCN",
+        "config_flow": False,
+        "documentation": "https://www.home-assistant.io/integrations/lcn",
+        "requirements": [
+            "pypck==0.7.10",
+        ],
+        "codeowners": [
+            "@alengwenus",
+        ],
+        "iot_class": "local_push",
+    },
+    "lg_netcast": {
+        "domain": "lg_netcast",
+        "name": "LG Netcast",
+        "documentation": "https://www.home-assistant.io/integrations/lg_netcast",
+        "requirements": [
+            "pylgnetcast==0.3.3",
+        ],
+        "codeowners": [
+            "@Drafteed",
+        ],
+        "iot_class": "local_polling",
+    },
+    "lg_soundbar": {
+        "domain": "lg_soundbar",
+        "name": "LG Soundbars",
+        "documentation": "https://www.home-assistant.io/integrations/lg_soundbar",
+        "requirements": [
+            "temescal==0.3",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "life360": {
+        "domain": "life360",
+        "name": "Life360",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/life360",
+        "codeowners": [
+            "@pnbruckner",
+        ],
+        "requirements": [
+            "life360==4.1.1",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "lifx": {
+        "domain": "lifx",
+        "name": "LIFX",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/lifx",
+        "requirements": [
+            "aiolifx==0.6.9",
+            "aiolifx_effects==0.2.2",
+        ],
+        "homekit": {
+            "models": [
+                "LIFX",
+            ],
+        },
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "lifx_cloud": {
+        "domain": "lifx_cloud",
+        "name": "LIFX Cloud",
+        "documentation": "https://www.home-assistant.io/integrations/lifx_cloud",
+        "codeowners": [],
+        "iot_class": "cloud_push",
+    },
+    "light": {
+        "domain": "light",
+        "name": "Light",
+        "documentation": "https://www.home-assistant.io/integrations/light",
+        "codeowners": [],
+        "quality_scale": "internal",
+    },
+    "lightwave": {
+        "domain": "lightwave",
+        "name": "Lightwave",
+        "documentation": "https://www.home-assistant.io/integrations/lightwave",
+        "requirements": [
+            "lightwave==0.19",
+        ],
+        "codeowners": [],
+        "iot_class": "assumed_state",
+    },
+    "limitlessled": {
+        "domain": "limitlessled",
+        "name": "LimitlessLED",
+        "documentation": "https://www.home-assistant.io/integrations/limitlessled",
+        "requirements": [
+            "limitlessled==1.1.3",
+        ],
+        "codeowners": [],
+        "iot_class": "assumed_state",
+    },
+    "linksys_smart": {
+        "domain": "linksys_smart",
+        "name": "Linksys Smart Wi-Fi",
+        "documentation": "https://www.home-assistant.io/integrations/linksys_smart",
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "linode": {
+        "domain": "linode",
+        "name": "Linode",
+        "documentation": "https://www.home-assistant.io/integrations/linode",
+        "requirements": [
+            "linode-api==4.1.9b1",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_polling",
+    },
+    "linux_battery": {
+        "domain": "linux_battery",
+        "name": "Linux Battery",
+        "documentation": "https://www.home-assistant.io/integrations/linux_battery",
+        "requirements": [
+            "batinfo==0.4.2",
+        ],
+        "codeowners": [
+            "@fabaff",
+        ],
+        "iot_class": "local_polling",
+    },
+    "lirc": {
+        "domain": "lirc",
+        "name": "LIRC",
+        "documentation": "https://www.home-assistant.io/integrations/lirc",
+        "requirements": [
+            "python-lirc==1.2.3",
+        ],
+        "codeowners": [],
+        "iot_class": "local_push",
+    },
+    "litejet": {
+        "domain": "litejet",
+        "name": "LiteJet",
+        "documentation": "https://www.home-assistant.io/integrations/litejet",
+        "requirements": [
+            "pylitejet==0.3.0",
+        ],
+        "codeowners": [
+            "@joncar",
+        ],
+        "config_flow": True,
+        "iot_class": "local_push",
+    },
+    "litterrobot": {
+        "domain": "litterrobot",
+        "name": "Litter-Robot",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/litterrobot",
+        "requirements": [
+            "pylitterbot==2021.3.1",
+        ],
+        "codeowners": [
+            "@natekspencer",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "llamalab_automate": {
+        "domain": "llamalab_automate",
+        "name": "LlamaLab Automate",
+        "documentation": "https://www.home-assistant.io/integrations/llamalab_automate",
+        "codeowners": [],
+        "iot_class": "cloud_push",
+    },
+    "local_file": {
+        "domain": "local_file",
+        "name": "Local File",
+        "documentation": "https://www.home-assistant.io/integrations/local_file",
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "local_ip": {
+        "domain": "local_ip",
+        "name": "Local IP Address",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/local_ip",
+        "codeowners": [
+            "@issacg",
+        ],
+        "iot_class": "local_polling",
+    },
+    "locative": {
+        "domain": "locative",
+        "name": "Locative",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/locative",
+        "dependencies": [
+            "webhook",
+        ],
+        "codeowners": [],
+        "iot_class": "local_push",
+    },
+    "lock": {
+        "domain": "lock",
+        "name": "Lock",
+        "documentation": "https://www.home-assistant.io/integrations/lock",
+        "codeowners": [],
+        "quality_scale": "internal",
+    },
+    "logbook": {
+        "domain": "logbook",
+        "name": "Logbook",
+        "documentation": "https://www.home-assistant.io/integrations/logbook",
+        "dependencies": [
+            "frontend",
+            "http",
+            "recorder",
+        ],
+        "codeowners": [],
+        "quality_scale": "internal",
+    },
+    "logentries": {
+        "domain": "logentries",
+        "name": "Logentries",
+        "documentation": "https://www.home-assistant.io/integrations/logentries",
+        "codeowners": [],
+        "iot_class": "cloud_push",
+    },
+    "logger": {
+        "domain": "logger",
+        "name": "Logger",
+        "documentation": "https://www.home-assistant.io/integrations/logger",
+        "codeowners": [
+            "@home-assistant/core",
+        ],
+        "quality_scale": "internal",
+    },
+    "logi_circle": {
+        "domain": "logi_circle",
+        "name": "Logi Circle",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/logi_circle",
+        "requirements": [
+            "logi_circle==0.2.2",
+        ],
+        "dependencies": [
+            "ffmpeg",
+            "http",
+        ],
+        "codeowners": [
+            "@evanjd",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "london_air": {
+        "domain": "london_air",
+        "name": "London Air",
+        "documentation": "https://www.home-assistant.io/integrations/london_air",
+        "codeowners": [],
+        "iot_class": "cloud_polling",
+    },
+    "london_underground": {
+        "domain": "london_underground",
+        "name": "London Underground",
+        "documentation": "https://www.home-assistant.io/integrations/london_underground",
+        "requirements": [
+            "london-tube-status==0.2",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_polling",
+    },
+    "loopenergy": {
+        "domain": "loopenergy",
+        "name": "Loop Energy",
+        "documentation": "https://www.home-assistant.io/integrations/loopenergy",
+        "requirements": [
+            "pyloopenergy==0.2.1",
+        ],
+        "codeowners": [
+            "@pavoni",
+        ],
+        "iot_class": "cloud_push",
+    },
+    "lovelace": {
+        "domain": "lovelace",
+        "name": "Lovelace",
+        "documentation": "https://www.home-assistant.io/integrations/lovelace",
+        "codeowners": [
+            "@home-assistant/frontend",
+        ],
+    },
+    "luci": {
+        "domain": "luci",
+        "name": "OpenWRT (luci)",
+        "documentation": "https://www.home-assistant.io/integrations/luci",
+        "requirements": [
+            "openwrt-luci-rpc==1.1.8",
+        ],
+        "codeowners": [
+            "@mzdrale",
+        ],
+        "iot_class": "local_polling",
+    },
+    "luftdaten": {
+        "domain": "luftdaten",
+        "name": "Luftdaten",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/luftdaten",
+        "requirements": [
+            "luftdaten==0.6.5",
+        ],
+        "codeowners": [
+            "@fabaff",
+        ],
+        "quality_scale": "gold",
+        "iot_class": "cloud_polling",
+    },
+    "lupusec": {
+        "domain": "lupusec",
+        "name": "Lupus Electronics LUPUSEC",
+        "documentation": "https://www.home-assistant.io/integrations/lupusec",
+        "requirements": [
+            "lupupy==0.0.18",
+        ],
+        "codeowners": [
+            "@majuss",
+        ],
+        "iot_class": "local_polling",
+    },
+    "lutron": {
+        "domain": "lutron",
+        "name": "Lutron",
+        "documentation": "https://www.home-assistant.io/integrations/lutron",
+        "requirements": [
+            "pylutron==0.2.8",
+        ],
+        "codeowners": [
+            "@JonGilmore",
+        ],
+        "iot_class": "local_polling",
+    },
+    "lutron_caseta": {
+        "domain": "lutron_caseta",
+        "name": "Lutron Cas\u00e9ta",
+        "documentation": "https://www.home-assistant.io/integrations/lutron_caseta",
+        "requirements": [
+            "pylutron-caseta==0.10.0",
+            "aiolip==1.1.4",
+        ],
+        "config_flow": True,
+        "zeroconf": [
+            "_leap._tcp.local.",
+        ],
+        "homekit": {
+            "models": [
+                "Smart Bridge",
+            ],
+        },
+        "codeowners": [
+            "@swails",
+            "@bdraco",
+        ],
+        "iot_class": "local_push",
+    },
+    "lw12wifi": {
+        "domain": "lw12wifi",
+        "name": "LAGUTE LW-12",
+        "documentation": "https://www.home-assistant.io/integrations/lw12wifi",
+        "requirements": [
+            "lw12==0.9.2",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "lyft": {
+        "domain": "lyft",
+        "name": "Lyft",
+        "documentation": "https://www.home-assistant.io/integrations/lyft",
+        "requirements": [
+            "lyft_rides==0.2",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_polling",
+    },
+    "lyric": {
+        "domain": "lyric",
+        "name": "Honeywell Lyric",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/lyric",
+        "dependencies": [
+            "http",
+        ],
+        "requirements": [
+            "aiolyric==1.0.7",
+        ],
+        "codeowners": [
+            "@timmo001",
+        ],
+        "quality_scale": "silver",
+        "dhcp": [
+            {
+                "hostname": "lyric-*",
+                "macaddress": "48A2E6*",
+            },
+            {
+                "hostname": "lyric-*",
+                "macaddress": "B82CA0*",
+            },
+            {
+                "hostname": "lyric-*",
+                "macaddress": "00D02D*",
+            },
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "magicseaweed": {
+        "domain": "magicseaweed",
+        "name": "Magicseaweed",
+        "documentation": "https://www.home-assistant.io/integrations/magicseaweed",
+        "requirements": [
+            "magicseaweed==1.0.3",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_polling",
+    },
+    "mailbox": {
+        "domain": "mailbox",
+        "name": "Mailbox",
+        "documentation": "https://www.home-assistant.io/integrations/mailbox",
+        "dependencies": [
+            "http",
+        ],
+        "codeowners": [],
+        "quality_scale": "internal",
+    },
+    "mailgun": {
+        "domain": "mailgun",
+        "name": "Mailgun",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/mailgun",
+        "requirements": [
+            "pymailgunner==1.4",
+        ],
+        "dependencies": [
+            "webhook",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_push",
+    },
+    "manual": {
+        "domain": "manual",
+        "name": "Manual",
+        "documentation": "https://www.home-assistant.io/integrations/manual",
+        "codeowners": [],
+        "quality_scale": "internal",
+        "iot_class": "calculated",
+    },
+    "manual_mqtt": {
+        "domain": "manual_mqtt",
+        "name": "Manual MQTT",
+        "documentation": "https://www.home-assistant.io/integrations/manual_mqtt",
+        "dependencies": [
+            "mqtt",
+        ],
+        "codeowners": [],
+        "iot_class": "local_push",
+    },
+    "map": {
+        "domain": "map",
+        "name": "Map",
+        "documentation": "https://www.home-assistant.io/integrations/map",
+        "dependencies": [
+            "frontend",
+        ],
+        "codeowners": [],
+        "quality_scale": "internal",
+    },
+    "marytts": {
+        "domain": "marytts",
+        "name": "MaryTTS",
+        "documentation": "https://www.home-assistant.io/integrations/marytts",
+        "requirements": [
+            "speak2mary==1.4.0",
+        ],
+        "codeowners": [],
+        "iot_class": "local_push",
+    },
+    "mastodon": {
+        "domain": "mastodon",
+        "name": "Mastodon",
+        "documentation": "https://www.home-assistant.io/integrations/mastodon",
+        "requirements": [
+            "Mastodon.py==1.5.1",
+        ],
+        "codeowners": [
+            "@fabaff",
+        ],
+        "iot_class": "cloud_push",
+    },
+    "matrix": {
+        "domain": "matrix",
+        "name": "Matrix",
+        "documentation": "https://www.home-assistant.io/integrations/matrix",
+        "requirements": [
+            "matrix-client==0.3.2",
+        ],
+        "codeowners": [
+            "@tinloaf",
+        ],
+        "iot_class": "cloud_push",
+    },
+    "maxcube": {
+        "domain": "maxcube",
+        "name": "eQ-3 MAX!",
+        "documentation": "https://www.home-assistant.io/integrations/maxcube",
+        "requirements": [
+            "maxcube-api==0.4.3",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "mazda": {
+        "domain": "mazda",
+        "name": "Mazda Connected Services",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/mazda",
+        "requirements": [
+            "pymazda==0.2.0",
+        ],
+        "codeowners": [
+            "@bdr99",
+        ],
+        "quality_scale": "platinum",
+        "iot_class": "cloud_polling",
+    },
+    "mcp23017": {
+        "domain": "mcp23017",
+        "name": "MCP23017 I/O Expander",
+        "documentation": "https://www.home-assistant.io/integrations/mcp23017",
+        "requirements": [
+            "RPi.GPIO==0.7.1a4",
+            "adafruit-circuitpython-mcp230xx==2.2.2",
+        ],
+        "codeowners": [
+            "@jardiamj",
+        ],
+        "iot_class": "local_polling",
+    },
+    "media_extractor": {
+        "domain": "media_extractor",
+        "name": "Media Extractor",
+        "documentation": "https://www.home-assistant.io/integrations/media_extractor",
+        "requirements": [
+            "youtube_dl==2021.04.26",
+        ],
+        "dependencies": [
+            "media_player",
+        ],
+        "codeowners": [],
+        "quality_scale": "internal",
+        "iot_class": "calculated",
+    },
+    "media_player": {
+        "domain": "media_player",
+        "name": "Media Player",
+        "documentation": "https://www.home-assistant.io/integrations/media_player",
+        "dependencies": [
+            "http",
+        ],
+        "codeowners": [],
+        "quality_scale": "internal",
+    },
+    "media_source": {
+        "domain": "media_source",
+        "name": "Media Source",
+        "documentation": "https://www.home-assistant.io/integrations/media_source",
+        "dependencies": [
+            "http",
+        ],
+        "codeowners": [
+            "@hunterjm",
+        ],
+        "quality_scale": "internal",
+    },
+    "mediaroom": {
+        "domain": "mediaroom",
+        "name": "Mediaroom",
+        "documentation": "https://www.home-assistant.io/integrations/mediaroom",
+        "requirements": [
+            "pymediaroom==0.6.4.1",
+        ],
+        "codeowners": [
+            "@dgomes",
+        ],
+        "iot_class": "local_polling",
+    },
+    "melcloud": {
+        "domain": "melcloud",
+        "name": "MELCloud",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/melcloud",
+        "requirements": [
+            "pymelcloud==2.5.3",
+        ],
+        "codeowners": [
+            "@vilppuvuorinen",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "melissa": {
+        "domain": "melissa",
+        "name": "Melissa",
+        "documentation": "https://www.home-assistant.io/integrations/melissa",
+        "requirements": [
+            "py-melissa-climate==2.1.4",
+        ],
+        "codeowners": [
+            "@kennedyshead",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "meraki": {
+        "domain": "meraki",
+        "name": "Meraki",
+        "documentation": "https://www.home-assistant.io/integrations/meraki",
+        "dependencies": [
+            "http",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_polling",
+    },
+    "message_bird": {
+        "domain": "message_bird",
+        "name": "MessageBird",
+        "documentation": "https://www.home-assistant.io/integrations/message_bird",
+        "requirements": [
+            "messagebird==1.2.0",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_push",
+    },
+    "met": {
+        "domain": "met",
+        "name": "Meteorologisk institutt (Met.no)",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/met",
+        "requirements": [
+            "pyMetno==0.8.3",
+        ],
+        "codeowners": [
+            "@danielhiversen",
+            "@thimic",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "met_eireann": {
+        "domain": "met_eireann",
+        "name": "Met \u00c9ireann",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/met_eireann",
+        "requirements": [
+            "pyMetEireann==0.2",
+        ],
+        "codeowners": [
+            "@DylanGore",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "meteo_france": {
+        "domain": "meteo_france",
+        "name": "M\u00e9t\u00e9o-France",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/meteo_france",
+        "requirements": [
+            "meteofrance-api==1.0.2",
+        ],
+        "codeowners": [
+            "@hacf-fr",
+            "@oncleben31",
+            "@Quentame",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "meteoalarm": {
+        "domain": "meteoalarm",
+        "name": "MeteoAlarm",
+        "documentation": "https://www.home-assistant.io/integrations/meteoalarm",
+        "requirements": [
+            "meteoalertapi==0.2.0",
+        ],
+        "codeowners": [
+            "@rolfberkenbosch",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "meteoclimatic": {
+        "domain": "meteoclimatic",
+        "name": "Meteoclimatic",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/meteoclimatic",
+        "requirements": [
+            "pymeteoclimatic==0.0.6",
+        ],
+        "codeowners": [
+            "@adrianmo",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "metoffice": {
+        "domain": "metoffice",
+        "name": "Met Office",
+        "documentation": "https://www.home-assistant.io/integrations/metoffice",
+        "requirements": [
+            "datapoint==0.9.8",
+        ],
+        "codeowners": [
+            "@MrHarcombe",
+        ],
+        "config_flow": True,
+        "iot_class": "cloud_polling",
+    },
+    "mfi": {
+        "domain": "mfi",
+        "name": "Ubiquiti mFi mPort",
+        "documentation": "https://www.home-assistant.io/integrations/mfi",
+        "requirements": [
+            "mficlient==0.3.0",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "mhz19": {
+        "domain": "mhz19",
+        "name": "MH-Z19 CO2 Sensor",
+        "documentation": "https://www.home-assistant.io/integrations/mhz19",
+        "requirements": [
+            "pmsensor==0.4",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "microsoft": {
+        "domain": "microsoft",
+        "name": "Microsoft Text-to-Speech (TTS)",
+        "documentation": "https://www.home-assistant.io/integrations/microsoft",
+        "requirements": [
+            "pycsspeechtts==1.0.4",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_push",
+    },
+    "microsoft_face": {
+        "domain": "microsoft_face",
+        "name": "Microsoft Face",
+        "documentation": "https://www.home-assistant.io/integrations/microsoft_face",
+        "dependencies": [
+            "camera",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_push",
+    },
+    "microsoft_face_detect": {
+        "domain": "microsoft_face_detect",
+        "name": "Microsoft Face Detect",
+        "documentation": "https://www.home-assistant.io/integrations/microsoft_face_detect",
+        "dependencies": [
+            "microsoft_face",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_push",
+    },
+    "microsoft_face_identify": {
+        "domain": "microsoft_face_identify",
+        "name": "Microsoft Face Identify",
+        "documentation": "https://www.home-assistant.io/integrations/microsoft_face_identify",
+        "dependencies": [
+            "microsoft_face",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_push",
+    },
+    "miflora": {
+        "domain": "miflora",
+        "name": "Mi Flora",
+        "documentation": "https://www.home-assistant.io/integrations/miflora",
+        "requirements": [
+            "bluepy==1.3.0",
+            "miflora==0.7.0",
+        ],
+        "codeowners": [
+            "@danielhiversen",
+            "@basnijholt",
+        ],
+        "iot_class": "local_polling",
+    },
+    "mikrotik": {
+        "domain": "mikrotik",
+        "name": "Mikrotik",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/mikrotik",
+        "requirements": [
+            "librouteros==3.0.0",
+        ],
+        "codeowners": [
+            "@engrbm87",
+        ],
+        "iot_class": "local_polling",
+    },
+    "mill": {
+        "domain": "mill",
+        "name": "Mill",
+        "documentation": "https://www.home-assistant.io/integrations/mill",
+        "requirements": [
+            "millheater==0.5.0",
+        ],
+        "codeowners": [
+            "@danielhiversen",
+        ],
+        "config_flow": True,
+        "iot_class": "cloud_polling",
+    },
+    "min_max": {
+        "domain": "min_max",
+        "name": "Min/Max",
+        "documentation": "https://www.home-assistant.io/integrations/min_max",
+        "codeowners": [
+            "@fabaff",
+        ],
+        "quality_scale": "internal",
+        "iot_class": "local_push",
+    },
+    "minecraft_server": {
+        "domain": "minecraft_server",
+        "name": "Minecraft Server",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/minecraft_server",
+        "requirements": [
+            "aiodns==3.0.0",
+            "getmac==0.8.2",
+            "mcstatus==6.0.0",
+        ],
+        "codeowners": [
+            "@elmurato",
+        ],
+        "quality_scale": "silver",
+        "iot_class": "local_polling",
+    },
+    "minio": {
+        "domain": "minio",
+        "name": "Minio",
+        "documentation": "https://www.home-assistant.io/integrations/minio",
+        "requirements": [
+            "minio==4.0.9",
+        ],
+        "codeowners": [
+            "@tkislan",
+        ],
+        "iot_class": "cloud_push",
+    },
+    "mitemp_bt": {
+        "domain": "mitemp_bt",
+        "name": "Xiaomi Mijia BLE Temperature and Humidity Sensor",
+        "documentation": "https://www.home-assistant.io/integrations/mitemp_bt",
+        "requirements": [
+            "mitemp_bt==0.0.3",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "mjpeg": {
+        "domain": "mjpeg",
+        "name": "MJPEG IP Camera",
+        "documentation": "https://www.home-assistant.io/integrations/mjpeg",
+        "codeowners": [],
+        "iot_class": "local_push",
+    },
+    "mobile_app": {
+        "domain": "mobile_app",
+        "name": "Mobile App",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/mobile_app",
+        "requirements": [
+            "PyNaCl==1.3.0",
+            "emoji==1.2.0",
+        ],
+        "dependencies": [
+            "http",
+            "webhook",
+            "person",
+            "tag",
+            "websocket_api",
+        ],
+        "after_dependencies": [
+            "cloud",
+            "camera",
+            "notify",
+        ],
+        "codeowners": [
+            "@robbiet480",
+        ],
+        "quality_scale": "internal",
+        "iot_class": "local_push",
+    },
+    "mochad": {
+        "domain": "mochad",
+        "name": "Mochad",
+        "documentation": "https://www.home-assistant.io/integrations/mochad",
+        "requirements": [
+            "pymochad==0.2.0",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "modbus": {
+        "domain": "modbus",
+        "name": "Modbus",
+        "documentation": "https://www.home-assistant.io/integrations/modbus",
+        "requirements": [
+            "pymodbus==2.5.2",
+        ],
+        "codeowners": [
+            "@adamchengtkc",
+            "@janiversen",
+            "@vzahradnik",
+        ],
+        "iot_class": "local_polling",
+    },
+    "modem_callerid": {
+        "domain": "modem_callerid",
+        "name": "Modem Caller ID",
+        "documentation": "https://www.home-assistant.io/integrations/modem_callerid",
+        "requirements": [
+            "basicmodem==0.7",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "modern_forms": {
+        "domain": "modern_forms",
+        "name": "Modern Forms",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/modern_forms",
+        "requirements": [
+            "aiomodernforms==0.1.8",
+        ],
+        "zeroconf": [
+            {
+                "type": "_easylink._tcp.local.",
+                "name": "wac*",
+            },
+        ],
+        "codeowners": [
+            "@wonderslug",
+        ],
+        "iot_class": "local_polling",
+    },
+    "mold_indicator": {
+        "domain": "mold_indicator",
+        "name": "Mold Indicator",
+        "documentation": "https://www.home-assistant.io/integrations/mold_indicator",
+        "codeowners": [],
+        "quality_scale": "internal",
+        "iot_class": "local_polling",
+    },
+    "monoprice": {
+        "domain": "monoprice",
+        "name": "Monoprice 6-Zone Amplifier",
+        "documentation": "https://www.home-assistant.io/integrations/monoprice",
+        "requirements": [
+            "pymonoprice==0.3",
+        ],
+        "codeowners": [
+            "@etsinko",
+            "@OnFreund",
+        ],
+        "config_flow": True,
+        "iot_class": "local_polling",
+    },
+    "moon": {
+        "domain": "moon",
+        "name": "Moon",
+        "documentation": "https://www.home-assistant.io/integrations/moon",
+        "codeowners": [
+            "@fabaff",
+        ],
+        "quality_scale": "internal",
+        "iot_class": "local_polling",
+    },
+    "motion_blinds": {
+        "domain": "motion_blinds",
+        "name": "Motion Blinds",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/motion_blinds",
+        "requirements": [
+            "motionblinds==0.4.10",
+        ],
+        "codeowners": [
+            "@starkillerOG",
+        ],
+        "iot_class": "local_push",
+    },
+    "motioneye": {
+        "domain": "motioneye",
+        "name": "motionEye",
+        "documentation": "https://www.home-assistant.io/integrations/motioneye",
+        "config_flow": True,
+        "dependencies": [
+            "http",
+            "webhook",
+        ],
+        "requirements": [
+            "motioneye-client==0.3.9",
+        ],
+        "codeowners": [
+            "@dermotduffy",
+        ],
+        "iot_class": "local_polling",
+    },
+    "mpchc": {
+        "domain": "mpchc",
+        "name": "Media Player Classic Home Cinema (MPC-HC)",
+        "documentation": "https://www.home-assistant.io/integrations/mpchc",
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "mpd": {
+        "domain": "mpd",
+        "name": "Music Player Daemon (MPD)",
+        "documentation": "https://www.home-assistant.io/integrations/mpd",
+        "requirements": [
+            "python-mpd2==3.0.4",
+        ],
+        "codeowners": [
+            "@fabaff",
+        ],
+        "iot_class": "local_polling",
+    },
+    "mqtt": {
+        "domain": "mqtt",
+        "name": "MQTT",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/mqtt",
+        "requirements": [
+            "paho-mqtt==1.5.1",
+        ],
+        "dependencies": [
+            "http",
+        ],
+        "codeowners": [
+            "@emontnemery",
+        ],
+        "iot_class": "local_push",
+    },
+    "mqtt_eventstream": {
+        "domain": "mqtt_eventstream",
+        "name": "MQTT Eventstream",
+        "documentation": "https://www.home-assistant.io/integrations/mqtt_eventstream",
+        "dependencies": [
+            "mqtt",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "mqtt_json": {
+        "domain": "mqtt_json",
+        "name": "MQTT JSON",
+        "documentation": "https://www.home-assistant.io/integrations/mqtt_json",
+        "dependencies": [
+            "mqtt",
+        ],
+        "codeowners": [],
+        "iot_class": "local_push",
+    },
+    "mqtt_room": {
+        "domain": "mqtt_room",
+        "name": "MQTT Room Presence",
+        "documentation": "https://www.home-assistant.io/integrations/mqtt_room",
+        "dependencies": [
+            "mqtt",
+        ],
+        "codeowners": [],
+        "iot_class": "local_push",
+    },
+    "mqtt_statestream": {
+        "domain": "mqtt_statestream",
+        "name": "MQTT Statestream",
+        "documentation": "https://www.home-assistant.io/integrations/mqtt_statestream",
+        "dependencies": [
+            "mqtt",
+        ],
+        "codeowners": [],
+        "iot_class": "local_push",
+    },
+    "msteams": {
+        "domain": "msteams",
+        "name": "Microsoft Teams",
+        "documentation": "https://www.home-assistant.io/integrations/msteams",
+        "requirements": [
+            "pymsteams==0.1.12",
+        ],
+        "codeowners": [
+            "@peroyvind",
+        ],
+        "iot_class": "cloud_push",
+    },
+    "mullvad": {
+        "domain": "mullvad",
+        "name": "Mullvad VPN",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/mullvad",
+        "requirements": [
+            "mullvad-api==1.0.0",
+        ],
+        "codeowners": [
+            "@meichthys",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "mutesync": {
+        "domain": "mutesync",
+        "name": "mutesync",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/mutesync",
+        "requirements": [
+            "mutesync==0.0.1",
+        ],
+        "iot_class": "local_polling",
+        "codeowners": [
+            "@currentoor",
+        ],
+    },
+    "mvglive": {
+        "domain": "mvglive",
+        "name": "MVG",
+        "documentation": "https://www.home-assistant.io/integrations/mvglive",
+        "requirements": [
+            "PyMVGLive==1.1.4",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_polling",
+    },
+    "my": {
+        "domain": "my",
+        "name": "My Home Assistant",
+        "documentation": "https://www.home-assistant.io/integrations/my",
+        "dependencies": [
+            "frontend",
+        ],
+        "codeowners": [
+            "@home-assistant/core",
+        ],
+        "quality_scale": "internal",
+    },
+    "mychevy": {
+        "domain": "mychevy",
+        "name": "myChevrolet",
+        "documentation": "https://www.home-assistant.io/integrations/mychevy",
+        "requirements": [
+            "mychevy==2.1.1",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_polling",
+    },
+    "mycroft": {
+        "domain": "mycroft",
+        "name": "Mycroft",
+        "documentation": "https://www.home-assistant.io/integrations/mycroft",
+        "requirements": [
+            "mycroftapi==2.0",
+        ],
+        "codeowners": [],
+        "iot_class": "local_push",
+    },
+    "myq": {
+        "domain": "myq",
+        "name": "MyQ",
+        "documentation": "https://www.home-assistant.io/integrations/myq",
+        "requirements": [
+            "pymyq==3.0.4",
+        ],
+        "codeowners": [
+            "@bdraco",
+        ],
+        "config_flow": True,
+        "homekit": {
+            "models": [
+                "819LMB",
+                "MYQ",
+            ],
+        },
+        "iot_class": "cloud_polling",
+        "dhcp": [
+            {
+                "macaddress": "645299*",
+            },
+        ],
+    },
+    "mysensors": {
+        "domain": "mysensors",
+        "name": "MySensors",
+        "documentation": "https://www.home-assistant.io/integrations/mysensors",
+        "requirements": [
+            "pymysensors==0.21.0",
+        ],
+        "after_dependencies": [
+            "mqtt",
+        ],
+        "codeowners": [
+            "@MartinHjelmare",
+            "@functionpointer",
+        ],
+        "config_flow": True,
+        "iot_class": "local_push",
+    },
+    "mystrom": {
+        "domain": "mystrom",
+        "name": "myStrom",
+        "documentation": "https://www.home-assistant.io/integrations/mystrom",
+        "requirements": [
+            "python-mystrom==1.1.2",
+        ],
+        "dependencies": [
+            "http",
+        ],
+        "codeowners": [
+            "@fabaff",
+        ],
+        "iot_class": "local_polling",
+    },
+    "mythicbeastsdns": {
+        "domain": "mythicbeastsdns",
+        "name": "Mythic Beasts DNS",
+        "documentation": "https://www.home-assistant.io/integrations/mythicbeastsdns",
+        "requirements": [
+            "mbddns==0.1.2",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_push",
+    },
+    "nad": {
+        "domain": "nad",
+        "name": "NAD",
+        "documentation": "https://www.home-assistant.io/integrations/nad",
+        "requirements": [
+            "nad_receiver==0.2.0",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "nam": {
+        "domain": "nam",
+        "name": "Nettigo Air Monitor",
+        "documentation": "https://www.home-assistant.io/integrations/nam",
+        "codeowners": [
+            "@bieniu",
+        ],
+        "requirements": [
+            "nettigo-air-monitor==1.0.0",
+        ],
+        "zeroconf": [
+            {
+                "type": "_http._tcp.local.",
+                "name": "nam-*",
+            },
+            {
+                "type": "_http._tcp.local.",
+                "manufacturer": "nettigo",
+            },
+        ],
+        "config_flow": True,
+        "quality_scale": "platinum",
+        "iot_class": "local_polling",
+    },
+    "namecheapdns": {
+        "domain": "namecheapdns",
+        "name": "Namecheap FreeDNS",
+        "documentation": "https://www.home-assistant.io/integrations/namecheapdns",
+        "requirements": [
+            "defusedxml==0.7.1",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_push",
+    },
+    "nanoleaf": {
+        "domain": "nanoleaf",
+        "name": "Nanoleaf",
+        "documentation": "https://www.home-assistant.io/integrations/nanoleaf",
+        "requirements": [
+            "pynanoleaf==0.1.0",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "neato": {
+        "domain": "neato",
+        "name": "Neato Botvac",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/neato",
+        "requirements": [
+            "pybotvac==0.0.21",
+        ],
+        "codeowners": [
+            "@dshokouhi",
+            "@Santobert",
+        ],
+        "dependencies": [
+            "http",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "nederlandse_spoorwegen": {
+        "domain": "nederlandse_spoorwegen",
+        "name": "Nederlandse Spoorwegen (NS)",
+        "documentation": "https://www.home-assistant.io/integrations/nederlandse_spoorwegen",
+        "requirements": [
+            "nsapi==3.0.4",
+        ],
+        "codeowners": [
+            "@YarmoM",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "nello": {
+        "domain": "nello",
+        "name": "Nello",
+        "documentation": "https://www.home-assistant.io/integrations/nello",
+        "requirements": [
+            "pynello==2.0.3",
+        ],
+        "codeowners": [
+            "@pschmitt",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "ness_alarm": {
+        "domain": "ness_alarm",
+        "name": "Ness Alarm",
+        "documentation": "https://www.home-assistant.io/integrations/ness_alarm",
+        "requirements": [
+            "nessclient==0.9.15",
+        ],
+        "codeowners": [
+            "@nickw444",
+        ],
+        "iot_class": "local_push",
+    },
+    "nest": {
+        "domain": "nest",
+        "name": "Nest",
+        "config_flow": True,
+        "dependencies": [
+            "ffmpeg",
+            "http",
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/nest",
+        "requirements": [
+            "python-nest==4.1.0",
+            "google-nest-sdm==0.2.12",
+        ],
+        "codeowners": [
+            "@allenporter",
+        ],
+        "quality_scale": "platinum",
+        "dhcp": [
+            {
+                "macaddress": "18B430*",
+            },
+        ],
+        "iot_class": "cloud_push",
+    },
+    "netatmo": {
+        "domain": "netatmo",
+        "name": "Netatmo",
+        "documentation": "https://www.home-assistant.io/integrations/netatmo",
+        "requirements": [
+            "pyatmo==5.2.0",
+        ],
+        "after_dependencies": [
+            "cloud",
+            "media_source",
+        ],
+        "dependencies": [
+            "webhook",
+        ],
+        "codeowners": [
+            "@cgtobi",
+        ],
+        "config_flow": True,
+        "homekit": {
+            "models": [
+                "Healty Home Coach",
+                "Netatmo Relay",
+                "Presence",
+                "Welcome",
+            ],
+        },
+        "iot_class": "cloud_polling",
+    },
+    "netdata": {
+        "domain": "netdata",
+        "name": "Netdata",
+        "documentation": "https://www.home-assistant.io/integrations/netdata",
+        "requirements": [
+            "netdata==0.2.0",
+        ],
+        "codeowners": [
+            "@fabaff",
+        ],
+        "iot_class": "local_polling",
+    },
+    "netgear": {
+        "domain": "netgear",
+        "name": "NETGEAR",
+        "documentation": "https://www.home-assistant.io/integrations/netgear",
+        "requirements": [
+            "pynetgear==0.6.1",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "netgear_lte": {
+        "domain": "netgear_lte",
+        "name": "NETGEAR LTE",
+        "documentation": "https://www.home-assistant.io/integrations/netgear_lte",
+        "requirements": [
+            "eternalegypt==0.0.12",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "netio": {
+        "domain": "netio",
+        "name": "Netio",
+        "documentation": "https://www.home-assistant.io/integrations/netio",
+        "requirements": [
+            "pynetio==0.1.9.1",
+        ],
+        "dependencies": [
+            "http",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "network": {
+        "domain": "network",
+        "name": "Network Configuration",
+        "documentation": "https://www.home-assistant.io/integrations/network",
+        "requirements": [
+            "ifaddr==0.1.7",
+        ],
+        "codeowners": [],
+        "dependencies": [
+            "websocket_api",
+        ],
+        "quality_scale": "internal",
+        "iot_class": "local_push",
+    },
+    "neurio_energy": {
+        "domain": "neurio_energy",
+        "name": "Neurio energy",
+        "documentation": "https://www.home-assistant.io/integrations/neurio_energy",
+        "requirements": [
+            "neurio==0.3.1",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_polling",
+    },
+    "nexia": {
+        "domain": "nexia",
+        "name": "Nexia/American Standard/Trane",
+        "requirements": [
+            "nexia==0.9.9",
+        ],
+        "codeowners": [
+            "@bdraco",
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/nexia",
+        "config_flow": True,
+        "dhcp": [
+            {
+                "hostname": "xl857-*",
+                "macaddress": "000231*",
+            },
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "nextbus": {
+        "domain": "nextbus",
+        "name": "NextBus",
+        "documentation": "https://www.home-assistant.io/integrations/nextbus",
+        "codeowners": [
+            "@vividboarder",
+        ],
+        "requirements": [
+            "py_nextbusnext==0.1.4",
+        ],
+        "iot_class": "local_polling",
+    },
+    "nextcloud": {
+        "domain": "nextcloud",
+        "name": "Nextcloud",
+        "documentation": "https://www.home-assistant.io/integrations/nextcloud",
+        "requirements": [
+            "nextcloudmonitor==1.1.0",
+        ],
+        "codeowners": [
+            "@meichthys",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "nfandroidtv": {
+        "domain": "nfandroidtv",
+        "name": "Notifications for Android TV / FireTV",
+        "documentation": "https://www.home-assistant.io/integrations/nfandroidtv",
+        "codeowners": [],
+        "iot_class": "local_push",
+    },
+    "nightscout": {
+        "domain": "nightscout",
+        "name": "Nightscout",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/nightscout",
+        "requirements": [
+            "py-nightscout==1.2.2",
+        ],
+        "codeowners": [
+            "@marciogranzotto",
+        ],
+        "quality_scale": "platinum",
+        "iot_class": "cloud_polling",
+    },
+    "niko_home_control": {
+        "domain": "niko_home_control",
+        "name": "Niko Home Control",
+        "documentation": "https://www.home-assistant.io/integrations/niko_home_control",
+        "requirements": [
+            "niko-home-control==0.2.1",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "nilu": {
+        "domain": "nilu",
+        "name": "Norwegian Institute for Air Research (NILU)",
+        "documentation": "https://www.home-assistant.io/integrations/nilu",
+        "requirements": [
+            "niluclient==0.1.2",
+        ],
+        "codeowners": [
+            "@hfurubotten",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "nissan_leaf": {
+        "domain": "nissan_leaf",
+        "name": "Nissan Leaf",
+        "documentation": "https://www.home-assistant.io/integrations/nissan_leaf",
+        "requirements": [
+            "pycarwings2==2.10",
+        ],
+        "codeowners": [
+            "@filcole",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "nmap_tracker": {
+        "domain": "nmap_tracker",
+        "name": "Nmap Tracker",
+        "documentation": "https://www.home-assistant.io/integrations/nmap_tracker",
+        "requirements": [
+            "python-nmap==0.6.1",
+            "getmac==0.8.2",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "nmbs": {
+        "domain": "nmbs",
+        "name": "NMBS",
+        "documentation": "https://www.home-assistant.io/integrations/nmbs",
+        "requirements": [
+            "pyrail==0.0.3",
+        ],
+        "codeowners": [
+            "@thibmaek",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "no_ip": {
+        "domain": "no_ip",
+        "name": "No-IP.com",
+        "documentation": "https://www.home-assistant.io/integrations/no_ip",
+        "codeowners": [
+            "@fabaff",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "noaa_tides": {
+        "domain": "noaa_tides",
+        "name": "NOAA Tides",
+        "documentation": "https://www.home-assistant.io/integrations/noaa_tides",
+        "requirements": [
+            "noaa-coops==0.1.8",
+        ],
+        "codeowners": [
+            "@jdelaney72",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "norway_air": {
+        "domain": "norway_air",
+        "name": "Om Luftkvalitet i Norge (Norway Air)",
+        "documentation": "https://www.home-assistant.io/integrations/norway_air",
+        "requirements": [
+            "pyMetno==0.8.3",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_polling",
+    },
+    "notify": {
+        "domain": "notify",
+        "name": "Notifications",
+        "documentation": "https://www.home-assistant.io/integrations/notify",
+        "codeowners": [
+            "@home-assistant/core",
+        ],
+        "quality_scale": "internal",
+    },
+    "notify_events": {
+        "domain": "notify_events",
+        "name": "Notify.Events",
+        "documentation": "https://www.home-assistant.io/integrations/notify_events",
+        "codeowners": [
+            "@matrozov",
+            "@papajojo",
+        ],
+        "requirements": [
+            "notify-events==1.0.4",
+        ],
+        "iot_class": "cloud_push",
+    },
+    "notion": {
+        "domain": "notion",
+        "name": "Notion",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/notion",
+        "requirements": [
+            "aionotion==1.1.0",
+        ],
+        "codeowners": [
+            "@bachya",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "nsw_fuel_station": {
+        "domain": "nsw_fuel_station",
+        "name": "NSW Fuel Station Price",
+        "documentation": "https://www.home-assistant.io/integrations/nsw_fuel_station",
+        "requirements": [
+            "nsw-fuel-api-client==1.1.0",
+        ],
+        "codeowners": [
+            "@nickw444",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "nsw_rural_fire_service_feed": {
+        "domain": "nsw_rural_fire_service_feed",
+        "name": "NSW Rural Fire Service Incidents",
+        "documentation": "https://www.home-assistant.io/integrations/nsw_rural_fire_service_feed",
+        "requirements": [
+            "aio_geojson_nsw_rfs_incidents==0.4",
+        ],
+        "codeowners": [
+            "@exxamalte",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "nuheat": {
+        "domain": "nuheat",
+        "name": "NuHeat",
+        "documentation": "https://www.home-assistant.io/integrations/nuheat",
+        "requirements": [
+            "nuheat==0.3.0",
+        ],
+        "codeowners": [],
+        "config_flow": True,
+        "dhcp": [
+            {
+                "hostname": "nuheat",
+                "macaddress": "002338*",
+            },
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "nuki": {
+        "domain": "nuki",
+        "name": "Nuki",
+        "documentation": "https://www.home-assistant.io/integrations/nuki",
+        "requirements": [
+            "pynuki==1.4.1",
+        ],
+        "codeowners": [
+            "@pschmitt",
+            "@pvizeli",
+            "@pree",
+        ],
+        "config_flow": True,
+        "dhcp": [
+            {
+                "hostname": "nuki_bridge_*",
+            },
+        ],
+        "iot_class": "local_polling",
+    },
+    "numato": {
+        "domain": "numato",
+        "name": "Numato USB GPIO Expander",
+        "documentation": "https://www.home-assistant.io/integrations/numato",
+        "requirements": [
+            "numato-gpio==0.10.0",
+        ],
+        "codeowners": [
+            "@clssn",
+        ],
+        "iot_class": "local_push",
+    },
+    "number": {
+        "domain": "number",
+        "name": "Number",
+        "documentation": "https://www.home-assistant.io/integrations/number",
+        "codeowners": [
+            "@home-assistant/core",
+            "@Shulyaka",
+        ],
+        "quality_scale": "internal",
+    },
+    "nut": {
+        "domain": "nut",
+        "name": "Network UPS Tools (NUT)",
+        "documentation": "https://www.home-assistant.io/integrations/nut",
+        "requirements": [
+            "pynut2==2.1.2",
+        ],
+        "codeowners": [
+            "@bdraco",
+        ],
+        "config_flow": True,
+        "zeroconf": [
+            "_nut._tcp.local.",
+        ],
+        "iot_class": "local_polling",
+    },
+    "nws": {
+        "domain": "nws",
+        "name": "National Weather Service (NWS)",
+        "documentation": "https://www.home-assistant.io/integrations/nws",
+        "codeowners": [
+            "@MatthewFlamm",
+        ],
+        "requirements": [
+            "pynws==1.3.0",
+        ],
+        "quality_scale": "platinum",
+        "config_flow": True,
+        "iot_class": "cloud_polling",
+    },
+    "nx584": {
+        "domain": "nx584",
+        "name": "NX584",
+        "documentation": "https://www.home-assistant.io/integrations/nx584",
+        "requirements": [
+            "pynx584==0.5",
+        ],
+        "codeowners": [],
+        "iot_class": "local_push",
+    },
+    "nzbget": {
+        "domain": "nzbget",
+        "name": "NZBGet",
+        "documentation": "https://www.home-assistant.io/integrations/nzbget",
+        "requirements": [
+            "pynzbgetapi==0.2.0",
+        ],
+        "codeowners": [
+            "@chriscla",
+        ],
+        "config_flow": True,
+        "iot_class": "local_polling",
+    },
+    "oasa_telematics": {
+        "domain": "oasa_telematics",
+        "name": "OASA Telematics",
+        "documentation": "https://www.home-assistant.io/integrations/oasa_telematics/",
+        "requirements": [
+            "oasatelematics==0.3",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_polling",
+    },
+    "obihai": {
+        "domain": "obihai",
+        "name": "Obihai",
+        "documentation": "https://www.home-assistant.io/integrations/obihai",
+        "requirements": [
+            "pyobihai==1.3.1",
+        ],
+        "codeowners": [
+            "@dshokouhi",
+        ],
+        "iot_class": "local_polling",
+    },
+    "octoprint": {
+        "domain": "octoprint",
+        "name": "OctoPrint",
+        "documentation": "https://www.home-assistant.io/integrations/octoprint",
+        "after_dependencies": [
+            "discovery",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "oem": {
+        "domain": "oem",
+        "name": "OpenEnergyMonitor WiFi Thermostat",
+        "documentation": "https://www.home-assistant.io/integrations/oem",
+        "requirements": [
+            "oemthermostat==1.1.1",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "ohmconnect": {
+        "domain": "ohmconnect",
+        "name": "OhmConnect",
+        "documentation": "https://www.home-assistant.io/integrations/ohmconnect",
+        "requirements": [
+            "defusedxml==0.7.1",
+        ],
+        "codeowners": [
+            "@robbiet480",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "ombi": {
+        "domain": "ombi",
+        "name": "Ombi",
+        "documentation": "https://www.home-assistant.io/integrations/ombi/",
+        "codeowners": [
+            "@larssont",
+        ],
+        "requirements": [
+            "pyombi==0.1.10",
+        ],
+        "iot_class": "local_polling",
+    },
+    "omnilogic": {
+        "domain": "omnilogic",
+        "name": "Hayward Omnilogic",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/omnilogic",
+        "requirements": [
+            "omnilogic==0.4.5",
+        ],
+        "codeowners": [
+            "@oliver84",
+            "@djtimca",
+            "@gentoosu",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "onboarding": {
+        "domain": "onboarding",
+        "name": "Home Assistant Onboarding",
+        "documentation": "https://www.home-assistant.io/integrations/onboarding",
+        "after_dependencies": [
+            "hassio",
+        ],
+        "dependencies": [
+            "analytics",
+            "auth",
+            "http",
+            "person",
+        ],
+        "codeowners": [
+            "@home-assistant/core",
+        ],
+        "quality_scale": "internal",
+    },
+    "ondilo_ico": {
+        "domain": "ondilo_ico",
+        "name": "Ondilo ICO",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/ondilo_ico",
+        "requirements": [
+            "ondilo==0.2.0",
+        ],
+        "dependencies": [
+            "http",
+        ],
+        "codeowners": [
+            "@JeromeHXP",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "onewire": {
+        "domain": "onewire",
+        "name": "1-Wire",
+        "documentation": "https://www.home-assistant.io/integrations/onewire",
+        "config_flow": True,
+        "requirements": [
+            "pyownet==0.10.0.post1",
+            "pi1wire==0.1.0",
+        ],
+        "codeowners": [
+            "@garbled1",
+            "@epenet",
+        ],
+        "iot_class": "local_polling",
+    },
+    "onkyo": {
+        "domain": "onkyo",
+        "name": "Onkyo",
+        "documentation": "https://www.home-assistant.io/integrations/onkyo",
+        "requirements": [
+            "onkyo-eiscp==1.2.7",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "onvif": {
+        "domain": "onvif",
+        "name": "ONVIF",
+        "documentation": "https://www.home-assistant.io/integrations/onvif",
+        "requirements": [
+            "onvif-zeep-async==1.0.0",
+            "WSDiscovery==2.0.0",
+            "zeep[async]==4.0.0",
+        ],
+        "dependencies": [
+            "ffmpeg",
+        ],
+        "codeowners": [
+            "@hunterjm",
+        ],
+        "config_flow": True,
+        "iot_class": "local_push",
+    },
+    "openalpr_cloud": {
+        "domain": "openalpr_cloud",
+        "name": "OpenALPR Cloud",
+        "documentation": "https://www.home-assistant.io/integrations/openalpr_cloud",
+        "codeowners": [],
+        "iot_class": "cloud_push",
+    },
+    "openalpr_local": {
+        "domain": "openalpr_local",
+        "name": "OpenALPR Local",
+        "documentation": "https://www.home-assistant.io/integrations/openalpr_local",
+        "codeowners": [],
+        "iot_class": "local_push",
+    },
+    "opencv": {
+        "domain": "opencv",
+        "name": "OpenCV",
+        "documentation": "https://www.home-assistant.io/integrations/opencv",
+        "requirements": [
+            "numpy==1.21.0",
+            "opencv-python-headless==4.5.2.54",
+        ],
+        "codeowners": [],
+        "iot_class": "local_push",
+    },
+    "openerz": {
+        "domain": "openerz",
+        "name": "Open ERZ",
+        "documentation": "https://www.home-assistant.io/integrations/openerz",
+        "codeowners": [
+            "@misialq",
+        ],
+        "requirements": [
+            "openerz-api==0.1.0",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "openevse": {
+        "domain": "openevse",
+        "name": "OpenEVSE",
+        "documentation": "https://www.home-assistant.io/integrations/openevse",
+        "requirements": [
+            "openevsewifi==1.1.0",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "openexchangerates": {
+        "domain": "openexchangerates",
+        "name": "Open Exchange Rates",
+        "documentation": "https://www.home-assistant.io/integrations/openexchangerates",
+        "codeowners": [],
+        "iot_class": "cloud_polling",
+    },
+    "opengarage": {
+        "domain": "opengarage",
+        "name": "OpenGarage",
+        "documentation": "https://www.home-assistant.io/integrations/opengarage",
+        "codeowners": [
+            "@danielhiversen",
+        ],
+        "requirements": [
+            "open-garage==0.1.4",
+        ],
+        "iot_class": "local_polling",
+    },
+    "openhardwaremonitor": {
+        "domain": "openhardwaremonitor",
+        "name": "Open Hardware Monitor",
+        "documentation": "https://www.home-assistant.io/integrations/openhardwaremonitor",
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "openhome": {
+        "domain": "openhome",
+        "name": "Linn / OpenHome",
+        "documentation": "https://www.home-assistant.io/integrations/openhome",
+        "requirements": [
+            "openhomedevice==2.0.1",
+        ],
+        "codeowners": [
+            "@bazwilliams",
+        ],
+        "iot_class": "local_polling",
+    },
+    "opensensemap": {
+        "domain": "opensensemap",
+        "name": "openSenseMap",
+        "documentation": "https://www.home-assistant.io/integrations/opensensemap",
+        "requirements": [
+            "opensensemap-api==0.1.5",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_polling",
+    },
+    "opensky": {
+        "domain": "opensky",
+        "name": "OpenSky Network",
+        "documentation": "https://www.home-assistant.io/integrations/opensky",
+        "codeowners": [],
+        "iot_class": "cloud_polling",
+    },
+    "opentherm_gw": {
+        "domain": "opentherm_gw",
+        "name": "OpenTherm Gateway",
+        "documentation": "https://www.home-assistant.io/integrations/opentherm_gw",
+        "requirements": [
+            "pyotgw==1.1b1",
+        ],
+        "codeowners": [
+            "@mvn23",
+        ],
+        "config_flow": True,
+        "iot_class": "local_push",
+    },
+    "openuv": {
+        "domain": "openuv",
+        "name": "OpenUV",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/openuv",
+        "requirements": [
+            "pyopenuv==1.0.9",
+        ],
+        "codeowners": [
+            "@bachya",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "openweathermap": {
+        "domain": "openweathermap",
+        "name": "OpenWeatherMap",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/openweathermap",
+        "requirements": [
+            "pyowm==3.2.0",
+        ],
+        "codeowners": [
+            "@fabaff",
+            "@freekode",
+            "@nzapponi",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "opnsense": {
+        "domain": "opnsense",
+        "name": "OPNSense",
+        "documentation": "https://www.home-assistant.io/integrations/opnsense",
+        "requirements": [
+            "pyopnsense==0.2.0",
+        ],
+        "codeowners": [
+            "@mtreinish",
+        ],
+        "iot_class": "local_polling",
+    },
+    "opple": {
+        "domain": "opple",
+        "name": "Opple",
+        "documentation": "https://www.home-assistant.io/integrations/opple",
+        "requirements": [
+            "pyoppleio==1.0.5",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "orangepi_gpio": {
+        "domain": "orangepi_gpio",
+        "name": "Orange Pi GPIO",
+        "documentation": "https://www.home-assistant.io/integrations/orangepi_gpio",
+        "requirements": [
+            "OPi.GPIO==0.4.0",
+        ],
+        "codeowners": [
+            "@pascallj",
+        ],
+        "iot_class": "local_push",
+    },
+    "oru": {
+        "domain": "oru",
+        "name": "Orange and Rockland Utility (ORU)",
+        "documentation": "https://www.home-assistant.io/integrations/oru",
+        "codeowners": [
+            "@bvlaicu",
+        ],
+        "requirements": [
+            "oru==0.1.11",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "orvibo": {
+        "domain": "orvibo",
+        "name": "Orvibo",
+        "documentation": "https://www.home-assistant.io/integrations/orvibo",
+        "requirements": [
+            "orvibo==1.1.1",
+        ],
+        "codeowners": [],
+        "iot_class": "local_push",
+    },
+    "osramlightify": {
+        "domain": "osramlightify",
+        "name": "Osramlightify",
+        "documentation": "https://www.home-assistant.io/integrations/osramlightify",
+        "requirements": [
+            "lightify==1.0.7.3",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "otp": {
+        "domain": "otp",
+        "name": "One-Time Password (OTP)",
+        "documentation": "https://www.home-assistant.io/integrations/otp",
+        "requirements": [
+            "pyotp==2.3.0",
+        ],
+        "codeowners": [],
+        "quality_scale": "internal",
+        "iot_class": "local_polling",
+    },
+    "ovo_energy": {
+        "domain": "ovo_energy",
+        "name": "OVO Energy",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/ovo_energy",
+        "requirements": [
+            "ovoenergy==1.1.12",
+        ],
+        "codeowners": [
+            "@timmo001",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "owntracks": {
+        "domain": "owntracks",
+        "name": "OwnTracks",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/owntracks",
+        "requirements": [
+            "PyNaCl==1.3.0",
+        ],
+        "dependencies": [
+            "webhook",
+        ],
+        "after_dependencies": [
+            "mqtt",
+            "cloud",
+        ],
+        "codeowners": [],
+        "iot_class": "local_push",
+    },
+    "ozw": {
+        "domain": "ozw",
+        "name": "OpenZWave (beta)",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/ozw",
+        "requirements": [
+            "python-openzwave-mqtt[mqtt-client]==1.4.0",
+        ],
+        "after_dependencies": [
+            "mqtt",
+        ],
+        "codeowners": [
+            "@cgarwood",
+            "@marcelveldt",
+            "@MartinHjelmare",
+        ],
+        "iot_class": "local_push",
+    },
+    "panasonic_bluray": {
+        "domain": "panasonic_bluray",
+        "name": "Panasonic Blu-Ray Player",
+        "documentation": "https://www.home-assistant.io/integrations/panasonic_bluray",
+        "requirements": [
+            "panacotta==0.1",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "panasonic_viera": {
+        "domain": "panasonic_viera",
+        "name": "Panasonic Viera",
+        "documentation": "https://www.home-assistant.io/integrations/panasonic_viera",
+        "requirements": [
+            "panasonic_viera==0.3.6",
+        ],
+        "codeowners": [],
+        "config_flow": True,
+        "iot_class": "local_polling",
+    },
+    "pandora": {
+        "domain": "pandora",
+        "name": "Pandora",
+        "documentation": "https://www.home-assistant.io/integrations/pandora",
+        "requirements": [
+            "pexpect==4.6.0",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "panel_custom": {
+        "domain": "panel_custom",
+        "name": "Custom Panel",
+        "documentation": "https://www.home-assistant.io/integrations/panel_custom",
+        "dependencies": [
+            "frontend",
+        ],
+        "codeowners": [
+            "@home-assistant/frontend",
+        ],
+        "quality_scale": "internal",
+    },
+    "panel_iframe": {
+        "domain": "panel_iframe",
+        "name": "iframe Panel",
+        "documentation": "https://www.home-assistant.io/integrations/panel_iframe",
+        "dependencies": [
+            "frontend",
+        ],
+        "codeowners": [
+            "@home-assistant/frontend",
+        ],
+        "quality_scale": "internal",
+    },
+    "pcal9535a": {
+        "domain": "pcal9535a",
+        "name": "PCAL9535A I/O Expander",
+        "documentation": "https://www.home-assistant.io/integrations/pcal9535a",
+        "requirements": [
+            "pcal9535a==0.7",
+        ],
+        "codeowners": [
+            "@Shulyaka",
+        ],
+        "iot_class": "local_polling",
+    },
+    "pencom": {
+        "domain": "pencom",
+        "name": "Pencom",
+        "documentation": "https://www.home-assistant.io/integrations/pencom",
+        "requirements": [
+            "pencompy==0.0.3",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "persistent_notification": {
+        "domain": "persistent_notification",
+        "name": "Persistent Notification",
+        "documentation": "https://www.home-assistant.io/integrations/persistent_notification",
+        "codeowners": [
+            "@home-assistant/core",
+        ],
+        "quality_scale": "internal",
+        "iot_class": "local_push",
+    },
+    "person": {
+        "domain": "person",
+        "name": "Person",
+        "documentation": "https://www.home-assistant.io/integrations/person",
+        "dependencies": [
+            "image",
+        ],
+        "after_dependencies": [
+            "device_tracker",
+        ],
+        "codeowners": [],
+        "quality_scale": "internal",
+        "iot_class": "calculated",
+    },
+    "philips_js": {
+        "domain": "philips_js",
+        "name": "Philips TV",
+        "documentation": "https://www.home-assistant.io/integrations/philips_js",
+        "requirements": [
+            "ha-philipsjs==2.7.4",
+        ],
+        "codeowners": [
+            "@elupus",
+        ],
+        "config_flow": True,
+        "iot_class": "local_polling",
+    },
+    "pi4ioe5v9xxxx": {
+        "domain": "pi4ioe5v9xxxx",
+        "name": "pi4ioe5v9xxxx IO Expander",
+        "documentation": "https://www.home-assistant.io/integrations/pi4ioe5v9xxxx",
+        "requirements": [
+            "pi4ioe5v9xxxx==0.0.2",
+        ],
+        "codeowners": [
+            "@antonverburg",
+        ],
+        "iot_class": "local_polling",
+    },
+    "pi_hole": {
+        "domain": "pi_hole",
+        "name": "Pi-hole",
+        "documentation": "https://www.home-assistant.io/integrations/pi_hole",
+        "requirements": [
+            "hole==0.5.1",
+        ],
+        "codeowners": [
+            "@fabaff",
+            "@johnluetke",
+            "@shenxn",
+        ],
+        "config_flow": True,
+        "iot_class": "local_polling",
+    },
+    "picnic": {
+        "domain": "picnic",
+        "name": "Picnic",
+        "config_flow": True,
+        "iot_class": "cloud_polling",
+        "documentation": "https://www.home-assistant.io/integrations/picnic",
+        "requirements": [
+            "python-picnic-api==1.1.0",
+        ],
+        "codeowners": [
+            "@corneyl",
+        ],
+    },
+    "picotts": {
+        "domain": "picotts",
+        "name": "Pico TTS",
+        "documentation": "https://www.home-assistant.io/integrations/picotts",
+        "codeowners": [],
+        "iot_class": "local_push",
+    },
+    "piglow": {
+        "domain": "piglow",
+        "name": "Piglow",
+        "documentation": "https://www.home-assistant.io/integrations/piglow",
+        "requirements": [
+            "piglow==1.2.4",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "pilight": {
+        "domain": "pilight",
+        "name": "Pilight",
+        "documentation": "https://www.home-assistant.io/integrations/pilight",
+        "requirements": [
+            "pilight==0.1.1",
+        ],
+        "codeowners": [
+            "@trekky12",
+        ],
+        "iot_class": "local_push",
+    },
+    "ping": {
+        "domain": "ping",
+        "name": "Ping (ICMP)",
+        "documentation": "https://www.home-assistant.io/integrations/ping",
+        "codeowners": [],
+        "requirements": [
+            "icmplib==3.0",
+        ],
+        "quality_scale": "internal",
+        "iot_class": "local_polling",
+    },
+    "pioneer": {
+        "domain": "pioneer",
+        "name": "Pioneer",
+        "documentation": "https://www.home-assistant.io/integrations/pioneer",
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "pjlink": {
+        "domain": "pjlink",
+        "name": "PJLink",
+        "documentation": "https://www.home-assistant.io/integrations/pjlink",
+        "requirements": [
+            "pypjlink2==1.2.1",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "plaato": {
+        "domain": "plaato",
+        "name": "Plaato",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/plaato",
+        "dependencies": [
+            "webhook",
+        ],
+        "after_dependencies": [
+            "cloud",
+        ],
+        "codeowners": [
+            "@JohNan",
+        ],
+        "requirements": [
+            "pyplaato==0.0.15",
+        ],
+        "iot_class": "cloud_push",
+    },
+    "plant": {
+        "domain": "plant",
+        "name": "Plant Monitor",
+        "documentation": "https://www.home-assistant.io/integrations/plant",
+        "after_dependencies": [
+            "recorder",
+        ],
+        "codeowners": [],
+        "quality_scale": "internal",
+    },
+    "plex": {
+        "domain": "plex",
+        "name": "Plex Media Server",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/plex",
+        "requirements": [
+            "plexapi==4.6.1",
+            "plexauth==0.0.6",
+            "plexwebsocket==0.0.13",
+        ],
+        "dependencies": [
+            "http",
+        ],
+        "codeowners": [
+            "@jjlawren",
+        ],
+        "iot_class": "local_push",
+    },
+    "plugwise": {
+        "domain": "plugwise",
+        "name": "Plugwise",
+        "documentation": "https://www.home-assistant.io/integrations/plugwise",
+        "requirements": [
+            "plugwise==0.8.5",
+        ],
+        "codeowners": [
+            "@CoMPaTech",
+            "@bouwew",
+            "@brefra",
+        ],
+        "zeroconf": [
+            "_plugwise._tcp.local.",
+        ],
+        "config_flow": True,
+        "iot_class": "local_polling",
+    },
+    "plum_lightpad": {
+        "domain": "plum_lightpad",
+        "name": "Plum Lightpad",
+        "documentation": "https://www.home-assistant.io/integrations/plum_lightpad",
+        "requirements": [
+            "plumlightpad==0.0.11",
+        ],
+        "codeowners": [
+            "@ColinHarrington",
+            "@prystupa",
+        ],
+        "config_flow": True,
+        "iot_class": "local_push",
+    },
+    "pocketcasts": {
+        "domain": "pocketcasts",
+        "name": "Pocket Casts",
+        "documentation": "https://www.home-assistant.io/integrations/pocketcasts",
+        "requirements": [
+            "pycketcasts==1.0.0",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_polling",
+    },
+    "point": {
+        "domain": "point",
+        "name": "Minut Point",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/point",
+        "requirements": [
+            "pypoint==2.1.0",
+        ],
+        "dependencies": [
+            "webhook",
+            "http",
+        ],
+        "codeowners": [
+            "@fredrike",
+        ],
+        "quality_scale": "gold",
+        "iot_class": "cloud_polling",
+    },
+    "poolsense": {
+        "domain": "poolsense",
+        "name": "PoolSense",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/poolsense",
+        "requirements": [
+            "poolsense==0.0.8",
+        ],
+        "codeowners": [
+            "@haemishkyd",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "powerwall": {
+        "domain": "powerwall",
+        "name": "Tesla Powerwall",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/powerwall",
+        "requirements": [
+            "tesla-powerwall==0.3.10",
+        ],
+        "codeowners": [
+            "@bdraco",
+            "@jrester",
+        ],
+        "dhcp": [
+            {
+                "hostname": "1118431-*",
+                "macaddress": "88DA1A*",
+            },
+            {
+                "hostname": "1118431-*",
+                "macaddress": "000145*",
+            },
+        ],
+        "iot_class": "local_polling",
+    },
+    "profiler": {
+        "domain": "profiler",
+        "name": "Profiler",
+        "documentation": "https://www.home-assistant.io/integrations/profiler",
+        "requirements": [
+            "pyprof2calltree==1.4.5",
+            "guppy3==3.1.0",
+            "objgraph==3.4.1",
+        ],
+        "codeowners": [
+            "@bdraco",
+        ],
+        "quality_scale": "internal",
+        "config_flow": True,
+    },
+    "progettihwsw": {
+        "domain": "progettihwsw",
+        "name": "ProgettiHWSW Automation",
+        "documentation": "https://www.home-assistant.io/integrations/progettihwsw",
+        "codeowners": [
+            "@ardaseremet",
+        ],
+        "requirements": [
+            "progettihwsw==0.1.1",
+        ],
+        "config_flow": True,
+        "iot_class": "local_polling",
+    },
+    "proliphix": {
+        "domain": "proliphix",
+        "name": "Proliphix",
+        "documentation": "https://www.home-assistant.io/integrations/proliphix",
+        "requirements": [
+            "proliphix==0.4.1",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "prometheus": {
+        "domain": "prometheus",
+        "name": "Prometheus",
+        "documentation": "https://www.home-assistant.io/integrations/prometheus",
+        "requirements": [
+            "prometheus_client==0.7.1",
+        ],
+        "dependencies": [
+            "http",
+        ],
+        "codeowners": [
+            "@knyar",
+        ],
+        "iot_class": "assumed_state",
+    },
+    "prowl": {
+        "domain": "prowl",
+        "name": "Prowl",
+        "documentation": "https://www.home-assistant.io/integrations/prowl",
+        "codeowners": [],
+        "iot_class": "cloud_push",
+    },
+    "proximity": {
+        "domain": "proximity",
+        "name": "Proximity",
+        "documentation": "https://www.home-assistant.io/integrations/proximity",
+        "dependencies": [
+            "device_tracker",
+            "zone",
+        ],
+        "codeowners": [],
+        "quality_scale": "internal",
+        "iot_class": "calculated",
+    },
+    "proxmoxve": {
+        "domain": "proxmoxve",
+        "name": "Proxmox VE",
+        "documentation": "https://www.home-assistant.io/integrations/proxmoxve",
+        "codeowners": [
+            "@k4ds3",
+            "@jhollowe",
+            "@Corbeno",
+        ],
+        "requirements": [
+            "proxmoxer==1.1.1",
+        ],
+        "iot_class": "local_polling",
+    },
+    "proxy": {
+        "domain": "proxy",
+        "name": "Camera Proxy",
+        "documentation": "https://www.home-assistant.io/integrations/proxy",
+        "requirements": [
+            "pillow==8.2.0",
+        ],
+        "codeowners": [],
+    },
+    "ps4": {
+        "domain": "ps4",
+        "name": "Sony PlayStation 4",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/ps4",
+        "requirements": [
+            "pyps4-2ndscreen==1.2.0",
+        ],
+        "codeowners": [
+            "@ktnrg45",
+        ],
+        "iot_class": "local_polling",
+    },
+    "pulseaudio_loopback": {
+        "domain": "pulseaudio_loopback",
+        "name": "PulseAudio Loopback",
+        "documentation": "https://www.home-assistant.io/integrations/pulseaudio_loopback",
+        "requirements": [
+            "pulsectl==20.2.4",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "push": {
+        "domain": "push",
+        "name": "Push",
+        "documentation": "https://www.home-assistant.io/integrations/push",
+        "dependencies": [
+            "webhook",
+        ],
+        "codeowners": [
+            "@dgomes",
+        ],
+        "iot_class": "local_push",
+    },
+    "pushbullet": {
+        "domain": "pushbullet",
+        "name": "Pushbullet",
+        "documentation": "https://www.home-assistant.io/integrations/pushbullet",
+        "requirements": [
+            "pushbullet.py==0.11.0",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_polling",
+    },
+    "pushover": {
+        "domain": "pushover",
+        "name": "Pushover",
+        "documentation": "https://www.home-assistant.io/integrations/pushover",
+        "requirements": [
+            "pushover_complete==1.1.1",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_push",
+    },
+    "pushsafer": {
+        "domain": "pushsafer",
+        "name": "Pushsafer",
+        "documentation": "https://www.home-assistant.io/integrations/pushsafer",
+        "codeowners": [],
+        "iot_class": "cloud_push",
+    },
+    "pvoutput": {
+        "domain": "pvoutput",
+        "name": "PVOutput",
+        "documentation": "https://www.home-assistant.io/integrations/pvoutput",
+        "after_dependencies": [
+            "rest",
+        ],
+        "codeowners": [
+            "@fabaff",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "pvpc_hourly_pricing": {
+        "domain": "pvpc_hourly_pricing",
+        "name": "Spain electricity hourly pricing (PVPC)",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/pvpc_hourly_pricing",
+        "requirements": [
+            "aiopvpc==2.2.0",
+        ],
+        "codeowners": [
+            "@azogue",
+        ],
+        "quality_scale": "platinum",
+        "iot_class": "cloud_polling",
+    },
+    "pyload": {
+        "domain": "pyload",
+        "name": "pyLoad",
+        "documentation": "https://www.home-assistant.io/integrations/pyload",
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "python_script": {
+        "domain": "python_script",
+        "name": "Python Scripts",
+        "documentation": "https://www.home-assistant.io/integrations/python_script",
+        "requirements": [
+            "restrictedpython==5.1",
+        ],
+        "codeowners": [],
+        "quality_scale": "internal",
+    },
+    "qbittorrent": {
+        "domain": "qbittorrent",
+        "name": "qBittorrent",
+        "documentation": "https://www.home-assistant.io/integrations/qbittorrent",
+        "requirements": [
+            "python-qbittorrent==0.4.2",
+        ],
+        "codeowners": [
+            "@geoffreylagaisse",
+        ],
+        "iot_class": "local_polling",
+    },
+    "qld_bushfire": {
+        "domain": "qld_bushfire",
+        "name": "Queensland Bushfire Alert",
+        "documentation": "https://www.home-assistant.io/integrations/qld_bushfire",
+        "requirements": [
+            "georss_qld_bushfire_alert_client==0.5",
+        ],
+        "codeowners": [
+            "@exxamalte",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "qnap": {
+        "domain": "qnap",
+        "name": "QNAP",
+        "documentation": "https://www.home-assistant.io/integrations/qnap",
+        "requirements": [
+            "qnapstats==0.3.1",
+        ],
+        "codeowners": [
+            "@colinodell",
+        ],
+        "iot_class": "local_polling",
+    },
+    "qrcode": {
+        "domain": "qrcode",
+        "name": "QR Code",
+        "documentation": "https://www.home-assistant.io/integrations/qrcode",
+        "requirements": [
+            "pillow==8.2.0",
+            "pyzbar==0.1.7",
+        ],
+        "codeowners": [],
+        "iot_class": "calculated",
+    },
+    "quantum_gateway": {
+        "domain": "quantum_gateway",
+        "name": "Quantum Gateway",
+        "documentation": "https://www.home-assistant.io/integrations/quantum_gateway",
+        "requirements": [
+            "quantum-gateway==0.0.5",
+        ],
+        "codeowners": [
+            "@cisasteelersfan",
+        ],
+        "iot_class": "local_polling",
+    },
+    "qvr_pro": {
+        "domain": "qvr_pro",
+        "name": "QVR Pro",
+        "documentation": "https://www.home-assistant.io/integrations/qvr_pro",
+        "requirements": [
+            "pyqvrpro==0.52",
+        ],
+        "codeowners": [
+            "@oblogic7",
+        ],
+        "iot_class": "local_polling",
+    },
+    "qwikswitch": {
+        "domain": "qwikswitch",
+        "name": "QwikSwitch QSUSB",
+        "documentation": "https://www.home-assistant.io/integrations/qwikswitch",
+        "requirements": [
+            "pyqwikswitch==0.93",
+        ],
+        "codeowners": [
+            "@kellerza",
+        ],
+        "iot_class": "local_push",
+    },
+    "rachio": {
+        "domain": "rachio",
+        "name": "Rachio",
+        "documentation": "https://www.home-assistant.io/integrations/rachio",
+        "requirements": [
+            "rachiopy==1.0.3",
+        ],
+        "dependencies": [
+            "http",
+        ],
+        "after_dependencies": [
+            "cloud",
+        ],
+        "codeowners": [
+            "@bdraco",
+        ],
+        "config_flow": True,
+        "dhcp": [
+            {
+                "hostname": "rachio-*",
+                "macaddress": "009D6B*",
+            },
+            {
+                "hostname": "rachio-*",
+                "macaddress": "F0038C*",
+            },
+            {
+                "hostname": "rachio-*",
+                "macaddress": "74C63B*",
+            },
+        ],
+        "homekit": {
+            "models": [
+                "Rachio",
+            ],
+        },
+        "zeroconf": [
+            {
+                "type": "_http._tcp.local.",
+                "name": "rachio*",
+            },
+        ],
+        "iot_class": "cloud_push",
+    },
+    "radarr": {
+        "domain": "radarr",
+        "name": "Radarr",
+        "documentation": "https://www.home-assistant.io/integrations/radarr",
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "radiotherm": {
+        "domain": "radiotherm",
+        "name": "Radio Thermostat",
+        "documentation": "https://www.home-assistant.io/integrations/radiotherm",
+        "requirements": [
+            "radiotherm==2.1.0",
+        ],
+        "codeowners": [
+            "@vinnyfuria",
+        ],
+        "iot_class": "local_polling",
+    },
+    "rainbird": {
+        "domain": "rainbird",
+        "name": "Rain Bird",
+        "documentation": "https://www.home-assistant.io/integrations/rainbird",
+        "requirements": [
+            "pyrainbird==0.4.3",
+        ],
+        "codeowners": [
+            "@konikvranik",
+        ],
+        "iot_class": "local_polling",
+    },
+    "raincloud": {
+        "domain": "raincloud",
+        "name": "Melnor RainCloud",
+        "documentation": "https://www.home-assistant.io/integrations/raincloud",
+        "requirements": [
+            "raincloudy==0.0.7",
+        ],
+        "codeowners": [
+            "@vanstinator",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "rainforest_eagle": {
+        "domain": "rainforest_eagle",
+        "name": "Rainforest Eagle-200",
+        "documentation": "https://www.home-assistant.io/integrations/rainforest_eagle",
+        "requirements": [
+            "eagle200_reader==0.2.4",
+            "uEagle==0.0.2",
+        ],
+        "codeowners": [
+            "@gtdiehl",
+            "@jcalbert",
+        ],
+        "iot_class": "local_polling",
+    },
+    "rainmachine": {
+        "domain": "rainmachine",
+        "name": "RainMachine",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/rainmachine",
+        "requirements": [
+            "regenmaschine==3.0.0",
+        ],
+        "codeowners": [
+            "@bachya",
+        ],
+        "iot_class": "local_polling",
+        "homekit": {
+            "models": [
+                "Touch HD",
+                "SPK5",
+            ],
+        },
+        "zeroconf": [
+            {
+                "type": "_http._tcp.local.",
+                "name": "rainmachine*",
+            },
+        ],
+    },
+    "random": {
+        "domain": "random",
+        "name": "Random",
+        "documentation": "https://www.home-assistant.io/integrations/random",
+        "codeowners": [
+            "@fabaff",
+        ],
+        "quality_scale": "internal",
+        "iot_class": "local_polling",
+    },
+    "raspihats": {
+        "domain": "raspihats",
+        "name": "Raspihats",
+        "documentation": "https://www.home-assistant.io/integrations/raspihats",
+        "requirements": [
+            "raspihats==2.2.3",
+            "smbus-cffi==0.5.1",
+        ],
+        "codeowners": [],
+        "iot_class": "local_push",
+    },
+    "raspyrfm": {
+        "domain": "raspyrfm",
+        "name": "RaspyRFM",
+        "documentation": "https://www.home-assistant.io/integrations/raspyrfm",
+        "requirements": [
+            "raspyrfm-client==1.2.8",
+        ],
+        "codeowners": [],
+        "iot_class": "assumed_state",
+    },
+    "recollect_waste": {
+        "domain": "recollect_waste",
+        "name": "ReCollect Waste",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/recollect_waste",
+        "requirements": [
+            "aiorecollect==1.0.5",
+        ],
+        "codeowners": [
+            "@bachya",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "recorder": {
+        "domain": "recorder",
+        "name": "Recorder",
+        "documentation": "https://www.home-assistant.io/integrations/recorder",
+        "requirements": [
+            "sqlalchemy==1.4.17",
+        ],
+        "codeowners": [],
+        "quality_scale": "internal",
+        "iot_class": "local_push",
+    },
+    "recswitch": {
+        "domain": "recswitch",
+        "name": "Ankuoo REC Switch",
+        "documentation": "https://www.home-assistant.io/integrations/recswitch",
+        "requirements": [
+            "pyrecswitch==1.0.2",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "reddit": {
+        "domain": "reddit",
+        "name": "Reddit",
+        "documentation": "https://www.home-assistant.io/integrations/reddit",
+        "requirements": [
+            "praw==7.2.0",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_polling",
+    },
+    "rejseplanen": {
+        "domain": "rejseplanen",
+        "name": "Rejseplanen",
+        "documentation": "https://www.home-assistant.io/integrations/rejseplanen",
+        "requirements": [
+            "rjpl==0.3.6",
+        ],
+        "codeowners": [
+            "@DarkFox",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "remember_the_milk": {
+        "domain": "remember_the_milk",
+        "name": "Remember The Milk",
+        "documentation": "https://www.home-assistant.io/integrations/remember_the_milk",
+        "requirements": [
+            "RtmAPI==0.7.2",
+            "httplib2==0.19.0",
+        ],
+        "dependencies": [
+            "configurator",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_push",
+    },
+    "remote": {
+        "domain": "remote",
+        "name": "Remote",
+        "documentation": "https://www.home-assistant.io/integrations/remote",
+        "codeowners": [],
+        "quality_scale": "internal",
+    },
+    "remote_rpi_gpio": {
+        "domain": "remote_rpi_gpio",
+        "name": "remote_rpi_gpio",
+        "documentation": "https://www.home-assistant.io/integrations/remote_rpi_gpio",
+        "requirements": [
+            "gpiozero==1.5.1",
+        ],
+        "codeowners": [],
+        "iot_class": "local_push",
+    },
+    "repetier": {
+        "domain": "repetier",
+        "name": "Repetier-Server",
+        "documentation": "https://www.home-assistant.io/integrations/repetier",
+        "requirements": [
+            "pyrepetier==3.0.5",
+        ],
+        "codeowners": [
+            "@MTrab",
+        ],
+        "iot_class": "local_polling",
+    },
+    "rest": {
+        "domain": "rest",
+        "name": "RESTful",
+        "documentation": "https://www.home-assistant.io/integrations/rest",
+        "requirements": [
+            "jsonpath==0.82",
+            "xmltodict==0.12.0",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "rest_command": {
+        "domain": "rest_command",
+        "name": "RESTful Command",
+        "documentation": "https://www.home-assistant.io/integrations/rest_command",
+        "codeowners": [],
+        "iot_class": "local_push",
+    },
+    "rflink": {
+        "domain": "rflink",
+        "name": "RFLink",
+        "documentation": "https://www.home-assistant.io/integrations/rflink",
+        "requirements": [
+            "rflink==0.0.58",
+        ],
+        "codeowners": [
+            "@javicalle",
+        ],
+        "iot_class": "assumed_state",
+    },
+    "rfxtrx": {
+        "domain": "rfxtrx",
+        "name": "RFXCOM RFXtrx",
+        "documentation": "https://www.home-assistant.io/integrations/rfxtrx",
+        "requirements": [
+            "pyRFXtrx==0.27.0",
+        ],
+        "codeowners": [
+            "@danielhiversen",
+            "@elupus",
+            "@RobBie1221",
+        ],
+        "config_flow": True,
+        "iot_class": "local_push",
+    },
+    "ring": {
+        "domain": "ring",
+        "name": "Ring",
+        "documentation": "https://www.home-assistant.io/integrations/ring",
+        "requirements": [
+            "ring_doorbell==0.6.2",
+        ],
+        "dependencies": [
+            "ffmpeg",
+        ],
+        "codeowners": [
+            "@balloob",
+        ],
+        "config_flow": True,
+        "dhcp": [
+            {
+                "hostname": "ring*",
+                "macaddress": "0CAE7D*",
+            },
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "ripple": {
+        "domain": "ripple",
+        "name": "Ripple",
+        "documentation": "https://www.home-assistant.io/integrations/ripple",
+        "requirements": [
+            "python-ripple-api==0.0.3",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_polling",
+    },
+    "risco": {
+        "domain": "risco",
+        "name": "Risco",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/risco",
+        "requirements": [
+            "pyrisco==0.3.1",
+        ],
+        "codeowners": [
+            "@OnFreund",
+        ],
+        "quality_scale": "platinum",
+        "iot_class": "cloud_polling",
+    },
+    "rituals_perfume_genie": {
+        "domain": "rituals_perfume_genie",
+        "name": "Rituals Perfume Genie",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/rituals_perfume_genie",
+        "requirements": [
+            "pyrituals==0.0.5",
+        ],
+        "codeowners": [
+            "@milanmeu",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "rmvtransport": {
+        "domain": "rmvtransport",
+        "name": "RMV",
+        "documentation": "https://www.home-assistant.io/integrations/rmvtransport",
+        "requirements": [
+            "PyRMVtransport==0.3.2",
+        ],
+        "codeowners": [
+            "@cgtobi",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "rocketchat": {
+        "domain": "rocketchat",
+        "name": "Rocket.Chat",
+        "documentation": "https://www.home-assistant.io/integrations/rocketchat",
+        "requirements": [
+            "rocketchat-API==0.6.1",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_push",
+    },
+    "roku": {
+        "domain": "roku",
+        "name": "Roku",
+        "documentation": "https://www.home-assistant.io/integrations/roku",
+        "requirements": [
+            "rokuecp==0.8.1",
+        ],
+        "homekit": {
+            "models": [
+                "3810X",
+                "4660X",
+                "7820X",
+                "C105X",
+                "C135X",
+            ],
+        },
+        "ssdp": [
+            {
+                "st": "roku:ecp",
+                "manufacturer": "Roku",
+                "deviceType": "urn:roku-com:device:player:1-0",
+            },
+        ],
+        "codeowners": [
+            "@ctalkington",
+        ],
+        "quality_scale": "silver",
+        "config_flow": True,
+        "iot_class": "local_polling",
+    },
+    "roomba": {
+        "domain": "roomba",
+        "name": "iRobot Roomba and Braava",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/roomba",
+        "requirements": [
+            "roombapy==1.6.3",
+        ],
+        "codeowners": [
+            "@pschmitt",
+            "@cyr-ius",
+            "@shenxn",
+        ],
+        "dhcp": [
+            {
+                "hostname": "irobot-*",
+                "macaddress": "501479*",
+            },
+            {
+                "hostname": "roomba-*",
+                "macaddress": "80A589*",
+            },
+        ],
+        "iot_class": "local_push",
+    },
+    "roon": {
+        "domain": "roon",
+        "name": "RoonLabs music player",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/roon",
+        "requirements": [
+            "roonapi==0.0.37",
+        ],
+        "codeowners": [
+            "@pavoni",
+        ],
+        "iot_class": "local_push",
+    },
+    "route53": {
+        "domain": "route53",
+        "name": "AWS Route53",
+        "documentation": "https://www.home-assistant.io/integrations/route53",
+        "requirements": [
+            "boto3==1.16.52",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_push",
+    },
+    "rova": {
+        "domain": "rova",
+        "name": "ROVA",
+        "documentation": "https://www.home-assistant.io/integrations/rova",
+        "requirements": [
+            "rova==0.2.1",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_polling",
+    },
+    "rpi_camera": {
+        "domain": "rpi_camera",
+        "name": "Raspberry Pi Camera",
+        "documentation": "https://www.home-assistant.io/integrations/rpi_camera",
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "rpi_gpio": {
+        "domain": "rpi_gpio",
+        "name": "Raspberry Pi GPIO",
+        "documentation": "https://www.home-assistant.io/integrations/rpi_gpio",
+        "requirements": [
+            "RPi.GPIO==0.7.1a4",
+        ],
+        "codeowners": [],
+        "iot_class": "local_push",
+    },
+    "rpi_gpio_pwm": {
+        "domain": "rpi_gpio_pwm",
+        "name": "pigpio Daemon PWM LED",
+        "documentation": "https://www.home-assistant.io/integrations/rpi_gpio_pwm",
+        "requirements": [
+            "pwmled==1.6.7",
+        ],
+        "codeowners": [
+            "@soldag",
+        ],
+        "iot_class": "local_push",
+    },
+    "rpi_pfio": {
+        "domain": "rpi_pfio",
+        "name": "PiFace Digital I/O (PFIO)",
+        "documentation": "https://www.home-assistant.io/integrations/rpi_pfio",
+        "requirements": [
+            "pifacecommon==4.2.2",
+            "pifacedigitalio==3.0.5",
+        ],
+        "codeowners": [],
+        "iot_class": "local_push",
+    },
+    "rpi_power": {
+        "domain": "rpi_power",
+        "name": "Raspberry Pi Power Supply Checker",
+        "documentation": "https://www.home-assistant.io/integrations/rpi_power",
+        "codeowners": [
+            "@shenxn",
+            "@swetoast",
+        ],
+        "requirements": [
+            "rpi-bad-power==0.1.0",
+        ],
+        "config_flow": True,
+        "iot_class": "local_polling",
+    },
+    "rpi_rf": {
+        "domain": "rpi_rf",
+        "name": "Raspberry Pi RF",
+        "documentation": "https://www.home-assistant.io/integrations/rpi_rf",
+        "requirements": [
+            "rpi-rf==0.9.7",
+        ],
+        "codeowners": [],
+        "iot_class": "assumed_state",
+    },
+    "rss_feed_template": {
+        "domain": "rss_feed_template",
+        "name": "RSS Feed Template",
+        "documentation": "https://www.home-assistant.io/integrations/rss_feed_template",
+        "dependencies": [
+            "http",
+        ],
+        "codeowners": [],
+        "quality_scale": "internal",
+        "iot_class": "local_push",
+    },
+    "rtorrent": {
+        "domain": "rtorrent",
+        "name": "rTorrent",
+        "documentation": "https://www.home-assistant.io/integrations/rtorrent",
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "ruckus_unleashed": {
+        "domain": "ruckus_unleashed",
+        "name": "Ruckus Unleashed",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/ruckus_unleashed",
+        "requirements": [
+            "pyruckus==0.12",
+        ],
+        "codeowners": [
+            "@gabe565",
+        ],
+        "iot_class": "local_polling",
+    },
+    "russound_rio": {
+        "domain": "russound_rio",
+        "name": "Russound RIO",
+        "documentation": "https://www.home-assistant.io/integrations/russound_rio",
+        "requirements": [
+            "russound_rio==0.1.7",
+        ],
+        "codeowners": [],
+        "iot_class": "local_push",
+    },
+    "russound_rnet": {
+        "domain": "russound_rnet",
+        "name": "Russound RNET",
+        "documentation": "https://www.home-assistant.io/integrations/russound_rnet",
+        "requirements": [
+            "russound==0.1.9",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "sabnzbd": {
+        "domain": "sabnzbd",
+        "name": "SABnzbd",
+        "documentation": "https://www.home-assistant.io/integrations/sabnzbd",
+        "requirements": [
+            "pysabnzbd==1.1.0",
+        ],
+        "dependencies": [
+            "configurator",
+        ],
+        "after_dependencies": [
+            "discovery",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "safe_mode": {
+        "domain": "safe_mode",
+        "name": "Safe Mode",
+        "config_flow": False,
+        "documentation": "https://www.home-assistant.io/integrations/safe_mode",
+        "dependencies": [
+            "frontend",
+            "persistent_notification",
+            "cloud",
+        ],
+        "codeowners": [
+            "@home-assistant/core",
+        ],
+    },
+    "saj": {
+        "domain": "saj",
+        "name": "SAJ Solar Inverter",
+        "documentation": "https://www.home-assistant.io/integrations/saj",
+        "requirements": [
+            "pysaj==0.0.16",
+        ],
+        "codeowners": [
+            "@fredericvl",
+        ],
+        "iot_class": "local_polling",
+    },
+    "samsungtv": {
+        "domain": "samsungtv",
+        "name": "Samsung Smart TV",
+        "documentation": "https://www.home-assistant.io/integrations/samsungtv",
+        "requirements": [
+            "samsungctl[websocket]==0.7.1",
+            "samsungtvws==1.6.0",
+            "wakeonlan==2.0.1",
+        ],
+        "ssdp": [
+            {
+                "st": "urn:samsung.com:device:RemoteControlReceiver:1",
+            },
+        ],
+        "zeroconf": [
+            {
+                "type": "_airplay._tcp.local.",
+                "manufacturer": "samsung*",
+            },
+        ],
+        "dhcp": [
+            {
+                "hostname": "tizen*",
+            },
+            {
+                "macaddress": "8CC8CD*",
+            },
+            {
+                "macaddress": "606BBD*",
+            },
+            {
+                "macaddress": "F47B5E*",
+            },
+            {
+                "macaddress": "4844F7*",
+            },
+        ],
+        "codeowners": [
+            "@escoand",
+            "@chemelli74",
+        ],
+        "config_flow": True,
+        "iot_class": "local_polling",
+    },
+    "satel_integra": {
+        "domain": "satel_integra",
+        "name": "Satel Integra",
+        "documentation": "https://www.home-assistant.io/integrations/satel_integra",
+        "requirements": [
+            "satel_integra==0.3.4",
+        ],
+        "codeowners": [],
+        "iot_class": "local_push",
+    },
+    "scene": {
+        "domain": "scene",
+        "name": "Scenes",
+        "documentation": "https://www.home-assistant.io/integrations/scene",
+        "codeowners": [
+            "@home-assistant/core",
+        ],
+        "quality_scale": "internal",
+    },
+    "schluter": {
+        "domain": "schluter",
+        "name": "Schluter",
+        "documentation": "https://www.home-assistant.io/integrations/schluter",
+        "requirements": [
+            "py-schluter==0.1.7",
+        ],
+        "codeowners": [
+            "@prairieapps",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "scrape": {
+        "domain": "scrape",
+        "name": "Scrape",
+        "documentation": "https://www.home-assistant.io/integrations/scrape",
+        "requirements": [
+            "beautifulsoup4==4.9.3",
+        ],
+        "after_dependencies": [
+            "rest",
+        ],
+        "codeowners": [
+            "@fabaff",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "screenlogic": {
+        "domain": "screenlogic",
+        "name": "Pentair ScreenLogic",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/screenlogic",
+        "requirements": [
+            "screenlogicpy==0.4.1",
+        ],
+        "codeowners": [
+            "@dieselrabbit",
+        ],
+        "dhcp": [
+            {
+                "hostname": "pentair: *",
+                "macaddress": "00C033*",
+            },
+        ],
+        "iot_class": "local_polling",
+    },
+    "script": {
+        "domain": "script",
+        "name": "Scripts",
+        "documentation": "https://www.home-assistant.io/integrations/script",
+        "dependencies": [
+            "blueprint",
+            "trace",
+        ],
+        "codeowners": [
+            "@home-assistant/core",
+        ],
+        "quality_scale": "internal",
+    },
+    "scsgate": {
+        "domain": "scsgate",
+        "name": "SCSGate",
+        "documentation": "https://www.home-assistant.io/integrations/scsgate",
+        "requirements": [
+            "scsgate==0.1.0",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "search": {
+        "domain": "search",
+        "name": "Search",
+        "documentation": "https://www.home-assistant.io/integrations/search",
+        "dependencies": [
+            "websocket_api",
+        ],
+        "after_dependencies": [
+            "scene",
+            "group",
+            "automation",
+            "script",
+        ],
+        "codeowners": [
+            "@home-assistant/core",
+        ],
+        "quality_scale": "internal",
+    },
+    "season": {
+        "domain": "season",
+        "name": "Season",
+        "documentation": "https://www.home-assistant.io/integrations/season",
+        "requirements": [
+            "ephem==3.7.7.0",
+        ],
+        "codeowners": [],
+        "quality_scale": "internal",
+        "iot_class": "local_polling",
+    },
+    "select": {
+        "domain": "select",
+        "name": "Select",
+        "documentation": "https://www.home-assistant.io/integrations/select",
+        "codeowners": [
+            "@home-assistant/core",
+        ],
+        "quality_scale": "internal",
+    },
+    "sendgrid": {
+        "domain": "sendgrid",
+        "name": "SendGrid",
+        "documentation": "https://www.home-assistant.io/integrations/sendgrid",
+        "requirements": [
+            "sendgrid==6.7.0",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_push",
+    },
+    "sense": {
+        "domain": "sense",
+        "name": "Sense",
+        "documentation": "https://www.home-assistant.io/integrations/sense",
+        "requirements": [
+            "sense_energy==0.9.0",
+        ],
+        "codeowners": [
+            "@kbickar",
+        ],
+        "config_flow": True,
+        "dhcp": [
+            {
+                "hostname": "sense-*",
+                "macaddress": "009D6B*",
+            },
+            {
+                "hostname": "sense-*",
+                "macaddress": "DCEFCA*",
+            },
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "sensehat": {
+        "domain": "sensehat",
+        "name": "Sense HAT",
+        "documentation": "https://www.home-assistant.io/integrations/sensehat",
+        "requirements": [
+            "sense-hat==2.2.0",
+        ],
+        "codeowners": [],
+        "iot_class": "assumed_state",
+    },
+    "sensibo": {
+        "domain": "sensibo",
+        "name": "Sensibo",
+        "documentation": "https://www.home-assistant.io/integrations/sensibo",
+        "requirements": [
+            "pysensibo==1.0.3",
+        ],
+        "codeowners": [
+            "@andrey-git",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "sensor": {
+        "domain": "sensor",
+        "name": "Sensor",
+        "documentation": "https://www.home-assistant.io/integrations/sensor",
+        "codeowners": [],
+        "quality_scale": "internal",
+        "after_dependencies": [
+            "recorder",
+        ],
+    },
+    "sentry": {
+        "domain": "sentry",
+        "name": "Sentry",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/sentry",
+        "requirements": [
+            "sentry-sdk==1.3.0",
+        ],
+        "codeowners": [
+            "@dcramer",
+            "@frenck",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "serial": {
+        "domain": "serial",
+        "name": "Serial",
+        "documentation": "https://www.home-assistant.io/integrations/serial",
+        "requirements": [
+            "pyserial-asyncio==0.5",
+        ],
+        "codeowners": [
+            "@fabaff",
+        ],
+        "iot_class": "local_polling",
+    },
+    "serial_pm": {
+        "domain": "serial_pm",
+        "name": "Serial Particulate Matter",
+        "documentation": "https://www.home-assistant.io/integrations/serial_pm",
+        "requirements": [
+            "pmsensor==0.4",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "sesame": {
+        "domain": "sesame",
+        "name": "Sesame Smart Lock",
+        "documentation": "https://www.home-assistant.io/integrations/sesame",
+        "requirements": [
+            "pysesame2==1.0.1",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_polling",
+    },
+    "seven_segments": {
+        "domain": "seven_segments",
+        "name": "Seven Segments OCR",
+        "documentation": "https://www.home-assistant.io/integrations/seven_segments",
+        "requirements": [
+            "pillow==8.2.0",
+        ],
+        "codeowners": [
+            "@fabaff",
+        ],
+        "iot_class": "local_polling",
+    },
+    "seventeentrack": {
+        "domain": "seventeentrack",
+        "name": "17TRACK",
+        "documentation": "https://www.home-assistant.io/integrations/seventeentrack",
+        "requirements": [
+            "py17track==3.2.1",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_polling",
+    },
+    "sharkiq": {
+        "domain": "sharkiq",
+        "name": "Shark IQ",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/sharkiq",
+        "requirements": [
+            "sharkiqpy==0.1.8",
+        ],
+        "codeowners": [
+            "@ajmarks",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "shell_command": {
+        "domain": "shell_command",
+        "name": "Shell Command",
+        "documentation": "https://www.home-assistant.io/integrations/shell_command",
+        "codeowners": [
+            "@home-assistant/core",
+        ],
+        "quality_scale": "internal",
+        "iot_class": "local_push",
+    },
+    "shelly": {
+        "domain": "shelly",
+        "name": "Shelly",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/shelly",
+        "requirements": [
+            "aioshelly==0.6.4",
+        ],
+        "zeroconf": [
+            {
+                "type": "_http._tcp.local.",
+                "name": "shelly*",
+            },
+        ],
+        "codeowners": [
+            "@balloob",
+            "@bieniu",
+            "@thecode",
+            "@chemelli74",
+        ],
+        "iot_class": "local_push",
+    },
+    "shiftr": {
+        "domain": "shiftr",
+        "name": "shiftr.io",
+        "documentation": "https://www.home-assistant.io/integrations/shiftr",
+        "requirements": [
+            "paho-mqtt==1.5.1",
+        ],
+        "codeowners": [
+            "@fabaff",
+        ],
+        "iot_class": "cloud_push",
+    },
+    "shodan": {
+        "domain": "shodan",
+        "name": "Shodan",
+        "documentation": "https://www.home-assistant.io/integrations/shodan",
+        "requirements": [
+            "shodan==1.25.0",
+        ],
+        "codeowners": [
+            "@fabaff",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "shopping_list": {
+        "domain": "shopping_list",
+        "name": "Shopping List",
+        "documentation": "https://www.home-assistant.io/integrations/shopping_list",
+        "dependencies": [
+            "http",
+        ],
+        "codeowners": [],
+        "config_flow": True,
+        "quality_scale": "internal",
+        "iot_class": "local_push",
+    },
+    "sht31": {
+        "domain": "sht31",
+        "name": "Sensirion SHT31",
+        "documentation": "https://www.home-assistant.io/integrations/sht31",
+        "requirements": [
+            "Adafruit-GPIO==1.0.3",
+            "Adafruit-SHT31==1.0.2",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "sia": {
+        "domain": "sia",
+        "name": "SIA Alarm Systems",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/sia",
+        "requirements": [
+            "pysiaalarm==3.0.0",
+        ],
+        "codeowners": [
+            "@eavanvalkenburg",
+        ],
+        "iot_class": "local_push",
+    },
+    "sigfox": {
+        "domain": "sigfox",
+        "name": "Sigfox",
+        "documentation": "https://www.home-assistant.io/integrations/sigfox",
+        "codeowners": [],
+        "iot_class": "cloud_polling",
+    },
+    "sighthound": {
+        "domain": "sighthound",
+        "name": "Sighthound",
+        "documentation": "https://www.home-assistant.io/integrations/sighthound",
+        "requirements": [
+            "pillow==8.2.0",
+            "simplehound==0.3",
+        ],
+        "codeowners": [
+            "@robmarkcole",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "signal_messenger": {
+        "domain": "signal_messenger",
+        "name": "Signal Messenger",
+        "documentation": "https://www.home-assistant.io/integrations/signal_messenger",
+        "codeowners": [
+            "@bbernhard",
+        ],
+        "requirements": [
+            "pysignalclirestapi==0.3.4",
+        ],
+        "iot_class": "cloud_push",
+    },
+    "simplepush": {
+        "domain": "simplepush",
+        "name": "Simplepush",
+        "documentation": "https://www.home-assistant.io/integrations/simplepush",
+        "requirements": [
+            "simplepush==1.1.4",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_polling",
+    },
+    "simplisafe": {
+        "domain": "simplisafe",
+        "name": "SimpliSafe",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/simplisafe",
+        "requirements": [
+            "simplisafe-python==11.0.1",
+        ],
+        "codeowners": [
+            "@bachya",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "simulated": {
+        "domain": "simulated",
+        "name": "Simulated",
+        "documentation": "https://www.home-assistant.io/integrations/simulated",
+        "codeowners": [],
+        "quality_scale": "internal",
+        "iot_class": "local_polling",
+    },
+    "sinch": {
+        "domain": "sinch",
+        "name": "Sinch SMS",
+        "documentation": "https://www.home-assistant.io/integrations/sinch",
+        "codeowners": [
+            "@bendikrb",
+        ],
+        "requirements": [
+            "clx-sdk-xms==1.0.0",
+        ],
+        "iot_class": "cloud_push",
+    },
+    "siren": {
+        "domain": "siren",
+        "name": "Siren",
+        "documentation": "https://www.home-assistant.io/integrations/siren",
+        "codeowners": [
+            "@home-assistant/core",
+            "@raman325",
+        ],
+        "quality_scale": "internal",
+    },
+    "sisyphus": {
+        "domain": "sisyphus",
+        "name": "Sisyphus",
+        "documentation": "https://www.home-assistant.io/integrations/sisyphus",
+        "requirements": [
+            "sisyphus-control==3.0",
+        ],
+        "codeowners": [
+            "@jkeljo",
+        ],
+        "iot_class": "local_push",
+    },
+    "sky_hub": {
+        "domain": "sky_hub",
+        "name": "Sky Hub",
+        "documentation": "https://www.home-assistant.io/integrations/sky_hub",
+        "requirements": [
+            "pyskyqhub==0.1.3",
+        ],
+        "codeowners": [
+            "@rogerselwyn",
+        ],
+        "iot_class": "local_polling",
+    },
+    "skybeacon": {
+        "domain": "skybeacon",
+        "name": "Skybeacon",
+        "documentation": "https://www.home-assistant.io/integrations/skybeacon",
+        "requirements": [
+            "pygatt[GATTTOOL]==4.0.5",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "skybell": {
+        "domain": "skybell",
+        "name": "SkyBell",
+        "documentation": "https://www.home-assistant.io/integrations/skybell",
+        "requirements": [
+            "skybellpy==0.6.3",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_polling",
+    },
+    "slack": {
+        "domain": "slack",
+        "name": "Slack",
+        "documentation": "https://www.home-assistant.io/integrations/slack",
+        "requirements": [
+            "slackclient==2.5.0",
+        ],
+        "codeowners": [
+            "@bachya",
+        ],
+        "iot_class": "cloud_push",
+    },
+    "sleepiq": {
+        "domain": "sleepiq",
+        "name": "SleepIQ",
+        "documentation": "https://www.home-assistant.io/integrations/sleepiq",
+        "requirements": [
+            "sleepyq==0.8.1",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_polling",
+    },
+    "slide": {
+        "domain": "slide",
+        "name": "Slide",
+        "documentation": "https://www.home-assistant.io/integrations/slide",
+        "requirements": [
+            "goslide-api==0.5.1",
+        ],
+        "codeowners": [
+            "@ualex73",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "sma": {
+        "domain": "sma",
+        "name": "SMA Solar",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/sma",
+        "requirements": [
+            "pysma==0.6.4",
+        ],
+        "codeowners": [
+            "@kellerza",
+            "@rklomp",
+        ],
+        "iot_class": "local_polling",
+    },
+    "smappee": {
+        "domain": "smappee",
+        "name": "Smappee",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/smappee",
+        "dependencies": [
+            "http",
+        ],
+        "requirements": [
+            "pysmappee==0.2.25",
+        ],
+        "codeowners": [
+            "@bsmappee",
+        ],
+        "zeroconf": [
+            {
+                "type": "_ssh._tcp.local.",
+                "name": "smappee1*",
+            },
+            {
+                "type": "_ssh._tcp.local.",
+                "name": "smappee2*",
+            },
+            {
+                "type": "_ssh._tcp.local.",
+                "name": "smappee50*",
+            },
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "smart_meter_texas": {
+        "domain": "smart_meter_texas",
+        "name": "Smart Meter Texas",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/smart_meter_texas",
+        "requirements": [
+            "smart-meter-texas==0.4.0",
+        ],
+        "codeowners": [
+            "@grahamwetzler",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "smarthab": {
+        "domain": "smarthab",
+        "name": "SmartHab",
+        "documentation": "https://www.home-assistant.io/integrations/smarthab",
+        "config_flow": True,
+        "requirements": [
+            "smarthab==0.21",
+        ],
+        "codeowners": [
+            "@outadoc",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "smartthings": {
+        "domain": "smartthings",
+        "name": "SmartThings",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/smartthings",
+        "requirements": [
+            "pysmartapp==0.3.3",
+            "pysmartthings==0.7.6",
+        ],
+        "dependencies": [
+            "webhook",
+        ],
+        "after_dependencies": [
+            "cloud",
+        ],
+        "codeowners": [
+            "@andrewsayre",
+        ],
+        "iot_class": "cloud_push",
+        "dhcp": [
+            {
+                "hostname": "st*",
+                "macaddress": "24FD5B*",
+            },
+            {
+                "hostname": "smartthings*",
+                "macaddress": "24FD5B*",
+            },
+            {
+                "hostname": "hub*",
+                "macaddress": "24FD5B*",
+            },
+            {
+                "hostname": "hub*",
+                "macaddress": "D052A8*",
+            },
+            {
+                "hostname": "hub*",
+                "macaddress": "286D97*",
+            },
+        ],
+    },
+    "smarttub": {
+        "domain": "smarttub",
+        "name": "SmartTub",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/smarttub",
+        "dependencies": [],
+        "codeowners": [
+            "@mdz",
+        ],
+        "requirements": [
+            "python-smarttub==0.0.25",
+        ],
+        "quality_scale": "platinum",
+        "iot_class": "cloud_polling",
+    },
+    "smarty": {
+        "domain": "smarty",
+        "name": "Salda Smarty",
+        "documentation": "https://www.home-assistant.io/integrations/smarty",
+        "requirements": [
+            "pysmarty==0.8",
+        ],
+        "codeowners": [
+            "@z0mbieprocess",
+        ],
+        "iot_class": "local_polling",
+    },
+    "smhi": {
+        "domain": "smhi",
+        "name": "SMHI",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/smhi",
+        "requirements": [
+            "smhi-pkg==1.0.15",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_polling",
+    },
+    "sms": {
+        "domain": "sms",
+        "name": "SMS notifications via GSM-modem",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/sms",
+        "requirements": [
+            "python-gammu==3.1",
+        ],
+        "codeowners": [
+            "@ocalvo",
+        ],
+        "iot_class": "local_polling",
+    },
+    "smtp": {
+        "domain": "smtp",
+        "name": "SMTP",
+        "documentation": "https://www.home-assistant.io/integrations/smtp",
+        "codeowners": [
+            "@fabaff",
+        ],
+        "iot_class": "cloud_push",
+    },
+    "snapcast": {
+        "domain": "snapcast",
+        "name": "Snapcast",
+        "documentation": "https://www.home-assistant.io/integrations/snapcast",
+        "requirements": [
+            "snapcast==2.1.3",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "snips": {
+        "domain": "snips",
+        "name": "Snips",
+        "documentation": "https://www.home-assistant.io/integrations/snips",
+        "dependencies": [
+            "mqtt",
+        ],
+        "codeowners": [],
+        "iot_class": "local_push",
+    },
+    "snmp": {
+        "domain": "snmp",
+        "name": "SNMP",
+        "documentation": "https://www.home-assistant.io/integrations/snmp",
+        "requirements": [
+            "pysnmp==4.4.12",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "sochain": {
+        "domain": "sochain",
+        "name": "SoChain",
+        "documentation": "https://www.home-assistant.io/integrations/sochain",
+        "requirements": [
+            "python-sochain-api==0.0.2",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_polling",
+    },
+    "solaredge": {
+        "domain": "solaredge",
+        "name": "SolarEdge",
+        "documentation": "https://www.home-assistant.io/integrations/solaredge",
+        "requirements": [
+            "solaredge==0.0.2",
+            "stringcase==1.2.0",
+        ],
+        "config_flow": True,
+        "codeowners": [
+            "@frenck",
+        ],
+        "dhcp": [
+            {
+                "hostname": "target",
+                "macaddress": "002702*",
+            },
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "solaredge_local": {
+        "domain": "solaredge_local",
+        "name": "SolarEdge Local",
+        "documentation": "https://www.home-assistant.io/integrations/solaredge_local",
+        "requirements": [
+            "solaredge-local==0.2.0",
+        ],
+        "codeowners": [
+            "@drobtravels",
+            "@scheric",
+        ],
+        "iot_class": "local_polling",
+    },
+    "solarlog": {
+        "domain": "solarlog",
+        "name": "Solar-Log",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/solarlog",
+        "codeowners": [
+            "@Ernst79",
+        ],
+        "requirements": [
+            "sunwatcher==0.2.1",
+        ],
+        "iot_class": "local_polling",
+    },
+    "solax": {
+        "domain": "solax",
+        "name": "SolaX Power",
+        "documentation": "https://www.home-assistant.io/integrations/solax",
+        "requirements": [
+            "solax==0.2.6",
+        ],
+        "codeowners": [
+            "@squishykid",
+        ],
+        "iot_class": "local_polling",
+    },
+    "soma": {
+        "domain": "soma",
+        "name": "Soma Connect",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/soma",
+        "codeowners": [
+            "@ratsept",
+        ],
+        "requirements": [
+            "pysoma==0.0.10",
+        ],
+        "iot_class": "local_polling",
+    },
+    "somfy": {
+        "domain": "somfy",
+        "name": "Somfy",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/somfy",
+        "dependencies": [
+            "http",
+        ],
+        "codeowners": [
+            "@tetienne",
+        ],
+        "requirements": [
+            "pymfy==0.11.0",
+        ],
+        "zeroconf": [
+            {
+                "type": "_kizbox._tcp.local.",
+                "name": "gateway*",
+            },
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "somfy_mylink": {
+        "domain": "somfy_mylink",
+        "name": "Somfy MyLink",
+        "documentation": "https://www.home-assistant.io/integrations/somfy_mylink",
+        "requirements": [
+            "somfy-mylink-synergy==1.0.6",
+        ],
+        "codeowners": [],
+        "config_flow": True,
+        "dhcp": [
+            {
+                "hostname": "somfy_*",
+                "macaddress": "B8B7F1*",
+            },
+        ],
+        "iot_class": "assumed_state",
+    },
+    "sonarr": {
+        "domain": "sonarr",
+        "name": "Sonarr",
+        "documentation": "https://www.home-assistant.io/integrations/sonarr",
+        "codeowners": [
+            "@ctalkington",
+        ],
+        "requirements": [
+            "sonarr==0.3.0",
+        ],
+        "config_flow": True,
+        "quality_scale": "silver",
+        "iot_class": "local_polling",
+    },
+    "songpal": {
+        "domain": "songpal",
+        "name": "Sony Songpal",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/songpal",
+        "requirements": [
+            "python-songpal==0.12",
+        ],
+        "codeowners": [
+            "@rytilahti",
+            "@shenxn",
+        ],
+        "ssdp": [
+            {
+                "st": "urn:schemas-sony-com:service:ScalarWebAPI:1",
+                "manufacturer": "Sony Corporation",
+            },
+        ],
+        "quality_scale": "gold",
+        "iot_class": "local_push",
+    },
+    "sonos": {
+        "domain": "sonos",
+        "name": "Sonos",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/sonos",
+        "requirements": [
+            "pysonos==0.0.52",
+        ],
+        "dependencies": [
+            "ssdp",
+        ],
+        "after_dependencies": [
+            "plex",
+            "zeroconf",
+        ],
+        "zeroconf": [
+            "_sonos._tcp.local.",
+        ],
+        "ssdp": [
+            {
+                "st": "urn:schemas-upnp-org:device:ZonePlayer:1",
+            },
+        ],
+        "codeowners": [
+            "@cgtobi",
+            "@jjlawren",
+        ],
+        "iot_class": "local_push",
+    },
+    "sony_projector": {
+        "domain": "sony_projector",
+        "name": "Sony Projector",
+        "documentation": "https://www.home-assistant.io/integrations/sony_projector",
+        "requirements": [
+            "pysdcp==1",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "soundtouch": {
+        "domain": "soundtouch",
+        "name": "Bose Soundtouch",
+        "documentation": "https://www.home-assistant.io/integrations/soundtouch",
+        "requirements": [
+            "libsoundtouch==0.8",
+        ],
+        "after_dependencies": [
+            "zeroconf",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "spaceapi": {
+        "domain": "spaceapi",
+        "name": "Space API",
+        "documentation": "https://www.home-assistant.io/integrations/spaceapi",
+        "dependencies": [
+            "http",
+        ],
+        "codeowners": [
+            "@fabaff",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "spc": {
+        "domain": "spc",
+        "name": "Vanderbilt SPC",
+        "documentation": "https://www.home-assistant.io/integrations/spc",
+        "requirements": [
+            "pyspcwebgw==0.4.0",
+        ],
+        "codeowners": [],
+        "iot_class": "local_push",
+    },
+    "speedtestdotnet": {
+        "domain": "speedtestdotnet",
+        "name": "Speedtest.net",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/speedtestdotnet",
+        "requirements": [
+            "speedtest-cli==2.1.3",
+        ],
+        "codeowners": [
+            "@rohankapoorcom",
+            "@engrbm87",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "spider": {
+        "domain": "spider",
+        "name": "Itho Daalderop Spider",
+        "documentation": "https://www.home-assistant.io/integrations/spider",
+        "requirements": [
+            "spiderpy==1.4.2",
+        ],
+        "codeowners": [
+            "@peternijssen",
+        ],
+        "config_flow": True,
+        "iot_class": "cloud_polling",
+    },
+    "splunk": {
+        "domain": "splunk",
+        "name": "Splunk",
+        "documentation": "https://www.home-assistant.io/integrations/splunk",
+        "requirements": [
+            "hass_splunk==0.1.1",
+        ],
+        "codeowners": [
+            "@Bre77",
+        ],
+        "iot_class": "local_push",
+    },
+    "spotify": {
+        "domain": "spotify",
+        "name": "Spotify",
+        "documentation": "https://www.home-assistant.io/integrations/spotify",
+        "requirements": [
+            "spotipy==2.18.0",
+        ],
+        "zeroconf": [
+            "_spotify-connect._tcp.local.",
+        ],
+        "dependencies": [
+            "http",
+        ],
+        "codeowners": [
+            "@frenck",
+        ],
+        "config_flow": True,
+        "quality_scale": "silver",
+        "iot_class": "cloud_polling",
+    },
+    "sql": {
+        "domain": "sql",
+        "name": "SQL",
+        "documentation": "https://www.home-assistant.io/integrations/sql",
+        "requirements": [
+            "sqlalchemy==1.4.17",
+        ],
+        "codeowners": [
+            "@dgomes",
+        ],
+        "iot_class": "local_polling",
+    },
+    "squeezebox": {
+        "domain": "squeezebox",
+        "name": "Logitech Squeezebox",
+        "documentation": "https://www.home-assistant.io/integrations/squeezebox",
+        "codeowners": [
+            "@rajlaud",
+        ],
+        "requirements": [
+            "pysqueezebox==0.5.5",
+        ],
+        "config_flow": True,
+        "dhcp": [
+            {
+                "hostname": "squeezebox*",
+                "macaddress": "000420*",
+            },
+        ],
+        "iot_class": "local_polling",
+    },
+    "srp_energy": {
+        "domain": "srp_energy",
+        "name": "SRP Energy",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/srp_energy",
+        "requirements": [
+            "srpenergy==1.3.2",
+        ],
+        "codeowners": [
+            "@briglx",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "ssdp": {
+        "domain": "ssdp",
+        "name": "Simple Service Discovery Protocol (SSDP)",
+        "documentation": "https://www.home-assistant.io/integrations/ssdp",
+        "requirements": [
+            "defusedxml==0.7.1",
+            "async-upnp-client==0.19.0",
+        ],
+        "dependencies": [
+            "network",
+        ],
+        "after_dependencies": [
+            "zeroconf",
+        ],
+        "codeowners": [],
+        "quality_scale": "internal",
+        "iot_class": "local_push",
+    },
+    "starline": {
+        "domain": "starline",
+        "name": "StarLine",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/starline",
+        "requirements": [
+            "starline==0.1.5",
+        ],
+        "codeowners": [
+            "@anonym-tsk",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "starlingbank": {
+        "domain": "starlingbank",
+        "name": "Starling Bank",
+        "documentation": "https://www.home-assistant.io/integrations/starlingbank",
+        "requirements": [
+            "starlingbank==3.2",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_polling",
+    },
+    "startca": {
+        "domain": "startca",
+        "name": "Start.ca",
+        "documentation": "https://www.home-assistant.io/integrations/startca",
+        "requirements": [
+            "xmltodict==0.12.0",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_polling",
+    },
+    "statistics": {
+        "domain": "statistics",
+        "name": "Statistics",
+        "documentation": "https://www.home-assistant.io/integrations/statistics",
+        "after_dependencies": [
+            "recorder",
+        ],
+        "codeowners": [
+            "@fabaff",
+        ],
+        "quality_scale": "internal",
+        "iot_class": "local_polling",
+    },
+    "statsd": {
+        "domain": "statsd",
+        "name": "StatsD",
+        "documentation": "https://www.home-assistant.io/integrations/statsd",
+        "requirements": [
+            "statsd==3.2.1",
+        ],
+        "codeowners": [],
+        "iot_class": "local_push",
+    },
+    "steam_online": {
+        "domain": "steam_online",
+        "name": "Steam",
+        "documentation": "https://www.home-assistant.io/integrations/steam_online",
+        "requirements": [
+            "steamodd==4.21",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_polling",
+    },
+    "stiebel_eltron": {
+        "domain": "stiebel_eltron",
+        "name": "STIEBEL ELTRON",
+        "documentation": "https://www.home-assistant.io/integrations/stiebel_eltron",
+        "requirements": [
+            "pystiebeleltron==0.0.1.dev2",
+        ],
+        "dependencies": [
+            "modbus",
+        ],
+        "codeowners": [
+            "@fucm",
+        ],
+        "iot_class": "local_polling",
+    },
+    "stookalert": {
+        "domain": "stookalert",
+        "name": "RIVM Stookalert",
+        "documentation": "https://www.home-assistant.io/integrations/stookalert",
+        "codeowners": [
+            "@fwestenberg",
+        ],
+        "requirements": [
+            "stookalert==0.1.4",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "stream": {
+        "domain": "stream",
+        "name": "Stream",
+        "documentation": "https://www.home-assistant.io/integrations/stream",
+        "requirements": [
+            "av==8.0.3",
+        ],
+        "dependencies": [
+            "http",
+        ],
+        "codeowners": [
+            "@hunterjm",
+            "@uvjustin",
+            "@allenporter",
+        ],
+        "quality_scale": "internal",
+        "iot_class": "local_push",
+    },
+    "streamlabswater": {
+        "domain": "streamlabswater",
+        "name": "StreamLabs",
+        "documentation": "https://www.home-assistant.io/integrations/streamlabswater",
+        "requirements": [
+            "streamlabswater==1.0.1",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_polling",
+    },
+    "stt": {
+        "domain": "stt",
+        "name": "Speech-to-Text (STT)",
+        "documentation": "https://www.home-assistant.io/integrations/stt",
+        "dependencies": [
+            "http",
+        ],
+        "codeowners": [
+            "@pvizeli",
+        ],
+        "quality_scale": "internal",
+    },
+    "subaru": {
+        "domain": "subaru",
+        "name": "Subaru",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/subaru",
+        "requirements": [
+            "subarulink==0.3.12",
+        ],
+        "codeowners": [
+            "@G-Two",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "suez_water": {
+        "domain": "suez_water",
+        "name": "Suez Water",
+        "documentation": "https://www.home-assistant.io/integrations/suez_water",
+        "codeowners": [
+            "@ooii",
+        ],
+        "requirements": [
+            "pysuez==0.1.19",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "sun": {
+        "domain": "sun",
+        "name": "Sun",
+        "documentation": "https://www.home-assistant.io/integrations/sun",
+        "codeowners": [
+            "@Swamp-Ig",
+        ],
+        "quality_scale": "internal",
+        "iot_class": "calculated",
+    },
+    "supervisord": {
+        "domain": "supervisord",
+        "name": "Supervisord",
+        "documentation": "https://www.home-assistant.io/integrations/supervisord",
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "supla": {
+        "domain": "supla",
+        "name": "Supla",
+        "documentation": "https://www.home-assistant.io/integrations/supla",
+        "requirements": [
+            "asyncpysupla==0.0.5",
+        ],
+        "codeowners": [
+            "@mwegrzynek",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "surepetcare": {
+        "domain": "surepetcare",
+        "name": "Sure Petcare",
+        "documentation": "https://www.home-assistant.io/integrations/surepetcare",
+        "codeowners": [
+            "@benleb",
+            "@danielhiversen",
+        ],
+        "requirements": [
+            "surepy==0.6.0",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "swiss_hydrological_data": {
+        "domain": "swiss_hydrological_data",
+        "name": "Swiss Hydrological Data",
+        "documentation": "https://www.home-assistant.io/integrations/swiss_hydrological_data",
+        "requirements": [
+            "swisshydrodata==0.1.0",
+        ],
+        "codeowners": [
+            "@fabaff",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "swiss_public_transport": {
+        "domain": "swiss_public_transport",
+        "name": "Swiss public transport",
+        "documentation": "https://www.home-assistant.io/integrations/swiss_public_transport",
+        "requirements": [
+            "python_opendata_transport==0.2.1",
+        ],
+        "codeowners": [
+            "@fabaff",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "swisscom": {
+        "domain": "swisscom",
+        "name": "Swisscom Internet-Box",
+        "documentation": "https://www.home-assistant.io/integrations/swisscom",
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "switch": {
+        "domain": "switch",
+        "name": "Switch",
+        "documentation": "https://www.home-assistant.io/integrations/switch",
+        "codeowners": [],
+        "quality_scale": "internal",
+    },
+    "switchbot": {
+        "domain": "switchbot",
+        "name": "SwitchBot",
+        "documentation": "https://www.home-assistant.io/integrations/switchbot",
+        "requirements": [
+            "PySwitchbot==0.8.0",
+        ],
+        "codeowners": [
+            "@danielhiversen",
+        ],
+        "iot_class": "local_polling",
+    },
+    "switcher_kis": {
+        "domain": "switcher_kis",
+        "name": "Switcher",
+        "documentation": "https://www.home-assistant.io/integrations/switcher_kis/",
+        "codeowners": [
+            "@tomerfi",
+            "@thecode",
+        ],
+        "requirements": [
+            "aioswitcher==1.2.3",
+        ],
+        "iot_class": "local_push",
+    },
+    "switchmate": {
+        "domain": "switchmate",
+        "name": "Switchmate SimplySmart Home",
+        "documentation": "https://www.home-assistant.io/integrations/switchmate",
+        "requirements": [
+            "pySwitchmate==0.4.6",
+        ],
+        "codeowners": [
+            "@danielhiversen",
+        ],
+        "iot_class": "local_polling",
+    },
+    "syncthing": {
+        "domain": "syncthing",
+        "name": "Syncthing",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/syncthing",
+        "requirements": [
+            "aiosyncthing==0.5.1",
+        ],
+        "codeowners": [
+            "@zhulik",
+        ],
+        "quality_scale": "silver",
+        "iot_class": "local_polling",
+    },
+    "syncthru": {
+        "domain": "syncthru",
+        "name": "Samsung SyncThru Printer",
+        "documentation": "https://www.home-assistant.io/integrations/syncthru",
+        "config_flow": True,
+        "requirements": [
+            "pysyncthru==0.7.3",
+            "url-normalize==1.4.1",
+        ],
+        "ssdp": [
+            {
+                "deviceType": "urn:schemas-upnp-org:device:Printer:1",
+                "manufacturer": "Samsung Electronics",
+            },
+        ],
+        "codeowners": [
+            "@nielstron",
+        ],
+        "iot_class": "local_polling",
+    },
+    "synology_chat": {
+        "domain": "synology_chat",
+        "name": "Synology Chat",
+        "documentation": "https://www.home-assistant.io/integrations/synology_chat",
+        "codeowners": [],
+        "iot_class": "cloud_push",
+    },
+    "synology_dsm": {
+        "domain": "synology_dsm",
+        "name": "Synology DSM",
+        "documentation": "https://www.home-assistant.io/integrations/synology_dsm",
+        "requirements": [
+            "synologydsm-api==1.0.2",
+        ],
+        "codeowners": [
+            "@hacf-fr",
+            "@Quentame",
+            "@mib1185",
+        ],
+        "config_flow": True,
+        "ssdp": [
+            {
+                "manufacturer": "Synology",
+                "deviceType": "urn:schemas-upnp-org:device:Basic:1",
+            },
+        ],
+        "iot_class": "local_polling",
+    },
+    "synology_srm": {
+        "domain": "synology_srm",
+        "name": "Synology SRM",
+        "documentation": "https://www.home-assistant.io/integrations/synology_srm",
+        "requirements": [
+            "synology-srm==0.2.0",
+        ],
+        "codeowners": [
+            "@aerialls",
+        ],
+        "iot_class": "local_polling",
+    },
+    "syslog": {
+        "domain": "syslog",
+        "name": "Syslog",
+        "documentation": "https://www.home-assistant.io/integrations/syslog",
+        "codeowners": [
+            "@fabaff",
+        ],
+        "iot_class": "local_push",
+    },
+    "system_bridge": {
+        "domain": "system_bridge",
+        "name": "System Bridge",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/system_bridge",
+        "requirements": [
+            "systembridge==1.1.5",
+        ],
+        "codeowners": [
+            "@timmo001",
+        ],
+        "zeroconf": [
+            "_system-bridge._udp.local.",
+        ],
+        "after_dependencies": [
+            "zeroconf",
+        ],
+        "quality_scale": "silver",
+        "iot_class": "local_polling",
+    },
+    "system_health": {
+        "domain": "system_health",
+        "name": "System Health",
+        "documentation": "https://www.home-assistant.io/integrations/system_health",
+        "dependencies": [
+            "http",
+        ],
+        "codeowners": [],
+        "quality_scale": "internal",
+    },
+    "system_log": {
+        "domain": "system_log",
+        "name": "System Log",
+        "documentation": "https://www.home-assistant.io/integrations/system_log",
+        "dependencies": [
+            "http",
+        ],
+        "codeowners": [],
+        "quality_scale": "internal",
+    },
+    "systemmonitor": {
+        "domain": "systemmonitor",
+        "name": "System Monitor",
+        "documentation": "https://www.home-assistant.io/integrations/systemmonitor",
+        "requirements": [
+            "psutil==5.8.0",
+        ],
+        "codeowners": [],
+        "iot_class": "local_push",
+    },
+    "tado": {
+        "domain": "tado",
+        "name": "Tado",
+        "documentation": "https://www.home-assistant.io/integrations/tado",
+        "requirements": [
+            "python-tado==0.10.0",
+        ],
+        "codeowners": [
+            "@michaelarnauts",
+            "@bdraco",
+            "@noltari",
+        ],
+        "config_flow": True,
+        "homekit": {
+            "models": [
+                "tado",
+                "AC02",
+            ],
+        },
+        "dhcp": [
+            {
+                "hostname": "tado*",
+            },
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "tag": {
+        "domain": "tag",
+        "name": "Tags",
+        "documentation": "https://www.home-assistant.io/integrations/tag",
+        "codeowners": [
+            "@balloob",
+            "@dmulcahey",
+        ],
+        "quality_scale": "internal",
+    },
+    "tahoma": {
+        "domain": "tahoma",
+        "name": "Tahoma",
+        "documentation": "https://www.home-assistant.io/integrations/tahoma",
+        "requirements": [
+            "tahoma-api==0.0.16",
+        ],
+        "codeowners": [
+            "@philklei",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "tank_utility": {
+        "domain": "tank_utility",
+        "name": "Tank Utility",
+        "documentation": "https://www.home-assistant.io/integrations/tank_utility",
+        "requirements": [
+            "tank_utility==1.4.0",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_polling",
+    },
+    "tankerkoenig": {
+        "domain": "tankerkoenig",
+        "name": "Tankerkoenig",
+        "documentation": "https://www.home-assistant.io/integrations/tankerkoenig",
+        "requirements": [
+            "pytankerkoenig==0.0.6",
+        ],
+        "codeowners": [
+            "@guillempages",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "tapsaff": {
+        "domain": "tapsaff",
+        "name": "Taps Aff",
+        "documentation": "https://www.home-assistant.io/integrations/tapsaff",
+        "requirements": [
+            "tapsaff==0.2.1",
+        ],
+        "codeowners": [
+            "@bazwilliams",
+        ],
+        "iot_class": "local_polling",
+    },
+    "tasmota": {
+        "domain": "tasmota",
+        "name": "Tasmota",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/tasmota",
+        "requirements": [
+            "hatasmota==0.2.20",
+        ],
+        "dependencies": [
+            "mqtt",
+        ],
+        "mqtt": [
+            "tasmota/discovery/#",
+        ],
+        "codeowners": [
+            "@emontnemery",
+        ],
+        "iot_class": "local_push",
+    },
+    "tautulli": {
+        "domain": "tautulli",
+        "name": "Tautulli",
+        "documentation": "https://www.home-assistant.io/integrations/tautulli",
+        "requirements": [
+            "pytautulli==0.5.0",
+        ],
+        "codeowners": [
+            "@ludeeus",
+        ],
+        "iot_class": "local_polling",
+    },
+    "tcp": {
+        "domain": "tcp",
+        "name": "TCP",
+        "documentation": "https://www.home-assistant.io/integrations/tcp",
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "ted5000": {
+        "domain": "ted5000",
+        "name": "The Energy Detective TED5000",
+        "documentation": "https://www.home-assistant.io/integrations/ted5000",
+        "requirements": [
+            "xmltodict==0.12.0",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "telegram": {
+        "domain": "telegram",
+        "name": "Telegram",
+        "documentation": "https://www.home-assistant.io/integrations/telegram",
+        "dependencies": [
+            "telegram_bot",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_polling",
+    },
+    "telegram_bot": {
+        "domain": "telegram_bot",
+        "name": "Telegram bot",
+        "documentation": "https://www.home-assistant.io/integrations/telegram_bot",
+        "requirements": [
+            "python-telegram-bot==13.1",
+            "PySocks==1.7.1",
+        ],
+        "dependencies": [
+            "http",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_push",
+    },
+    "tellduslive": {
+        "domain": "tellduslive",
+        "name": "Telldus Live",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/tellduslive",
+        "requirements": [
+            "tellduslive==0.10.11",
+        ],
+        "codeowners": [
+            "@fredrike",
+        ],
+        "quality_scale": "gold",
+        "iot_class": "cloud_polling",
+    },
+    "tellstick": {
+        "domain": "tellstick",
+        "name": "TellStick",
+        "documentation": "https://www.home-assistant.io/integrations/tellstick",
+        "requirements": [
+            "tellcore-net==0.4",
+            "tellcore-py==1.1.2",
+        ],
+        "codeowners": [],
+        "iot_class": "assumed_state",
+    },
+    "telnet": {
+        "domain": "telnet",
+        "name": "Telnet",
+        "documentation": "https://www.home-assistant.io/integrations/telnet",
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "temper": {
+        "domain": "temper",
+        "name": "TEMPer",
+        "documentation": "https://www.home-assistant.io/integrations/temper",
+        "requirements": [
+            "temperusb==1.5.3",
+        ],
+        "codeowners": [],
+        "iot_class": "local_push",
+    },
+    "template": {
+        "domain": "template",
+        "name": "Template",
+        "documentation": "https://www.home-assistant.io/integrations/template",
+        "codeowners": [
+            "@PhracturedBlue",
+            "@tetienne",
+            "@home-assistant/core",
+        ],
+        "quality_scale": "internal",
+        "after_dependencies": [
+            "group",
+        ],
+        "iot_class": "local_push",
+    },
+    "tensorflow": {
+        "domain": "tensorflow",
+        "name": "TensorFlow",
+        "documentation": "https://www.home-assistant.io/integrations/tensorflow",
+        "requirements": [
+            "tensorflow==2.3.0",
+            "tf-models-official==2.3.0",
+            "pycocotools==2.0.1",
+            "numpy==1.21.0",
+            "pillow==8.2.0",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "tesla": {
+        "domain": "tesla",
+        "name": "Tesla",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/tesla",
+        "requirements": [
+            "teslajsonpy==0.18.3",
+        ],
+        "codeowners": [
+            "@zabuldon",
+            "@alandtse",
+        ],
+        "dhcp": [
+            {
+                "hostname": "tesla_*",
+                "macaddress": "4CFCAA*",
+            },
+            {
+                "hostname": "tesla_*",
+                "macaddress": "044EAF*",
+            },
+            {
+                "hostname": "tesla_*",
+                "macaddress": "98ED5C*",
+            },
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "tfiac": {
+        "domain": "tfiac",
+        "name": "Tfiac",
+        "documentation": "https://www.home-assistant.io/integrations/tfiac",
+        "requirements": [
+            "pytfiac==0.4",
+        ],
+        "codeowners": [
+            "@fredrike",
+            "@mellado",
+        ],
+        "iot_class": "local_polling",
+    },
+    "thermoworks_smoke": {
+        "domain": "thermoworks_smoke",
+        "name": "ThermoWorks Smoke",
+        "documentation": "https://www.home-assistant.io/integrations/thermoworks_smoke",
+        "requirements": [
+            "stringcase==1.2.0",
+            "thermoworks_smoke==0.1.8",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_polling",
+    },
+    "thethingsnetwork": {
+        "domain": "thethingsnetwork",
+        "name": "The Things Network",
+        "documentation": "https://www.home-assistant.io/integrations/thethingsnetwork",
+        "codeowners": [
+            "@fabaff",
+        ],
+        "iot_class": "local_push",
+    },
+    "thingspeak": {
+        "domain": "thingspeak",
+        "name": "ThingSpeak",
+        "documentation": "https://www.home-assistant.io/integrations/thingspeak",
+        "requirements": [
+            "thingspeak==1.0.0",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_push",
+    },
+    "thinkingcleaner": {
+        "domain": "thinkingcleaner",
+        "name": "Thinking Cleaner",
+        "documentation": "https://www.home-assistant.io/integrations/thinkingcleaner",
+        "requirements": [
+            "pythinkingcleaner==0.0.3",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "thomson": {
+        "domain": "thomson",
+        "name": "Thomson",
+        "documentation": "https://www.home-assistant.io/integrations/thomson",
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "threshold": {
+        "domain": "threshold",
+        "name": "Threshold",
+        "documentation": "https://www.home-assistant.io/integrations/threshold",
+        "codeowners": [
+            "@fabaff",
+        ],
+        "quality_scale": "internal",
+        "iot_class": "local_polling",
+    },
+    "tibber": {
+        "domain": "tibber",
+        "name": "Tibber",
+        "documentation": "https://www.home-assistant.io/integrations/tibber",
+        "requirements": [
+            "pyTibber==0.18.0",
+        ],
+        "codeowners": [
+            "@danielhiversen",
+        ],
+        "quality_scale": "silver",
+        "config_flow": True,
+        "iot_class": "cloud_polling",
+    },
+    "tikteck": {
+        "domain": "tikteck",
+        "name": "Tikteck",
+        "documentation": "https://www.home-assistant.io/integrations/tikteck",
+        "requirements": [
+            "tikteck==0.4",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "tile": {
+        "domain": "tile",
+        "name": "Tile",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/tile",
+        "requirements": [
+            "pytile==5.2.2",
+        ],
+        "codeowners": [
+            "@bachya",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "time_date": {
+        "domain": "time_date",
+        "name": "Time & Date",
+        "documentation": "https://www.home-assistant.io/integrations/time_date",
+        "codeowners": [
+            "@fabaff",
+        ],
+        "quality_scale": "internal",
+        "iot_class": "local_push",
+    },
+    "timer": {
+        "domain": "timer",
+        "name": "Timer",
+        "documentation": "https://www.home-assistant.io/integrations/timer",
+        "codeowners": [],
+        "quality_scale": "internal",
+    },
+    "tmb": {
+        "domain": "tmb",
+        "name": "Transports Metropolitans de Barcelona",
+        "documentation": "https://www.home-assistant.io/integrations/tmb",
+        "requirements": [
+            "tmb==0.0.4",
+        ],
+        "codeowners": [
+            "@alemuro",
+        ],
+        "iot_class": "local_polling",
+    },
+    "tod": {
+        "domain": "tod",
+        "name": "Times of the Day",
+        "documentation": "https://www.home-assistant.io/integrations/tod",
+        "codeowners": [],
+        "quality_scale": "internal",
+        "iot_class": "local_push",
+    },
+    "todoist": {
+        "domain": "todoist",
+        "name": "Todoist",
+        "documentation": "https://www.home-assistant.io/integrations/todoist",
+        "requirements": [
+            "todoist-python==8.0.0",
+        ],
+        "codeowners": [
+            "@boralyl",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "tof": {
+        "domain": "tof",
+        "name": "Time of Flight",
+        "documentation": "https://www.home-assistant.io/integrations/tof",
+        "requirements": [
+            "VL53L1X2==0.1.5",
+        ],
+        "dependencies": [
+            "rpi_gpio",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "tomato": {
+        "domain": "tomato",
+        "name": "Tomato",
+        "documentation": "https://www.home-assistant.io/integrations/tomato",
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "toon": {
+        "domain": "toon",
+        "name": "Toon",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/toon",
+        "requirements": [
+            "toonapi==0.2.0",
+        ],
+        "dependencies": [
+            "http",
+        ],
+        "after_dependencies": [
+            "cloud",
+        ],
+        "codeowners": [
+            "@frenck",
+        ],
+        "dhcp": [
+            {
+                "hostname": "eneco-*",
+                "macaddress": "74C63B*",
+            },
+        ],
+        "iot_class": "cloud_push",
+    },
+    "torque": {
+        "domain": "torque",
+        "name": "Torque",
+        "documentation": "https://www.home-assistant.io/integrations/torque",
+        "dependencies": [
+            "http",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_polling",
+    },
+    "totalconnect": {
+        "domain": "totalconnect",
+        "name": "Total Connect",
+        "documentation": "https://www.home-assistant.io/integrations/totalconnect",
+        "requirements": [
+            "total_connect_client==0.57",
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@austinmroczek",
+        ],
+        "config_flow": True,
+        "iot_class": "cloud_polling",
+    },
+    "touchline": {
+        "domain": "touchline",
+        "name": "Roth Touchline",
+        "documentation": "https://www.home-assistant.io/integrations/touchline",
+        "requirements": [
+            "pytouchline==0.7",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "tplink": {
+        "domain": "tplink",
+        "name": "TP-Link Kasa Smart",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/tplink",
+        "requirements": [
+            "pyHS100==0.3.5.2",
+        ],
+        "codeowners": [
+            "@rytilahti",
+            "@thegardenmonkey",
+        ],
+        "iot_class": "local_polling",
+        "dhcp": [
+            {
+                "hostname": "hs*",
+                "macaddress": "1C3BF3*",
+            },
+            {
+                "hostname": "hs*",
+                "macaddress": "50C7BF*",
+            },
+            {
+                "hostname": "hs*",
+                "macaddress": "68FF7B*",
+            },
+            {
+                "hostname": "hs*",
+                "macaddress": "98DAC4*",
+            },
+            {
+                "hostname": "hs*",
+                "macaddress": "B09575*",
+            },
+            {
+                "hostname": "k[lp]*",
+                "macaddress": "1C3BF3*",
+            },
+            {
+                "hostname": "k[lp]*",
+                "macaddress": "50C7BF*",
+            },
+            {
+                "hostname": "k[lp]*",
+                "macaddress": "68FF7B*",
+            },
+            {
+                "hostname": "k[lp]*",
+                "macaddress": "98DAC4*",
+            },
+            {
+                "hostname": "k[lp]*",
+                "macaddress": "B09575*",
+            },
+            {
+                "hostname": "lb*",
+                "macaddress": "1C3BF3*",
+            },
+            {
+                "hostname": "lb*",
+                "macaddress": "50C7BF*",
+            },
+            {
+                "hostname": "lb*",
+                "macaddress": "68FF7B*",
+            },
+            {
+                "hostname": "lb*",
+                "macaddress": "98DAC4*",
+            },
+            {
+                "hostname": "lb*",
+                "macaddress": "B09575*",
+            },
+        ],
+    },
+    "tplink_lte": {
+        "domain": "tplink_lte",
+        "name": "TP-Link LTE",
+        "documentation": "https://www.home-assistant.io/integrations/tplink_lte",
+        "requirements": [
+            "tp-connected==0.0.4",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "traccar": {
+        "domain": "traccar",
+        "name": "Traccar",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/traccar",
+        "requirements": [
+            "pytraccar==0.9.0",
+            "stringcase==1.2.0",
+        ],
+        "dependencies": [
+            "webhook",
+        ],
+        "codeowners": [
+            "@ludeeus",
+        ],
+        "iot_class": "local_polling",
+    },
+    "trace": {
+        "domain": "trace",
+        "name": "Trace",
+        "documentation": "https://www.home-assistant.io/integrations/automation",
+        "codeowners": [
+            "@home-assistant/core",
+        ],
+        "quality_scale": "internal",
+    },
+    "trackr": {
+        "domain": "trackr",
+        "name": "TrackR",
+        "documentation": "https://www.home-assistant.io/integrations/trackr",
+        "requirements": [
+            "pytrackr==0.0.5",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_polling",
+    },
+    "tradfri": {
+        "domain": "tradfri",
+        "name": "IKEA TR\u00c5DFRI",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/tradfri",
+        "requirements": [
+            "pytradfri[async]==7.0.6",
+        ],
+        "homekit": {
+            "models": [
+                "TRADFRI",
+            ],
+        },
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "trafikverket_train": {
+        "domain": "trafikverket_train",
+        "name": "Trafikverket Train",
+        "documentation": "https://www.home-assistant.io/integrations/trafikverket_train",
+        "requirements": [
+            "pytrafikverket==0.1.6.2",
+        ],
+        "codeowners": [
+            "@endor-force",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "trafikverket_weatherstation": {
+        "domain": "trafikverket_weatherstation",
+        "name": "Trafikverket Weather Station",
+        "documentation": "https://www.home-assistant.io/integrations/trafikverket_weatherstation",
+        "requirements": [
+            "pytrafikverket==0.1.6.2",
+        ],
+        "codeowners": [
+            "@endor-force",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "transmission": {
+        "domain": "transmission",
+        "name": "Transmission",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/transmission",
+        "requirements": [
+            "transmissionrpc==0.11",
+        ],
+        "codeowners": [
+            "@engrbm87",
+            "@JPHutchins",
+        ],
+        "iot_class": "local_polling",
+    },
+    "transport_nsw": {
+        "domain": "transport_nsw",
+        "name": "Transport NSW",
+        "documentation": "https://www.home-assistant.io/integrations/transport_nsw",
+        "requirements": [
+            "PyTransportNSW==0.1.1",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_polling",
+    },
+    "travisci": {
+        "domain": "travisci",
+        "name": "Travis-CI",
+        "documentation": "https://www.home-assistant.io/integrations/travisci",
+        "requirements": [
+            "TravisPy==0.3.5",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_polling",
+    },
+    "trend": {
+        "domain": "trend",
+        "name": "Trend",
+        "documentation": "https://www.home-assistant.io/integrations/trend",
+        "requirements": [
+            "numpy==1.21.0",
+        ],
+        "codeowners": [],
+        "quality_scale": "internal",
+        "iot_class": "local_push",
+    },
+    "tts": {
+        "domain": "tts",
+        "name": "Text-to-Speech (TTS)",
+        "documentation": "https://www.home-assistant.io/integrations/tts",
+        "requirements": [
+            "mutagen==1.45.1",
+        ],
+        "dependencies": [
+            "http",
+        ],
+        "after_dependencies": [
+            "media_player",
+        ],
+        "codeowners": [
+            "@pvizeli",
+        ],
+        "quality_scale": "internal",
+    },
+    "tuya": {
+        "domain": "tuya",
+        "name": "Tuya",
+        "documentation": "https://www.home-assistant.io/integrations/tuya",
+        "requirements": [
+            "tuyaha==0.0.10",
+        ],
+        "codeowners": [
+            "@ollo69",
+        ],
+        "config_flow": True,
+        "iot_class": "cloud_polling",
+        "dhcp": [
+            {
+                "macaddress": "508A06*",
+            },
+            {
+                "macaddress": "7CF666*",
+            },
+            {
+                "macaddress": "10D561*",
+            },
+            {
+                "macaddress": "D4A651*",
+            },
+            {
+                "macaddress": "68572D*",
+            },
+            {
+                "macaddress": "1869D8*",
+            },
+        ],
+    },
+    "twentemilieu": {
+        "domain": "twentemilieu",
+        "name": "Twente Milieu",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/twentemilieu",
+        "requirements": [
+            "twentemilieu==0.3.0",
+        ],
+        "codeowners": [
+            "@frenck",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "twilio": {
+        "domain": "twilio",
+        "name": "Twilio",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/twilio",
+        "requirements": [
+            "twilio==6.32.0",
+        ],
+        "dependencies": [
+            "webhook",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_push",
+    },
+    "twilio_call": {
+        "domain": "twilio_call",
+        "name": "Twilio Call",
+        "documentation": "https://www.home-assistant.io/integrations/twilio_call",
+        "dependencies": [
+            "twilio",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_push",
+    },
+    "twilio_sms": {
+        "domain": "twilio_sms",
+        "name": "Twilio SMS",
+        "documentation": "https://www.home-assistant.io/integrations/twilio_sms",
+        "dependencies": [
+            "twilio",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_push",
+    },
+    "twinkly": {
+        "domain": "twinkly",
+        "name": "Twinkly",
+        "documentation": "https://www.home-assistant.io/integrations/twinkly",
+        "requirements": [
+            "twinkly-client==0.0.2",
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@dr1rrb",
+        ],
+        "config_flow": True,
+        "iot_class": "local_polling",
+    },
+    "twitch": {
+        "domain": "twitch",
+        "name": "Twitch",
+        "documentation": "https://www.home-assistant.io/integrations/twitch",
+        "requirements": [
+            "python-twitch-client==0.6.0",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_polling",
+    },
+    "twitter": {
+        "domain": "twitter",
+        "name": "Twitter",
+        "documentation": "https://www.home-assistant.io/integrations/twitter",
+        "requirements": [
+            "TwitterAPI==2.7.3",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_push",
+    },
+    "ubus": {
+        "domain": "ubus",
+        "name": "OpenWrt (ubus)",
+        "documentation": "https://www.home-assistant.io/integrations/ubus",
+        "requirements": [
+            "openwrt-ubus-rpc==0.0.2",
+        ],
+        "codeowners": [
+            "@noltari",
+        ],
+        "iot_class": "local_polling",
+    },
+    "ue_smart_radio": {
+        "domain": "ue_smart_radio",
+        "name": "Logitech UE Smart Radio",
+        "documentation": "https://www.home-assistant.io/integrations/ue_smart_radio",
+        "codeowners": [],
+        "iot_class": "cloud_polling",
+    },
+    "uk_transport": {
+        "domain": "uk_transport",
+        "name": "UK Transport",
+        "documentation": "https://www.home-assistant.io/integrations/uk_transport",
+        "codeowners": [],
+        "iot_class": "cloud_polling",
+    },
+    "unifi": {
+        "domain": "unifi",
+        "name": "Ubiquiti UniFi",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/unifi",
+        "requirements": [
+            "aiounifi==26",
+        ],
+        "codeowners": [
+            "@Kane610",
+        ],
+        "quality_scale": "platinum",
+        "ssdp": [
+            {
+                "manufacturer": "Ubiquiti Networks",
+                "deviceType": "urn:schemas-upnp-org:device:InternetGatewayDevice:1",
+                "modelDescription": "UniFi Dream Machine",
+            },
+            {
+                "manufacturer": "Ubiquiti Networks",
+                "deviceType": "urn:schemas-upnp-org:device:InternetGatewayDevice:1",
+                "modelDescription": "UniFi Dream Machine Pro",
+            },
+        ],
+        "iot_class": "local_push",
+    },
+    "unifi_direct": {
+        "domain": "unifi_direct",
+        "name": "Ubiquiti UniFi AP",
+        "documentation": "https://www.home-assistant.io/integrations/unifi_direct",
+        "requirements": [
+            "pexpect==4.6.0",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "unifiled": {
+        "domain": "unifiled",
+        "name": "Ubiquiti UniFi LED",
+        "documentation": "https://www.home-assistant.io/integrations/unifiled",
+        "codeowners": [
+            "@florisvdk",
+        ],
+        "requirements": [
+            "unifiled==0.11",
+        ],
+        "iot_class": "local_polling",
+    },
+    "universal": {
+        "domain": "universal",
+        "name": "Universal Media Player",
+        "documentation": "https://www.home-assistant.io/integrations/universal",
+        "codeowners": [],
+        "quality_scale": "internal",
+        "iot_class": "calculated",
+    },
+    "upb": {
+        "domain": "upb",
+        "name": "Universal Powerline Bus (UPB)",
+        "documentation": "https://www.home-assistant.io/integrations/upb",
+        "requirements": [
+            "upb_lib==0.4.12",
+        ],
+        "codeowners": [
+            "@gwww",
+        ],
+        "config_flow": True,
+        "iot_class": "local_push",
+    },
+    "upc_connect": {
+        "domain": "upc_connect",
+        "name": "UPC Connect Box",
+        "documentation": "https://www.home-assistant.io/integrations/upc_connect",
+        "requirements": [
+            "connect-box==0.2.8",
+        ],
+        "codeowners": [
+            "@pvizeli",
+            "@fabaff",
+        ],
+        "iot_class": "local_polling",
+    },
+    "upcloud": {
+        "domain": "upcloud",
+        "name": "UpCloud",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/upcloud",
+        "requirements": [
+            "upcloud-api==2.0.0",
+        ],
+        "codeowners": [
+            "@scop",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "updater": {
+        "domain": "updater",
+        "name": "Updater",
+        "documentation": "https://www.home-assistant.io/integrations/updater",
+        "requirements": [
+            "distro==1.5.0",
+        ],
+        "codeowners": [
+            "@home-assistant/core",
+        ],
+        "quality_scale": "internal",
+        "iot_class": "cloud_polling",
+    },
+    "upnp": {
+        "domain": "upnp",
+        "name": "UPnP/IGD",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/upnp",
+        "requirements": [
+            "async-upnp-client==0.19.0",
+        ],
+        "dependencies": [
+            "ssdp",
+        ],
+        "codeowners": [
+            "@StevenLooman",
+        ],
+        "ssdp": [
+            {
+                "st": "urn:schemas-upnp-org:device:InternetGatewayDevice:1",
+            },
+            {
+                "st": "urn:schemas-upnp-org:device:InternetGatewayDevice:2",
+            },
+        ],
+        "iot_class": "local_polling",
+    },
+    "uptime": {
+        "domain": "uptime",
+        "name": "Uptime",
+        "documentation": "https://www.home-assistant.io/integrations/uptime",
+        "codeowners": [],
+        "quality_scale": "internal",
+        "iot_class": "local_push",
+    },
+    "uptimerobot": {
+        "domain": "uptimerobot",
+        "name": "Uptime Robot",
+        "documentation": "https://www.home-assistant.io/integrations/uptimerobot",
+        "requirements": [
+            "pyuptimerobot==0.0.5",
+        ],
+        "codeowners": [
+            "@ludeeus",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "uscis": {
+        "domain": "uscis",
+        "name": "U.S. Citizenship and Immigration Services (USCIS)",
+        "documentation": "https://www.home-assistant.io/integrations/uscis",
+        "requirements": [
+            "uscisstatus==0.1.1",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_polling",
+    },
+    "usgs_earthquakes_feed": {
+        "domain": "usgs_earthquakes_feed",
+        "name": "U.S. Geological Survey Earthquake Hazards (USGS)",
+        "documentation": "https://www.home-assistant.io/integrations/usgs_earthquakes_feed",
+        "requirements": [
+            "geojson_client==0.6",
+        ],
+        "codeowners": [
+            "@exxamalte",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "utility_meter": {
+        "domain": "utility_meter",
+        "name": "Utility Meter",
+        "documentation": "https://www.home-assistant.io/integrations/utility_meter",
+        "codeowners": [
+            "@dgomes",
+        ],
+        "quality_scale": "internal",
+        "iot_class": "local_push",
+    },
+    "uvc": {
+        "domain": "uvc",
+        "name": "Ubiquiti UniFi Video",
+        "documentation": "https://www.home-assistant.io/integrations/uvc",
+        "requirements": [
+            "uvcclient==0.11.0",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "vacuum": {
+        "domain": "vacuum",
+        "name": "Vacuum",
+        "documentation": "https://www.home-assistant.io/integrations/vacuum",
+        "codeowners": [],
+        "quality_scale": "internal",
+    },
+    "vallox": {
+        "domain": "vallox",
+        "name": "Vallox",
+        "documentation": "https://www.home-assistant.io/integrations/vallox",
+        "requirements": [
+            "vallox-websocket-api==2.4.0",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "vasttrafik": {
+        "domain": "vasttrafik",
+        "name": "V\u00e4sttrafik",
+        "documentation": "https://www.home-assistant.io/integrations/vasttrafik",
+        "requirements": [
+            "vtjp==0.1.14",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_polling",
+    },
+    "velbus": {
+        "domain": "velbus",
+        "name": "Velbus",
+        "documentation": "https://www.home-assistant.io/integrations/velbus",
+        "requirements": [
+            "python-velbus==2.1.2",
+        ],
+        "config_flow": True,
+        "codeowners": [
+            "@Cereal2nd",
+            "@brefra",
+        ],
+        "iot_class": "local_push",
+    },
+    "velux": {
+        "domain": "velux",
+        "name": "Velux",
+        "documentation": "https://www.home-assistant.io/integrations/velux",
+        "requirements": [
+            "pyvlx==0.2.19",
+        ],
+        "codeowners": [
+            "@Julius2342",
+        ],
+        "iot_class": "local_polling",
+    },
+    "venstar": {
+        "domain": "venstar",
+        "name": "Venstar",
+        "documentation": "https://www.home-assistant.io/integrations/venstar",
+        "requirements": [
+            "venstarcolortouch==0.14",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "vera": {
+        "domain": "vera",
+        "name": "Vera",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/vera",
+        "requirements": [
+            "pyvera==0.3.13",
+        ],
+        "codeowners": [
+            "@pavoni",
+        ],
+        "iot_class": "local_polling",
+    },
+    "verisure": {
+        "domain": "verisure",
+        "name": "Verisure",
+        "documentation": "https://www.home-assistant.io/integrations/verisure",
+        "requirements": [
+            "vsure==1.7.3",
+        ],
+        "codeowners": [
+            "@frenck",
+        ],
+        "config_flow": True,
+        "dhcp": [
+            {
+                "macaddress": "0023C1*",
+            },
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "versasense": {
+        "domain": "versasense",
+        "name": "VersaSense",
+        "documentation": "https://www.home-assistant.io/integrations/versasense",
+        "codeowners": [
+            "@flamm3blemuff1n",
+        ],
+        "requirements": [
+            "pyversasense==0.0.6",
+        ],
+        "iot_class": "local_polling",
+    },
+    "version": {
+        "domain": "version",
+        "name": "Version",
+        "documentation": "https://www.home-assistant.io/integrations/version",
+        "requirements": [
+            "pyhaversion==21.7.0",
+        ],
+        "codeowners": [
+            "@fabaff",
+            "@ludeeus",
+        ],
+        "quality_scale": "internal",
+        "iot_class": "local_push",
+    },
+    "vesync": {
+        "domain": "vesync",
+        "name": "VeSync",
+        "documentation": "https://www.home-assistant.io/integrations/vesync",
+        "codeowners": [
+            "@markperdue",
+            "@webdjoe",
+            "@thegardenmonkey",
+        ],
+        "requirements": [
+            "pyvesync==1.4.0",
+        ],
+        "config_flow": True,
+        "iot_class": "cloud_polling",
+    },
+    "viaggiatreno": {
+        "domain": "viaggiatreno",
+        "name": "Trenitalia ViaggiaTreno",
+        "documentation": "https://www.home-assistant.io/integrations/viaggiatreno",
+        "codeowners": [],
+        "iot_class": "cloud_polling",
+    },
+    "vicare": {
+        "domain": "vicare",
+        "name": "Viessmann ViCare",
+        "documentation": "https://www.home-assistant.io/integrations/vicare",
+        "codeowners": [
+            "@oischinger",
+        ],
+        "requirements": [
+            "PyViCare==0.2.5",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "vilfo": {
+        "domain": "vilfo",
+        "name": "Vilfo Router",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/vilfo",
+        "requirements": [
+            "vilfo-api-client==0.3.2",
+        ],
+        "codeowners": [
+            "@ManneW",
+        ],
+        "iot_class": "local_polling",
+    },
+    "vivotek": {
+        "domain": "vivotek",
+        "name": "VIVOTEK",
+        "documentation": "https://www.home-assistant.io/integrations/vivotek",
+        "requirements": [
+            "libpyvivotek==0.4.0",
+        ],
+        "codeowners": [
+            "@HarlemSquirrel",
+        ],
+        "iot_class": "local_polling",
+    },
+    "vizio": {
+        "domain": "vizio",
+        "name": "VIZIO SmartCast",
+        "documentation": "https://www.home-assistant.io/integrations/vizio",
+        "requirements": [
+            "pyvizio==0.1.57",
+        ],
+        "codeowners": [
+            "@raman325",
+        ],
+        "config_flow": True,
+        "zeroconf": [
+            "_viziocast._tcp.local.",
+        ],
+        "quality_scale": "platinum",
+        "iot_class": "local_polling",
+    },
+    "vlc": {
+        "domain": "vlc",
+        "name": "VLC media player",
+        "documentation": "https://www.home-assistant.io/integrations/vlc",
+        "requirements": [
+            "python-vlc==1.1.2",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "vlc_telnet": {
+        "domain": "vlc_telnet",
+        "name": "VLC media player Telnet",
+        "documentation": "https://www.home-assistant.io/integrations/vlc_telnet",
+        "requirements": [
+            "python-telnet-vlc==2.0.1",
+        ],
+        "codeowners": [
+            "@rodripf",
+            "@dmcc",
+        ],
+        "iot_class": "local_polling",
+    },
+    "voicerss": {
+        "domain": "voicerss",
+        "name": "VoiceRSS",
+        "documentation": "https://www.home-assistant.io/integrations/voicerss",
+        "codeowners": [],
+        "iot_class": "cloud_push",
+    },
+    "volkszaehler": {
+        "domain": "volkszaehler",
+        "name": "Volkszaehler",
+        "documentation": "https://www.home-assistant.io/integrations/volkszaehler",
+        "requirements": [
+            "volkszaehler==0.2.1",
+        ],
+        "codeowners": [
+            "@fabaff",
+        ],
+        "iot_class": "local_polling",
+    },
+    "volumio": {
+        "domain": "volumio",
+        "name": "Volumio",
+        "documentation": "https://www.home-assistant.io/integrations/volumio",
+        "codeowners": [
+            "@OnFreund",
+        ],
+        "config_flow": True,
+        "zeroconf": [
+            "_Volumio._tcp.local.",
+        ],
+        "requirements": [
+            "pyvolumio==0.1.3",
+        ],
+        "iot_class": "local_polling",
+    },
+    "volvooncall": {
+        "domain": "volvooncall",
+        "name": "Volvo On Call",
+        "documentation": "https://www.home-assistant.io/integrations/volvooncall",
+        "requirements": [
+            "volvooncall==0.8.12",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_polling",
+    },
+    "vultr": {
+        "domain": "vultr",
+        "name": "Vultr",
+        "documentation": "https://www.home-assistant.io/integrations/vultr",
+        "requirements": [
+            "vultr==0.1.2",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_polling",
+    },
+    "w800rf32": {
+        "domain": "w800rf32",
+        "name": "WGL Designs W800RF32",
+        "documentation": "https://www.home-assistant.io/integrations/w800rf32",
+        "requirements": [
+            "pyW800rf32==0.1",
+        ],
+        "codeowners": [],
+        "iot_class": "local_push",
+    },
+    "wake_on_lan": {
+        "domain": "wake_on_lan",
+        "name": "Wake on LAN",
+        "documentation": "https://www.home-assistant.io/integrations/wake_on_lan",
+        "requirements": [
+            "wakeonlan==2.0.1",
+        ],
+        "codeowners": [
+            "@ntilley905",
+        ],
+        "iot_class": "local_push",
+    },
+    "wallbox": {
+        "domain": "wallbox",
+        "name": "Wallbox",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/wallbox",
+        "requirements": [
+            "wallbox==0.4.4",
+        ],
+        "ssdp": [],
+        "zeroconf": [],
+        "homekit": {},
+        "dependencies": [],
+        "codeowners": [
+            "@hesselonline",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "waqi": {
+        "domain": "waqi",
+        "name": "World Air Quality Index (WAQI)",
+        "documentation": "https://www.home-assistant.io/integrations/waqi",
+        "requirements": [
+            "waqiasync==1.0.0",
+        ],
+        "codeowners": [
+            "@andrey-git",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "water_heater": {
+        "domain": "water_heater",
+        "name": "Water Heater",
+        "documentation": "https://www.home-assistant.io/integrations/water_heater",
+        "codeowners": [],
+        "quality_scale": "internal",
+    },
+    "waterfurnace": {
+        "domain": "waterfurnace",
+        "name": "WaterFurnace",
+        "documentation": "https://www.home-assistant.io/integrations/waterfurnace",
+        "requirements": [
+            "waterfurnace==1.1.0",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_polling",
+    },
+    "watson_iot": {
+        "domain": "watson_iot",
+        "name": "IBM Watson IoT Platform",
+        "documentation": "https://www.home-assistant.io/integrations/watson_iot",
+        "requirements": [
+            "ibmiotf==0.3.4",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_push",
+    },
+    "watson_tts": {
+        "domain": "watson_tts",
+        "name": "IBM Watson TTS",
+        "documentation": "https://www.home-assistant.io/integrations/watson_tts",
+        "requirements": [
+            "ibm-watson==5.1.0",
+        ],
+        "codeowners": [
+            "@rutkai",
+        ],
+        "iot_class": "cloud_push",
+    },
+    "waze_travel_time": {
+        "domain": "waze_travel_time",
+        "name": "Waze Travel Time",
+        "documentation": "https://www.home-assistant.io/integrations/waze_travel_time",
+        "requirements": [
+            "WazeRouteCalculator==0.12",
+        ],
+        "codeowners": [],
+        "config_flow": True,
+        "iot_class": "cloud_polling",
+    },
+    "weather": {
+        "domain": "weather",
+        "name": "Weather",
+        "documentation": "https://www.home-assistant.io/integrations/weather",
+        "codeowners": [
+            "@fabaff",
+        ],
+        "quality_scale": "internal",
+    },
+    "webhook": {
+        "domain": "webhook",
+        "name": "Webhook",
+        "documentation": "https://www.home-assistant.io/integrations/webhook",
+        "dependencies": [
+            "http",
+        ],
+        "codeowners": [],
+        "quality_scale": "internal",
+    },
+    "webostv": {
+        "domain": "webostv",
+        "name": "LG webOS Smart TV",
+        "documentation": "https://www.home-assistant.io/integrations/webostv",
+        "requirements": [
+            "aiopylgtv==0.4.0",
+        ],
+        "dependencies": [
+            "configurator",
+        ],
+        "codeowners": [
+            "@bendavid",
+        ],
+        "iot_class": "local_polling",
+    },
+    "websocket_api": {
+        "domain": "websocket_api",
+        "name": "Home Assistant WebSocket API",
+        "documentation": "https://www.home-assistant.io/integrations/websocket_api",
+        "dependencies": [
+            "http",
+        ],
+        "codeowners": [
+            "@home-assistant/core",
+        ],
+        "quality_scale": "internal",
+    },
+    "wemo": {
+        "domain": "wemo",
+        "name": "Belkin WeMo",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/wemo",
+        "requirements": [
+            "pywemo==0.6.5",
+        ],
+        "ssdp": [
+            {
+                "manufacturer": "Belkin International Inc.",
+            },
+        ],
+        "homekit": {
+            "models": [
+                "Socket",
+                "Wemo",
+            ],
+        },
+        "codeowners": [
+            "@esev",
+        ],
+        "iot_class": "local_push",
+    },
+    "whois": {
+        "domain": "whois",
+        "name": "Whois",
+        "documentation": "https://www.home-assistant.io/integrations/whois",
+        "requirements": [
+            "python-whois==0.7.3",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_polling",
+    },
+    "wiffi": {
+        "domain": "wiffi",
+        "name": "Wiffi",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/wiffi",
+        "requirements": [
+            "wiffi==1.0.1",
+        ],
+        "codeowners": [
+            "@mampfes",
+        ],
+        "iot_class": "local_push",
+    },
+    "wilight": {
+        "domain": "wilight",
+        "name": "WiLight",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/wilight",
+        "requirements": [
+            "pywilight==0.0.70",
+        ],
+        "ssdp": [
+            {
+                "manufacturer": "All Automacao Ltda",
+            },
+        ],
+        "codeowners": [
+            "@leofig-rj",
+        ],
+        "quality_scale": "silver",
+        "iot_class": "local_polling",
+    },
+    "wink": {
+        "domain": "wink",
+        "name": "Wink",
+        "documentation": "https://www.home-assistant.io/integrations/wink",
+        "requirements": [
+            "pubnubsub-handler==1.0.9",
+            "python-wink==1.10.5",
+        ],
+        "dependencies": [
+            "configurator",
+            "http",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_polling",
+    },
+    "wirelesstag": {
+        "domain": "wirelesstag",
+        "name": "Wireless Sensor Tags",
+        "documentation": "https://www.home-assistant.io/integrations/wirelesstag",
+        "requirements": [
+            "wirelesstagpy==0.4.1",
+        ],
+        "codeowners": [],
+        "iot_class": "local_push",
+    },
+    "withings": {
+        "domain": "withings",
+        "name": "Withings",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/withings",
+        "requirements": [
+            "withings-api==2.3.2",
+        ],
+        "dependencies": [
+            "http",
+            "webhook",
+        ],
+        "codeowners": [
+            "@vangorra",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "wled": {
+        "domain": "wled",
+        "name": "WLED",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/wled",
+        "requirements": [
+            "wled==0.7.1",
+        ],
+        "zeroconf": [
+            "_wled._tcp.local.",
+        ],
+        "codeowners": [
+            "@frenck",
+        ],
+        "quality_scale": "platinum",
+        "iot_class": "local_push",
+    },
+    "wolflink": {
+        "domain": "wolflink",
+        "name": "Wolf SmartSet Service",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/wolflink",
+        "requirements": [
+            "wolf_smartset==0.1.11",
+        ],
+        "codeowners": [
+            "@adamkrol93",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "workday": {
+        "domain": "workday",
+        "name": "Workday",
+        "documentation": "https://www.home-assistant.io/integrations/workday",
+        "requirements": [
+            "holidays==0.11.1",
+        ],
+        "codeowners": [
+            "@fabaff",
+        ],
+        "quality_scale": "internal",
+        "iot_class": "local_polling",
+    },
+    "worldclock": {
+        "domain": "worldclock",
+        "name": "Worldclock",
+        "documentation": "https://www.home-assistant.io/integrations/worldclock",
+        "codeowners": [
+            "@fabaff",
+        ],
+        "quality_scale": "internal",
+        "iot_class": "local_push",
+    },
+    "worldtidesinfo": {
+        "domain": "worldtidesinfo",
+        "name": "World Tides",
+        "documentation": "https://www.home-assistant.io/integrations/worldtidesinfo",
+        "codeowners": [],
+        "iot_class": "cloud_polling",
+    },
+    "worxlandroid": {
+        "domain": "worxlandroid",
+        "name": "Worx Landroid",
+        "documentation": "https://www.home-assistant.io/integrations/worxlandroid",
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "wsdot": {
+        "domain": "wsdot",
+        "name": "Washington State Department of Transportation (WSDOT)",
+        "documentation": "https://www.home-assistant.io/integrations/wsdot",
+        "codeowners": [],
+        "iot_class": "cloud_polling",
+    },
+    "x10": {
+        "domain": "x10",
+        "name": "Heyu X10",
+        "documentation": "https://www.home-assistant.io/integrations/x10",
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "xbee": {
+        "domain": "xbee",
+        "name": "XBee",
+        "documentation": "https://www.home-assistant.io/integrations/xbee",
+        "requirements": [
+            "xbee-helper==0.0.7",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "xbox": {
+        "domain": "xbox",
+        "name": "Xbox",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/xbox",
+        "requirements": [
+            "xbox-webapi==2.0.11",
+        ],
+        "dependencies": [
+            "http",
+        ],
+        "codeowners": [
+            "@hunterjm",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "xbox_live": {
+        "domain": "xbox_live",
+        "name": "Xbox Live",
+        "documentation": "https://www.home-assistant.io/integrations/xbox_live",
+        "requirements": [
+            "xboxapi==2.0.1",
+        ],
+        "codeowners": [
+            "@MartinHjelmare",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "xeoma": {
+        "domain": "xeoma",
+        "name": "Xeoma",
+        "documentation": "https://www.home-assistant.io/integrations/xeoma",
+        "requirements": [
+            "pyxeoma==1.4.1",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "xiaomi": {
+        "domain": "xiaomi",
+        "name": "Xiaomi",
+        "documentation": "https://www.home-assistant.io/integrations/xiaomi",
+        "dependencies": [
+            "ffmpeg",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "xiaomi_aqara": {
+        "domain": "xiaomi_aqara",
+        "name": "Xiaomi Gateway (Aqara)",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/xiaomi_aqara",
+        "requirements": [
+            "PyXiaomiGateway==0.13.4",
+        ],
+        "after_dependencies": [
+            "discovery",
+        ],
+        "codeowners": [
+            "@danielhiversen",
+            "@syssi",
+        ],
+        "zeroconf": [
+            "_miio._udp.local.",
+        ],
+        "iot_class": "local_push",
+    },
+    "xiaomi_miio": {
+        "domain": "xiaomi_miio",
+        "name": "Xiaomi Miio",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/xiaomi_miio",
+        "requirements": [
+            "construct==2.10.56",
+            "micloud==0.3",
+            "python-miio==0.5.6",
+        ],
+        "codeowners": [
+            "@rytilahti",
+            "@syssi",
+            "@starkillerOG",
+        ],
+        "zeroconf": [
+            "_miio._udp.local.",
+        ],
+        "iot_class": "local_polling",
+    },
+    "xiaomi_tv": {
+        "domain": "xiaomi_tv",
+        "name": "Xiaomi TV",
+        "documentation": "https://www.home-assistant.io/integrations/xiaomi_tv",
+        "requirements": [
+            "pymitv==1.4.3",
+        ],
+        "codeowners": [
+            "@simse",
+        ],
+        "iot_class": "assumed_state",
+    },
+    "xmpp": {
+        "domain": "xmpp",
+        "name": "Jabber (XMPP)",
+        "documentation": "https://www.home-assistant.io/integrations/xmpp",
+        "requirements": [
+            "slixmpp==1.7.1",
+        ],
+        "codeowners": [
+            "@fabaff",
+            "@flowolf",
+        ],
+        "iot_class": "cloud_push",
+    },
+    "xs1": {
+        "domain": "xs1",
+        "name": "EZcontrol XS1",
+        "documentation": "https://www.home-assistant.io/integrations/xs1",
+        "requirements": [
+            "xs1-api-client==3.0.0",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "yale_smart_alarm": {
+        "domain": "yale_smart_alarm",
+        "name": "Yale Smart Living",
+        "documentation": "https://www.home-assistant.io/integrations/yale_smart_alarm",
+        "requirements": [
+            "yalesmartalarmclient==0.3.3",
+        ],
+        "codeowners": [
+            "@gjohansson-ST",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "yamaha": {
+        "domain": "yamaha",
+        "name": "Yamaha Network Receivers",
+        "documentation": "https://www.home-assistant.io/integrations/yamaha",
+        "requirements": [
+            "rxv==0.6.0",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "yamaha_musiccast": {
+        "domain": "yamaha_musiccast",
+        "name": "MusicCast",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/yamaha_musiccast",
+        "requirements": [
+            "aiomusiccast==0.8.0",
+        ],
+        "ssdp": [
+            {
+                "manufacturer": "Yamaha Corporation",
+            },
+        ],
+        "iot_class": "local_push",
+        "codeowners": [
+            "@vigonotion",
+            "@micha91",
+        ],
+    },
+    "yandex_transport": {
+        "domain": "yandex_transport",
+        "name": "Yandex Transport",
+        "documentation": "https://www.home-assistant.io/integrations/yandex_transport",
+        "requirements": [
+            "aioymaps==1.1.0",
+        ],
+        "codeowners": [
+            "@rishatik92",
+            "@devbis",
+        ],
+        "iot_class": "cloud_polling",
+    },
+    "yandextts": {
+        "domain": "yandextts",
+        "name": "Yandex TTS",
+        "documentation": "https://www.home-assistant.io/integrations/yandextts",
+        "codeowners": [],
+        "iot_class": "cloud_push",
+    },
+    "yeelight": {
+        "domain": "yeelight",
+        "name": "Yeelight",
+        "documentation": "https://www.home-assistant.io/integrations/yeelight",
+        "requirements": [
+            "yeelight==0.6.3",
+        ],
+        "codeowners": [
+            "@rytilahti",
+            "@zewelor",
+            "@shenxn",
+        ],
+        "config_flow": True,
+        "iot_class": "local_polling",
+        "dhcp": [
+            {
+                "hostname": "yeelink-*",
+            },
+        ],
+        "homekit": {
+            "models": [
+                "YLDP*",
+            ],
+        },
+    },
+    "yeelightsunflower": {
+        "domain": "yeelightsunflower",
+        "name": "Yeelight Sunflower",
+        "documentation": "https://www.home-assistant.io/integrations/yeelightsunflower",
+        "requirements": [
+            "yeelightsunflower==0.0.10",
+        ],
+        "codeowners": [
+            "@lindsaymarkward",
+        ],
+        "iot_class": "local_polling",
+    },
+    "yi": {
+        "domain": "yi",
+        "name": "Yi Home Cameras",
+        "documentation": "https://www.home-assistant.io/integrations/yi",
+        "requirements": [
+            "aioftp==0.12.0",
+        ],
+        "dependencies": [
+            "ffmpeg",
+        ],
+        "codeowners": [
+            "@bachya",
+        ],
+        "iot_class": "local_polling",
+    },
+    "zabbix": {
+        "domain": "zabbix",
+        "name": "Zabbix",
+        "documentation": "https://www.home-assistant.io/integrations/zabbix",
+        "requirements": [
+            "py-zabbix==1.1.7",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "zamg": {
+        "domain": "zamg",
+        "name": "Zentralanstalt f\u00fcr Meteorologie und Geodynamik (ZAMG)",
+        "documentation": "https://www.home-assistant.io/integrations/zamg",
+        "codeowners": [],
+        "iot_class": "cloud_polling",
+    },
+    "zengge": {
+        "domain": "zengge",
+        "name": "Zengge",
+        "documentation": "https://www.home-assistant.io/integrations/zengge",
+        "requirements": [
+            "zengge==0.2",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "zeroconf": {
+        "domain": "zeroconf",
+        "name": "Zero-configuration networking (zeroconf)",
+        "documentation": "https://www.home-assistant.io/integrations/zeroconf",
+        "requirements": [
+            "zeroconf==0.32.1",
+        ],
+        "dependencies": [
+            "network",
+            "api",
+        ],
+        "codeowners": [
+            "@bdraco",
+        ],
+        "quality_scale": "internal",
+        "iot_class": "local_push",
+    },
+    "zerproc": {
+        "domain": "zerproc",
+        "name": "Zerproc",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/zerproc",
+        "requirements": [
+            "pyzerproc==0.4.8",
+        ],
+        "codeowners": [
+            "@emlove",
+        ],
+        "iot_class": "local_polling",
+    },
+    "zestimate": {
+        "domain": "zestimate",
+        "name": "Zestimate",
+        "documentation": "https://www.home-assistant.io/integrations/zestimate",
+        "requirements": [
+            "xmltodict==0.12.0",
+        ],
+        "codeowners": [],
+        "iot_class": "cloud_polling",
+    },
+    "zha": {
+        "domain": "zha",
+        "name": "Zigbee Home Automation",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/zha",
+        "requirements": [
+            "bellows==0.25.0",
+            "pyserial==3.5",
+            "pyserial-asyncio==0.5",
+            "zha-quirks==0.0.59",
+            "zigpy-cc==0.5.2",
+            "zigpy-deconz==0.12.0",
+            "zigpy==0.35.2",
+            "zigpy-xbee==0.13.0",
+            "zigpy-zigate==0.7.3",
+            "zigpy-znp==0.5.1",
+        ],
+        "codeowners": [
+            "@dmulcahey",
+            "@adminiuga",
+        ],
+        "zeroconf": [
+            {
+                "type": "_esphomelib._tcp.local.",
+                "name": "tube*",
+            },
+        ],
+        "after_dependencies": [
+            "zeroconf",
+        ],
+        "iot_class": "local_polling",
+    },
+    "zhong_hong": {
+        "domain": "zhong_hong",
+        "name": "ZhongHong",
+        "documentation": "https://www.home-assistant.io/integrations/zhong_hong",
+        "requirements": [
+            "zhong_hong_hvac==1.0.9",
+        ],
+        "codeowners": [],
+        "iot_class": "local_push",
+    },
+    "ziggo_mediabox_xl": {
+        "domain": "ziggo_mediabox_xl",
+        "name": "Ziggo Mediabox XL",
+        "documentation": "https://www.home-assistant.io/integrations/ziggo_mediabox_xl",
+        "requirements": [
+            "ziggo-mediabox-xl==1.1.0",
+        ],
+        "codeowners": [],
+        "iot_class": "local_polling",
+    },
+    "zodiac": {
+        "domain": "zodiac",
+        "name": "Zodiac",
+        "documentation": "https://www.home-assistant.io/integrations/zodiac",
+        "codeowners": [
+            "@JulienTant",
+        ],
+        "quality_scale": "silver",
+        "iot_class": "local_polling",
+    },
+    "zone": {
+        "domain": "zone",
+        "name": "Zone",
+        "config_flow": False,
+        "documentation": "https://www.home-assistant.io/integrations/zone",
+        "codeowners": [
+            "@home-assistant/core",
+        ],
+        "quality_scale": "internal",
+    },
+    "zoneminder": {
+        "domain": "zoneminder",
+        "name": "ZoneMinder",
+        "documentation": "https://www.home-assistant.io/integrations/zoneminder",
+        "requirements": [
+            "zm-py==0.5.2",
+        ],
+        "codeowners": [
+            "@rohankapoorcom",
+        ],
+        "iot_class": "local_polling",
+    },
+    "zwave": {
+        "domain": "zwave",
+        "name": "Z-Wave (deprecated)",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/zwave",
+        "requirements": [
+            "homeassistant-pyozw==0.1.10",
+            "pydispatcher==2.0.5",
+        ],
+        "after_dependencies": [
+            "ozw",
+        ],
+        "codeowners": [
+            "@home-assistant/z-wave",
+        ],
+        "iot_class": "local_push",
+    },
+    "zwave_js": {
+        "domain": "zwave_js",
+        "name": "Z-Wave JS",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/zwave_js",
+        "requirements": [
+            "zwave-js-server-python==0.27.1",
+        ],
+        "codeowners": [
+            "@home-assistant/z-wave",
+        ],
+        "dependencies": [
+            "http",
+            "websocket_api",
+        ],
+        "iot_class": "local_push",
+    },
+}
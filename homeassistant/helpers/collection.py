@@ -347,7 +347,9 @@ def sync_entity_lifecycle(
         entities.pop(change_set.item_id)
 
     async def _update_entity(change_set: CollectionChangeSet) -> None:
-        await entities[change_set.item_id].async_update_config(change_set.item)  # type: ignore
+        entity = entities[change_set.item_id]
+        entity.async_invalidate_static_attributes()
+        await entity.async_update_config(change_set.item)  # type: ignore
 
     _func_map: dict[
         str, Callable[[CollectionChangeSet], Coroutine[Any, Any, Entity | None]]
@@ -47,6 +47,9 @@ ORPHANED_DEVICE_KEEP_SECONDS = 86400 * 30
 class _DeviceIndex(NamedTuple):
     identifiers: dict[tuple[str, str], str]
     connections: dict[tuple[str, str], str]
+    # Only registered devices are indexed by area and config entry
+    area_ids: dict[str, dict[str, None]]
+    config_entries: dict[str, dict[str, None]]
 
 
 @attr.s(slots=True, frozen=True)
@@ -228,8 +231,12 @@ class DeviceRegistry:
 
     def _clear_index(self) -> None:
         """Clear the index."""
-        self._registered_index = _DeviceIndex(identifiers={}, connections={})
-        self._deleted_index = _DeviceIndex(identifiers={}, connections={})
+        self._registered_index = _DeviceIndex(
+            identifiers={}, connections={}, area_ids={}, config_entries={}
+        )
+        self._deleted_index = _DeviceIndex(
+            identifiers={}, connections={}, area_ids={}, config_entries={}
+        )
 
     def _rebuild_index(self) -> None:
         """Create the index after loading devices."""
@@ -615,9 +622,8 @@ class DeviceRegistry:
     @callback
     def async_clear_area_id(self, area_id: str) -> None:
         """Clear area id from registry entries."""
-        for dev_id, device in self.devices.items():
-            if area_id == device.area_id:
-                self._async_update_device(dev_id, area_id=None)
+        for device in async_entries_for_area(self, area_id):
+            self._async_update_device(device.id, area_id=None)
 
 
 @callback
@@ -645,7 +651,9 @@ async def async_get_registry(hass: HomeAssistant) -> DeviceRegistry:
 @callback
 def async_entries_for_area(registry: DeviceRegistry, area_id: str) -> list[DeviceEntry]:
     """Return entries that match an area."""
-    return [device for device in registry.devices.values() if device.area_id == area_id]
+    # pylint: disable=protected-access
+    device_ids = registry._registered_index.area_ids.get(area_id, {})
+    return [registry.devices[device_id] for device_id in device_ids]
 
 
 @callback
@@ -653,11 +661,9 @@ def async_entries_for_config_entry(
     registry: DeviceRegistry, config_entry_id: str
 ) -> list[DeviceEntry]:
     """Return entries that match a config entry."""
-    return [
-        device
-        for device in registry.devices.values()
-        if config_entry_id in device.config_entries
-    ]
+    # pylint: disable=protected-access
+    device_ids = registry._registered_index.config_entries.get(config_entry_id, {})
+    return [registry.devices[device_id] for device_id in device_ids]
 
 
 @callback
@@ -792,6 +798,12 @@ def _add_device_to_index(
         devices_index.identifiers[identifier] = device.id
     for connection in device.connections:
         devices_index.connections[connection] = device.id
+    if isinstance(device, DeletedDeviceEntry):
+        return
+    if device.area_id is not None:
+        devices_index.area_ids.setdefault(device.area_id, {})[device.id] = None
+    for config_entry_id in device.config_entries:
+        devices_index.config_entries.setdefault(config_entry_id, {})[device.id] = None
 
 
 def _remove_device_from_index(
@@ -805,3 +817,21 @@ def _remove_device_from_index(
     for connection in device.connections:
         if connection in devices_index.connections:
             del devices_index.connections[connection]
+    if isinstance(device, DeletedDeviceEntry):
+        return
+    if device.area_id is not None:
+        _remove_from_multi_index(devices_index.area_ids, device.area_id, device.id)
+    for config_entry_id in device.config_entries:
+        _remove_from_multi_index(
+            devices_index.config_entries, config_entry_id, device.id
+        )
+
+
+def _remove_from_multi_index(
+    index: dict[str, dict[str, None]], key: str, device_id: str
+) -> None:
+    """Remove a device from an index that maps a key to many devices."""
+    device_ids = index[key]
+    del device_ids[device_id]
+    if not device_ids:
+        del index[key]
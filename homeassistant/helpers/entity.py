@@ -10,7 +10,8 @@ import logging
 import math
 import sys
 from timeit import default_timer as timer
-from typing import Any, TypedDict, final
+from types import MappingProxyType
+from typing import Any, NamedTuple, TypedDict, final
 
 from homeassistant.config import DATA_CUSTOMIZE
 from homeassistant.const import (
@@ -34,10 +35,12 @@ from homeassistant.exceptions import HomeAssistantError, NoEntitySpecifiedError
 from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.entity_platform import EntityPlatform
 from homeassistant.helpers.entity_registry import RegistryEntry
+from homeassistant.helpers.entity_values import EntityValues
 from homeassistant.helpers.event import Event, async_track_entity_registry_updated_event
 from homeassistant.helpers.typing import StateType
 from homeassistant.loader import bind_hass
 from homeassistant.util import dt as dt_util, ensure_unique_string, slugify
+from homeassistant.util.unit_system import UnitSystem
 
 _LOGGER = logging.getLogger(__name__)
 SLOW_UPDATE_WARNING = 10
@@ -50,6 +53,38 @@ SOURCE_PLATFORM_CONFIG = "platform_config"
 FLOAT_PRECISION = abs(int(math.floor(math.log10(abs(sys.float_info.epsilon))))) - 1
 
 
+class _StaticAttributes(NamedTuple):
+    """Attributes of an entity that are only read again when invalidated."""
+
+    entity_id: str
+    registry_entry: RegistryEntry | None
+    customize: EntityValues | None
+    capability_attributes: Mapping[str, Any]
+    attributes: dict[str, Any]
+    overrides: dict[str, Any]
+
+
+def _convert_temperature(
+    state: str, unit_of_measure: str | None, units: UnitSystem
+) -> str | None:
+    """Return the state converted to the temperature unit of the unit system.
+
+    Return None if the state is not a temperature in another unit.
+    """
+    if (
+        unit_of_measure not in (TEMP_CELSIUS, TEMP_FAHRENHEIT)
+        or unit_of_measure == units.temperature_unit
+    ):
+        return None
+    try:
+        prec = len(state) - state.index(".") - 1 if "." in state else 0
+        temp = units.temperature(float(state), unit_of_measure)
+    except ValueError:
+        # Could not convert state to float
+        return None
+    return str(round(temp) if prec == 0 else round(temp, prec))
+
+
 @callback
 @bind_hass
 def entity_sources(hass: HomeAssistant) -> dict[str, dict[str, str]]:
@@ -209,6 +244,16 @@ class Entity(ABC):
     # Entry in the entity registry
     registry_entry: RegistryEntry | None = None
 
+    # Attributes assumed not to change, with the entity id, registry entry and
+    # customize they were calculated from
+    _static_attributes: _StaticAttributes | None = None
+
+    # The attributes written last, with the values they were calculated from,
+    # the unit before converting temperatures and if the state was converted
+    _written_attributes: (
+        tuple[tuple[Any, ...], MappingProxyType[str, Any], str | None, bool] | None
+    ) = None
+
     # Hold list for functions to call on remove.
     _on_remove: list[CALLBACK_TYPE] | None = None
 
@@ -264,7 +309,9 @@ class Entity(ABC):
     def capability_attributes(self) -> Mapping[str, Any] | None:
         """Return the capability attributes.
 
-        Attributes that explain the capabilities of an entity.
+        Attributes that explain the capabilities of an entity. They are only
+        read again after an update of the entity, or after
+        async_invalidate_static_attributes was called.
 
         Implemented by component base class. Convention for attribute names
         is lowercase snake_case.
@@ -447,48 +494,32 @@ class Entity(ABC):
 
         start = timer()
 
-        attr = self.capability_attributes
-        attr = dict(attr) if attr else {}
-
+        static = self._async_static_attributes()
         state = self._stringify_state()
+        dynamic: dict[str, Any] = {}
         if self.available:
-            attr.update(self.state_attributes or {})
+            dynamic.update(self.state_attributes or {})
             extra_state_attributes = self.extra_state_attributes
             # Backwards compatibility for "device_state_attributes" deprecated in 2021.4
             # Add warning in 2021.6, remove in 2021.10
             if extra_state_attributes is None:
                 extra_state_attributes = self.device_state_attributes
-            attr.update(extra_state_attributes or {})
-
-        unit_of_measurement = self.unit_of_measurement
-        if unit_of_measurement is not None:
-            attr[ATTR_UNIT_OF_MEASUREMENT] = unit_of_measurement
-
-        entry = self.registry_entry
-        # pylint: disable=consider-using-ternary
-        name = (entry and entry.name) or self.name
-        if name is not None:
-            attr[ATTR_FRIENDLY_NAME] = name
-
-        icon = (entry and entry.icon) or self.icon
-        if icon is not None:
-            attr[ATTR_ICON] = icon
+            dynamic.update(extra_state_attributes or {})
 
+        icon = self.icon
         entity_picture = self.entity_picture
-        if entity_picture is not None:
-            attr[ATTR_ENTITY_PICTURE] = entity_picture
-
         assumed_state = self.assumed_state
-        if assumed_state:
-            attr[ATTR_ASSUMED_STATE] = assumed_state
-
         supported_features = self.supported_features
-        if supported_features is not None:
-            attr[ATTR_SUPPORTED_FEATURES] = supported_features
-
-        device_class = self.device_class
-        if device_class is not None:
-            attr[ATTR_DEVICE_CLASS] = str(device_class)
+        units = self.hass.config.units
+        key = (
+            static,
+            dynamic,
+            icon,
+            entity_picture,
+            assumed_state,
+            supported_features,
+            units,
+        )
 
         end = timer()
 
@@ -515,25 +546,48 @@ class Entity(ABC):
                 extra,
             )
 
-        # Overwrite properties that have been set in the config file.
-        if DATA_CUSTOMIZE in self.hass.data:
-            attr.update(self.hass.data[DATA_CUSTOMIZE].get(self.entity_id))
-
-        # Convert temperature if we detect one
-        try:
+        written = self._written_attributes
+        if written is not None and written[0] == key:
+            # Nothing changed, write the same attributes object again so the
+            # state machine doesn't have to compare them
+            attributes = written[1]
+            converted_state = _convert_temperature(state, written[2], units)
+            if (converted_state is not None) is not written[3]:
+                written = None
+            elif converted_state is not None:
+                state = converted_state
+        else:
+            written = None
+
+        if written is None:
+            attr = dict(static.capability_attributes)
+            attr.update(dynamic)
+            attr.update(static.attributes)
+            if icon is not None:
+                attr[ATTR_ICON] = icon
+            if entity_picture is not None:
+                attr[ATTR_ENTITY_PICTURE] = entity_picture
+            if assumed_state:
+                attr[ATTR_ASSUMED_STATE] = assumed_state
+            if supported_features is not None:
+                attr[ATTR_SUPPORTED_FEATURES] = supported_features
+            # Overwrite properties that have been set in the registry or the config file.
+            attr.update(static.overrides)
+
+            # Convert temperature if we detect one
             unit_of_measure = attr.get(ATTR_UNIT_OF_MEASUREMENT)
-            units = self.hass.config.units
-            if (
-                unit_of_measure in (TEMP_CELSIUS, TEMP_FAHRENHEIT)
-                and unit_of_measure != units.temperature_unit
-            ):
-                prec = len(state) - state.index(".") - 1 if "." in state else 0
-                temp = units.temperature(float(state), unit_of_measure)
-                state = str(round(temp) if prec == 0 else round(temp, prec))
+            converted_state = _convert_temperature(state, unit_of_measure, units)
+            if converted_state is not None:
+                state = converted_state
                 attr[ATTR_UNIT_OF_MEASUREMENT] = units.temperature_unit
-        except ValueError:
-            # Could not convert state to float
-            pass
+
+            attributes = MappingProxyType(attr)
+            self._written_attributes = (
+                key,
+                attributes,
+                unit_of_measure,
+                converted_state is not None,
+            )
 
         if (
             self._context_set is not None
@@ -543,8 +597,68 @@ class Entity(ABC):
             self._context_set = None
 
         self.hass.states.async_set(
-            self.entity_id, state, attr, self.force_update, self._context
+            self.entity_id, state, attributes, self.force_update, self._context
+        )
+
+    @callback
+    def _async_static_attributes(self) -> _StaticAttributes:
+        """Return the attributes of the entity that are assumed not to change.
+
+        They are only read again when the entity id, the registry entry or
+        customize changed, or after async_invalidate_static_attributes was
+        called.
+        """
+        entry = self.registry_entry
+        customize: EntityValues | None = self.hass.data.get(DATA_CUSTOMIZE)
+        cached = self._static_attributes
+        if (
+            cached is not None
+            and cached.entity_id == self.entity_id
+            and cached.registry_entry is entry
+            and cached.customize is customize
+        ):
+            return cached
+
+        attr: dict[str, Any] = {}
+        unit_of_measurement = self.unit_of_measurement
+        if unit_of_measurement is not None:
+            attr[ATTR_UNIT_OF_MEASUREMENT] = unit_of_measurement
+
+        name = self.name
+        if name is not None:
+            attr[ATTR_FRIENDLY_NAME] = name
+
+        device_class = self.device_class
+        if device_class is not None:
+            attr[ATTR_DEVICE_CLASS] = str(device_class)
+
+        overrides: dict[str, Any] = {}
+        if entry is not None:
+            if entry.name:
+                overrides[ATTR_FRIENDLY_NAME] = entry.name
+            if entry.icon:
+                overrides[ATTR_ICON] = entry.icon
+        if customize is not None:
+            overrides.update(customize.get(self.entity_id))
+
+        self._static_attributes = _StaticAttributes(
+            self.entity_id,
+            entry,
+            customize,
+            dict(self.capability_attributes or {}),
+            attr,
+            overrides,
         )
+        return self._static_attributes
+
+    @callback
+    def async_invalidate_static_attributes(self) -> None:
+        """Read the capability attributes, unit, name and device class again.
+
+        Call this before writing the state if any of them changed outside an
+        update of the entity.
+        """
+        self._static_attributes = None
 
     def schedule_update_ha_state(self, force_refresh: bool = False) -> None:
         """Schedule an update ha state change task.
@@ -617,6 +731,8 @@ class Entity(ABC):
             await task
         finally:
             self._update_staged = False
+            # The update may have changed the static attributes
+            self._static_attributes = None
             if self.parallel_updates:
                 self.parallel_updates.release()
 
@@ -4,11 +4,14 @@ from __future__ import annotations
 import asyncio
 from collections.abc import Coroutine, Iterable
 from contextvars import ContextVar
+from dataclasses import dataclass
 from datetime import datetime, timedelta
+import functools as ft
 import logging
 from logging import Logger
 from types import ModuleType
 from typing import TYPE_CHECKING, Any, Callable, Protocol
+import zlib
 
 import voluptuous as vol
 
@@ -21,6 +24,7 @@ from homeassistant.const import (
 from homeassistant.core import (
     CALLBACK_TYPE,
     CoreState,
+    HassJob,
     HomeAssistant,
     ServiceCall,
     callback,
@@ -33,6 +37,7 @@ from homeassistant.exceptions import (
     RequiredParameterMissing,
 )
 from homeassistant.setup import async_start_setup
+from homeassistant.util import dt as dt_util
 from homeassistant.util.async_ import run_callback_threadsafe
 
 from . import (
@@ -43,7 +48,7 @@ from . import (
 )
 from .device_registry import DeviceRegistry
 from .entity_registry import DISABLED_INTEGRATION, EntityRegistry
-from .event import async_call_later, async_track_time_interval
+from .event import async_call_later, async_track_point_in_utc_time
 from .typing import ConfigType, DiscoveryInfoType
 
 if TYPE_CHECKING:
@@ -58,6 +63,7 @@ SLOW_ADD_MIN_TIMEOUT = 500
 PLATFORM_NOT_READY_RETRIES = 10
 DATA_ENTITY_PLATFORM = "entity_platform"
 PLATFORM_NOT_READY_BASE_WAIT_TIME = 30  # seconds
+POLL_OVERRUN_WARNING_INTERVAL = 900  # seconds
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -71,6 +77,50 @@ class AddEntitiesCallback(Protocol):
         """Define add_entities type."""
 
 
+@dataclass
+class PollStatistics:
+    """Statistics of polling the entities of a platform.
+
+    Durations are in seconds. An overrun is a poll that was skipped because
+    the previous update of the entity was still running.
+    """
+
+    polls: int = 0
+    overruns: int = 0
+    total_duration: float = 0.0
+    max_duration: float = 0.0
+
+    @property
+    def mean_duration(self) -> float | None:
+        """Return the mean duration of a poll."""
+        return self.total_duration / self.polls if self.polls else None
+
+    def add_poll(self, duration: float) -> None:
+        """Add the duration of a poll."""
+        self.polls += 1
+        self.total_duration += duration
+        self.max_duration = max(self.max_duration, duration)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics as a dictionary."""
+        return {
+            "polls": self.polls,
+            "overruns": self.overruns,
+            "mean_duration": self.mean_duration,
+            "max_duration": self.max_duration,
+        }
+
+
+def poll_phase(entity_id: str) -> float:
+    """Return the phase of polling an entity as a fraction of the interval.
+
+    The phase is derived from the entity id, so entities of the same platform
+    and of platforms with the same interval are spread over the interval, and
+    an entity is polled at the same offset after a restart.
+    """
+    return zlib.crc32(entity_id.encode("utf-8")) / 2 ** 32
+
+
 class EntityPlatform:
     """Manage the entities for a single platform."""
 
@@ -100,9 +150,15 @@ class EntityPlatform:
         self._setup_complete = False
         # Method to cancel the state change listener
         self._async_unsub_polling: CALLBACK_TYPE | None = None
+        # Methods to cancel the next poll of each entity
+        self._async_unsub_entity_polls: dict[str, CALLBACK_TYPE] = {}
+        # Entities that are still updating from their last poll
+        self._updating_entities: set[str] = set()
+        self.poll_statistics = PollStatistics()
+        # When the last overrun warning was logged, in loop time
+        self._poll_overrun_warned: float | None = None
         # Method to cancel the retry of setup
         self._async_cancel_retry_setup: CALLBACK_TYPE | None = None
-        self._process_updates: asyncio.Lock | None = None
 
         self.parallel_updates: asyncio.Semaphore | None = None
 
@@ -395,18 +451,23 @@ class EntityPlatform:
             )
             raise
 
-        if (
-            (self.config_entry and self.config_entry.pref_disable_polling)
-            or self._async_unsub_polling is not None
-            or not any(entity.should_poll for entity in self.entities.values())
+        if (self.config_entry and self.config_entry.pref_disable_polling) or (
+            self._async_unsub_polling is None
+            and not any(entity.should_poll for entity in self.entities.values())
         ):
             return
 
-        self._async_unsub_polling = async_track_time_interval(
-            self.hass,
-            self._update_entity_states,
-            self.scan_interval,
-        )
+        self._async_unsub_polling = self._async_cancel_entity_polls
+        now = dt_util.utcnow()
+        for entity_id, entity in self.entities.items():
+            if entity_id in self._async_unsub_entity_polls or not entity.should_poll:
+                continue
+            # The first poll of the entities is spread over the second
+            # half of the interval, the next polls keep their phase
+            self._async_schedule_entity_poll(
+                entity_id,
+                now + self.scan_interval * (1 - poll_phase(entity_id) / 2),
+            )
 
     async def _async_add_entity(  # noqa: C901
         self,
@@ -581,6 +642,9 @@ class EntityPlatform:
         def remove_entity_cb() -> None:
             """Remove entity from entities list."""
             self.entities.pop(entity_id)
+            unsub_poll = self._async_unsub_entity_polls.pop(entity_id, None)
+            if unsub_poll is not None:
+                unsub_poll()
 
         entity.async_on_remove(remove_entity_cb)
 
@@ -622,6 +686,10 @@ class EntityPlatform:
         """Remove entity id from platform."""
         await self.entities[entity_id].async_remove()
 
+        unsub_poll = self._async_unsub_entity_polls.pop(entity_id, None)
+        if unsub_poll is not None:
+            unsub_poll()
+
         # Clean up polling job if no longer needed
         if self._async_unsub_polling is not None and not any(
             entity.should_poll for entity in self.entities.values()
@@ -678,34 +746,76 @@ class EntityPlatform:
             self.platform_name, name, handle_service, schema
         )
 
-    async def _update_entity_states(self, now: datetime) -> None:
-        """Update the states of all the polling entities.
+    @callback
+    def _async_cancel_entity_polls(self) -> None:
+        """Cancel the next poll of all entities."""
+        for unsub_poll in self._async_unsub_entity_polls.values():
+            unsub_poll()
+        self._async_unsub_entity_polls.clear()
 
-        To protect from flooding the executor, we will update async entities
-        in parallel and other entities sequential.
+    @callback
+    def _async_schedule_entity_poll(self, entity_id: str, when: datetime) -> None:
+        """Schedule the next poll of an entity."""
+        self._async_unsub_entity_polls[entity_id] = async_track_point_in_utc_time(
+            self.hass, HassJob(ft.partial(self._async_poll_entity, entity_id)), when
+        )
 
-        This method must be run in the event loop.
+    @callback
+    def _async_poll_entity(self, entity_id: str, scheduled: datetime) -> None:
+        """Poll an entity and schedule its next poll.
+
+        The update is skipped if the previous one is still running. Entities
+        are updated in parallel, the parallel updates semaphore of the entity
+        protects from flooding the executor.
         """
-        if self._process_updates is None:
-            self._process_updates = asyncio.Lock()
-        if self._process_updates.locked():
-            self.logger.warning(
-                "Updating %s %s took longer than the scheduled update interval %s",
-                self.platform_name,
-                self.domain,
-                self.scan_interval,
-            )
+        entity = self.entities.get(entity_id)
+        if entity is None or not entity.should_poll:
+            self._async_unsub_entity_polls.pop(entity_id, None)
             return
 
-        async with self._process_updates:
-            tasks = []
-            for entity in self.entities.values():
-                if not entity.should_poll:
-                    continue
-                tasks.append(entity.async_update_ha_state(True))
+        next_poll = scheduled + self.scan_interval
+        now = dt_util.utcnow()
+        if next_poll <= now:
+            # Skip the polls that were missed, keeping the phase
+            next_poll += (now - scheduled) // self.scan_interval * self.scan_interval
+        self._async_schedule_entity_poll(entity_id, next_poll)
 
-            if tasks:
-                await asyncio.gather(*tasks)
+        if entity_id in self._updating_entities:
+            self.poll_statistics.overruns += 1
+            self._async_warn_poll_overrun(entity_id)
+            return
+
+        self._updating_entities.add(entity_id)
+        self.hass.async_create_task(self._async_update_entity(entity))
+
+    @callback
+    def _async_warn_poll_overrun(self, entity_id: str) -> None:
+        """Warn that a poll overran, at most once per interval per platform."""
+        now = self.hass.loop.time()
+        if (
+            self._poll_overrun_warned is not None
+            and now - self._poll_overrun_warned < POLL_OVERRUN_WARNING_INTERVAL
+        ):
+            return
+        self._poll_overrun_warned = now
+        self.logger.warning(
+            "Updating %s %s took longer than the scheduled update interval %s, "
+            "poll statistics of the platform: %s",
+            self.platform_name,
+            entity_id,
+            self.scan_interval,
+            self.poll_statistics.as_dict(),
+        )
+
+    async def _async_update_entity(self, entity: Entity) -> None:
+        """Update a polled entity and record the duration."""
+        entity_id = entity.entity_id
+        start = self.hass.loop.time()
+        try:
+            await entity.async_update_ha_state(True)
+        finally:
+            self._updating_entities.discard(entity_id)
+            self.poll_statistics.add_poll(self.hass.loop.time() - start)
 
 
 current_platform: ContextVar[EntityPlatform | None] = ContextVar(
@@ -736,3 +846,22 @@ def async_get_platforms(
     platforms: list[EntityPlatform] = hass.data[DATA_ENTITY_PLATFORM][integration_name]
 
     return platforms
+
+
+@callback
+def async_get_poll_statistics(hass: HomeAssistant) -> list[dict[str, Any]]:
+    """Return the poll statistics of the platforms which polled entities."""
+    return [
+        {
+            "domain": platform.domain,
+            "platform": platform.platform_name,
+            "config_entry_id": platform.config_entry.entry_id
+            if platform.config_entry
+            else None,
+            "scan_interval": platform.scan_interval.total_seconds(),
+            **platform.poll_statistics.as_dict(),
+        }
+        for platforms in hass.data.get(DATA_ENTITY_PLATFORM, {}).values()
+        for platform in platforms
+        if platform.poll_statistics.polls or platform.poll_statistics.overruns
+    ]
@@ -1,7 +1,17 @@
 """Helpers to help with encoding Home Assistant objects in JSON."""
+from __future__ import annotations
+
 from datetime import datetime, timedelta
 import json
-from typing import Any
+import math
+from typing import Any, Callable
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    HAS_ORJSON = False
+else:
+    HAS_ORJSON = True
 
 
 class JSONEncoder(json.JSONEncoder):
@@ -36,3 +46,100 @@ class ExtendedJSONEncoder(JSONEncoder):
             return super().default(o)
         except TypeError:
             return {"__type": str(type(o)), "repr": repr(o)}
+
+
+def json_encoder_default(obj: Any) -> Any:
+    """Convert Home Assistant objects the JSON backend doesn't serialize natively.
+
+    Raise TypeError for other objects.
+    """
+    if isinstance(obj, set):
+        return list(obj)
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, float):
+        # A subclass of float
+        return float(obj)
+    if hasattr(obj, "as_dict"):
+        return obj.as_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _has_non_finite_float(data: Any) -> bool:
+    """Return if the data contains NaN or infinity."""
+    to_process = [data]
+    while to_process:
+        obj = to_process.pop()
+        if isinstance(obj, float):
+            if not math.isfinite(obj):
+                return True
+        elif isinstance(obj, (str, int, type(None))):
+            continue
+        elif isinstance(obj, dict):
+            to_process.extend(obj.values())
+        elif isinstance(obj, (list, tuple)):
+            to_process.extend(obj)
+        else:
+            try:
+                to_process.append(json_encoder_default(obj))
+            except TypeError:
+                # Serialized natively by orjson
+                continue
+    return False
+
+
+# Context ids are None in nearly every state and event, so their nulls
+# don't make the data worth checking for non-finite floats
+_CONTEXT_NULLS = (b'"parent_id":null', b'"user_id":null')
+
+
+def _orjson_json_bytes(data: Any, default: Callable[[Any], Any] | None) -> bytes:
+    """Serialize to compact JSON bytes with orjson."""
+    result = orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS, default=default)
+    # orjson writes NaN and infinity as null and never hands floats to
+    # default, so only nulls that are not context ids are checked
+    nulls = result.count(b"null")
+    if (
+        nulls
+        and nulls > sum(result.count(context_null) for context_null in _CONTEXT_NULLS)
+        and _has_non_finite_float(data)
+    ):
+        raise ValueError("Out of range float values are not JSON compliant")
+    return result
+
+
+def _stdlib_json_bytes(
+    data: Any, indent: bool, default: Callable[[Any], Any] | None
+) -> bytes:
+    """Serialize to JSON bytes with the json module."""
+    if indent:
+        # The format of the files in .storage, which always allowed NaN
+        return json.dumps(data, default=default, indent=4).encode("utf-8")
+    return json.dumps(
+        data, default=default, allow_nan=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def json_bytes(
+    data: Any,
+    *,
+    indent: bool = False,
+    default: Callable[[Any], Any] | None = json_encoder_default,
+) -> bytes:
+    """Serialize Home Assistant objects to compact JSON bytes.
+
+    Uses orjson when it is installed. Objects are converted with default,
+    pass None to only serialize plain data. NaN and infinity raise ValueError.
+
+    Indented JSON is the format of the files in .storage and is always
+    written by the json module, with an indent of 4 and NaN allowed, as
+    orjson only indents with 2 spaces.
+    """
+    if HAS_ORJSON and not indent:
+        return _orjson_json_bytes(data, default)
+    return _stdlib_json_bytes(data, indent, default)
+
+
+def json_dumps(data: Any) -> str:
+    """Serialize Home Assistant objects to a JSON string."""
+    return json_bytes(data).decode("utf-8")
@@ -23,7 +23,7 @@ from homeassistant.const import (
     ENTITY_MATCH_ALL,
     ENTITY_MATCH_NONE,
 )
-from homeassistant.core import Context, HomeAssistant, ServiceCall, callback
+from homeassistant.core import Context, Event, HomeAssistant, ServiceCall, callback
 from homeassistant.exceptions import (
     HomeAssistantError,
     TemplateError,
@@ -59,6 +59,10 @@ CONF_SERVICE_DATA_TEMPLATE = "data_template"
 _LOGGER = logging.getLogger(__name__)
 
 SERVICE_DESCRIPTION_CACHE = "service_description_cache"
+SERVICE_TARGET_CACHE = "service_target_cache"
+
+# The number of resolved areas and devices kept in the target cache
+TARGET_CACHE_SIZE = 1024
 
 
 class ServiceParams(TypedDict):
@@ -345,38 +349,143 @@ async def async_extract_referenced_entity_ids(
     dev_reg = device_registry.async_get(hass)
     area_reg = area_registry.async_get(hass)
 
+    target_cache = _async_get_target_cache(hass, ent_reg, dev_reg, area_reg)
+
     for device_id in selector.device_ids:
         if device_id not in dev_reg.devices:
             selected.missing_devices.add(device_id)
 
+        # All entities of the target device
+        selected.indirectly_referenced.update(
+            target_cache.async_device_entity_ids(device_id)
+        )
+
+    selected.referenced_devices.update(selector.device_ids)
+
     for area_id in selector.area_ids:
         if area_id not in area_reg.areas:
             selected.missing_areas.add(area_id)
 
-    # Find devices for this area
-    selected.referenced_devices.update(selector.device_ids)
-    for device_entry in dev_reg.devices.values():
-        if device_entry.area_id in selector.area_ids:
-            selected.referenced_devices.add(device_entry.id)
+        # The devices of the area and the entities of the area or of its
+        # devices when they have no area set explicitly
+        area_device_ids, area_entity_ids = target_cache.async_area_ids(area_id)
+        selected.referenced_devices.update(area_device_ids)
+        selected.indirectly_referenced.update(area_entity_ids)
 
-    if not selector.area_ids and not selected.referenced_devices:
-        return selected
+    return selected
+
+
+class _TargetCache:
+    """Cache the devices and entities that areas and devices resolve to.
 
-    for ent_entry in ent_reg.entities.values():
-        if (
-            # when area matches the target area
-            ent_entry.area_id in selector.area_ids
-            # when device matches a referenced devices with no explicitly set area
-            or (
-                not ent_entry.area_id
-                and ent_entry.device_id in selected.referenced_devices
+    The cache is cleared when an update of the entity, device or area
+    registry is handled. It keeps at most TARGET_CACHE_SIZE areas and
+    devices, the oldest ones are dropped first.
+    """
+
+    def __init__(
+        self,
+        ent_reg: entity_registry.EntityRegistry,
+        dev_reg: device_registry.DeviceRegistry,
+        area_reg: area_registry.AreaRegistry,
+    ) -> None:
+        """Initialize the cache."""
+        self.registries = (ent_reg, dev_reg, area_reg)
+        self._areas: dict[str, tuple[frozenset[str], frozenset[str]]] = {}
+        self._devices: dict[str, frozenset[str]] = {}
+
+    @callback
+    def async_clear(self) -> None:
+        """Clear the cache."""
+        self._areas.clear()
+        self._devices.clear()
+
+    @callback
+    def async_device_entity_ids(self, device_id: str) -> frozenset[str]:
+        """Return the ids of the entities of a device."""
+        if (entity_ids := self._devices.get(device_id)) is not None:
+            return entity_ids
+
+        entity_ids = frozenset(
+            entry.entity_id
+            for entry in entity_registry.async_entries_for_device(
+                self.registries[0], device_id, include_disabled_entities=True
+            )
+        )
+        _async_add_bounded(self._devices, device_id, entity_ids)
+        return entity_ids
+
+    @callback
+    def async_area_ids(self, area_id: str) -> tuple[frozenset[str], frozenset[str]]:
+        """Return the ids of the devices and the entities in an area."""
+        if (area_ids := self._areas.get(area_id)) is not None:
+            return area_ids
+
+        ent_reg, dev_reg, _ = self.registries
+        device_ids = frozenset(
+            device.id
+            for device in device_registry.async_entries_for_area(dev_reg, area_id)
+        )
+        entity_ids = {
+            entry.entity_id
+            for entry in entity_registry.async_entries_for_area(ent_reg, area_id)
+        }
+        for device_id in device_ids:
+            entity_ids.update(
+                entry.entity_id
+                for entry in entity_registry.async_entries_for_device(
+                    ent_reg, device_id, include_disabled_entities=True
+                )
+                if not entry.area_id
             )
-            # when device matches target device
-            or ent_entry.device_id in selector.device_ids
+
+        area_ids = (device_ids, frozenset(entity_ids))
+        _async_add_bounded(self._areas, area_id, area_ids)
+        return area_ids
+
+
+@callback
+def _async_add_bounded(cache: dict[str, Any], key: str, value: Any) -> None:
+    """Add a value to a cache, dropping the oldest value when it is full."""
+    if len(cache) >= TARGET_CACHE_SIZE:
+        del cache[next(iter(cache))]
+    cache[key] = value
+
+
+@callback
+def _async_get_target_cache(
+    hass: HomeAssistant,
+    ent_reg: entity_registry.EntityRegistry,
+    dev_reg: device_registry.DeviceRegistry,
+    area_reg: area_registry.AreaRegistry,
+) -> _TargetCache:
+    """Return the target cache of the registries."""
+    target_cache: _TargetCache | None = hass.data.get(SERVICE_TARGET_CACHE)
+    if target_cache is not None and target_cache.registries == (
+        ent_reg,
+        dev_reg,
+        area_reg,
+    ):
+        return target_cache
+
+    if target_cache is None:
+
+        @callback
+        def _async_clear(event: Event) -> None:
+            """Clear the current target cache."""
+            hass.data[SERVICE_TARGET_CACHE].async_clear()
+
+        for event_type in (
+            entity_registry.EVENT_ENTITY_REGISTRY_UPDATED,
+            device_registry.EVENT_DEVICE_REGISTRY_UPDATED,
+            area_registry.EVENT_AREA_REGISTRY_UPDATED,
         ):
-            selected.indirectly_referenced.add(ent_entry.entity_id)
+            hass.bus.async_listen(event_type, _async_clear)
 
-    return selected
+    target_cache = hass.data[SERVICE_TARGET_CACHE] = _TargetCache(
+        ent_reg, dev_reg, area_reg
+    )
+    return target_cache
 
 
 @bind_hass
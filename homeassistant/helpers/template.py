@@ -4,19 +4,25 @@ from __future__ import annotations
 from ast import literal_eval
 import asyncio
 import base64
+from collections import OrderedDict
 import collections.abc
 from collections.abc import Generator, Iterable
 from contextlib import suppress
 from contextvars import ContextVar
 from datetime import datetime, timedelta
 from functools import partial, wraps
+import hashlib
+from importlib.util import MAGIC_NUMBER
 import json
 import logging
+import marshal
 import math
 from operator import attrgetter
 import random
 import re
 import sys
+import threading
+from types import CodeType
 from typing import Any, Callable, cast
 from urllib.parse import urlencode as urllib_urlencode
 import weakref
@@ -60,6 +66,15 @@ _RENDER_INFO = "template.render_info"
 _ENVIRONMENT = "template.environment"
 _ENVIRONMENT_LIMITED = "template.environment_limited"
 _ENVIRONMENT_STRICT = "template.environment_strict"
+_BYTECODE_CACHE = "template.bytecode_cache"
+
+BYTECODE_STORAGE_KEY = "core.template_bytecode"
+BYTECODE_STORAGE_VERSION = 1
+BYTECODE_SAVE_DELAY = 30
+# The compiled code depends on both the Python and the Jinja version
+_BYTECODE_MAGIC = f"{MAGIC_NUMBER.hex()}-{jinja2.__version__}"
+MAX_BYTECODE_CACHE_SIZE = 2048
+MAX_TEMPLATE_LRU_SIZE = 512
 
 _RE_JINJA_DELIMITERS = re.compile(r"\{%|\{\{|\{#")
 # Match "simple" ints and floats. -1.0, 1, +5, 5.0
@@ -1397,6 +1412,85 @@ class LoggingUndefined(jinja2.Undefined):
         return super().__bool__()
 
 
+class TemplateBytecodeCache:
+    """Persistent cache of the code of compiled templates."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the cache."""
+        # Storage imports the event helper, which imports this module
+        from homeassistant.helpers.storage import (  # pylint: disable=import-outside-toplevel
+            Store,
+        )
+
+        self.hass = hass
+        self._store = Store(
+            hass, BYTECODE_STORAGE_VERSION, BYTECODE_STORAGE_KEY, private=True
+        )
+        # Marshalled code by cache key, the most recently used last. Templates
+        # can be compiled outside of the event loop, so it's guarded by a lock.
+        self._codes: dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._save_scheduled = False
+
+    async def async_load(self) -> None:
+        """Load the cache."""
+        data = await self._store.async_load()
+        if not isinstance(data, dict) or data.get("magic") != _BYTECODE_MAGIC:
+            return
+        with self._lock:
+            self._codes = data["templates"]
+
+    def get(self, key: str) -> CodeType | None:
+        """Return the cached code of a template."""
+        with self._lock:
+            encoded = self._codes.pop(key, None)
+            if encoded is None:
+                return None
+            # Mark as most recently used
+            self._codes[key] = encoded
+        try:
+            code = marshal.loads(base64.b64decode(encoded))
+        except (ValueError, EOFError, TypeError):
+            code = None
+        if not isinstance(code, CodeType):
+            with self._lock:
+                if self._codes.get(key) is encoded:
+                    del self._codes[key]
+            return None
+        return code
+
+    def set(self, key: str, code: CodeType) -> None:
+        """Cache the code of a template."""
+        encoded = base64.b64encode(marshal.dumps(code)).decode()
+        with self._lock:
+            self._codes[key] = encoded
+            while len(self._codes) > MAX_BYTECODE_CACHE_SIZE:
+                del self._codes[next(iter(self._codes))]
+            if self._save_scheduled:
+                return
+            self._save_scheduled = True
+        self.hass.loop.call_soon_threadsafe(self._async_schedule_save)
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        """Schedule saving the cache."""
+        self._store.async_delay_save(self._data_to_save, BYTECODE_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data of the cache to store."""
+        with self._lock:
+            self._save_scheduled = False
+            return {"magic": _BYTECODE_MAGIC, "templates": dict(self._codes)}
+
+
+async def async_load_bytecode_cache(hass: HomeAssistant) -> None:
+    """Load the persistent cache of compiled templates."""
+    cache = TemplateBytecodeCache(hass)
+    await cache.async_load()
+    hass.data[_BYTECODE_CACHE] = cache
+
+
 class TemplateEnvironment(ImmutableSandboxedEnvironment):
     """The Home Assistant template environment."""
 
@@ -1408,7 +1502,15 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
             undefined = jinja2.StrictUndefined
         super().__init__(undefined=undefined)
         self.hass = hass
+        if limited:
+            self.kind = "limited"
+        elif strict:
+            self.kind = "strict"
+        else:
+            self.kind = "normal"
         self.template_cache = weakref.WeakValueDictionary()
+        # Keep the recently used templates alive even when unreferenced
+        self.template_lru: OrderedDict[str, CodeType] = OrderedDict()
         self.filters["round"] = forgiving_round
         self.filters["multiply"] = multiply
         self.filters["log"] = logarithm
@@ -1557,9 +1659,29 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         cached = self.template_cache.get(source)
 
         if cached is None:
-            cached = self.template_cache[source] = super().compile(source)
+            cached = self.template_cache[source] = self._compile_cached(source)
+
+        self.template_lru[source] = cached
+        self.template_lru.move_to_end(source)
+        if len(self.template_lru) > MAX_TEMPLATE_LRU_SIZE:
+            self.template_lru.popitem(last=False)
 
         return cached
 
+    def _compile_cached(self, source):
+        """Compile the template, using the persistent cache if loaded."""
+        bytecode_cache: TemplateBytecodeCache | None = (
+            self.hass.data.get(_BYTECODE_CACHE) if self.hass is not None else None
+        )
+        if bytecode_cache is None:
+            return super().compile(source)
+
+        key = f"{self.kind}-{hashlib.sha256(source.encode()).hexdigest()}"
+        code = bytecode_cache.get(key)
+        if code is None:
+            code = super().compile(source)
+            bytecode_cache.set(key, code)
+        return code
+
 
 _NO_HASS_ENV = TemplateEnvironment(None)  # type: ignore[no-untyped-call]
@@ -322,6 +322,7 @@ class CoordinatorEntity(Generic[T], entity.Entity):
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
+        self.async_invalidate_static_attributes()
         self.async_write_ha_state()
 
     async def async_update(self) -> None:
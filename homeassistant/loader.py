@@ -14,6 +14,7 @@ import json
 import logging
 import pathlib
 import sys
+from timeit import default_timer as timer
 from types import ModuleType
 from typing import TYPE_CHECKING, Any, Callable, Dict, TypedDict, TypeVar, cast
 
@@ -27,7 +28,6 @@ from homeassistant.generated.dhcp import DHCP
 from homeassistant.generated.mqtt import MQTT
 from homeassistant.generated.ssdp import SSDP
 from homeassistant.generated.zeroconf import HOMEKIT, ZEROCONF
-from homeassistant.util.async_ import gather_with_concurrency
 
 # Typing imports that create a circular dependency
 if TYPE_CHECKING:
@@ -44,8 +44,11 @@ _LOGGER = logging.getLogger(__name__)
 DATA_COMPONENTS = "components"
 DATA_INTEGRATIONS = "integrations"
 DATA_CUSTOM_COMPONENTS = "custom_components"
+DATA_IMPORT_LOCKS = "integration_import_locks"
+DATA_IMPORT_TIME = "integration_import_time"
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
+GENERATED_MANIFESTS = "homeassistant.generated.manifests"
 CUSTOM_WARNING = (
     "We found a custom integration %s which has not "
     "been tested by Home Assistant. This component might "
@@ -57,6 +60,9 @@ _UNDEF = object()  # Internal; not helpers.typing.UNDEFINED due to circular depe
 
 MAX_LOAD_CONCURRENTLY = 4
 
+CUSTOM_COMPONENTS_STORAGE_KEY = "core.custom_components"
+CUSTOM_COMPONENTS_STORAGE_VERSION = 1
+
 
 class Manifest(TypedDict, total=False):
     """
@@ -98,6 +104,56 @@ def manifest_from_legacy_module(domain: str, module: ModuleType) -> Manifest:
     }
 
 
+def _load_custom_manifests(
+    paths: list[str], index: dict[str, dict[str, Any]]
+) -> tuple[list[tuple[str, pathlib.Path, Manifest]], dict[str, dict[str, Any]]]:
+    """Load the manifests of the custom integrations.
+
+    Manifests that didn't change since they were indexed are not parsed again.
+    Return the manifests and the updated index.
+    """
+    manifests: list[tuple[str, pathlib.Path, Manifest]] = []
+    new_index: dict[str, dict[str, Any]] = {}
+
+    for path in paths:
+        for entry in pathlib.Path(path).iterdir():
+            if not entry.is_dir() or entry.name in new_index:
+                continue
+
+            manifest_path = entry / "manifest.json"
+            try:
+                stat = manifest_path.stat()
+            except OSError:
+                continue
+
+            indexed = index.get(entry.name)
+            if (
+                indexed is not None
+                and indexed["path"] == str(manifest_path)
+                and indexed["mtime"] == stat.st_mtime_ns
+                and indexed["size"] == stat.st_size
+            ):
+                manifest = indexed["manifest"]
+            else:
+                try:
+                    manifest = json.loads(manifest_path.read_text())
+                except ValueError as err:
+                    _LOGGER.error(
+                        "Error parsing manifest.json file at %s: %s", manifest_path, err
+                    )
+                    continue
+
+            new_index[entry.name] = {
+                "path": str(manifest_path),
+                "mtime": stat.st_mtime_ns,
+                "size": stat.st_size,
+                "manifest": manifest,
+            }
+            manifests.append((entry.name, manifest_path, manifest))
+
+    return manifests, new_index
+
+
 async def _async_get_custom_components(
     hass: HomeAssistant,
 ) -> dict[str, Integration]:
@@ -110,34 +166,33 @@ async def _async_get_custom_components(
     except ImportError:
         return {}
 
-    def get_sub_directories(paths: list[str]) -> list[pathlib.Path]:
-        """Return all sub directories in a set of paths."""
-        return [
-            entry
-            for path in paths
-            for entry in pathlib.Path(path).iterdir()
-            if entry.is_dir()
-        ]
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.helpers.storage import Store
 
-    dirs = await hass.async_add_executor_job(
-        get_sub_directories, custom_components.__path__
+    store = Store(
+        hass, CUSTOM_COMPONENTS_STORAGE_VERSION, CUSTOM_COMPONENTS_STORAGE_KEY
     )
+    index = await store.async_load() or {}
 
-    integrations = await gather_with_concurrency(
-        MAX_LOAD_CONCURRENTLY,
-        *(
-            hass.async_add_executor_job(
-                Integration.resolve_from_root, hass, custom_components, comp.name
-            )
-            for comp in dirs
-        ),
+    manifests, new_index = await hass.async_add_executor_job(
+        _load_custom_manifests, custom_components.__path__, index
     )
 
-    return {
-        integration.domain: integration
-        for integration in integrations
-        if integration is not None
-    }
+    if new_index != index:
+        store.async_delay_save(lambda: new_index)
+
+    integrations = {}
+    for name, manifest_path, manifest in manifests:
+        integration = Integration(
+            hass,
+            f"{custom_components.__name__}.{name}",
+            manifest_path.parent,
+            cast(Manifest, dict(manifest)),
+        )
+        if _validate_custom_integration(integration):
+            integrations[integration.domain] = integration
+
+    return integrations
 
 
 async def async_get_custom_components(
@@ -297,31 +352,10 @@ class Integration:
                 manifest,
             )
 
-            if integration.is_built_in:
+            if integration.is_built_in or _validate_custom_integration(integration):
                 return integration
 
-            _LOGGER.warning(CUSTOM_WARNING, integration.domain)
-            try:
-                AwesomeVersion(
-                    integration.version,
-                    [
-                        AwesomeVersionStrategy.CALVER,
-                        AwesomeVersionStrategy.SEMVER,
-                        AwesomeVersionStrategy.SIMPLEVER,
-                        AwesomeVersionStrategy.BUILDVER,
-                        AwesomeVersionStrategy.PEP440,
-                    ],
-                )
-            except AwesomeVersionException:
-                _LOGGER.error(
-                    "The custom integration '%s' does not have a "
-                    "valid version key (%s) in the manifest file and was blocked from loading. "
-                    "See https://developers.home-assistant.io/blog/2021/01/29/custom-integration-changes#versions for more details",
-                    integration.domain,
-                    integration.version,
-                )
-                return None
-            return integration
+            return None
 
         return None
 
@@ -498,6 +532,67 @@ class Integration:
             cache[full_name] = self._import_platform(platform_name)
         return cache[full_name]  # type: ignore
 
+    async def async_get_component(self) -> ModuleType:
+        """Return the component, importing it in the executor if needed."""
+        return await self._async_import(self.domain, self.get_component)
+
+    async def async_get_platform(self, platform_name: str) -> ModuleType:
+        """Return a platform, importing it in the executor if needed."""
+        return await self._async_import(
+            f"{self.domain}.{platform_name}",
+            ft.partial(self.get_platform, platform_name),
+        )
+
+    async def _async_import(
+        self, name: str, import_module: Callable[[], ModuleType]
+    ) -> ModuleType:
+        """Import a module of the integration without blocking the event loop.
+
+        Only one import per module runs at a time. The time spent importing is
+        added to the import time of the integration.
+        """
+        cache = self.hass.data.setdefault(DATA_COMPONENTS, {})
+        if name in cache:
+            return cache[name]  # type: ignore
+
+        locks: dict[str, asyncio.Lock] = self.hass.data.setdefault(
+            DATA_IMPORT_LOCKS, {}
+        )
+        if (lock := locks.get(name)) is None:
+            lock = locks[name] = asyncio.Lock()
+
+        async with lock:
+            if name in cache:
+                return cache[name]  # type: ignore
+
+            def timed_import() -> tuple[ModuleType, float]:
+                """Import the module and return the time it took."""
+                start = timer()
+                module = import_module()
+                return module, timer() - start
+
+            try:
+                module, import_time = await self.hass.async_add_executor_job(
+                    timed_import
+                )
+            except ImportError:
+                raise
+            except Exception:  # pylint: disable=broad-except
+                # Modules creating asyncio primitives when imported need
+                # the event loop before Python 3.10
+                _LOGGER.debug(
+                    "Unable to import %s in the executor, importing in the event loop",
+                    name,
+                    exc_info=True,
+                )
+                module, import_time = timed_import()
+            import_times: dict[str, float] = self.hass.data.setdefault(
+                DATA_IMPORT_TIME, {}
+            )
+            import_times[self.domain] = import_times.get(self.domain, 0) + import_time
+
+        return module
+
     def _import_platform(self, platform_name: str) -> ModuleType:
         """Import the platform."""
         return importlib.import_module(f"{self.pkg_path}.{platform_name}")
@@ -507,6 +602,43 @@ class Integration:
         return f"<Integration {self.domain}: {self.pkg_path}>"
 
 
+def _validate_custom_integration(integration: Integration) -> bool:
+    """Warn about a custom integration and test if its version is valid."""
+    _LOGGER.warning(CUSTOM_WARNING, integration.domain)
+    try:
+        AwesomeVersion(
+            integration.version,
+            [
+                AwesomeVersionStrategy.CALVER,
+                AwesomeVersionStrategy.SEMVER,
+                AwesomeVersionStrategy.SIMPLEVER,
+                AwesomeVersionStrategy.BUILDVER,
+                AwesomeVersionStrategy.PEP440,
+            ],
+        )
+    except AwesomeVersionException:
+        _LOGGER.error(
+            "The custom integration '%s' does not have a "
+            "valid version key (%s) in the manifest file and was blocked from loading. "
+            "See https://developers.home-assistant.io/blog/2021/01/29/custom-integration-changes#versions for more details",
+            integration.domain,
+            integration.version,
+        )
+        return False
+    return True
+
+
+async def _async_get_builtin_manifests(hass: HomeAssistant) -> dict[str, Manifest]:
+    """Return the generated manifests of the built-in integrations."""
+    if GENERATED_MANIFESTS not in sys.modules:
+        # The manifests of all integrations are a large module to import
+        await hass.async_add_executor_job(importlib.import_module, GENERATED_MANIFESTS)
+    # pylint: disable=import-outside-toplevel
+    from .generated import manifests
+
+    return cast(Dict[str, Manifest], manifests.MANIFESTS)
+
+
 async def async_get_integration(hass: HomeAssistant, domain: str) -> Integration:
     """Get an integration."""
     cache = hass.data.get(DATA_INTEGRATIONS)
@@ -553,6 +685,15 @@ async def _async_get_integration(hass: HomeAssistant, domain: str) -> Integratio
 
     from homeassistant import components  # pylint: disable=import-outside-toplevel
 
+    # Built-in integrations are resolved from the manifests generated by hassfest
+    if manifest := (await _async_get_builtin_manifests(hass)).get(domain):
+        return Integration(
+            hass,
+            f"{components.__name__}.{domain}",
+            pathlib.Path(components.__path__[0]) / domain,  # type: ignore
+            cast(Manifest, dict(manifest)),
+        )
+
     if integration := await hass.async_add_executor_job(
         Integration.resolve_from_root, hass, components, domain
     ):
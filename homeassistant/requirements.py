@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import asyncio
 from collections.abc import Iterable
+import importlib
 import os
 from typing import Any, cast
 
@@ -162,6 +163,9 @@ async def async_process_requirements(
             if not ret:
                 raise RequirementsNotFound(name, [req])
 
+            # Let the import system find the installed package
+            importlib.invalidate_caches()
+
 
 def pip_kwargs(config_dir: str | None) -> dict[str, Any]:
     """Return keyword arguments for PIP install."""
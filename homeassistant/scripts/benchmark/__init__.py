@@ -4,18 +4,27 @@ from __future__ import annotations
 import argparse
 import asyncio
 import collections
-from contextlib import suppress
-from datetime import datetime
+from datetime import datetime, timedelta
+from functools import partial
 import json
 import logging
+import math
+import platform
+import tempfile
 from timeit import default_timer as timer
+import tracemalloc
 from typing import Callable, TypeVar
 
 from homeassistant import core
 from homeassistant.components.websocket_api.const import JSON_DUMP
-from homeassistant.const import ATTR_NOW, EVENT_STATE_CHANGED, EVENT_TIME_CHANGED
+from homeassistant.const import (
+    ATTR_NOW,
+    EVENT_STATE_CHANGED,
+    EVENT_TIME_CHANGED,
+    __version__,
+)
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
-from homeassistant.helpers.json import JSONEncoder
+from homeassistant.helpers.json import JSONEncoder, json_dumps
 from homeassistant.util import dt as dt_util
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-check-untyped-defs
@@ -25,24 +34,106 @@ CALLABLE_T = TypeVar("CALLABLE_T", bound=Callable)  # pylint: disable=invalid-na
 
 BENCHMARKS: dict[str, Callable] = {}
 
+# The sizes of the scaled benchmarks, can be changed with --scale
+SCALES = {
+    "entities": 10000,
+    "listeners": 1000,
+    "templates": 500,
+    "automations": 100,
+    "mqtt_subscriptions": 5000,
+}
+
+# Runs of each benchmark when the results are saved or compared
+DEFAULT_REPEAT = 5
+# Slowdown of the median run against the baseline flagged as regression
+DEFAULT_THRESHOLD = 0.1
+
+PERCENTILES = (50, 90, 99)
+
 
 def run(args):
     """Handle benchmark commandline script."""
     # Disable logging
     logging.getLogger("homeassistant.core").setLevel(logging.CRITICAL)
+    logging.getLogger("homeassistant").setLevel(logging.WARNING)
 
     parser = argparse.ArgumentParser(description=("Run a Home Assistant benchmark."))
-    parser.add_argument("name", choices=BENCHMARKS)
+    parser.add_argument("name", nargs="+", choices=["all", *BENCHMARKS])
     parser.add_argument("--script", choices=["benchmark"])
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        help="Number of runs of each benchmark, runs until interrupted by default",
+    )
+    parser.add_argument(
+        "--scale",
+        action="append",
+        default=[],
+        metavar="NAME=SIZE",
+        help=f"Size of the scaled benchmarks, one of {', '.join(SCALES)}",
+    )
+    parser.add_argument(
+        "--memory",
+        action="store_true",
+        help="Trace the memory allocated by an additional run of each benchmark",
+    )
+    parser.add_argument("--json", metavar="PATH", help="Write the results as JSON")
+    parser.add_argument(
+        "--baseline", metavar="PATH", help="Compare the results with saved results"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Slowdown against the baseline that is a regression",
+    )
 
     args = parser.parse_args()
 
-    bench = BENCHMARKS[args.name]
+    for scale in args.scale:
+        name, _, size = scale.partition("=")
+        if name not in SCALES or not size.isdigit():
+            parser.error(f"Invalid scale {scale}")
+        SCALES[name] = int(size)
+
+    names = list(BENCHMARKS) if "all" in args.name else args.name
     print("Using event loop:", asyncio.get_event_loop_policy().loop_name)
 
-    with suppress(KeyboardInterrupt):
-        while True:
-            asyncio.run(run_benchmark(bench))
+    if args.repeat is None and args.json is None and args.baseline is None:
+        try:
+            while True:
+                for name in names:
+                    asyncio.run(run_benchmark(BENCHMARKS[name]))
+        except KeyboardInterrupt:
+            return 0
+
+    results = {
+        "version": __version__,
+        "python": platform.python_version(),
+        "scales": dict(SCALES),
+        "benchmarks": {
+            name: run_benchmarks(
+                BENCHMARKS[name], args.repeat or DEFAULT_REPEAT, args.memory
+            )
+            for name in names
+        },
+    }
+
+    if args.json is not None:
+        with open(args.json, "w") as json_file:
+            json.dump(results, json_file, indent=2)
+
+    if args.baseline is None:
+        return 0
+
+    with open(args.baseline) as json_file:
+        baseline = json.load(json_file)
+    if baseline["scales"] != results["scales"]:
+        print("The baseline was run with other scales:", baseline["scales"])
+    regressions = compare_results(results, baseline, args.threshold)
+    for regression in regressions:
+        print("Regression:", regression)
+    return 1 if regressions else 0
 
 
 async def run_benchmark(bench):
@@ -51,6 +142,63 @@ async def run_benchmark(bench):
     runtime = await bench(hass)
     print(f"Benchmark {bench.__name__} done in {runtime}s")
     await hass.async_stop()
+    return runtime
+
+
+def run_benchmarks(bench, repeat, trace_memory):
+    """Run a benchmark repeatedly and return the statistics of the runs."""
+    runtimes = sorted(asyncio.run(run_benchmark(bench)) for _ in range(repeat))
+    result = {
+        "runs": repeat,
+        "min": runtimes[0],
+        "mean": sum(runtimes) / repeat,
+        "max": runtimes[-1],
+    }
+    for percent in PERCENTILES:
+        result[f"p{percent}"] = percentile(runtimes, percent)
+
+    if trace_memory:
+        # Tracing slows down the benchmark so it gets a run of its own
+        tracemalloc.start()
+        try:
+            asyncio.run(run_benchmark(bench))
+            retained, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        result["memory_peak"] = peak
+        result["memory_retained"] = retained
+
+    print(
+        f"Benchmark {bench.__name__}: "
+        + ", ".join(f"{key} {value:.6g}" for key, value in result.items())
+    )
+    return result
+
+
+def percentile(values, percent):
+    """Return the nearest rank percentile of sorted values."""
+    return values[max(math.ceil(len(values) * percent / 100), 1) - 1]
+
+
+def compare_results(results, baseline, threshold):
+    """Compare results with a baseline and return the regressions.
+
+    The median runtime and the peak memory of a benchmark regressed
+    when they grew by more than threshold.
+    """
+    regressions = []
+    for name, result in results["benchmarks"].items():
+        if name not in baseline["benchmarks"]:
+            continue
+        base = baseline["benchmarks"][name]
+        for key in ("p50", "memory_peak"):
+            if key not in result or key not in base:
+                continue
+            change = result[key] / base[key] - 1 if base[key] else 0
+            print(f"{name} {key}: {base[key]:.6g} -> {result[key]:.6g} ({change:+.1%})")
+            if change > threshold:
+                regressions.append(f"{name} {key} {change:+.1%}")
+    return regressions
 
 
 def benchmark(func: CALLABLE_T) -> CALLABLE_T:
@@ -118,6 +266,77 @@ async def fire_events_with_filter(hass):
     return timer() - start
 
 
+@benchmark
+async def fire_events_filtered_1k_listeners(hass):
+    """Fire 10000 events with 1000 listeners filtering by device_id."""
+    return await _fire_events_listeners(hass, 1000, keyed=False)
+
+
+@benchmark
+async def fire_events_filtered_10k_listeners(hass):
+    """Fire 10000 events with 10000 listeners filtering by device_id."""
+    return await _fire_events_listeners(hass, 10000, keyed=False)
+
+
+@benchmark
+async def fire_events_keyed_1k_listeners(hass):
+    """Fire 10000 events with 1000 listeners keyed by device_id."""
+    return await _fire_events_listeners(hass, 1000, keyed=True)
+
+
+@benchmark
+async def fire_events_keyed_10k_listeners(hass):
+    """Fire 10000 events with 10000 listeners keyed by device_id."""
+    return await _fire_events_listeners(hass, 10000, keyed=True)
+
+
+async def _fire_events_listeners(hass, listeners, keyed):
+    """Fire events with each listener listening for the events of one device.
+
+    Unlike the other event benchmarks, firing is timed as well as the
+    listeners are matched when the events are fired.
+    """
+    count = 0
+    event_name = "benchmark_event"
+    events_to_fire = 10 ** 4
+
+    @core.callback
+    def listener(_):
+        """Handle event."""
+        nonlocal count
+        count += 1
+
+    @core.callback
+    def event_key(event):
+        """Return the device_id of the event."""
+        return event.data.get("device_id")
+
+    for idx in range(listeners):
+        device_id = f"device{idx}"
+        if keyed:
+            hass.bus.async_listen_keyed(event_name, event_key, [device_id], listener)
+        else:
+
+            @core.callback
+            def event_filter(event, device_id=device_id):
+                """Filter event."""
+                return event.data.get("device_id") == device_id
+
+            hass.bus.async_listen(event_name, listener, event_filter=event_filter)
+
+    event_data = {"device_id": "device0"}
+    start = timer()
+
+    for _ in range(events_to_fire):
+        hass.bus.async_fire(event_name, event_data)
+
+    await hass.async_block_till_done()
+
+    assert count == events_to_fire
+
+    return timer() - start
+
+
 @benchmark
 async def time_changed_helper(hass):
     """Run a million events through time changed helper."""
@@ -264,7 +483,6 @@ async def logbook_filtering_attributes(hass):
     return await _logbook_filtering(hass, 1, 2)
 
 
-@benchmark
 async def _logbook_filtering(hass, last_changed, last_updated):
     # pylint: disable=import-outside-toplevel
     from homeassistant.components import logbook
@@ -390,6 +608,333 @@ async def json_serialize_states(hass):
     return timer() - start
 
 
+@benchmark
+async def json_serialize_all_states(hass):
+    """Serialize all states of 5000 entities 10 times with the JSON backend."""
+    return await _json_serialize_all_states(hass, json_dumps)
+
+
+@benchmark
+async def json_serialize_all_states_stdlib(hass):
+    """Serialize all states of 5000 entities 10 times with the stdlib encoder."""
+    return await _json_serialize_all_states(
+        hass, partial(json.dumps, cls=JSONEncoder, allow_nan=False)
+    )
+
+
+async def _json_serialize_all_states(hass, dumps):
+    """Serialize all states with dumps."""
+    attributes = {
+        "unit_of_measurement": "W",
+        "friendly_name": "Power",
+        "device_class": "power",
+        "state_class": "measurement",
+    }
+    for idx in range(5000):
+        hass.states.async_set(f"sensor.power_{idx}", str(idx), attributes)
+
+    start = timer()
+
+    for _ in range(10):
+        dumps(hass.states.async_all())
+
+    return timer() - start
+
+
+@benchmark
+async def recorder_write_states(hass):
+    """Record 100k state changes of 1000 entities with the session writer."""
+    return await _recorder_write_states(hass, False)
+
+
+@benchmark
+async def recorder_write_states_bulk_insert(hass):
+    """Record 100k state changes of 1000 entities with bulk inserts."""
+    return await _recorder_write_states(hass, True)
+
+
+async def _recorder_write_states(hass, bulk_insert):
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.components import recorder
+
+    events_to_write = 10 ** 5
+    # A burst of 500 state changes per commit interval
+    events_per_commit = 500
+    attributes = {"unit_of_measurement": "W", "friendly_name": "Power"}
+
+    # No statistics platforms
+    hass.data[recorder.DOMAIN] = {}
+    instance = recorder.Recorder(
+        hass,
+        auto_purge=False,
+        keep_days=1,
+        commit_interval=1,
+        uri="sqlite://",
+        db_max_retries=1,
+        db_retry_wait=0,
+        entity_filter=lambda entity_id: True,
+        exclude_t=[],
+        bulk_insert=bulk_insert,
+    )
+
+    events = []
+    time_changed = core.Event(EVENT_TIME_CHANGED, {ATTR_NOW: dt_util.utcnow()})
+    for idx in range(events_to_write):
+        entity_id = f"sensor.power_{idx % 1000}"
+        events.append(
+            core.Event(
+                EVENT_STATE_CHANGED,
+                {
+                    "entity_id": entity_id,
+                    "new_state": core.State(entity_id, str(idx), attributes),
+                },
+            )
+        )
+        if idx % events_per_commit == 0:
+            events.append(time_changed)
+
+    def _write_events():
+        # pylint: disable=protected-access
+        instance._setup_connection()
+        instance._setup_run()
+        start = timer()
+        for event in events:
+            instance._process_one_event(event)
+        instance._commit_event_session_or_retry()
+        return timer() - start
+
+    runtime = await hass.async_add_executor_job(_write_events)
+    print(f"Recorded {events_to_write / runtime:.0f} state changes per second")
+    return runtime
+
+
+@benchmark
+async def state_machine_set(hass):
+    """Set the state of every entity 10 times."""
+    entities = SCALES["entities"]
+    attributes = {"unit_of_measurement": "W", "friendly_name": "Power"}
+    entity_ids = [f"sensor.power_{idx}" for idx in range(entities)]
+
+    start = timer()
+
+    for value in range(10):
+        for entity_id in entity_ids:
+            hass.states.async_set(entity_id, str(value), attributes)
+
+    await hass.async_block_till_done()
+
+    return timer() - start
+
+
+@benchmark
+async def service_registry_call(hass):
+    """Call a service 10000 times and wait for each call to be handled."""
+    count = 0
+    calls = 10 ** 4
+
+    @core.callback
+    def handle_service(_):
+        """Handle service call."""
+        nonlocal count
+        count += 1
+
+    hass.services.async_register("benchmark", "service", handle_service)
+
+    start = timer()
+
+    for idx in range(calls):
+        await hass.services.async_call(
+            "benchmark", "service", {"entity_id": f"light.kitchen_{idx}"}, blocking=True
+        )
+
+    assert count == calls
+
+    return timer() - start
+
+
+@benchmark
+async def template_render(hass):
+    """Render templates of the states of the entities 10 times."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.helpers.template import Template
+
+    entities = SCALES["entities"]
+    for idx in range(entities):
+        hass.states.async_set(f"sensor.power_{idx}", str(idx))
+
+    templates = [
+        Template(
+            f"{{{{ states('sensor.power_{idx % entities}') | float * 2 }}}} "
+            f"{{{{ is_state('sensor.power_{idx % entities}', '{idx}') }}}}",
+            hass,
+        )
+        for idx in range(SCALES["templates"])
+    ]
+    for template in templates:
+        template.ensure_valid()
+
+    start = timer()
+
+    for _ in range(10):
+        for template in templates:
+            template.async_render()
+
+    return timer() - start
+
+
+@benchmark
+async def automation_state_triggers(hass):
+    """Run automations triggered by state changes of their entity 10 times."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.setup import async_setup_component
+
+    automations = SCALES["automations"]
+    count = 0
+
+    @core.callback
+    def handle_service(_):
+        """Handle service call."""
+        nonlocal count
+        count += 1
+
+    hass.services.async_register("benchmark", "automation", handle_service)
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        await _async_setup_integration_support(hass, config_dir)
+        entity_ids = [f"binary_sensor.motion_{idx}" for idx in range(automations)]
+        for entity_id in entity_ids:
+            hass.states.async_set(entity_id, "off")
+        assert await async_setup_component(
+            hass,
+            "automation",
+            {
+                "automation": [
+                    {
+                        "trigger": {
+                            "platform": "state",
+                            "entity_id": entity_id,
+                            "to": "on",
+                        },
+                        "action": {"service": "benchmark.automation"},
+                    }
+                    for entity_id in entity_ids
+                ]
+            },
+        )
+        await hass.async_block_till_done()
+
+        start = timer()
+
+        for _ in range(10):
+            for entity_id in entity_ids:
+                hass.states.async_set(entity_id, "on")
+            # An automation is not triggered again while it is running
+            await hass.async_block_till_done()
+            for entity_id in entity_ids:
+                hass.states.async_set(entity_id, "off")
+
+        await hass.async_block_till_done()
+        runtime = timer() - start
+
+        assert count == automations * 10
+
+        await hass.async_stop()
+
+    return runtime
+
+
+async def _async_setup_integration_support(hass, config_dir):
+    """Set up what integrations expect from bootstrap."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant import config_entries
+    from homeassistant.helpers import area_registry, device_registry, entity_registry
+
+    hass.config.config_dir = config_dir
+    hass.config.skip_pip = True
+    hass.state = core.CoreState.running
+    hass.config_entries = config_entries.ConfigEntries(hass, {})
+    await asyncio.gather(
+        area_registry.async_load(hass),
+        device_registry.async_load(hass),
+        entity_registry.async_load(hass),
+    )
+
+
+@benchmark
+async def websocket_fan_out(hass):
+    """Send 1000 state changes to every websocket subscribed to state changes."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.auth.models import RefreshToken, User
+    from homeassistant.components.websocket_api import commands
+    from homeassistant.components.websocket_api.connection import ActiveConnection
+
+    connections = SCALES["listeners"]
+    state_changes = 1000
+    count = 0
+    user = User(name="Benchmark", perm_lookup=None, is_owner=True)
+    refresh_token = RefreshToken(user, "benchmark", timedelta(minutes=30))
+
+    def send_message(message, coalesce_key=None):
+        """Handle sent message."""
+        nonlocal count
+        count += 1
+
+    for _ in range(connections):
+        connection = ActiveConnection(
+            logging.getLogger(__name__), hass, send_message, user, refresh_token
+        )
+        commands.handle_subscribe_events(
+            hass,
+            connection,
+            {"id": 1, "type": "subscribe_events", "event_type": EVENT_STATE_CHANGED},
+        )
+    # Every subscription sent its result
+    count = 0
+
+    start = timer()
+
+    for idx in range(state_changes):
+        hass.states.async_set("light.kitchen", "on" if idx % 2 else "off")
+
+    await hass.async_block_till_done()
+
+    assert count == connections * state_changes
+
+    return timer() - start
+
+
+@benchmark
+async def mqtt_route_messages(hass):
+    """Route 100k MQTT messages to the subscriptions with a matching topic."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.components.mqtt.router import TopicRouter
+
+    devices = SCALES["mqtt_subscriptions"]
+    messages = 10 ** 5
+    router = TopicRouter()
+
+    # Subscriptions like the ones of Zigbee2MQTT discovered entities
+    for idx in range(devices):
+        router.add(f"zigbee2mqtt/device_{idx}", idx)
+        router.add(f"zigbee2mqtt/device_{idx}/availability", idx)
+    router.add("homeassistant/+/+/config", -1)
+    router.add("homeassistant/+/+/+/config", -1)
+    router.add("zigbee2mqtt/bridge/#", -1)
+
+    topics = [f"zigbee2mqtt/device_{idx}" for idx in range(devices)]
+
+    start = timer()
+
+    count = 0
+    for idx in range(messages):
+        count += len(router.match(topics[idx % devices]))
+
+    elapsed = timer() - start
+    assert count == messages
+    print(f"Routed {messages / elapsed:.0f} messages/s to {3 + 2 * devices} topics")
+    return elapsed
+
+
 def _create_state_changed_event_from_old_new(
     entity_id, event_time_fired, old_state, new_state
 ):
@@ -412,6 +957,7 @@ def _create_state_changed_event_from_old_new(
             "entity_id"
             "domain"
             "attributes"
+            "shared_attrs"
             "state_id",
             "old_state_id",
         ],
@@ -419,7 +965,8 @@ def _create_state_changed_event_from_old_new(
 
     row.event_type = EVENT_STATE_CHANGED
     row.event_data = "{}"
-    row.attributes = attributes_json
+    row.attributes = None
+    row.shared_attrs = attributes_json
     row.time_fired = event_time_fired
     row.state = new_state and new_state.get("state")
     row.entity_id = entity_id
@@ -7,7 +7,7 @@ import contextlib
 import logging.handlers
 from timeit import default_timer as timer
 from types import ModuleType
-from typing import Callable
+from typing import Any, Callable
 
 from homeassistant import config as conf_util, core, loader, requirements
 from homeassistant.config import async_notify_setup_error
@@ -52,6 +52,7 @@ BASE_PLATFORMS = {
 DATA_SETUP_DONE = "setup_done"
 DATA_SETUP_STARTED = "setup_started"
 DATA_SETUP_TIME = "setup_time"
+DATA_SETUP_TIMELINE = "setup_timeline"
 
 DATA_SETUP = "setup_tasks"
 DATA_DEPS_REQS = "deps_reqs_processed"
@@ -173,19 +174,20 @@ async def _async_setup_component(
         _LOGGER.error("Setup failed for %s: %s", domain, msg)
         async_notify_setup_error(hass, domain, link)
 
-    try:
-        integration = await loader.async_get_integration(hass, domain)
-    except loader.IntegrationNotFound:
-        log_error("Integration not found.")
-        return False
+    with async_record_setup_phase(hass, domain, "resolve"):
+        try:
+            integration = await loader.async_get_integration(hass, domain)
+        except loader.IntegrationNotFound:
+            log_error("Integration not found.")
+            return False
 
-    if integration.disabled:
-        log_error(f"Dependency is disabled - {integration.disabled}")
-        return False
+        if integration.disabled:
+            log_error(f"Dependency is disabled - {integration.disabled}")
+            return False
 
-    # Validate all dependencies exist and there are no circular dependencies
-    if not await integration.resolve_dependencies():
-        return False
+        # Validate all dependencies exist and there are no circular dependencies
+        if not await integration.resolve_dependencies():
+            return False
 
     # Process requirements as soon as possible, so we can import the component
     # without requiring imports to be in functions.
@@ -198,7 +200,8 @@ async def _async_setup_component(
     # Some integrations fail on import because they call functions incorrectly.
     # So we do it before validating config to catch these errors.
     try:
-        component = integration.get_component()
+        with async_record_setup_phase(hass, domain, "import"):
+            component = await integration.async_get_component()
     except ImportError as err:
         log_error(f"Unable to import component: {err}", integration.documentation)
         return False
@@ -326,7 +329,7 @@ async def async_prepare_setup_platform(
         return None
 
     try:
-        platform = integration.get_platform(domain)
+        platform = await integration.async_get_platform(domain)
     except ImportError as exc:
         log_error(f"Platform not found ({exc}).")
         return None
@@ -339,7 +342,7 @@ async def async_prepare_setup_platform(
     # If the integration is not set up yet, and can be set up, set it up.
     if integration.domain not in hass.config.components:
         try:
-            component = integration.get_component()
+            component = await integration.async_get_component()
         except ImportError as exc:
             log_error(f"Unable to import the component ({exc}).")
             return None
@@ -367,14 +370,16 @@ async def async_process_deps_reqs(
     elif integration.domain in processed:
         return
 
-    if not await _async_process_dependencies(hass, config, integration):
-        raise HomeAssistantError("Could not set up all dependencies.")
+    with async_record_setup_phase(hass, integration.domain, "dependencies"):
+        if not await _async_process_dependencies(hass, config, integration):
+            raise HomeAssistantError("Could not set up all dependencies.")
 
     if not hass.config.skip_pip and integration.requirements:
-        async with hass.timeout.async_freeze(integration.domain):
-            await requirements.async_get_integration_with_requirements(
-                hass, integration.domain
-            )
+        with async_record_setup_phase(hass, integration.domain, "requirements"):
+            async with hass.timeout.async_freeze(integration.domain):
+                await requirements.async_get_integration_with_requirements(
+                    hass, integration.domain
+                )
 
     processed.add(integration.domain)
 
@@ -458,6 +463,7 @@ def async_start_setup(hass: core.HomeAssistant, components: Iterable) -> Generat
     """Keep track of when setup starts and finishes."""
     setup_started = hass.data.setdefault(DATA_SETUP_STARTED, {})
     started = dt_util.utcnow()
+    start = timer()
     unique_components = {}
     for domain in components:
         unique = ensure_unique_string(domain, setup_started)
@@ -468,13 +474,85 @@ def async_start_setup(hass: core.HomeAssistant, components: Iterable) -> Generat
 
     setup_time = hass.data.setdefault(DATA_SETUP_TIME, {})
     time_taken = dt_util.utcnow() - started
+    end = timer()
     for unique, domain in unique_components.items():
         del setup_started[unique]
         if "." in domain:
-            _, integration = domain.split(".", 1)
+            platform, integration = domain.split(".", 1)
+            phase = f"{platform} platform setup"
         else:
             integration = domain
+            phase = "setup"
         if integration in setup_time:
             setup_time[integration] += time_taken
         else:
             setup_time[integration] = time_taken
+        _async_add_to_setup_timeline(hass, integration, phase, start, end)
+
+
+@contextlib.contextmanager
+def async_record_setup_phase(
+    hass: core.HomeAssistant, integration: str, phase: str
+) -> Generator:
+    """Record when a phase of the setup of an integration starts and finishes."""
+    start = timer()
+    try:
+        yield
+    finally:
+        _async_add_to_setup_timeline(hass, integration, phase, start, timer())
+
+
+@core.callback
+def _async_add_to_setup_timeline(
+    hass: core.HomeAssistant, integration: str, phase: str, start: float, end: float
+) -> None:
+    """Add a setup phase to the timeline while Home Assistant is starting.
+
+    Integrations set up once Home Assistant is running are not recorded,
+    so the timeline doesn't keep growing.
+    """
+    if hass.state in (core.CoreState.not_running, core.CoreState.starting):
+        hass.data.setdefault(DATA_SETUP_TIMELINE, []).append(
+            (integration, phase, start, end)
+        )
+
+
+@core.callback
+def async_get_setup_timeline(hass: core.HomeAssistant) -> dict[str, Any]:
+    """Return the setup phases of the integrations in the Chrome trace format.
+
+    Each integration is shown as a thread so the phases of all integrations
+    can be compared on a single timeline.
+    """
+    setup_timeline: list[tuple[str, str, float, float]] = hass.data.get(
+        DATA_SETUP_TIMELINE, []
+    )
+    origin = min((start for _, _, start, _ in setup_timeline), default=0)
+    thread_ids: dict[str, int] = {}
+    trace_events: list[dict[str, Any]] = []
+
+    for integration, phase, start, end in setup_timeline:
+        if (thread_id := thread_ids.get(integration)) is None:
+            thread_id = thread_ids[integration] = len(thread_ids) + 1
+            trace_events.append(
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": 1,
+                    "tid": thread_id,
+                    "args": {"name": integration},
+                }
+            )
+        trace_events.append(
+            {
+                "name": phase,
+                "cat": "setup",
+                "ph": "X",
+                "pid": 1,
+                "tid": thread_id,
+                "ts": round((start - origin) * 1_000_000),
+                "dur": round((end - start) * 1_000_000),
+            }
+        )
+
+    return {"traceEvents": trace_events, "displayTimeUnit": "ms"}
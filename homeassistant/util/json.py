@@ -10,6 +10,7 @@ from typing import Any, Callable
 
 from homeassistant.core import Event, State
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.json import JSONEncoder, json_bytes
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -54,7 +55,12 @@ def save_json(
     Returns True on success.
     """
     try:
-        json_data = json.dumps(data, indent=4, cls=encoder)
+        if encoder is None:
+            json_data = json_bytes(data, indent=True, default=None)
+        elif encoder is JSONEncoder:
+            json_data = json_bytes(data, indent=True)
+        else:
+            json_data = json.dumps(data, indent=4, cls=encoder).encode("utf-8")
     except TypeError as error:
         msg = f"Failed to serialize to JSON: {filename}. Bad data at {format_unserializable_data(find_paths_unserializable_data(data))}"
         _LOGGER.error(msg)
@@ -65,7 +71,7 @@ def save_json(
     try:
         # Modern versions of Python tempfile create this file with mode 0o600
         with tempfile.NamedTemporaryFile(
-            mode="w", encoding="utf-8", dir=tmp_path, delete=False
+            mode="wb", dir=tmp_path, delete=False
         ) as fdesc:
             fdesc.write(json_data)
             tmp_filename = fdesc.name
@@ -12,6 +12,7 @@ from . import (
     dhcp,
     json,
     manifest,
+    manifests,
     mqtt,
     mypy_config,
     requirements,
@@ -34,6 +35,7 @@ INTEGRATION_PLUGINS = [
     translations,
     zeroconf,
     dhcp,
+    manifests,
 ]
 HASS_PLUGINS = [
     coverage,
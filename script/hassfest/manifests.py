@@ -0,0 +1,80 @@
+"""Generate manifests file."""
+from __future__ import annotations
+
+import json
+from typing import Any
+
+from .model import Config, Integration
+
+BASE = """
+\"\"\"Automatically generated by hassfest.
+
+To update, run python3 -m script.hassfest
+\"\"\"
+
+# fmt: off
+
+MANIFESTS = {}
+""".strip()
+
+
+def format_value(value: Any, indent: int = 0) -> str:
+    """Format a JSON value as a Python literal."""
+    pad = " " * indent
+    if isinstance(value, dict):
+        if not value:
+            return "{}"
+        items = [
+            f"{pad}    {json.dumps(key)}: {format_value(item, indent + 4)},"
+            for key, item in value.items()
+        ]
+        return "{{\n{}\n{}}}".format("\n".join(items), pad)
+    if isinstance(value, list):
+        if not value:
+            return "[]"
+        items = [f"{pad}    {format_value(item, indent + 4)}," for item in value]
+        return "[\n{}\n{}]".format("\n".join(items), pad)
+    if isinstance(value, bool) or value is None:
+        return repr(value)
+    return json.dumps(value)
+
+
+def generate_and_validate(integrations: dict[str, Integration]):
+    """Validate and generate manifests data."""
+    manifests = {}
+
+    for domain in sorted(integrations):
+        integration = integrations[domain]
+
+        if not integration.manifest:
+            continue
+
+        manifests[domain] = integration.manifest
+
+    return BASE.format(format_value(manifests))
+
+
+def validate(integrations: dict[str, Integration], config: Config):
+    """Validate manifests file."""
+    manifests_path = config.root / "homeassistant/generated/manifests.py"
+    config.cache["manifests"] = content = generate_and_validate(integrations)
+
+    if config.specific_integrations:
+        return
+
+    with open(str(manifests_path)) as fp:
+        if fp.read().strip() != content:
+            config.add_error(
+                "manifests",
+                "File manifests.py is not up to date. "
+                "Run python3 -m script.hassfest",
+                fixable=True,
+            )
+        return
+
+
+def generate(integrations: dict[str, Integration], config: Config):
+    """Generate manifests file."""
+    manifests_path = config.root / "homeassistant/generated/manifests.py"
+    with open(str(manifests_path), "w") as fp:
+        fp.write(f"{config.cache['manifests']}\n")
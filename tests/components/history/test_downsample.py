@@ -0,0 +1,38 @@
+"""The tests for the history downsampling."""
+from datetime import timedelta
+
+from homeassistant.components.history.downsample import downsample
+import homeassistant.util.dt as dt_util
+
+
+def test_downsample():
+    """Test downsampling numeric and non numeric states."""
+    start = dt_util.utcnow().replace(microsecond=0)
+    end = start + timedelta(minutes=40)
+    minutes = timedelta(minutes=1)
+    values = [
+        ("1", start),
+        ("3", start + 5 * minutes),
+        ("nan", start + 15 * minutes),
+        ("on", start + 25 * minutes),
+    ]
+
+    assert downsample(values, start, end, 10 * minutes) == [
+        {"start": start.isoformat(), "mean": 2, "min": 1, "max": 3},
+        {"start": (start + 10 * minutes).isoformat(), "mean": 3, "min": 3, "max": 3},
+        {"start": (start + 20 * minutes).isoformat(), "state": "on"},
+        {"start": (start + 30 * minutes).isoformat(), "state": "on"},
+    ]
+
+
+def test_downsample_starts_at_first_state():
+    """Test no buckets are returned before the first state."""
+    start = dt_util.utcnow().replace(microsecond=0)
+    end = start + timedelta(minutes=25)
+    minutes = timedelta(minutes=1)
+
+    assert downsample([], start, end, 10 * minutes) == []
+    assert downsample([("4", start + 12 * minutes)], start, end, 10 * minutes) == [
+        {"start": (start + 10 * minutes).isoformat(), "mean": 4, "min": 4, "max": 4},
+        {"start": (start + 20 * minutes).isoformat(), "mean": 4, "min": 4, "max": 4},
+    ]
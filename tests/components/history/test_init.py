@@ -6,11 +6,14 @@ from unittest.mock import patch, sentinel
 
 import pytest
 from pytest import approx
+from sqlalchemy.exc import SQLAlchemyError
 
 from homeassistant.components import history, recorder
 from homeassistant.components.recorder.history import get_significant_states
 from homeassistant.components.recorder.models import process_timestamp
+from homeassistant.const import EVENT_STATE_CHANGED
 import homeassistant.core as ha
+from homeassistant.helpers.event import entity_id_event_key
 from homeassistant.helpers.json import JSONEncoder
 from homeassistant.setup import async_setup_component
 import homeassistant.util.dt as dt_util
@@ -613,6 +616,137 @@ async def test_fetch_period_api_with_minimal_response(hass, hass_client):
     assert response.status == 200
 
 
+async def test_fetch_downsampled_api(hass, hass_client):
+    """Test the downsampled history view."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "history", {})
+    instance = hass.data[recorder.DATA_INSTANCE]
+    start = dt_util.utcnow().replace(microsecond=0) - timedelta(hours=2)
+
+    for offset, state in (
+        (timedelta(seconds=1), "10"),
+        (timedelta(minutes=30), "20"),
+        (timedelta(minutes=45), "40"),
+        (timedelta(minutes=50), "unavailable"),
+        (timedelta(minutes=90), "30"),
+    ):
+        with patch("homeassistant.core.dt_util.utcnow", return_value=start + offset):
+            hass.states.async_set("sensor.power", state)
+            hass.states.async_set("light.kitchen", "on" if state != "40" else "off")
+    await hass.async_block_till_done()
+    await hass.async_add_executor_job(trigger_db_commit, hass)
+    await hass.async_add_executor_job(instance.block_till_done)
+
+    client = await hass_client()
+    response = await client.get(
+        f"/api/history/downsampled/{start.isoformat()}",
+        params={
+            "filter_entity_id": "sensor.power,light.kitchen",
+            "end_time": (start + timedelta(hours=1)).isoformat(),
+            "bucket": "1800",
+        },
+    )
+    assert response.status == 200
+    assert await response.json() == [
+        {
+            "entity_id": "sensor.power",
+            "buckets": [
+                {"start": start.isoformat(), "mean": 10, "min": 10, "max": 10},
+                {
+                    "start": (start + timedelta(minutes=30)).isoformat(),
+                    "mean": 25,
+                    "min": 20,
+                    "max": 40,
+                },
+            ],
+        },
+        {
+            "entity_id": "light.kitchen",
+            "buckets": [
+                {"start": start.isoformat(), "state": "on"},
+                {"start": (start + timedelta(minutes=30)).isoformat(), "state": "on"},
+            ],
+        },
+    ]
+
+    response = await client.get(
+        f"/api/history/downsampled/{start.isoformat()}",
+        params={
+            "filter_entity_id": "sensor.power",
+            "end_time": (start + timedelta(hours=2)).isoformat(),
+            "points": "4",
+        },
+    )
+    assert response.status == 200
+    buckets = (await response.json())[0]["buckets"]
+    assert len(buckets) == 4
+    assert buckets[3] == {
+        "start": (start + timedelta(minutes=90)).isoformat(),
+        "mean": 30,
+        "min": 30,
+        "max": 30,
+    }
+
+
+async def test_fetch_downsampled_api_with_exclude(hass, hass_client):
+    """Test the downsampled history view leaves out excluded entities."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(
+        hass,
+        "history",
+        {
+            history.DOMAIN: {
+                history.CONF_EXCLUDE: {history.CONF_DOMAINS: ["light"]},
+            }
+        },
+    )
+    instance = hass.data[recorder.DATA_INSTANCE]
+    start = dt_util.utcnow().replace(microsecond=0) - timedelta(hours=1)
+
+    with patch(
+        "homeassistant.core.dt_util.utcnow", return_value=start + timedelta(seconds=1)
+    ):
+        hass.states.async_set("sensor.power", "10")
+        hass.states.async_set("light.kitchen", "on")
+    await hass.async_block_till_done()
+    await hass.async_add_executor_job(trigger_db_commit, hass)
+    await hass.async_add_executor_job(instance.block_till_done)
+
+    client = await hass_client()
+    response = await client.get(
+        f"/api/history/downsampled/{start.isoformat()}",
+        params={
+            "filter_entity_id": "sensor.power,light.kitchen",
+            "end_time": (start + timedelta(minutes=30)).isoformat(),
+            "bucket": "1800",
+        },
+    )
+    assert response.status == 200
+    assert [entity["entity_id"] for entity in await response.json()] == ["sensor.power"]
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {},
+        {"filter_entity_id": "sensor.power", "points": "0"},
+        {"filter_entity_id": "sensor.power", "points": "many"},
+        {"filter_entity_id": "sensor.power", "points": str(history.MAX_POINTS + 1)},
+        {"filter_entity_id": "sensor.power", "bucket": "-1"},
+        {"filter_entity_id": "sensor.power", "bucket": "1"},
+        {"filter_entity_id": "sensor.power", "end_time": "yesterday"},
+    ],
+)
+async def test_fetch_downsampled_api_invalid(hass, hass_client, params):
+    """Test the downsampled history view with invalid parameters."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "history", {})
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+    client = await hass_client()
+    response = await client.get("/api/history/downsampled", params=params)
+    assert response.status == 400
+
+
 async def test_fetch_period_api_with_no_timestamp(hass, hass_client):
     """Test the fetch period view for history with no timestamp."""
     await hass.async_add_executor_job(init_recorder_component, hass)
@@ -847,6 +981,159 @@ TEMPERATURE_SENSOR_ATTRIBUTES = {
 }
 
 
+async def test_stream_history(hass, hass_ws_client):
+    """Test streaming the history of entities followed by their state changes."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "history", {})
+    instance = hass.data[recorder.DATA_INSTANCE]
+    await hass.async_add_executor_job(instance.block_till_done)
+    start = dt_util.utcnow()
+
+    for state in ("1", "2", "3"):
+        hass.states.async_set("sensor.power", state, {"unit_of_measurement": "W"})
+        hass.states.async_set("light.kitchen", "on" if state == "2" else "off")
+        await hass.async_block_till_done()
+    # Attribute changes are not state changes
+    hass.states.async_set("sensor.power", "3", {"unit_of_measurement": "kW"})
+    await hass.async_block_till_done()
+    await hass.async_add_executor_job(trigger_db_commit, hass)
+    await hass.async_add_executor_job(instance.block_till_done)
+
+    client = await hass_ws_client()
+    with patch.object(history, "STREAM_BATCH_SIZE", 2):
+        await client.send_json(
+            {
+                "id": 1,
+                "type": "history/stream",
+                "start_time": start.isoformat(),
+                "entity_ids": ["sensor.power", "light.kitchen"],
+                "minimal_response": True,
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+
+        batches = []
+        while True:
+            response = await client.receive_json()
+            assert response["id"] == 1
+            assert response["type"] == "event"
+            if response["event"].get("history_complete"):
+                break
+            batches.append(response["event"])
+
+    assert [(batch["entity_id"], len(batch["states"])) for batch in batches] == [
+        ("sensor.power", 2),
+        ("sensor.power", 1),
+        ("light.kitchen", 2),
+        ("light.kitchen", 1),
+    ]
+    assert batches[0]["states"][0]["attributes"] == {"unit_of_measurement": "W"}
+    assert batches[0]["states"][1] == {
+        "state": "2",
+        "last_changed": batches[0]["states"][1]["last_changed"],
+    }
+    assert [state["state"] for state in batches[3]["states"]] == ["off"]
+
+    hass.states.async_set("sensor.power", "4")
+    hass.states.async_set("sensor.other", "5")
+    await hass.async_block_till_done()
+    response = await client.receive_json()
+    assert response["event"]["entity_id"] == "sensor.power"
+    assert response["event"]["states"][0]["state"] == "4"
+
+    await client.send_json({"id": 2, "type": "unsubscribe_events", "subscription": 1})
+    response = await client.receive_json()
+    assert response["success"]
+
+
+async def test_stream_history_ended(hass, hass_ws_client):
+    """Test streaming the history of a period that ended."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "history", {})
+    instance = hass.data[recorder.DATA_INSTANCE]
+    await hass.async_add_executor_job(instance.block_till_done)
+    start = dt_util.utcnow()
+
+    hass.states.async_set("sensor.power", "1")
+    await hass.async_block_till_done()
+    await hass.async_add_executor_job(trigger_db_commit, hass)
+    await hass.async_add_executor_job(instance.block_till_done)
+    end = dt_util.utcnow()
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/stream",
+            "start_time": start.isoformat(),
+            "end_time": end.isoformat(),
+            "entity_ids": ["sensor.power"],
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    response = await client.receive_json()
+    assert response["event"]["entity_id"] == "sensor.power"
+    assert [state["state"] for state in response["event"]["states"]] == ["1"]
+    response = await client.receive_json()
+    assert response["event"] == {"history_complete": True}
+
+    # The period ended so there are no live state changes
+    hass.states.async_set("sensor.power", "2")
+    await hass.async_block_till_done()
+    await client.send_json({"id": 2, "type": "ping"})
+    response = await client.receive_json()
+    assert response["id"] == 2
+
+
+async def test_stream_history_read_error(hass, hass_ws_client):
+    """Test streaming stops when the history can't be read."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "history", {})
+    client = await hass_ws_client()
+    with patch.object(
+        history, "_read_stream_batch", side_effect=SQLAlchemyError("no database")
+    ):
+        await client.send_json(
+            {
+                "id": 1,
+                "type": "history/stream",
+                "start_time": dt_util.utcnow().isoformat(),
+                "entity_ids": ["sensor.power"],
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        response = await client.receive_json()
+        assert response["id"] == 1
+        assert not response["success"]
+        assert response["error"]["code"] == "unknown_error"
+
+    # The state changes are no longer tracked
+    assert (
+        hass.bus.async_keyed_listeners(EVENT_STATE_CHANGED, entity_id_event_key) == {}
+    )
+
+
+async def test_stream_history_bad_start_time(hass, hass_ws_client):
+    """Test streaming history with an invalid start time."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "history", {})
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/stream",
+            "start_time": "cats",
+            "entity_ids": ["sensor.power"],
+        }
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "invalid_start_time"
+
+
 @pytest.mark.parametrize(
     "units, attributes, state, value",
     [
@@ -858,8 +1145,9 @@ TEMPERATURE_SENSOR_ATTRIBUTES = {
         (METRIC_SYSTEM, PRESSURE_SENSOR_ATTRIBUTES, 1000, 100000),
     ],
 )
+@pytest.mark.parametrize("period", ["hour", "5minute"])
 async def test_statistics_during_period(
-    hass, hass_ws_client, units, attributes, state, value
+    hass, hass_ws_client, units, attributes, state, value, period
 ):
     """Test statistics_during_period."""
     now = dt_util.utcnow()
@@ -875,7 +1163,7 @@ async def test_statistics_during_period(
     await hass.async_add_executor_job(trigger_db_commit, hass)
     await hass.async_block_till_done()
 
-    hass.data[recorder.DATA_INSTANCE].do_adhoc_statistics(period="hourly", start=now)
+    hass.data[recorder.DATA_INSTANCE].do_adhoc_statistics(period=period, start=now)
     await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
 
     client = await hass_ws_client()
@@ -886,6 +1174,7 @@ async def test_statistics_during_period(
             "start_time": now.isoformat(),
             "end_time": now.isoformat(),
             "statistic_ids": ["sensor.test"],
+            "period": period,
         }
     )
     response = await client.receive_json()
@@ -898,7 +1187,9 @@ async def test_statistics_during_period(
             "id": 1,
             "type": "history/statistics_during_period",
             "start_time": now.isoformat(),
+            "end_time": (now + timedelta(minutes=5)).isoformat(),
             "statistic_ids": ["sensor.test"],
+            "period": period,
         }
     )
     response = await client.receive_json()
@@ -37,12 +37,13 @@ from homeassistant.const import (
     ATTR_BATTERY_LEVEL,
     ATTR_ENTITY_ID,
     ATTR_SERVICE,
+    EVENT_STATE_CHANGED,
     STATE_OFF,
     STATE_ON,
     STATE_UNAVAILABLE,
     __version__,
 )
-from homeassistant.helpers.event import TRACK_STATE_CHANGE_CALLBACKS
+from homeassistant.helpers.event import entity_id_event_key
 
 from tests.common import async_mock_service
 
@@ -58,9 +59,11 @@ async def test_accessory_cancels_track_state_change_on_stop(hass, hk_driver):
         "homeassistant.components.homekit.accessories.HomeAccessory.async_update_state"
     ):
         await acc.run()
-    assert len(hass.data[TRACK_STATE_CHANGE_CALLBACKS][entity_id]) == 1
+    listeners = hass.bus.async_keyed_listeners(EVENT_STATE_CHANGED, entity_id_event_key)
+    assert listeners[entity_id] == 1
     acc.async_stop()
-    assert entity_id not in hass.data[TRACK_STATE_CHANGE_CALLBACKS]
+    listeners = hass.bus.async_keyed_listeners(EVENT_STATE_CHANGED, entity_id_event_key)
+    assert entity_id not in listeners
 
 
 async def test_home_accessory(hass, hk_driver):
@@ -19,6 +19,7 @@ from homeassistant.const import (
     TEMP_CELSIUS,
 )
 from homeassistant.core import callback
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import device_registry as dr
 from homeassistant.setup import async_setup_component
 from homeassistant.util.dt import utcnow
@@ -321,6 +322,71 @@ async def test_all_subscriptions_run_when_decode_fails(
     assert len(calls) == 1
 
 
+async def test_inbound_messages_dispatched_in_batches(
+    hass, hass_ws_client, mqtt_client_mock, calls, record_calls
+):
+    """Test messages received together are dispatched in one loop wakeup."""
+    assert await async_setup_component(
+        hass, mqtt.DOMAIN, {mqtt.DOMAIN: {mqtt.CONF_BROKER: "mock-broker"}}
+    )
+    await hass.async_block_till_done()
+    mqtt_data = hass.data["mqtt"]
+
+    await mqtt.async_subscribe(hass, "test/+", record_calls, encoding="utf-8")
+    await mqtt.async_subscribe(hass, "test/#", record_calls, encoding="utf-8")
+
+    for idx in range(3):
+        msg = mqtt.models.ReceiveMessage(f"test/{idx}", b"on", 0, False)
+        mqtt_data._mqtt_on_message(None, None, msg)
+    assert len(calls) == 0
+
+    await hass.async_block_till_done()
+    assert len(calls) == 6
+    assert [args[0].payload for args in calls] == ["on"] * 6
+
+    metrics = mqtt_data.inbound_metrics
+    assert metrics.messages == 3
+    assert metrics.batches == 1
+    assert metrics.queue_depth_max == 3
+
+    client = await hass_ws_client(hass)
+    await client.send_json({"id": 5, "type": "mqtt/inbound_metrics"})
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"]["messages"] == 3
+    assert response["result"]["queue_depth_max"] == 3
+    assert response["result"]["dispatch_latency_avg"] == pytest.approx(
+        metrics.dispatch_latency_total / 3
+    )
+
+
+async def test_inbound_batch_survives_failing_subscriber(
+    hass, mqtt_client_mock, calls, record_calls, caplog
+):
+    """Test a failing subscriber doesn't stop the rest of the batch."""
+    assert await async_setup_component(
+        hass, mqtt.DOMAIN, {mqtt.DOMAIN: {mqtt.CONF_BROKER: "mock-broker"}}
+    )
+    await hass.async_block_till_done()
+    mqtt_data = hass.data["mqtt"]
+
+    @callback
+    def bad_handler(msg):
+        """Fail to handle the message."""
+        raise ValueError
+
+    await mqtt.async_subscribe(hass, "test/bad", bad_handler)
+    await mqtt.async_subscribe(hass, "test/good", record_calls)
+
+    for topic in ("test/bad", "test/good"):
+        msg = mqtt.models.ReceiveMessage(topic, b"on", 0, False)
+        mqtt_data._mqtt_on_message(None, None, msg)
+
+    await hass.async_block_till_done()
+    assert len(calls) == 1
+    assert "Error while dispatching message on test/bad" in caplog.text
+
+
 async def test_subscribe_topic(hass, mqtt_mock, calls, record_calls):
     """Test the subscription of a topic."""
     unsub = await mqtt.async_subscribe(hass, "test-topic", record_calls)
@@ -664,16 +730,14 @@ async def test_restore_all_active_subscriptions_on_reconnect(
     # Fake that the client is connected
     mqtt_mock().connected = True
 
-    unsub = await mqtt.async_subscribe(hass, "test/state", None, qos=2)
-    await mqtt.async_subscribe(hass, "test/state", None)
-    await mqtt.async_subscribe(hass, "test/state", None, qos=1)
+    unsub, *_ = await asyncio.gather(
+        mqtt.async_subscribe(hass, "test/state", None, qos=2),
+        mqtt.async_subscribe(hass, "test/state", None),
+        mqtt.async_subscribe(hass, "test/state", None, qos=1),
+    )
     await hass.async_block_till_done()
 
-    expected = [
-        call("test/state", 2),
-        call("test/state", 0),
-        call("test/state", 1),
-    ]
+    expected = [call([("test/state", 2)])]
     assert mqtt_client_mock.subscribe.mock_calls == expected
 
     unsub()
@@ -685,10 +749,80 @@ async def test_restore_all_active_subscriptions_on_reconnect(
         mqtt_mock._mqtt_on_connect(None, None, None, 0)
         await hass.async_block_till_done()
 
-    expected.append(call("test/state", 1))
+    expected.append(call([("test/state", 1)]))
     assert mqtt_client_mock.subscribe.mock_calls == expected
 
 
+async def test_subscriptions_batched(hass, mqtt_client_mock, mqtt_mock):
+    """Test subscriptions made together are sent in one packet."""
+    # Fake that the client is connected
+    mqtt_mock().connected = True
+
+    unsub_a, unsub_b = await asyncio.gather(
+        mqtt.async_subscribe(hass, "test/a", None),
+        mqtt.async_subscribe(hass, "test/b", None, qos=1),
+    )
+
+    mqtt_client_mock.subscribe.assert_called_once_with([("test/a", 0), ("test/b", 1)])
+
+    unsub_a()
+    unsub_b()
+    await hass.async_block_till_done()
+
+    mqtt_client_mock.unsubscribe.assert_called_once_with(["test/a", "test/b"])
+
+
+async def test_subscribe_waits_for_broker(hass, mqtt_client_mock, mqtt_mock):
+    """Test subscribing returns once the broker acknowledged the subscription."""
+    # Fake that the client is connected
+    mqtt_mock().connected = True
+
+    await mqtt.async_subscribe(hass, "test/a", None)
+    mqtt_client_mock.subscribe.assert_called_once_with([("test/a", 0)])
+
+    mqtt_client_mock.subscribe.side_effect = lambda topics: (1, None)
+    with pytest.raises(HomeAssistantError):
+        await mqtt.async_subscribe(hass, "test/c", None)
+
+
+async def test_subscribe_client_raises(hass, mqtt_client_mock, mqtt_mock, caplog):
+    """Test subscribing does not hang and keeps the topic when the client raises."""
+    # Fake that the client is connected
+    mqtt_mock().connected = True
+
+    subscribe = mqtt_client_mock.subscribe.side_effect
+    mqtt_client_mock.subscribe.side_effect = ValueError("Invalid topic")
+    with pytest.raises(HomeAssistantError):
+        await mqtt.async_subscribe(hass, "test/a", None)
+    await hass.async_block_till_done()
+    assert "Unable to update subscriptions" in caplog.text
+
+    # The topic is subscribed together with the next subscription
+    mqtt_client_mock.subscribe.side_effect = subscribe
+    await mqtt.async_subscribe(hass, "test/b", None)
+    mqtt_client_mock.subscribe.assert_called_with([("test/a", 0), ("test/b", 0)])
+
+
+async def test_subscriptions_split_in_packets(hass, mqtt_client_mock, mqtt_mock):
+    """Test many subscriptions are split over several packets."""
+    # Fake that the client is connected
+    mqtt_mock().connected = True
+
+    with patch("homeassistant.components.mqtt.MAX_TOPICS_PER_PACKET", 2):
+        await asyncio.gather(
+            *(
+                mqtt.async_subscribe(hass, topic, None)
+                for topic in ("test/a", "test/b", "test/c")
+            )
+        )
+        await hass.async_block_till_done()
+
+    assert mqtt_client_mock.subscribe.mock_calls == [
+        call([("test/a", 0), ("test/b", 0)]),
+        call([("test/c", 0)]),
+    ]
+
+
 async def test_setup_logs_error_if_no_connect_broker(hass, caplog):
     """Test for setup failure if connection to broker is missing."""
     entry = MockConfigEntry(domain=mqtt.DOMAIN, data={mqtt.CONF_BROKER: "test-broker"})
@@ -885,16 +1019,15 @@ async def test_mqtt_subscribes_topics_on_connect(hass, mqtt_client_mock, mqtt_mo
     await mqtt.async_subscribe(hass, "still/pending", None)
     await mqtt.async_subscribe(hass, "still/pending", None, 1)
 
-    hass.add_job = MagicMock()
     mqtt_mock._mqtt_on_connect(None, None, 0, 0)
 
     await hass.async_block_till_done()
 
     assert mqtt_client_mock.disconnect.call_count == 0
 
-    expected = {"topic/test": 0, "home/sensor": 2, "still/pending": 1}
-    calls = {call[1][1]: call[1][2] for call in hass.add_job.mock_calls}
-    assert calls == expected
+    mqtt_client_mock.subscribe.assert_called_once_with(
+        [("home/sensor", 2), ("still/pending", 1), ("topic/test", 0)]
+    )
 
 
 async def test_setup_fails_without_config(hass):
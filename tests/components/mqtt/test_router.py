@@ -0,0 +1,70 @@
+"""The tests for the MQTT topic router."""
+import pytest
+
+from homeassistant.components.mqtt.router import TopicRouter
+
+
+@pytest.mark.parametrize(
+    "topic_filter,topic,matches",
+    [
+        ("test/topic", "test/topic", True),
+        ("test/topic", "test/topic/sub", False),
+        ("test/+/on", "test/bier/on", True),
+        ("test/+/on", "test/bier/off", False),
+        ("test/#", "test", True),
+        ("test/#", "test/bier/on", True),
+        ("test/#", "other/bier", False),
+        ("+/+/+", "/a/b", True),
+        ("#", "$SYS/broker", False),
+        ("+/broker", "$SYS/broker", False),
+        ("$SYS/#", "$SYS/broker", True),
+    ],
+)
+def test_match(topic_filter, topic, matches):
+    """Test topics are matched like the MQTT specification requires."""
+    router = TopicRouter()
+    router.add(topic_filter, "item")
+
+    assert router.match(topic) == (["item"] if matches else [])
+
+
+def test_match_in_order_added():
+    """Test the items of matching topic filters are returned in order."""
+    router = TopicRouter()
+    router.add("test/#", 1)
+    router.add("test/topic", 2)
+    router.add("test/+", 3)
+    router.add("test/topic", 4)
+
+    assert router.match("test/topic") == [1, 2, 3, 4]
+
+
+def test_add_remove():
+    """Test adding and removing items of topic filters."""
+    router = TopicRouter()
+    router.add("test/+/on", 1)
+    router.add("test/+/on", 2)
+    router.add("test/bier", 3)
+
+    assert "test/+/on" in router
+    assert "test/+" not in router
+    assert router.get("test/+/on") == [1, 2]
+    assert router.get("test/+") == []
+    assert sorted(router.topic_filters()) == [("test/+/on", [1, 2]), ("test/bier", [3])]
+
+    assert router.remove("test/+/on", 1) is True
+    assert router.match("test/bier/on") == [2]
+
+    assert router.remove("test/+/on", 2) is False
+    assert "test/+/on" not in router
+    assert router.match("test/bier/on") == []
+    assert router.match("test/bier") == [3]
+
+    with pytest.raises(KeyError):
+        router.remove("test/+/on", 2)
+
+    with pytest.raises(KeyError):
+        router.remove("test/bier", 1)
+
+    assert router.remove("test/bier", 3) is False
+    assert list(router.topic_filters()) == []
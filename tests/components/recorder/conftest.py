@@ -31,10 +31,19 @@ async def async_setup_recorder_instance(
     ) -> Recorder:
         """Setup and return recorder instance."""  # noqa: D401
         stats = recorder.Recorder.async_hourly_statistics if enable_statistics else None
+        short_term_stats = (
+            recorder.Recorder.async_five_minute_statistics
+            if enable_statistics
+            else None
+        )
         with patch(
             "homeassistant.components.recorder.Recorder.async_hourly_statistics",
             side_effect=stats,
             autospec=True,
+        ), patch(
+            "homeassistant.components.recorder.Recorder.async_five_minute_statistics",
+            side_effect=short_term_stats,
+            autospec=True,
         ):
             await async_init_recorder_component(hass, config)
             await hass.async_block_till_done()
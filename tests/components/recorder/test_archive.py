@@ -0,0 +1,246 @@
+"""The tests for the recorder states archive."""
+from datetime import timedelta
+from unittest.mock import patch
+
+from homeassistant.components import logbook, recorder
+from homeassistant.components.recorder import history
+from homeassistant.components.recorder.archive import (
+    FRAME_HEADER,
+    ArchivedState,
+    StatesArchive,
+    decode_segment,
+    encode_segment,
+    read_segment,
+)
+from homeassistant.components.recorder.models import States
+from homeassistant.components.recorder.purge import purge_old_data
+from homeassistant.components.recorder.util import session_scope
+import homeassistant.util.dt as dt_util
+
+from tests.components.recorder.common import wait_recording_done
+
+
+def test_segment_round_trip():
+    """Test encoding and decoding a segment."""
+    now = dt_util.utcnow()
+    rows = [
+        ArchivedState(
+            "sensor",
+            "sensor.test",
+            "on" if i % 2 else "off",
+            None,
+            '{"unit": "W"}',
+            now + timedelta(seconds=i // 2 * 2),
+            now + timedelta(seconds=i, microseconds=i),
+        )
+        for i in range(10)
+    ]
+
+    assert decode_segment(encode_segment("sensor.test", rows)) == rows
+
+
+def test_archive_config(hass_recorder):
+    """Test the archive is only set up when enabled."""
+    hass = hass_recorder({"archive": True})
+
+    archive = hass.data[recorder.DATA_INSTANCE].archive
+    assert archive.path == hass.config.path(recorder.DEFAULT_ARCHIVE_DIR)
+
+
+def test_purge_archives_states(hass_recorder, tmp_path):
+    """Test purged states are read back from the archive."""
+    hass = hass_recorder()
+    instance = hass.data[recorder.DATA_INSTANCE]
+    assert instance.archive is None
+    instance.archive = StatesArchive(str(tmp_path))
+    entity_id = "media_player.test"
+
+    def set_state(state, attributes=None):
+        """Set the state."""
+        hass.states.set(entity_id, state, attributes)
+        wait_recording_done(hass)
+        return hass.states.get(entity_id)
+
+    now = dt_util.utcnow()
+    old = now - timedelta(days=20)
+    start = old - timedelta(seconds=1)
+
+    states = []
+    for seconds, state, attributes in (
+        (0, "idle", {"volume": 1}),
+        (1, "YouTube", {"volume": 1}),
+        # Attribute only changes are not state changes
+        (2, "YouTube", {"volume": 2}),
+    ):
+        with patch(
+            "homeassistant.components.recorder.dt_util.utcnow",
+            return_value=old + timedelta(seconds=seconds),
+        ):
+            new_state = set_state(state, attributes)
+        if seconds < 2:
+            states.append(new_state)
+
+    states.append(set_state("Netflix"))
+
+    with session_scope(hass=hass) as session:
+        # Purge the states of the same day in two runs
+        assert not purge_old_data(
+            instance, old + timedelta(microseconds=500000), repack=False
+        )
+        assert purge_old_data(
+            instance, old + timedelta(microseconds=500000), repack=False
+        )
+        assert session.query(States).count() == 3
+        assert not purge_old_data(instance, now - timedelta(days=10), repack=False)
+        assert purge_old_data(instance, now - timedelta(days=10), repack=False)
+        assert session.query(States).count() == 1
+
+    # The states of a day are merged into a single segment
+    day = old.date().isoformat()
+    assert [path.name for path in (tmp_path / entity_id).iterdir()] == [f"{day}.seg"]
+    assert instance.archive.entity_ids() == [entity_id]
+    assert StatesArchive(str(tmp_path)).entity_ids() == [entity_id]
+    hist = history.state_changes_during_period(hass, start, entity_id=entity_id)
+    assert states == hist[entity_id]
+    assert hist[entity_id][1].attributes == {"volume": 1}
+
+    hist = history.state_changes_during_period(hass, start, now - timedelta(days=1))
+    assert states[:2] == hist[entity_id]
+
+
+def test_archived_states_in_significant_states(hass_recorder, tmp_path):
+    """Test the archived states are part of the significant states and get_state."""
+    hass = hass_recorder()
+    instance = hass.data[recorder.DATA_INSTANCE]
+    instance.archive = StatesArchive(str(tmp_path))
+
+    now = dt_util.utcnow()
+    old = now - timedelta(days=20)
+    start = old - timedelta(seconds=1)
+
+    states = {}
+    for entity_id, state in (("media_player.test", "idle"), ("zone.test", "1")):
+        with patch(
+            "homeassistant.components.recorder.dt_util.utcnow", return_value=old
+        ):
+            hass.states.set(entity_id, state, {"volume": 1})
+            wait_recording_done(hass)
+        states[entity_id] = hass.states.get(entity_id)
+    hass.states.set("media_player.test", "Netflix")
+    wait_recording_done(hass)
+
+    while not purge_old_data(instance, now - timedelta(days=10), repack=False):
+        pass
+
+    hist = history.get_significant_states(
+        hass, start, now - timedelta(days=1), entity_ids=["media_player.test"]
+    )
+    assert hist == {"media_player.test": [states["media_player.test"]]}
+
+    # Like the database, zones are not part of the history of all entities
+    hist = history.get_significant_states(hass, start, now - timedelta(days=1))
+    assert hist == {"media_player.test": [states["media_player.test"]]}
+
+    point = old + timedelta(seconds=1)
+    assert history.get_state(hass, point, "media_player.test") == (
+        states["media_player.test"]
+    )
+    assert history.get_state(hass, start, "media_player.test") is None
+
+    # The archived state is the state at the start of a later period
+    hist = history.get_significant_states(
+        hass, point, now - timedelta(days=1), entity_ids=["media_player.test"]
+    )
+    assert [state.state for state in hist["media_player.test"]] == ["idle"]
+
+
+def test_purge_appends_to_segments(hass_recorder, tmp_path):
+    """Test every purge batch is appended instead of rewriting the segment."""
+    hass = hass_recorder()
+    instance = hass.data[recorder.DATA_INSTANCE]
+    instance.archive = StatesArchive(str(tmp_path))
+    entity_id = "sensor.test"
+
+    now = dt_util.utcnow()
+    old = (now - timedelta(days=20)).replace(hour=12)
+    for day, count in ((0, 10), (1, 2)):
+        for seconds in range(count):
+            with patch(
+                "homeassistant.components.recorder.dt_util.utcnow",
+                return_value=old + timedelta(days=day, seconds=seconds),
+            ):
+                hass.states.set(entity_id, str(day * 100 + seconds))
+                wait_recording_done(hass)
+
+    encoded_rows = []
+
+    def _encode_segment(entity_id, rows):
+        encoded_rows.append(len(rows))
+        return encode_segment(entity_id, rows)
+
+    with patch("homeassistant.components.recorder.purge.MAX_ROWS_TO_PURGE", 1), patch(
+        "homeassistant.components.recorder.archive.encode_segment",
+        side_effect=_encode_segment,
+    ):
+        while not purge_old_data(instance, now - timedelta(days=10), repack=False):
+            pass
+
+    # Each batch is encoded once and the first day is compacted once
+    assert sorted(encoded_rows) == [1] * 12 + [10]
+
+    day_path = tmp_path / entity_id / f"{old.date().isoformat()}.seg"
+    rows = read_segment(str(day_path))
+    assert [row.state for row in rows] == [str(seconds) for seconds in range(10)]
+    (length,) = FRAME_HEADER.unpack_from(day_path.read_bytes())
+    assert day_path.stat().st_size == FRAME_HEADER.size + length
+
+    # A frame which is being appended is skipped
+    with open(day_path, "ab") as segment_file:
+        segment_file.write(FRAME_HEADER.pack(100) + b"partial")
+    assert read_segment(str(day_path)) == rows
+
+    hist = history.state_changes_during_period(
+        hass, old - timedelta(seconds=1), entity_id=entity_id
+    )
+    assert len(hist[entity_id]) == 12
+
+
+def test_archived_states_in_logbook(hass_recorder, tmp_path):
+    """Test the archived state changes are part of the logbook."""
+    hass = hass_recorder()
+    instance = hass.data[recorder.DATA_INSTANCE]
+    instance.archive = StatesArchive(str(tmp_path))
+    entity_id = "media_player.test"
+
+    now = dt_util.utcnow()
+    old = now - timedelta(days=20)
+
+    for seconds, state, attributes in (
+        (0, "idle", {"volume": 1}),
+        (1, "YouTube", {"volume": 1}),
+        # Attribute only changes are not logbook entries
+        (2, "YouTube", {"volume": 2}),
+        (3, "Netflix", {"volume": 2}),
+    ):
+        with patch(
+            "homeassistant.components.recorder.dt_util.utcnow",
+            return_value=old + timedelta(seconds=seconds),
+        ):
+            hass.states.set(entity_id, state, attributes)
+            wait_recording_done(hass)
+
+    while not purge_old_data(instance, now - timedelta(days=10), repack=False):
+        pass
+
+    start = old + timedelta(microseconds=500000)
+    events = logbook._get_events(hass, start, now, entity_ids=[entity_id])
+    assert [(event["entity_id"], event["state"]) for event in events] == [
+        (entity_id, "YouTube"),
+        (entity_id, "Netflix"),
+    ]
+    assert events[0]["when"] == (old + timedelta(seconds=1)).isoformat()
+
+    events = logbook._get_events(hass, start, now)
+    assert [event.get("entity_id") for event in events] == [entity_id, entity_id, None]
+
+    assert logbook._get_events(hass, start, now, entity_ids=["light.test"]) == []
@@ -100,6 +100,49 @@ def test_state_changes_during_period(hass_recorder):
     assert states == hist[entity_id]
 
 
+def test_get_state_changes_batch(hass_recorder):
+    """Test reading the state changes of a period in batches."""
+    hass = hass_recorder()
+    entity_id = "sensor.test"
+
+    def set_state(state):
+        """Set the state."""
+        hass.states.set(entity_id, state)
+        wait_recording_done(hass)
+        return hass.states.get(entity_id)
+
+    start = dt_util.utcnow()
+    point = start + timedelta(seconds=1)
+    end = point + timedelta(seconds=1)
+
+    before = start - timedelta(seconds=1)
+    with patch("homeassistant.components.recorder.dt_util.utcnow", return_value=before):
+        set_state("0")
+
+    # State changes with the same last_updated are split over batches
+    with patch("homeassistant.components.recorder.dt_util.utcnow", return_value=point):
+        states = [set_state(str(value)) for value in range(1, 6)]
+
+    with patch("homeassistant.components.recorder.dt_util.utcnow", return_value=end):
+        set_state("6")
+
+    batches = []
+    after = None
+    while True:
+        batch, after = history.get_state_changes_batch(
+            hass, start, end, entity_id, after, limit=2
+        )
+        batches.append([state.state for state in batch])
+        if after is None:
+            break
+
+    # The state at start_time comes first
+    assert batches == [["0", "1", "2"], ["3", "4"], ["5"]]
+    hist = history.get_state_changes_batch(hass, start, end, entity_id, limit=10)
+    assert hist[0][1:] == states
+    assert hist[1] is None
+
+
 def test_get_last_state_changes(hass_recorder):
     """Test number of state changes."""
     hass = hass_recorder()
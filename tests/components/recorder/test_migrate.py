@@ -19,7 +19,7 @@ from homeassistant.bootstrap import async_setup_component
 from homeassistant.components import recorder
 from homeassistant.components.recorder import RecorderRuns, migration, models
 from homeassistant.components.recorder.const import DATA_INSTANCE
-from homeassistant.components.recorder.models import States
+from homeassistant.components.recorder.models import Events, States
 from homeassistant.components.recorder.util import session_scope
 import homeassistant.util.dt as dt_util
 
@@ -293,12 +293,51 @@ def test_forgiving_add_column():
         migration._add_columns(session, "hello", ["context_id CHARACTER(36)"])
 
 
+def test_backfill_states_context():
+    """Test the context of existing states is copied from their events."""
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    models.Base.metadata.create_all(engine)
+    now = dt_util.utcnow()
+    with Session(engine) as session:
+        session.add(
+            Events(
+                event_id=1,
+                event_type="state_changed",
+                event_data="{}",
+                time_fired=now,
+                context_id="context1",
+                context_user_id="user1",
+                context_parent_id="parent1",
+            )
+        )
+        session.add(States(state_id=1, entity_id="sensor.one", state="on", event_id=1))
+        session.add(
+            States(
+                state_id=2,
+                entity_id="sensor.one",
+                state="off",
+                context_id="context2",
+            )
+        )
+        session.commit()
+
+        migration._backfill_states_context(session.connection())
+        session.commit()
+
+        first, second = session.query(States).order_by(States.state_id).all()
+        assert first.context_id == "context1"
+        assert first.context_user_id == "user1"
+        assert first.context_parent_id == "parent1"
+        assert second.context_id == "context2"
+        assert second.context_user_id is None
+
+
 def test_forgiving_add_index():
     """Test that add index will continue if index exists."""
     engine = create_engine("sqlite://", poolclass=StaticPool)
     models.Base.metadata.create_all(engine)
     with Session(engine) as session:
-        migration._create_index(session, "states", "ix_states_context_id")
+        migration._create_index(session.connection(), "states", "ix_states_context_id")
 
 
 @pytest.mark.parametrize(
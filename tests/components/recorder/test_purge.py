@@ -10,7 +10,12 @@ from sqlalchemy.orm.session import Session
 from homeassistant.components import recorder
 from homeassistant.components.recorder import PurgeTask
 from homeassistant.components.recorder.const import MAX_ROWS_TO_PURGE
-from homeassistant.components.recorder.models import Events, RecorderRuns, States
+from homeassistant.components.recorder.models import (
+    Events,
+    RecorderRuns,
+    StateAttributes,
+    States,
+)
 from homeassistant.components.recorder.purge import purge_old_data
 from homeassistant.components.recorder.util import session_scope
 from homeassistant.const import EVENT_STATE_CHANGED
@@ -61,6 +66,32 @@ async def test_purge_old_states(
         assert states.count() == 2
 
 
+async def test_purge_old_states_with_shared_attributes(
+    hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
+):
+    """Test deleting old states keeps attributes still in use."""
+    instance = await async_setup_recorder_instance(hass)
+
+    await _add_test_states_with_shared_attributes(hass, instance)
+
+    with session_scope(hass=hass) as session:
+        states = session.query(States)
+        state_attributes = session.query(StateAttributes)
+        assert states.count() == 6
+        assert state_attributes.count() == 2
+
+        purge_before = dt_util.utcnow() - timedelta(days=4)
+
+        finished = purge_old_data(instance, purge_before, repack=False)
+        assert not finished
+        assert states.count() == 3
+        # The attributes only used by the purged states are gone
+        assert state_attributes.count() == 1
+        assert {state.attributes_id for state in states} == {
+            state_attributes.one().attributes_id
+        }
+
+
 async def test_purge_old_states_encouters_database_corruption(
     hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
 ):
@@ -913,6 +944,49 @@ async def _add_test_states(hass: HomeAssistant, instance: recorder.Recorder):
             old_state_id = state.state_id
 
 
+async def _add_test_states_with_shared_attributes(
+    hass: HomeAssistant, instance: recorder.Recorder
+):
+    """Add multiple states with shared attributes to the db for testing."""
+    utcnow = dt_util.utcnow()
+    five_days_ago = utcnow - timedelta(days=5)
+
+    await hass.async_block_till_done()
+    await async_wait_recording_done(hass, instance)
+
+    with recorder.session_scope(hass=hass) as session:
+        old_attributes = StateAttributes(shared_attrs='{"test_attr": 5}')
+        new_attributes = StateAttributes(shared_attrs='{"test_attr": 10}')
+
+        for event_id in range(6):
+            timestamp = five_days_ago if event_id < 3 else utcnow
+            # The last old state shares its attributes with the recent states
+            state_attributes = old_attributes if event_id < 2 else new_attributes
+
+            event = Events(
+                event_type="state_changed",
+                event_data="{}",
+                origin="LOCAL",
+                created=timestamp,
+                time_fired=timestamp,
+            )
+            session.add(event)
+            session.flush()
+            session.add(
+                States(
+                    entity_id="test.recorder2",
+                    domain="sensor",
+                    state="on",
+                    last_changed=timestamp,
+                    last_updated=timestamp,
+                    created=timestamp,
+                    event_id=event.event_id,
+                    state_attributes=state_attributes,
+                )
+            )
+            session.flush()
+
+
 async def _add_test_events(hass: HomeAssistant, instance: recorder.Recorder):
     """Add a few events for testing."""
     utcnow = dt_util.utcnow()
@@ -7,11 +7,18 @@ from pytest import approx
 
 from homeassistant.components.recorder import history
 from homeassistant.components.recorder.const import DATA_INSTANCE
-from homeassistant.components.recorder.models import process_timestamp_to_utc_isoformat
+from homeassistant.components.recorder.models import (
+    Statistics,
+    StatisticsMeta,
+    StatisticsShortTerm,
+    process_timestamp_to_utc_isoformat,
+)
 from homeassistant.components.recorder.statistics import (
     get_last_statistics,
+    get_missed_periods,
     statistics_during_period,
 )
+from homeassistant.components.recorder.util import session_scope
 from homeassistant.const import TEMP_CELSIUS
 from homeassistant.setup import setup_component
 import homeassistant.util.dt as dt_util
@@ -151,6 +158,144 @@ def test_rename_entity(hass_recorder):
     assert stats == {"sensor.test99": expected_stats99, "sensor.test2": expected_stats2}
 
 
+def test_statistics_accumulators_added_with_platform(hass_recorder):
+    """Test the accumulators are created once, from the states on the loop."""
+    hass = hass_recorder()
+    recorder = hass.data[DATA_INSTANCE]
+    attributes = {
+        "device_class": "temperature",
+        "state_class": "measurement",
+        "unit_of_measurement": TEMP_CELSIUS,
+    }
+    hass.states.set("sensor.test1", "10", attributes=attributes)
+    wait_recording_done(hass)
+
+    with patch.object(
+        recorder.statistics_accumulators,
+        "async_create_platform_accumulators",
+        wraps=recorder.statistics_accumulators.async_create_platform_accumulators,
+    ) as create_accumulators:
+        setup_component(hass, "sensor", {})
+        wait_recording_done(hass)
+        for value in ("20", "30"):
+            hass.states.set("sensor.test1", value, attributes=attributes)
+        wait_recording_done(hass)
+
+    assert create_accumulators.call_count == 1
+    for table in (Statistics, StatisticsShortTerm):
+        accumulator = recorder.statistics_accumulators._accumulators[table]["sensor"]
+        windows = accumulator._entities["sensor.test1"].windows.values()
+        # Seeded with the state from before the platform was added
+        assert min(window.min for window in windows) == 10
+        assert max(window.max for window in windows) == 30
+
+
+def test_get_missed_periods(hass_recorder):
+    """Test finding the hours which were not compiled."""
+    hass = hass_recorder()
+    recorder = hass.data[DATA_INSTANCE]
+    setup_component(hass, "sensor", {})
+    zero, four, _ = record_states(hass)
+    assert get_missed_periods(recorder, four) == []
+
+    recorder.do_adhoc_statistics(period="hourly", start=zero)
+    wait_recording_done(hass)
+    assert get_missed_periods(recorder, zero) == []
+    assert get_missed_periods(recorder, zero + timedelta(hours=2)) == [
+        zero + timedelta(hours=1),
+        zero + timedelta(hours=2),
+    ]
+
+
+def test_compile_short_term_statistics(hass_recorder):
+    """Test compiling 5 minute statistics."""
+    hass = hass_recorder()
+    recorder = hass.data[DATA_INSTANCE]
+    setup_component(hass, "sensor", {})
+    zero, four, states = record_states(hass)
+
+    recorder.do_adhoc_statistics(period="5minute", start=zero)
+    recorder.do_adhoc_statistics(period="hourly", start=zero)
+    wait_recording_done(hass)
+    expected = {
+        "statistic_id": "sensor.test1",
+        "start": process_timestamp_to_utc_isoformat(zero),
+        "mean": approx(10.0),
+        "min": approx(10.0),
+        "max": approx(10.0),
+        "last_reset": None,
+        "state": None,
+        "sum": None,
+    }
+
+    stats = statistics_during_period(
+        hass,
+        zero,
+        zero + timedelta(minutes=5),
+        statistic_ids=["sensor.test1"],
+        period="5minute",
+    )
+    assert stats == {"sensor.test1": [expected]}
+
+    # The hourly statistics are returned by default
+    stats = statistics_during_period(hass, zero, statistic_ids=["sensor.test1"])
+    assert stats["sensor.test1"][0]["mean"] == approx(14.915254237288135)
+
+    # The short term statistics are returned for periods shorter than an hour
+    stats = statistics_during_period(
+        hass, zero, zero + timedelta(minutes=5), statistic_ids=["sensor.test1"]
+    )
+    assert stats == {"sensor.test1": [expected]}
+
+
+def test_short_term_statistics_retention(hass_recorder):
+    """Test old short term statistics are replaced by the hourly statistics."""
+    hass = hass_recorder()
+    recorder = hass.data[DATA_INSTANCE]
+    recorder.short_term_statistics_keep_days = 1
+    now = dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
+    old = now - timedelta(days=2)
+    recent = now - timedelta(hours=1)
+
+    with session_scope(hass=hass) as session:
+        meta = StatisticsMeta.from_meta("recorder", "sensor.test1", None, True, False)
+        session.add(meta)
+        session.flush()
+        for table, start, mean in (
+            (Statistics, old, 1.0),
+            (Statistics, recent, 2.0),
+            (StatisticsShortTerm, old, 3.0),
+            (StatisticsShortTerm, recent, 4.0),
+        ):
+            session.add(table.from_stats(meta.id, start, {"mean": mean}))
+
+    # Saving short term statistics removes the ones which are not kept
+    recorder.do_adhoc_statistics(period="5minute")
+    wait_recording_done(hass)
+    with session_scope(hass=hass) as session:
+        assert session.query(StatisticsShortTerm).count() == 1
+
+    stats = statistics_during_period(hass, old - timedelta(hours=1), period="5minute")
+    assert [(stat["start"], stat["mean"]) for stat in stats["sensor.test1"]] == [
+        (process_timestamp_to_utc_isoformat(old), 1.0),
+        (process_timestamp_to_utc_isoformat(recent), 4.0),
+    ]
+    stats = statistics_during_period(hass, old - timedelta(hours=1))
+    assert [(stat["start"], stat["mean"]) for stat in stats["sensor.test1"]] == [
+        (process_timestamp_to_utc_isoformat(old), 1.0),
+        (process_timestamp_to_utc_isoformat(recent), 2.0),
+    ]
+    # Short periods get the short term statistics while they are kept
+    stats = statistics_during_period(hass, recent, recent + timedelta(minutes=5))
+    assert [(stat["start"], stat["mean"]) for stat in stats["sensor.test1"]] == [
+        (process_timestamp_to_utc_isoformat(recent), 4.0),
+    ]
+    stats = statistics_during_period(hass, old, old + timedelta(minutes=5))
+    assert [(stat["start"], stat["mean"]) for stat in stats["sensor.test1"]] == [
+        (process_timestamp_to_utc_isoformat(old), 1.0),
+    ]
+
+
 def record_states(hass):
     """Record some test states.
 
@@ -229,6 +229,42 @@ def test_compile_hourly_energy_statistics(
     assert "Error while processing event StatisticsTask" not in caplog.text
 
 
+def test_compile_short_term_energy_statistics(hass_recorder, caplog):
+    """Test the short term sum continues from the hourly statistics."""
+    zero = dt_util.utcnow()
+    hass = hass_recorder()
+    recorder = hass.data[DATA_INSTANCE]
+    setup_component(hass, "sensor", {})
+    attributes = {**ENERGY_SENSOR_ATTRIBUTES, "last_reset": None}
+    seq = [10, 15, 20, 25, 30, 40, 50, 60, 70]
+    four, _, _ = record_energy_states(hass, zero, "sensor.test1", attributes, seq)
+
+    # The hour before the short term statistics, the sensor is reset at four
+    recorder.do_adhoc_statistics(period="hourly", start=four - timedelta(hours=1))
+    wait_recording_done(hass)
+    recorder.do_adhoc_statistics(period="5minute", start=four)
+    wait_recording_done(hass)
+
+    stats = statistics_during_period(
+        hass, four, four + timedelta(minutes=5), period="5minute"
+    )
+    assert stats == {
+        "sensor.test1": [
+            {
+                "statistic_id": "sensor.test1",
+                "start": process_timestamp_to_utc_isoformat(four),
+                "max": None,
+                "mean": None,
+                "min": None,
+                "last_reset": process_timestamp_to_utc_isoformat(four),
+                "state": approx(30.0),
+                "sum": approx(15.0),
+            }
+        ]
+    }
+    assert "Error while processing event StatisticsTask" not in caplog.text
+
+
 def test_compile_hourly_energy_statistics_unsupported(hass_recorder, caplog):
     """Test compiling hourly statistics."""
     zero = dt_util.utcnow()
@@ -620,6 +656,94 @@ def test_compile_hourly_statistics_fails(hass_recorder, caplog):
     assert "Error while processing event StatisticsTask" in caplog.text
 
 
+@pytest.mark.parametrize(
+    "attributes,expected",
+    [
+        (
+            TEMPERATURE_SENSOR_ATTRIBUTES,
+            [{"mean": approx(16.440677), "min": 10, "max": 30}],
+        ),
+        (
+            {**ENERGY_SENSOR_ATTRIBUTES, "last_reset": None},
+            [
+                {"state": approx(20.0), "sum": approx(10.0)},
+                {"state": approx(40.0), "sum": approx(10.0)},
+                {"state": approx(70.0), "sum": approx(40.0)},
+            ],
+        ),
+    ],
+)
+def test_compile_hourly_statistics_incremental(
+    hass_recorder, caplog, attributes, expected
+):
+    """Test compiling hourly statistics from the recorded state changes."""
+    hass = hass_recorder()
+    recorder = hass.data[DATA_INSTANCE]
+    setup_component(hass, "sensor", {})
+    # The accumulators cover the hours starting after they are created
+    wait_recording_done(hass)
+    zero = dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
+    zero += timedelta(hours=2)
+    if "last_reset" in attributes:
+        seq = [10, 15, 20, 10, 30, 40, 50, 60, 70]
+        record_energy_states(hass, zero, "sensor.test1", attributes, seq)
+    else:
+        record_states(hass, zero, "sensor.test1", attributes)
+
+    with patch(
+        "homeassistant.components.sensor.recorder.compile_statistics",
+        side_effect=Exception,
+    ):
+        for hour in range(len(expected)):
+            recorder.do_adhoc_statistics(
+                period="hourly", start=zero + timedelta(hours=hour)
+            )
+            wait_recording_done(hass)
+
+    stats = statistics_during_period(hass, zero)["sensor.test1"]
+    assert [
+        {key: row[key] for key in expected_row}
+        for row, expected_row in zip(stats, expected)
+    ] == expected
+    assert "Error while processing event StatisticsTask" not in caplog.text
+
+
+def test_compile_hourly_statistics_incremental_unavailable(hass_recorder, caplog):
+    """Test an unavailable state doesn't carry over into the next hour."""
+    hass = hass_recorder()
+    recorder = hass.data[DATA_INSTANCE]
+    setup_component(hass, "sensor", {})
+    wait_recording_done(hass)
+    zero = dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
+    zero += timedelta(hours=2)
+    record_states_partially_unavailable(
+        hass, zero, "sensor.test1", TEMPERATURE_SENSOR_ATTRIBUTES
+    )
+
+    with patch(
+        "homeassistant.components.sensor.recorder.compile_statistics",
+        side_effect=Exception,
+    ):
+        for hour in range(2):
+            recorder.do_adhoc_statistics(
+                period="hourly", start=zero + timedelta(hours=hour)
+            )
+            wait_recording_done(hass)
+
+    stats = statistics_during_period(hass, zero)["sensor.test1"]
+    assert [
+        {key: row[key] for key in ("start", "mean", "min", "max")} for row in stats
+    ] == [
+        {
+            "start": process_timestamp_to_utc_isoformat(zero),
+            "mean": approx(21.1864406779661),
+            "min": approx(10.0),
+            "max": approx(25.0),
+        }
+    ]
+    assert "Error while processing event StatisticsTask" not in caplog.text
+
+
 @pytest.mark.parametrize(
     "device_class,unit,native_unit,statistic_type",
     [
@@ -19,7 +19,11 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import entity
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.loader import async_get_integration
-from homeassistant.setup import DATA_SETUP_TIME, async_setup_component
+from homeassistant.setup import (
+    DATA_SETUP_TIME,
+    DATA_SETUP_TIMELINE,
+    async_setup_component,
+)
 
 from tests.common import MockEntity, MockEntityPlatform, async_mock_service
 
@@ -393,6 +397,96 @@ async def test_subscribe_unsubscribe_events(hass, websocket_client):
     assert sum(hass.bus.async_listeners().values()) == init_count
 
 
+async def test_subscribe_entities(hass, websocket_client, hass_admin_user):
+    """Test subscribe entities command."""
+    hass.states.async_set("light.permitted", "off", {"color": "red"})
+    hass.states.async_set("light.not_permitted", "off")
+    hass_admin_user.groups = []
+    hass_admin_user.mock_policy({"entities": {"entity_ids": {"light.permitted": True}}})
+
+    await websocket_client.send_json({"id": 7, "type": "subscribe_entities"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+
+    state = hass.states.get("light.permitted")
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert msg["event"] == {
+        "a": {
+            "light.permitted": {
+                "s": "off",
+                "a": {"color": "red"},
+                "c": state.context.id,
+                "lc": state.last_changed.timestamp(),
+            }
+        }
+    }
+
+    hass.states.async_set("light.not_permitted", "on")
+    hass.states.async_set("light.permitted", "on", {"color": "blue"})
+    await hass.async_block_till_done()
+
+    state = hass.states.get("light.permitted")
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["event"] == {
+        "c": {
+            "light.permitted": {
+                "+": {
+                    "s": "on",
+                    "a": {"color": "blue"},
+                    "c": state.context.id,
+                    "lc": state.last_changed.timestamp(),
+                }
+            }
+        }
+    }
+
+    hass.states.async_remove("light.permitted")
+    await hass.async_block_till_done()
+
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {"r": ["light.permitted"]}
+
+
+async def test_subscribe_entities_with_entity_ids(hass, websocket_client):
+    """Test subscribe entities command for some of the entities."""
+    hass.states.async_set("light.kitchen", "off")
+    hass.states.async_set("light.other", "off")
+
+    await websocket_client.send_json(
+        {
+            "id": 7,
+            "type": "subscribe_entities",
+            "entity_ids": ["light.kitchen", "light.missing"],
+        }
+    )
+
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+
+    msg = await websocket_client.receive_json()
+    assert list(msg["event"]["a"]) == ["light.kitchen"]
+
+    hass.states.async_set("light.other", "on")
+    hass.states.async_set("light.missing", "on")
+    await hass.async_block_till_done()
+
+    msg = await websocket_client.receive_json()
+    assert list(msg["event"]["a"]) == ["light.missing"]
+
+    await websocket_client.send_json(
+        {"id": 8, "type": "unsubscribe_events", "subscription": 7}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 8
+    assert msg["success"]
+
+
 async def test_get_states(hass, websocket_client):
     """Test get_states command."""
     hass.states.async_set("greeting.hello", "world")
@@ -537,6 +631,17 @@ async def test_get_states_not_allows_nan(hass, websocket_client):
     assert msg["error"]["code"] == const.ERR_UNKNOWN_ERROR
 
 
+async def test_get_states_not_serializable(hass, websocket_client):
+    """Test get_states command with attributes that can't be serialized."""
+    hass.states.async_set("greeting.hello", "world", {"hello": object()})
+
+    await websocket_client.send_json({"id": 5, "type": "get_states"})
+
+    msg = await websocket_client.receive_json()
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_UNKNOWN_ERROR
+
+
 async def test_subscribe_unsubscribe_events_whitelist(
     hass, websocket_client, hass_admin_user
 ):
@@ -1189,3 +1294,119 @@ async def test_integration_setup_info(hass, websocket_client, hass_admin_user):
         {"domain": "august", "seconds": 12.5},
         {"domain": "isy994", "seconds": 12.8},
     ]
+
+
+async def test_connection_metrics(hass, websocket_client):
+    """Test the metrics of the connections are returned."""
+    await websocket_client.send_json({"id": 5, "type": "ping"})
+    await websocket_client.receive_json()
+    await websocket_client.send_json({"id": 6, "type": "connection_metrics"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 6
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+    assert len(msg["result"]) == 1
+    metrics = msg["result"][0]
+    assert metrics["written_messages"] == 3
+    assert metrics["coalesced_messages"] == 0
+    assert metrics["batched_frames"] is False
+
+
+async def test_connection_metrics_requires_admin(
+    hass, websocket_client, hass_admin_user
+):
+    """Test the connection metrics require an admin."""
+    hass_admin_user.groups = []
+    await websocket_client.send_json({"id": 5, "type": "connection_metrics"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_UNAUTHORIZED
+
+
+async def test_integration_poll_statistics(hass, websocket_client):
+    """Test the poll statistics of the entity platforms are returned."""
+    platform = MockEntityPlatform(hass, scan_interval=datetime.timedelta(seconds=30))
+    MockEntityPlatform(hass, platform_name="not_polled")
+    platform.poll_statistics.add_poll(0.5)
+    platform.poll_statistics.add_poll(1.5)
+    platform.poll_statistics.overruns = 1
+
+    await websocket_client.send_json({"id": 7, "type": "integration/poll_statistics"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+    assert msg["result"] == [
+        {
+            "domain": "test_domain",
+            "platform": "test_platform",
+            "config_entry_id": None,
+            "scan_interval": 30.0,
+            "polls": 2,
+            "overruns": 1,
+            "mean_duration": 1.0,
+            "max_duration": 1.5,
+        }
+    ]
+
+
+async def test_integration_setup_timeline(hass, websocket_client, hass_admin_user):
+    """Test the setup timeline is returned in the Chrome trace format."""
+    hass.data[DATA_SETUP_TIMELINE] = [
+        ("august", "import", 10.0, 10.5),
+        ("august", "setup", 10.5, 12.0),
+        ("isy994", "sensor platform setup", 11.0, 11.25),
+    ]
+    await websocket_client.send_json({"id": 7, "type": "integration/setup_timeline"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+    assert msg["result"]["traceEvents"] == [
+        {
+            "name": "thread_name",
+            "ph": "M",
+            "pid": 1,
+            "tid": 1,
+            "args": {"name": "august"},
+        },
+        {
+            "name": "import",
+            "cat": "setup",
+            "ph": "X",
+            "pid": 1,
+            "tid": 1,
+            "ts": 0,
+            "dur": 500000,
+        },
+        {
+            "name": "setup",
+            "cat": "setup",
+            "ph": "X",
+            "pid": 1,
+            "tid": 1,
+            "ts": 500000,
+            "dur": 1500000,
+        },
+        {
+            "name": "thread_name",
+            "ph": "M",
+            "pid": 1,
+            "tid": 2,
+            "args": {"name": "isy994"},
+        },
+        {
+            "name": "sensor platform setup",
+            "cat": "setup",
+            "ph": "X",
+            "pid": 1,
+            "tid": 2,
+            "ts": 1000000,
+            "dur": 250000,
+        },
+    ]
@@ -51,7 +51,7 @@ async def test_pending_msg_peak(hass, mock_low_peak, hass_ws_client, caplog):
 
     # Kill writer task and fill queue past peak
     for _ in range(5):
-        instance._to_write.put_nowait(None)
+        instance._message_queue.append(None)
 
     # Trigger the peak check
     instance._send_message({})
@@ -66,6 +66,149 @@ async def test_pending_msg_peak(hass, mock_low_peak, hass_ws_client, caplog):
     assert "Client unable to keep up with pending messages" in caplog.text
 
 
+async def test_pending_msg_peak_client_reading(
+    hass, mock_low_peak, hass_ws_client, caplog
+):
+    """Test a client above the peak is kept while it reads messages."""
+    orig_handler = http.WebSocketHandler
+    instance = None
+
+    def instantiate_handler(*args):
+        nonlocal instance
+        instance = orig_handler(*args)
+        return instance
+
+    with patch(
+        "homeassistant.components.websocket_api.http.WebSocketHandler",
+        instantiate_handler,
+    ):
+        websocket_client = await hass_ws_client()
+
+    # Kill writer task and fill queue past peak
+    for _ in range(5):
+        instance._message_queue.append(None)
+
+    # Trigger the peak check
+    instance._send_message({})
+    # The client read a message since
+    instance.written_messages += 1
+
+    async_fire_time_changed(
+        hass, utcnow() + timedelta(seconds=const.PENDING_MSG_PEAK_TIME + 1)
+    )
+    await hass.async_block_till_done()
+
+    assert not websocket_client.closed
+    assert "Client unable to keep up with pending messages" not in caplog.text
+    assert instance.peak_pending_messages == 6
+
+
+async def test_coalesce_pending_messages(hass, hass_ws_client):
+    """Test pending messages with the same coalesce key are replaced."""
+    orig_handler = http.WebSocketHandler
+    instance = None
+
+    def instantiate_handler(*args):
+        nonlocal instance
+        instance = orig_handler(*args)
+        return instance
+
+    with patch(
+        "homeassistant.components.websocket_api.http.WebSocketHandler",
+        instantiate_handler,
+    ):
+        websocket_client = await hass_ws_client()
+
+    # Messages are only coalesced while the client is behind
+    instance._send_message({"id": 1, "state": "on"}, (1, "light.kitchen"))
+    instance._send_message({"id": 1, "state": "off"}, (1, "light.kitchen"))
+
+    assert await websocket_client.receive_json() == {"id": 1, "state": "on"}
+    assert await websocket_client.receive_json() == {"id": 1, "state": "off"}
+    assert instance.coalesced_messages == 0
+
+    with patch("homeassistant.components.websocket_api.http.PENDING_MSG_PEAK", 0):
+        instance._send_message({"id": 1, "state": "on"}, (1, "light.kitchen"))
+        instance._send_message({"id": 1, "state": "on"}, (1, "light.bed"))
+        instance._send_message({"id": 1, "state": "off"}, (1, "light.kitchen"))
+
+        assert await websocket_client.receive_json() == {"id": 1, "state": "off"}
+        assert await websocket_client.receive_json() == {"id": 1, "state": "on"}
+        assert instance.coalesced_messages == 1
+
+        # The key can be used again once the message was written
+        instance._send_message({"id": 1, "state": "on"}, (1, "light.kitchen"))
+        assert await websocket_client.receive_json() == {"id": 1, "state": "on"}
+
+
+async def test_wait_for_writer(hass, hass_ws_client):
+    """Test waiting until the pending messages were written."""
+    orig_handler = http.WebSocketHandler
+    instance = None
+
+    def instantiate_handler(*args):
+        nonlocal instance
+        instance = orig_handler(*args)
+        return instance
+
+    with patch(
+        "homeassistant.components.websocket_api.http.WebSocketHandler",
+        instantiate_handler,
+    ):
+        websocket_client = await hass_ws_client()
+
+    written = instance.written_messages
+    instance._send_message({"id": 1})
+    instance._send_message({"id": 2})
+    assert instance.written_messages == written
+
+    await instance._connection.async_wait_for_writer()
+    assert instance.written_messages == written + 2
+
+    assert await websocket_client.receive_json() == {"id": 1}
+    assert await websocket_client.receive_json() == {"id": 2}
+
+
+async def test_batch_pending_messages(hass, hass_ws_client):
+    """Test pending messages are sent in one frame when the client supports it."""
+    orig_handler = http.WebSocketHandler
+    instance = None
+
+    def instantiate_handler(*args):
+        nonlocal instance
+        instance = orig_handler(*args)
+        return instance
+
+    with patch(
+        "homeassistant.components.websocket_api.http.WebSocketHandler",
+        instantiate_handler,
+    ):
+        websocket_client = await hass_ws_client()
+
+    await websocket_client.send_json(
+        {
+            "id": 5,
+            "type": "supported_features",
+            "features": {const.FEATURE_COALESCE_MESSAGES: 1},
+        }
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
+    assert msg["success"]
+
+    instance._send_message({"id": 6, "type": "pong"})
+    instance._send_message({"id": 7, "type": "pong"})
+
+    assert await websocket_client.receive_json() == [
+        {"id": 6, "type": "pong"},
+        {"id": 7, "type": "pong"},
+    ]
+
+    # A single pending message is not wrapped
+    instance._send_message({"id": 8, "type": "pong"})
+    assert await websocket_client.receive_json() == {"id": 8, "type": "pong"}
+
+
 async def test_non_json_message(hass, websocket_client, caplog):
     """Test trying to serialize non JSON objects."""
     bad_data = object()
@@ -1,9 +1,15 @@
 """Test Websocket API messages module."""
 
+import json
+
 from homeassistant.components.websocket_api.messages import (
     _cached_event_message as lru_event_cache,
     cached_event_message,
+    cached_state_diff_message,
+    event_message,
     message_to_json,
+    result_message,
+    result_message_json,
 )
 from homeassistant.const import EVENT_STATE_CHANGED
 from homeassistant.core import callback
@@ -47,6 +53,37 @@ async def test_cached_event_message(hass):
     assert cache_info.currsize == 2
 
 
+async def test_cached_state_changed_event_message(hass):
+    """Test the state changed event message is spliced from the state JSON."""
+
+    events = []
+
+    @callback
+    def _event_listener(event):
+        events.append(event)
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, _event_listener)
+
+    hass.states.async_set("light.window", "on", {"brightness": 100})
+    hass.states.async_set("light.window", "off")
+    await hass.async_block_till_done()
+
+    assert len(events) == 2
+    lru_event_cache.cache_clear()
+
+    for event in events:
+        assert json.loads(cached_event_message(2, event)) == json.loads(
+            message_to_json(event_message(2, event))
+        )
+
+
+async def test_result_message_json():
+    """Test a result message with a serialized result."""
+    assert json.loads(result_message_json(5, '[{"state":"on"}]')) == result_message(
+        5, [{"state": "on"}]
+    )
+
+
 async def test_cached_event_message_with_different_idens(hass):
     """Test that we cache event messages when the subscrition idens differ."""
 
@@ -78,18 +115,80 @@ async def test_cached_event_message_with_different_idens(hass):
     assert cache_info.currsize == 1
 
 
+async def test_state_diff_message(hass):
+    """Test entity messages of state changes only contain what changed."""
+    events = []
+
+    @callback
+    def _event_listener(event):
+        events.append(event)
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, _event_listener)
+
+    hass.states.async_set("light.window", "on", {"brightness": 10, "color": "red"})
+    hass.states.async_set("light.window", "on", {"brightness": 20, "color": "red"})
+    hass.states.async_set("light.window", "off", {"color": "red"})
+    hass.states.async_remove("light.window")
+    await hass.async_block_till_done()
+
+    added, attribute_change, change, removed = (
+        json.loads(cached_state_diff_message(3, event)) for event in events
+    )
+    new_state = events[0].data["new_state"]
+    assert added == {
+        "id": 3,
+        "type": "event",
+        "event": {
+            "a": {
+                "light.window": {
+                    "s": "on",
+                    "a": {"brightness": 10, "color": "red"},
+                    "c": new_state.context.id,
+                    "lc": new_state.last_changed.timestamp(),
+                }
+            }
+        },
+    }
+    new_state = events[1].data["new_state"]
+    assert attribute_change["event"] == {
+        "c": {
+            "light.window": {
+                "+": {
+                    "lu": new_state.last_updated.timestamp(),
+                    "c": new_state.context.id,
+                    "a": {"brightness": 20},
+                }
+            }
+        }
+    }
+    new_state = events[2].data["new_state"]
+    assert change["event"] == {
+        "c": {
+            "light.window": {
+                "+": {
+                    "s": "off",
+                    "lc": new_state.last_changed.timestamp(),
+                    "c": new_state.context.id,
+                },
+                "-": {"a": ["brightness"]},
+            }
+        }
+    }
+    assert removed["event"] == {"r": ["light.window"]}
+
+
 async def test_message_to_json(caplog):
     """Test we can serialize websocket messages."""
 
     json_str = message_to_json({"id": 1, "message": "xyz"})
 
-    assert json_str == '{"id": 1, "message": "xyz"}'
+    assert json_str == '{"id":1,"message":"xyz"}'
 
     json_str2 = message_to_json({"id": 1, "message": _Unserializeable()})
 
     assert (
         json_str2
-        == '{"id": 1, "type": "result", "success": false, "error": {"code": "unknown_error", "message": "Invalid JSON in response"}}'
+        == '{"id":1,"type":"result","success":false,"error":{"code":"unknown_error","message":"Invalid JSON in response"}}'
     )
     assert "Unable to serialize to JSON" in caplog.text
 
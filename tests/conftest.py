@@ -460,13 +460,9 @@ async def mqtt_mock(hass, mqtt_client_mock, mqtt_config):
     assert result
     await hass.async_block_till_done()
 
-    # Workaround: asynctest==0.13 fails on @functools.lru_cache
-    spec = dir(hass.data["mqtt"])
-    spec.remove("_matching_subscriptions")
-
     mqtt_component_mock = MagicMock(
         return_value=hass.data["mqtt"],
-        spec_set=spec,
+        spec_set=hass.data["mqtt"],
         wraps=hass.data["mqtt"],
     )
     mqtt_component_mock._mqttc = mqtt_client_mock
@@ -614,10 +610,17 @@ def hass_recorder(enable_statistics, hass_storage):
     """Home Assistant fixture with in-memory recorder."""
     hass = get_test_home_assistant()
     stats = recorder.Recorder.async_hourly_statistics if enable_statistics else None
+    short_term_stats = (
+        recorder.Recorder.async_five_minute_statistics if enable_statistics else None
+    )
     with patch(
         "homeassistant.components.recorder.Recorder.async_hourly_statistics",
         side_effect=stats,
         autospec=True,
+    ), patch(
+        "homeassistant.components.recorder.Recorder.async_five_minute_statistics",
+        side_effect=short_term_stats,
+        autospec=True,
     ):
 
         def setup_recorder(config=None):
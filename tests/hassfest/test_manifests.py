@@ -0,0 +1,25 @@
+"""Tests for hassfest manifests."""
+from ast import literal_eval
+
+from script.hassfest.manifests import format_value
+
+
+def test_format_value():
+    """Test manifests are formatted as Python literals."""
+    manifest = {
+        "domain": "test",
+        "name": 'Test "quoted"',
+        "config_flow": True,
+        "dependencies": [],
+        "homekit": {"models": ["Model"]},
+        "zeroconf": [{"type": "_test._tcp.local.", "name": None}],
+    }
+    content = format_value(manifest)
+
+    assert literal_eval(content) == manifest
+    assert content.splitlines()[:4] == [
+        "{",
+        '    "domain": "test",',
+        '    "name": "Test \\"quoted\\"",',
+        '    "config_flow": True,',
+    ]
@@ -389,6 +389,40 @@ async def test_removing_area_id(registry):
     assert entry_w_area != entry_wo_area
 
 
+async def test_entries_lookup_indexes(registry):
+    """Test looking up devices by area and config entry."""
+    entry1 = registry.async_get_or_create(
+        config_entry_id="123",
+        identifiers={("bridgeid", "0123")},
+    )
+    entry2 = registry.async_get_or_create(
+        config_entry_id="123",
+        identifiers={("bridgeid", "4567")},
+    )
+    entry2 = registry.async_get_or_create(
+        config_entry_id="456",
+        identifiers={("bridgeid", "4567")},
+    )
+
+    assert device_registry.async_entries_for_config_entry(registry, "123") == [
+        entry1,
+        entry2,
+    ]
+    assert device_registry.async_entries_for_config_entry(registry, "456") == [entry2]
+    assert device_registry.async_entries_for_area(registry, "12345A") == []
+
+    entry1 = registry.async_update_device(entry1.id, area_id="12345A")
+    assert device_registry.async_entries_for_area(registry, "12345A") == [entry1]
+
+    entry2 = registry.async_update_device(entry2.id, remove_config_entry_id="123")
+    assert device_registry.async_entries_for_config_entry(registry, "123") == [entry1]
+
+    registry.async_remove_device(entry1.id)
+    assert device_registry.async_entries_for_area(registry, "12345A") == []
+    assert device_registry.async_entries_for_config_entry(registry, "123") == []
+    assert device_registry.async_entries_for_config_entry(registry, "456") == [entry2]
+
+
 async def test_deleted_device_removing_area_id(registry):
     """Make sure we can clear area id of deleted device."""
     entry = registry.async_get_or_create(
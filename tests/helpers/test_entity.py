@@ -5,11 +5,20 @@ from datetime import timedelta
 import threading
 from unittest.mock import MagicMock, PropertyMock, patch
 
+import attr
 import pytest
 
-from homeassistant.const import ATTR_DEVICE_CLASS, STATE_UNAVAILABLE, STATE_UNKNOWN
+from homeassistant.config import DATA_CUSTOMIZE
+from homeassistant.const import (
+    ATTR_DEVICE_CLASS,
+    ATTR_FRIENDLY_NAME,
+    ATTR_ICON,
+    STATE_UNAVAILABLE,
+    STATE_UNKNOWN,
+)
 from homeassistant.core import Context, HomeAssistantError
 from homeassistant.helpers import entity, entity_registry
+from homeassistant.helpers.entity_values import EntityValues
 
 from tests.common import (
     MockConfigEntry,
@@ -108,7 +117,7 @@ class TestHelpersEntity:
         with patch(
             "homeassistant.helpers.entity.Entity.device_class", new="test_class"
         ):
-            self.entity.schedule_update_ha_state()
+            self.entity.schedule_update_ha_state(True)
             self.hass.block_till_done()
         state = self.hass.states.get(self.entity.entity_id)
         assert state.attributes.get(ATTR_DEVICE_CLASS) == "test_class"
@@ -748,6 +757,103 @@ async def test_removing_entity_unavailable(hass):
     assert state.state == STATE_UNAVAILABLE
 
 
+async def test_registry_and_customize_attributes(hass):
+    """Test the registry entry and customize override attributes."""
+    entry = entity_registry.RegistryEntry(
+        entity_id="hello.world",
+        unique_id="test-unique-id",
+        platform="test-platform",
+        name="Registry name",
+    )
+
+    ent = entity.Entity()
+    ent.hass = hass
+    ent.entity_id = "hello.world"
+    ent._attr_name = "Entity name"
+    ent._attr_icon = "mdi:entity"
+    ent.registry_entry = entry
+    ent.async_write_ha_state()
+
+    state = hass.states.get("hello.world")
+    assert state.attributes[ATTR_FRIENDLY_NAME] == "Registry name"
+    assert state.attributes[ATTR_ICON] == "mdi:entity"
+
+    ent.registry_entry = attr.evolve(entry, icon="mdi:registry")
+    ent.async_write_ha_state()
+
+    state = hass.states.get("hello.world")
+    assert state.attributes[ATTR_FRIENDLY_NAME] == "Registry name"
+    assert state.attributes[ATTR_ICON] == "mdi:registry"
+
+    hass.data[DATA_CUSTOMIZE] = EntityValues(
+        {"hello.world": {ATTR_FRIENDLY_NAME: "Customized name"}}
+    )
+    ent.async_write_ha_state()
+
+    state = hass.states.get("hello.world")
+    assert state.attributes[ATTR_FRIENDLY_NAME] == "Customized name"
+    assert state.attributes[ATTR_ICON] == "mdi:registry"
+
+    ent.registry_entry = None
+    hass.data.pop(DATA_CUSTOMIZE)
+    ent.async_write_ha_state()
+
+    state = hass.states.get("hello.world")
+    assert state.attributes[ATTR_FRIENDLY_NAME] == "Entity name"
+    assert state.attributes[ATTR_ICON] == "mdi:entity"
+
+
+async def test_unchanged_write_reuses_attributes(hass):
+    """Test an unchanged write doesn't rebuild or compare the attributes."""
+    capability_attributes = PropertyMock(return_value={"max": 100})
+    unit_of_measurement = PropertyMock(return_value="%")
+    with patch.object(
+        entity.Entity, "capability_attributes", capability_attributes
+    ), patch.object(entity.Entity, "unit_of_measurement", unit_of_measurement):
+        ent = entity.Entity()
+        ent.hass = hass
+        ent.entity_id = "hello.world"
+        ent._attr_extra_state_attributes = {"level": 1}
+        ent.async_write_ha_state()
+        state = hass.states.get("hello.world")
+
+        ent._attr_state = "on"
+        with patch.object(
+            hass.states, "async_set", wraps=hass.states.async_set
+        ) as async_set:
+            ent.async_write_ha_state()
+        state2 = hass.states.get("hello.world")
+
+        assert async_set.call_args[0][2] is state.attributes
+        assert state2.state == "on"
+        assert state2.attributes is state.attributes
+        assert capability_attributes.call_count == 1
+        assert unit_of_measurement.call_count == 1
+
+        ent._attr_extra_state_attributes = {"level": 2}
+        ent.async_write_ha_state()
+        state3 = hass.states.get("hello.world")
+
+        assert state3.attributes == {
+            "max": 100,
+            "level": 2,
+            "unit_of_measurement": "%",
+        }
+        assert capability_attributes.call_count == 1
+
+        ent.registry_entry = entity_registry.RegistryEntry(
+            entity_id="hello.world",
+            unique_id="test-unique-id",
+            platform="test-platform",
+        )
+        ent.async_write_ha_state()
+        assert capability_attributes.call_count == 2
+
+        ent.async_invalidate_static_attributes()
+        ent.async_write_ha_state()
+        assert capability_attributes.call_count == 3
+
+
 async def test_get_supported_features_entity_registry(hass):
     """Test get_supported_features falls back to entity registry."""
     entity_reg = mock_registry(hass)
@@ -57,6 +57,109 @@ async def test_polling_only_updates_entities_it_should_poll(hass):
     assert poll_ent.async_update.called
 
 
+async def test_polling_spread_over_interval(hass):
+    """Test entities are polled at their own phase of the interval."""
+    platform = MockEntityPlatform(hass, scan_interval=timedelta(seconds=20))
+    updates = []
+
+    def make_entity(name):
+        ent = MockEntity(should_poll=True, entity_id=f"{DOMAIN}.{name}")
+
+        async def async_update():
+            updates.append(ent.entity_id)
+
+        ent.async_update = async_update
+        return ent
+
+    entities = [make_entity(f"entity_{idx}") for idx in range(10)]
+    start = dt_util.utcnow()
+    await platform.async_add_entities(entities)
+    updates.clear()
+
+    first_polls = {
+        ent.entity_id: start
+        + timedelta(seconds=20) * (1 - entity_platform.poll_phase(ent.entity_id) / 2)
+        for ent in entities
+    }
+    earliest = min(first_polls.values())
+    assert earliest < max(first_polls.values())
+
+    async_fire_time_changed(hass, earliest - timedelta(seconds=0.5))
+    await hass.async_block_till_done()
+    assert updates == []
+
+    async_fire_time_changed(hass, start + timedelta(seconds=20))
+    await hass.async_block_till_done()
+    assert sorted(updates) == sorted(first_polls)
+
+    # Every entity is polled once per interval
+    updates.clear()
+    async_fire_time_changed(hass, start + timedelta(seconds=40))
+    await hass.async_block_till_done()
+    assert sorted(updates) == sorted(first_polls)
+
+    assert platform.poll_statistics.polls == 20
+    assert platform.poll_statistics.overruns == 0
+
+
+async def test_polling_overrun(hass, caplog):
+    """Test an entity is not polled while its last update is running."""
+    platform = MockEntityPlatform(hass, scan_interval=timedelta(seconds=20))
+    release = asyncio.Event()
+    updates = 0
+
+    async def slow_update():
+        nonlocal updates
+        updates += 1
+        await release.wait()
+
+    ent = MockEntity(should_poll=True)
+    await platform.async_add_entities([ent])
+    ent.async_update = slow_update
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=20))
+    await asyncio.sleep(0)
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=40))
+    await asyncio.sleep(0)
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=60))
+    await asyncio.sleep(0)
+
+    assert updates == 1
+    assert platform.poll_statistics.overruns == 2
+    # The warning is only logged once per interval
+    assert caplog.text.count("took longer than the scheduled update interval") == 1
+    assert "'overruns': 1" in caplog.text
+
+    release.set()
+    await hass.async_block_till_done()
+
+    assert platform.poll_statistics.polls == 1
+    assert platform.poll_statistics.mean_duration is not None
+
+
+async def test_no_poll_timer_for_entities_not_polled(hass):
+    """Test no poll is scheduled for entities that should not be polled."""
+    platform = MockEntityPlatform(hass, scan_interval=timedelta(seconds=20))
+    no_poll_ent = MockEntity(should_poll=False, entity_id=f"{DOMAIN}.no_poll")
+    poll_ent = MockEntity(should_poll=True, entity_id=f"{DOMAIN}.poll")
+
+    await platform.async_add_entities([no_poll_ent, poll_ent])
+
+    assert list(platform._async_unsub_entity_polls) == [poll_ent.entity_id]
+
+    await platform.async_remove_entity(poll_ent.entity_id)
+
+    assert platform._async_unsub_entity_polls == {}
+
+
+def test_poll_phase():
+    """Test the poll phase is a deterministic fraction of the interval."""
+    phase = entity_platform.poll_phase("light.kitchen")
+    assert 0 <= phase < 1
+    assert phase == entity_platform.poll_phase("light.kitchen")
+    assert phase != entity_platform.poll_phase("light.bedroom")
+
+
 async def test_polling_disabled_by_config_entry(hass):
     """Test the polling of only updated entities."""
     entity_platform = MockEntityPlatform(hass)
@@ -150,7 +253,7 @@ async def test_update_state_adds_entities_with_update_before_add_false(hass):
     assert not ent.update.called
 
 
-@patch("homeassistant.helpers.entity_platform.async_track_time_interval")
+@patch("homeassistant.helpers.entity_platform.async_track_point_in_utc_time")
 async def test_set_scan_interval_via_platform(mock_track, hass):
     """Test the setting of the scan interval via platform."""
 
@@ -167,9 +270,12 @@ async def test_set_scan_interval_via_platform(mock_track, hass):
 
     component.setup({DOMAIN: {"platform": "platform"}})
 
+    before = dt_util.utcnow()
     await hass.async_block_till_done()
+    after = dt_util.utcnow()
     assert mock_track.called
-    assert timedelta(seconds=30) == mock_track.call_args[0][2]
+    first_poll = mock_track.call_args[0][2]
+    assert before + timedelta(seconds=15) <= first_poll <= after + timedelta(seconds=30)
 
 
 async def test_adding_entities_with_generator_and_thread_callback(hass):
@@ -352,6 +352,38 @@ async def test_removing_area_id(registry):
     assert entry_w_area != entry_wo_area
 
 
+async def test_entries_lookup_indexes(registry):
+    """Test looking up entries by device, area and config entry."""
+    config_entry = MockConfigEntry(domain="light", entry_id="mock-id-1")
+    entry1 = registry.async_get_or_create(
+        "light", "hue", "1234", config_entry=config_entry, device_id="device-1"
+    )
+    entry2 = registry.async_get_or_create("light", "hue", "5678", device_id="device-1")
+
+    assert er.async_entries_for_device(registry, "device-1") == [entry1, entry2]
+    assert er.async_entries_for_config_entry(registry, "mock-id-1") == [entry1]
+    assert er.async_entries_for_area(registry, "area-1") == []
+
+    entry1 = registry.async_update_entity(
+        entry1.entity_id, area_id="area-1", new_entity_id="light.renamed"
+    )
+    assert er.async_entries_for_area(registry, "area-1") == [entry1]
+    assert er.async_entries_for_config_entry(registry, "mock-id-1") == [entry1]
+    assert er.async_entries_for_device(registry, "device-1") == [entry2, entry1]
+
+    registry.async_clear_area_id("area-1")
+    assert er.async_entries_for_area(registry, "area-1") == []
+
+    registry.async_remove(entry2.entity_id)
+    assert er.async_entries_for_device(registry, "device-1") == [
+        registry.async_get("light.renamed")
+    ]
+
+    registry.async_clear_config_entry("mock-id-1")
+    assert er.async_entries_for_device(registry, "device-1") == []
+    assert er.async_entries_for_config_entry(registry, "mock-id-1") == []
+
+
 @pytest.mark.parametrize("load_registries", [False])
 async def test_migration(hass):
     """Test migration from old data to new."""
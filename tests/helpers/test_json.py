@@ -1,10 +1,19 @@
 """Test Home Assistant remote methods and classes."""
 from datetime import timedelta
+import json
+from unittest.mock import patch
 
 import pytest
 
 from homeassistant import core
-from homeassistant.helpers.json import ExtendedJSONEncoder, JSONEncoder
+from homeassistant.helpers import json as json_helper
+from homeassistant.helpers.json import (
+    ExtendedJSONEncoder,
+    JSONEncoder,
+    json_bytes,
+    json_dumps,
+    json_encoder_default,
+)
 from homeassistant.util import dt as dt_util
 
 
@@ -29,6 +38,82 @@ def test_json_encoder(hass):
         ha_json_enc.default(1)
 
 
+def test_json_encoder_default(hass):
+    """Test the default hook of the JSON backend."""
+    state = core.State("test.test", "hello")
+
+    now = dt_util.utcnow()
+    assert json_encoder_default(now) == now.isoformat()
+
+    data = {"milk", "beer"}
+    assert sorted(json_encoder_default(data)) == sorted(data)
+
+    assert json_encoder_default(state) == state.as_dict()
+
+    with pytest.raises(TypeError):
+        json_encoder_default(object())
+
+
+@pytest.fixture(params=[True, False], ids=["orjson", "stdlib"])
+def json_backend(request):
+    """Serialize JSON with orjson or with the json module."""
+    with patch.object(json_helper, "HAS_ORJSON", request.param):
+        yield
+
+
+def test_json_dumps(hass, json_backend):
+    """Test serializing Home Assistant objects."""
+    now = dt_util.utcnow()
+    state = core.State("test.test", "hello", {"count": 1}, now, now)
+    data = {"state": state, "time": now, "set": {1}, 1: "int key"}
+
+    assert json.loads(json_dumps(data)) == {
+        "state": json.loads(json.dumps(state, cls=JSONEncoder)),
+        "time": now.isoformat(),
+        "set": [1],
+        "1": "int key",
+    }
+    assert json_bytes(data) == json_dumps(data).encode("utf-8")
+    assert json_dumps({"a": [1, "two"]}) == '{"a":[1,"two"]}'
+
+    with pytest.raises(TypeError):
+        json_dumps({"bad": object()})
+
+
+def test_json_dumps_nan(hass, json_backend):
+    """Test NaN and infinity are not allowed."""
+    for value in (float("NaN"), float("inf"), float("-inf")):
+        with pytest.raises(ValueError):
+            json_dumps({"value": [value], "none": None})
+
+    assert json_dumps({"none": None, "count": 1.5}) == '{"none":null,"count":1.5}'
+
+
+def test_json_dumps_nan_with_context(hass, json_backend):
+    """Test NaN is found next to the nulls of context ids."""
+    state = core.State("test.test", "on", {"value": float("NaN")})
+    assert state.context.user_id is None
+    with pytest.raises(ValueError):
+        json_dumps(state)
+    with pytest.raises(ValueError):
+        json_dumps({"user_id": None, "parent_id": None, "value": float("inf")})
+
+    assert json.loads(json_dumps(core.State("test.test", "on", {"value": 1.5})))
+
+
+def test_json_bytes_indent(hass, json_backend):
+    """Test serializing indented JSON."""
+    assert json_bytes({"a": [1]}, indent=True) == b'{\n    "a": [\n        1\n    ]\n}'
+
+
+def test_json_bytes_without_default(hass, json_backend):
+    """Test serializing plain data doesn't convert objects."""
+    assert json_bytes({"a": 1}, default=None) == b'{"a":1}'
+
+    with pytest.raises(TypeError):
+        json_bytes({"hello": {1}}, default=None)
+
+
 def test_trace_json_encoder(hass):
     """Test the Trace JSON Encoder."""
     ha_json_enc = ExtendedJSONEncoder()
@@ -440,6 +440,58 @@ async def test_extract_entity_ids_from_devices(hass, area_mock):
     )
 
 
+async def test_extract_entity_ids_after_registry_updates(hass, area_mock):
+    """Test resolved areas and devices are updated with the registries."""
+    call = ha.ServiceCall(
+        "light",
+        "turn_on",
+        {"area_id": "test-area", "device_id": "device-no-area-id"},
+    )
+    assert await service.async_extract_entity_ids(hass, call) == {
+        "light.in_area",
+        "light.assigned_to_area",
+        "light.no_area",
+    }
+
+    ent_reg.async_get(hass).async_update_entity(
+        "light.in_own_area", area_id="test-area"
+    )
+    await hass.async_block_till_done()
+    assert await service.async_extract_entity_ids(hass, call) == {
+        "light.in_area",
+        "light.assigned_to_area",
+        "light.no_area",
+        "light.in_own_area",
+    }
+
+    dev_reg.async_get(hass).async_update_device("device-no-area-id", area_id="x")
+    ent_reg.async_get(hass).async_remove("light.no_area")
+    await hass.async_block_till_done()
+    assert await service.async_extract_entity_ids(hass, call) == {
+        "light.in_area",
+        "light.assigned_to_area",
+        "light.in_own_area",
+    }
+
+
+async def test_extract_entity_ids_cache_size(hass, area_mock):
+    """Test the resolved areas and devices are cached up to a limit."""
+    call = ha.ServiceCall(
+        "light",
+        "turn_on",
+        {"area_id": "test-area", "device_id": "device-no-area-id"},
+    )
+    with patch("homeassistant.helpers.service.TARGET_CACHE_SIZE", 1):
+        await service.async_extract_entity_ids(hass, call)
+        target_cache = hass.data[service.SERVICE_TARGET_CACHE]
+        assert list(target_cache._areas) == ["test-area"]
+        assert list(target_cache._devices) == ["device-no-area-id"]
+
+        call = ha.ServiceCall("light", "turn_on", {"area_id": "diff-area"})
+        await service.async_extract_entity_ids(hass, call)
+        assert list(target_cache._areas) == ["diff-area"]
+
+
 async def test_async_get_all_descriptions(hass):
     """Test async_get_all_descriptions."""
     group = hass.components.group
@@ -1,5 +1,6 @@
 """Test Home Assistant template helper methods."""
-from datetime import datetime
+import asyncio
+from datetime import datetime, timedelta
 import math
 import random
 from unittest.mock import patch
@@ -23,7 +24,12 @@ from homeassistant.setup import async_setup_component
 import homeassistant.util.dt as dt_util
 from homeassistant.util.unit_system import UnitSystem
 
-from tests.common import MockConfigEntry, mock_device_registry, mock_registry
+from tests.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+    mock_device_registry,
+    mock_registry,
+)
 
 
 def _set_up_units(hass):
@@ -2196,11 +2202,96 @@ async def test_cache_garbage_collection():
         template_string
     )  # pylint: disable=protected-access
     del tpl2
+    assert template._NO_HASS_ENV.template_cache.get(
+        template_string
+    )  # pylint: disable=protected-access
+
+    # Unreferenced templates are only kept while recently used
+    template._NO_HASS_ENV.template_lru.pop(template_string)
     assert not template._NO_HASS_ENV.template_cache.get(
         template_string
     )  # pylint: disable=protected-access
 
 
+async def test_cache_lru():
+    """Test the recently used templates are kept."""
+    env = template.TemplateEnvironment(None)
+    with patch.object(template, "MAX_TEMPLATE_LRU_SIZE", 2):
+        env.compile("{{ 1 }}")
+        env.compile("{{ 2 }}")
+        env.compile("{{ 1 }}")
+        env.compile("{{ 3 }}")
+
+    assert list(env.template_lru) == ["{{ 1 }}", "{{ 3 }}"]
+    assert list(env.template_cache) == ["{{ 1 }}", "{{ 3 }}"]
+
+
+async def test_bytecode_cache(hass, hass_storage):
+    """Test the code of compiled templates is stored."""
+    await template.async_load_bytecode_cache(hass)
+    assert template.Template("{{ 1 + 1 }}", hass).async_render() == 2
+    assert template.Template("{{ 1 + 2 }}", hass).async_render(limited=True) == 3
+    await hass.async_block_till_done()
+    assert template.BYTECODE_STORAGE_KEY not in hass_storage
+
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=template.BYTECODE_SAVE_DELAY)
+    )
+    await hass.async_block_till_done()
+    data = hass_storage[template.BYTECODE_STORAGE_KEY]["data"]
+    assert data["magic"] == template._BYTECODE_MAGIC
+    # Templates are validated in the normal environment
+    assert [key.split("-")[0] for key in data["templates"]] == ["normal", "normal"]
+
+    # A new instance loads the code instead of compiling the templates
+    hass.data.clear()
+    await template.async_load_bytecode_cache(hass)
+    with patch("jinja2.Environment.compile") as mock_compile:
+        assert template.Template("{{ 1 + 1 }}", hass).async_render() == 2
+        assert template.Template("{{ 1 + 2 }}", hass).async_render(limited=True) == 3
+    assert not mock_compile.called
+
+
+async def test_bytecode_cache_other_version(hass, hass_storage):
+    """Test code compiled by other versions is not used."""
+    hass_storage[template.BYTECODE_STORAGE_KEY] = {
+        "version": template.BYTECODE_STORAGE_VERSION,
+        "key": template.BYTECODE_STORAGE_KEY,
+        "data": {"magic": "other", "templates": {"normal-abc": "invalid"}},
+    }
+    await template.async_load_bytecode_cache(hass)
+    cache = hass.data[template._BYTECODE_CACHE]
+    assert cache.get("normal-abc") is None
+    assert cache._data_to_save() == {
+        "magic": template._BYTECODE_MAGIC,
+        "templates": {},
+    }
+
+
+async def test_bytecode_cache_from_threads(hass):
+    """Test the code of templates can be cached from several threads."""
+    await template.async_load_bytecode_cache(hass)
+    cache = hass.data[template._BYTECODE_CACHE]
+    code = compile("1", "<template>", "eval")
+
+    def _use_cache(thread):
+        for idx in range(200):
+            cache.set(f"normal-{thread}-{idx}", code)
+            cache.get(f"normal-{(thread + 1) % 4}-{idx}")
+
+    with patch.object(template, "MAX_BYTECODE_CACHE_SIZE", 10), patch.object(
+        cache, "_async_schedule_save"
+    ) as mock_schedule_save:
+        await asyncio.gather(
+            *(hass.async_add_executor_job(_use_cache, thread) for thread in range(4))
+        )
+        await hass.async_block_till_done()
+
+    # Saving is only scheduled once until the data is saved
+    assert len(mock_schedule_save.mock_calls) == 1
+    assert len(cache._data_to_save()["templates"]) == 10
+
+
 def test_is_template_string():
     """Test is template string."""
     assert template.is_template_string("{{ x }}") is True
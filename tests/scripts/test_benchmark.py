@@ -0,0 +1,37 @@
+"""Test the benchmark script."""
+from homeassistant.scripts import benchmark
+
+
+def test_percentile():
+    """Test the nearest rank percentiles."""
+    values = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+    assert benchmark.percentile(values, 50) == 5
+    assert benchmark.percentile(values, 90) == 9
+    assert benchmark.percentile(values, 99) == 10
+    assert benchmark.percentile([3], 50) == 3
+
+
+def test_compare_results():
+    """Test regressions against a baseline are flagged."""
+    baseline = {
+        "benchmarks": {
+            "fast": {"p50": 1.0, "memory_peak": 1000},
+            "slow": {"p50": 1.0},
+            "removed": {"p50": 1.0},
+        }
+    }
+    results = {
+        "benchmarks": {
+            "fast": {"p50": 0.5, "memory_peak": 1500},
+            "slow": {"p50": 1.05, "memory_peak": 1000},
+            "added": {"p50": 1.0},
+        }
+    }
+
+    assert benchmark.compare_results(results, baseline, 0.1) == [
+        "fast memory_peak +50.0%"
+    ]
+    assert benchmark.compare_results(results, baseline, 0.01) == [
+        "fast memory_peak +50.0%",
+        "slow p50 +5.0%",
+    ]
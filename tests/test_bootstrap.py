@@ -6,7 +6,7 @@ from unittest.mock import Mock, patch
 
 import pytest
 
-from homeassistant import bootstrap, core, runner
+from homeassistant import bootstrap, core, requirements, runner
 from homeassistant.bootstrap import SIGNAL_BOOTSTRAP_INTEGRATONS
 import homeassistant.config as config_util
 from homeassistant.exceptions import HomeAssistantError
@@ -669,3 +669,34 @@ async def test_empty_integrations_list_is_only_sent_at_the_end_of_bootstrap(hass
 
     assert "normal_integration" in hass.config.components
     assert order == ["an_after_dep", "normal_integration"]
+
+
+async def test_preimport_after_requirements(hass, caplog):
+    """Test integrations are only pre-imported once their requirements are met."""
+    imported = []
+
+    def mock_get_component(domain):
+        async def async_get_component():
+            imported.append(domain)
+
+        return async_get_component
+
+    integrations = {
+        domain: Mock(async_get_component=mock_get_component(domain))
+        for domain in ("with_requirements", "missing_requirements")
+    }
+
+    async def mock_get_integration_with_requirements(hass, domain):
+        if domain == "missing_requirements":
+            raise requirements.RequirementsNotFound(domain, ["missing==1.0"])
+        return integrations[domain]
+
+    with patch(
+        "homeassistant.requirements.async_get_integration_with_requirements",
+        side_effect=mock_get_integration_with_requirements,
+    ):
+        await bootstrap._async_preimport_integrations(hass, integrations, {})
+
+    assert imported == ["with_requirements"]
+    assert "Unable to pre-import module" in caplog.text
+    assert "Requirements for missing_requirements not found" in caplog.text
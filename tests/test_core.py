@@ -3,6 +3,7 @@
 import asyncio
 from datetime import datetime, timedelta
 import functools
+import json
 import logging
 import os
 from tempfile import TemporaryDirectory
@@ -33,6 +34,7 @@ from homeassistant.const import (
 )
 import homeassistant.core as ha
 from homeassistant.exceptions import (
+    HomeAssistantError,
     InvalidEntityFormatError,
     InvalidStateError,
     MaxLengthExceeded,
@@ -383,6 +385,28 @@ def test_state_as_dict():
     assert state.as_dict() is state.as_dict()
 
 
+def test_state_as_json():
+    """Test a State as JSON."""
+    last_time = datetime(1984, 12, 8, 12, 0, 0)
+    state = ha.State(
+        "happy.happy",
+        "on",
+        {"pig": "dog"},
+        last_updated=last_time,
+        last_changed=last_time,
+    )
+    assert json.loads(state.as_json()) == state.as_dict()
+    # 2nd time to verify cache
+    assert state.as_json() is state.as_json()
+
+
+def test_state_as_json_invalid_data():
+    """Test a State with attributes that can't be serialized."""
+    state = ha.State("happy.happy", "on", {"pig": object()})
+    with pytest.raises(TypeError):
+        state.as_json()
+
+
 async def test_eventbus_add_remove_listener(hass):
     """Test remove_listener method."""
     old_count = len(hass.bus.async_listeners())
@@ -431,6 +455,136 @@ async def test_eventbus_filtered_listener(hass):
     unsub()
 
 
+async def test_eventbus_keyed_listener(hass):
+    """Test listening for events by key."""
+    calls = []
+    all_calls = []
+
+    @ha.callback
+    def event_key(event):
+        """Mock event key."""
+        return event.data.get("device_id")
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    @ha.callback
+    def all_listener(event):
+        """Mock listener of all keys."""
+        all_calls.append(event)
+
+    unsub = hass.bus.async_listen_keyed("test", event_key, ["abc", "def"], listener)
+    unsub_all = hass.bus.async_listen_keyed(
+        "test", event_key, [MATCH_ALL], all_listener
+    )
+    assert hass.bus.async_listeners()["test"] == 2
+    assert hass.bus.async_keyed_listeners("test", event_key) == {
+        "abc": 1,
+        "def": 1,
+        MATCH_ALL: 1,
+    }
+
+    hass.bus.async_fire("test", {"device_id": "abc"})
+    hass.bus.async_fire("test", {"device_id": "ghi"})
+    hass.bus.async_fire("test", {})
+    hass.bus.async_fire("other", {"device_id": "def"})
+    await hass.async_block_till_done()
+
+    assert [event.data["device_id"] for event in calls] == ["abc"]
+    assert [event.data["device_id"] for event in all_calls] == ["abc", "ghi"]
+
+    # Listeners removed before the listeners of an event ran are not run
+    hass.bus.async_fire("test", {"device_id": "def"})
+    unsub()
+    unsub_all()
+    await hass.async_block_till_done()
+
+    assert len(calls) == 1
+    assert len(all_calls) == 2
+    assert "test" not in hass.bus.async_listeners()
+    assert hass.bus.async_keyed_listeners("test", event_key) == {}
+
+
+async def test_eventbus_keyed_listener_removed_by_listener(hass):
+    """Test keyed listeners removed by an earlier listener are not run."""
+    calls = []
+
+    @ha.callback
+    def event_key(event):
+        """Mock event key."""
+        return event.data.get("device_id")
+
+    @ha.callback
+    def remove_listener(event):
+        """Mock listener replacing the next listeners once."""
+        calls.append("remove")
+        if len(calls) == 1:
+            unsub()
+            unsub_all()
+            hass.bus.async_listen_keyed("test", event_key, ["abc"], listener)
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append("listener")
+
+    hass.bus.async_listen_keyed("test", event_key, ["abc"], remove_listener)
+    unsub = hass.bus.async_listen_keyed("test", event_key, ["abc"], listener)
+    unsub_all = hass.bus.async_listen_keyed("test", event_key, [MATCH_ALL], listener)
+
+    hass.bus.async_fire("test", {"device_id": "abc"})
+    await hass.async_block_till_done()
+    assert calls == ["remove"]
+
+    hass.bus.async_fire("test", {"device_id": "abc"})
+    await hass.async_block_till_done()
+    assert calls == ["remove", "remove", "listener"]
+
+
+async def test_eventbus_keyed_listener_errors(hass, caplog):
+    """Test errors of keyed listeners are logged."""
+    calls = []
+
+    @ha.callback
+    def event_key(event):
+        """Mock event key."""
+        return event.data["device_id"]
+
+    @ha.callback
+    def bad_listener(event):
+        """Mock listener that fails."""
+        raise ValueError
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    with pytest.raises(HomeAssistantError):
+        hass.bus.async_listen_keyed("test", lambda event: None, ["abc"], listener)
+
+    hass.bus.async_listen_keyed("test", event_key, ["abc"], bad_listener)
+    hass.bus.async_listen_keyed("test", event_key, ["abc"], listener)
+
+    hass.bus.async_fire("test", {})
+    hass.bus.async_fire("test", {"device_id": "abc"})
+    await hass.async_block_till_done()
+
+    assert "Error in event key" in caplog.text
+    assert "Error while processing event" in caplog.text
+    assert len(calls) == 1
+
+    # Unhashable keys can't be looked up
+    caplog.clear()
+    hass.bus.async_fire("test", {"device_id": ["abc"]})
+    await hass.async_block_till_done()
+
+    assert "Error in event key" in caplog.text
+    assert len(calls) == 1
+
+
 async def test_eventbus_unsubscribe_listener(hass):
     """Test unsubscribe listener from returned function."""
     calls = []
@@ -728,6 +882,35 @@ async def test_statemachine_force_update(hass):
     assert len(events) == 1
 
 
+async def test_statemachine_shares_unchanged_attributes(hass):
+    """Test a new state shares the attributes of the old state if unchanged."""
+    hass.states.async_set("light.bowl", "on", {"brightness": 100})
+    state = hass.states.get("light.bowl")
+
+    hass.states.async_set("light.bowl", "off", {"brightness": 100})
+    state2 = hass.states.get("light.bowl")
+    assert state2.state == "off"
+    assert state2.attributes is state.attributes
+
+    hass.states.async_set("light.bowl", "on", {"brightness": 50})
+    state3 = hass.states.get("light.bowl")
+    assert state3.attributes is not state2.attributes
+    assert state3.attributes == {"brightness": 50}
+
+
+async def test_statemachine_same_attributes_by_identity(hass):
+    """Test passing the attributes of the old state doesn't fire an event."""
+    hass.states.async_set("light.bowl", "on", {"brightness": 100})
+    state = hass.states.get("light.bowl")
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+
+    hass.states.async_set("light.bowl", "on", state.attributes)
+    await hass.async_block_till_done()
+
+    assert len(events) == 0
+    assert hass.states.get("light.bowl") is state
+
+
 def test_service_call_repr():
     """Test ServiceCall repr."""
     call = ha.ServiceCall("homeassistant", "start")
@@ -1,4 +1,7 @@
 """Test to verify that we can load components."""
+import asyncio
+import json
+import pathlib
 from unittest.mock import patch
 
 import pytest
@@ -160,6 +163,47 @@ async def test_get_integration(hass):
     assert hue_light == integration.get_platform("light")
 
 
+async def test_async_get_integration_modules(hass):
+    """Test importing the modules of an integration in the executor."""
+    integration = await loader.async_get_integration(hass, "hue")
+
+    with patch.object(
+        hass, "async_add_executor_job", wraps=hass.async_add_executor_job
+    ) as mock_executor:
+        component, same_component = await asyncio.gather(
+            integration.async_get_component(), integration.async_get_component()
+        )
+        assert await integration.async_get_platform("light") == hue_light
+
+    assert component is same_component is hue
+    assert mock_executor.call_count == 2
+    assert hass.data[loader.DATA_IMPORT_TIME]["hue"] >= 0
+
+    # Imported modules are taken from the cache
+    with patch.object(hass, "async_add_executor_job") as mock_executor:
+        assert await integration.async_get_component() == hue
+        assert await integration.async_get_platform("light") == hue_light
+
+    assert not mock_executor.called
+
+
+async def test_async_get_component_falls_back_to_event_loop(hass):
+    """Test a module failing to import in the executor is imported in the loop."""
+    integration = await loader.async_get_integration(hass, "hue")
+
+    async def failing_executor_job(target, *args):
+        """Fail like a module creating an asyncio.Lock in the executor."""
+        raise RuntimeError("There is no current event loop in thread")
+
+    with patch.object(hass, "async_add_executor_job", failing_executor_job):
+        assert await integration.async_get_component() == hue
+
+    with patch.object(
+        hass, "async_add_executor_job", side_effect=ImportError
+    ), pytest.raises(ImportError):
+        await integration.async_get_platform("light")
+
+
 async def test_get_integration_legacy(hass, enable_custom_integrations):
     """Test resolving integration."""
     integration = await loader.async_get_integration(hass, "test_embedded")
@@ -481,3 +525,41 @@ async def test_custom_integration_missing(hass, caplog):
 
         with pytest.raises(loader.IntegrationNotFound):
             await loader.async_get_integration(hass, "test1")
+
+
+async def test_get_integration_from_generated_manifests(hass):
+    """Test built-in integrations are resolved without reading their manifest."""
+    with patch.object(loader.Integration, "resolve_from_root") as mock_resolve:
+        integration = await loader.async_get_integration(hass, "hue")
+
+    assert not mock_resolve.called
+    assert integration.pkg_path == "homeassistant.components.hue"
+    assert integration.file_path == pathlib.Path(hue.__file__).parent
+    assert integration.is_built_in
+    assert integration.manifest == {
+        **json.loads((integration.file_path / "manifest.json").read_text()),
+        "is_built_in": True,
+    }
+
+
+async def test_custom_components_index(hass, hass_storage, enable_custom_integrations):
+    """Test the manifests of custom integrations are indexed."""
+    integrations = await loader.async_get_custom_components(hass)
+    assert integrations["test_package"].name == "Test Package"
+    await hass.async_block_till_done()
+
+    index = hass_storage[loader.CUSTOM_COMPONENTS_STORAGE_KEY]["data"]
+    assert index["test_package"]["manifest"]["name"] == "Test Package"
+    assert "test_no_version" in index
+
+    # Unchanged manifests are taken from the index
+    index["test_package"]["manifest"]["name"] = "Indexed Package"
+    hass.data.pop(loader.DATA_CUSTOM_COMPONENTS)
+    integrations = await loader.async_get_custom_components(hass)
+    assert integrations["test_package"].name == "Indexed Package"
+
+    # Changed manifests are parsed again
+    index["test_package"]["mtime"] = 0
+    hass.data.pop(loader.DATA_CUSTOM_COMPONENTS)
+    integrations = await loader.async_get_custom_components(hass)
+    assert integrations["test_package"].name == "Test Package"
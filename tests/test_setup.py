@@ -12,7 +12,7 @@ import voluptuous as vol
 from homeassistant import config_entries, setup
 import homeassistant.config as config_util
 from homeassistant.const import EVENT_COMPONENT_LOADED, EVENT_HOMEASSISTANT_START
-from homeassistant.core import callback
+from homeassistant.core import CoreState, callback
 from homeassistant.helpers import discovery
 from homeassistant.helpers.config_validation import (
     PLATFORM_SCHEMA,
@@ -708,3 +708,35 @@ async def test_async_start_setup_platforms(hass):
     assert "august" not in hass.data[setup.DATA_SETUP_STARTED]
     assert isinstance(hass.data[setup.DATA_SETUP_TIME]["august"], datetime.timedelta)
     assert "sensor" not in hass.data[setup.DATA_SETUP_TIME]
+
+
+async def test_setup_timeline(hass):
+    """Test the phases of the setup of an integration are recorded."""
+    hass.state = CoreState.starting
+    mock_integration(hass, MockModule("comp"))
+    assert await setup.async_setup_component(hass, "comp", {})
+
+    with setup.async_start_setup(hass, ["sensor.comp"]):
+        pass
+
+    timeline = hass.data[setup.DATA_SETUP_TIMELINE]
+    assert all(start <= end for _, _, start, end in timeline)
+    phases = [phase for integration, phase, _, _ in timeline if integration == "comp"]
+    assert phases == [
+        "resolve",
+        "dependencies",
+        "import",
+        "setup",
+        "sensor platform setup",
+    ]
+
+    trace_events = setup.async_get_setup_timeline(hass)["traceEvents"]
+    complete_events = [event for event in trace_events if event["ph"] == "X"]
+    assert len(complete_events) == len(timeline)
+
+    # Setups once running are not recorded
+    recorded = len(timeline)
+    hass.state = CoreState.running
+    with setup.async_start_setup(hass, ["light.comp"]):
+        pass
+    assert len(hass.data[setup.DATA_SETUP_TIMELINE]) == recorded
@@ -13,6 +13,7 @@ import pytest
 
 from homeassistant.core import Event, State
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.json import JSONEncoder as HAJSONEncoder
 from homeassistant.util.json import (
     SerializationError,
     find_paths_unserializable_data,
@@ -76,6 +77,26 @@ def test_overwrite_and_reload():
     assert data == TEST_JSON_B
 
 
+def test_save_file_format():
+    """Test the saved file has the format of the json module with an indent of 4."""
+    fname = _path_for("test_format")
+    now = datetime(2021, 7, 1, 12, 0, 0)
+    data = {
+        "a": [1, 2.5, {"b": None, "unicode": "\u00e9\u2603"}],
+        "nan": math.nan,
+        "state": State("test.test", "on", {"count": 1}, now, now),
+        "time": now,
+    }
+    save_json(fname, data, encoder=HAJSONEncoder)
+    with open(fname, "rb") as fh:
+        assert fh.read() == dumps(data, indent=4, cls=HAJSONEncoder).encode("utf-8")
+
+    del data["state"], data["time"]
+    save_json(fname, data)
+    with open(fname, "rb") as fh:
+        assert fh.read() == dumps(data, indent=4).encode("utf-8")
+
+
 def test_save_bad_data():
     """Test error from trying to save unserialisable data."""
     with pytest.raises(SerializationError) as excinfo: